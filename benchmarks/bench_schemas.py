@@ -0,0 +1,128 @@
+"""Schema micro-benchmark: validation, rebuild and serialization at scale.
+
+Compares the previous code paths (Python-level list validator, full
+re-validation of reconciled outputs, model_dump() + json.dumps(default=str))
+with the current ones (core max_length constraints, model_copy() for trusted
+rebuilds, model_dump_json()).
+
+Usage:
+    python benchmarks/bench_schemas.py [--n 100000]
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+from typing import List
+
+from pydantic import field_validator
+
+from committee_lite.schemas import AgentOutput, AgentUpdate, DebateRound, FinalDecision
+
+
+class LegacyAgentOutput(AgentOutput):
+    """AgentOutput with the old redundant Python-level list validator."""
+
+    @field_validator('bull_points', 'bear_points', 'key_risks')
+    @classmethod
+    def validate_max_length(cls, v: List[str]) -> List[str]:
+        if len(v) > 3:
+            raise ValueError("Maximum 3 items allowed")
+        return v
+
+
+AGENT_FIELDS = dict(
+    agent_name="Valuation",
+    ticker="NVDA",
+    score_0_100=70,
+    bull_points=["DCF implies 22% upside", "FCF margin expanding", "Net cash balance sheet"],
+    bear_points=["Terminal value is 80% of EV", "Multiple above sector"],
+    key_risks=["Growth deceleration", "Rate sensitivity"],
+    confidence="Medium",
+    evidence=["DCF model", "10-K FY2025"],
+)
+
+
+def make_decision() -> FinalDecision:
+    """A representative decision with one reconciliation round."""
+    return FinalDecision(
+        ticker="NVDA",
+        timestamp=datetime(2025, 6, 2, 16, 0),
+        agent_scores={"Fundamentals": 75, "Valuation": 70, "Technical": 72, "Sentiment": 68},
+        average_score=71.25,
+        score_spread=7,
+        final_rating="BUY",
+        final_confidence="Medium",
+        rationale=["Quality business", "Fair valuation", "Positive momentum"],
+        action_plan="Scale in over two weeks; review after earnings.",
+        invalidation_criteria=["Margin compression", "Guidance cut"],
+        debate_log=[
+            DebateRound(
+                round_number=1,
+                trigger="score spread 20 > threshold 15",
+                agent_updates=[
+                    AgentUpdate(
+                        agent_name="Valuation", old_score=60, new_score=70, reasoning="Adjusted"
+                    )
+                ],
+                outcome="Reconciliation complete (1 agents updated)",
+            )
+        ],
+    )
+
+
+def timed(label: str, n: int, fn) -> float:
+    """Run fn n times and print the elapsed time."""
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:42s} {elapsed:7.3f}s  ({elapsed / n * 1e6:6.2f} us/obj)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Schema micro-benchmark")
+    parser.add_argument("--n", type=int, default=100_000, help="Objects per case")
+    args = parser.parse_args()
+    n = args.n
+
+    print(f"Schema benchmark ({n:,} objects per case)\n")
+
+    print("AgentOutput validation:")
+    before = timed("field_validator + max_length", n, lambda: LegacyAgentOutput(**AGENT_FIELDS))
+    after = timed("max_length only", n, lambda: AgentOutput(**AGENT_FIELDS))
+    print(f"  speedup: {before / after:.2f}x\n")
+
+    output = AgentOutput(**AGENT_FIELDS)
+    print("Reconciliation rebuild:")
+    before = timed(
+        "AgentOutput(...) re-validation",
+        n,
+        lambda: AgentOutput(
+            agent_name=output.agent_name,
+            ticker=output.ticker,
+            score_0_100=72,
+            bull_points=output.bull_points,
+            bear_points=output.bear_points,
+            key_risks=output.key_risks,
+            confidence=output.confidence,
+            evidence=output.evidence,
+        ),
+    )
+    after = timed("model_copy(update=...)", n, lambda: output.model_copy(update={"score_0_100": 72}))
+    print(f"  speedup: {before / after:.2f}x\n")
+
+    decision = make_decision()
+    print("FinalDecision serialization:")
+    before = timed(
+        "json.dumps(model_dump(), default=str)",
+        n,
+        lambda: json.dumps(decision.model_dump(), default=str),
+    )
+    after = timed("model_dump_json()", n, decision.model_dump_json)
+    print(f"  speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
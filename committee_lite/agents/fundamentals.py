@@ -1,22 +1,42 @@
 """Fundamentals Agent - analyzes business quality and financial health."""
 
 import json
+from typing import Optional, Tuple
 from committee_lite.llm import LLMClient
 from committee_lite.schemas import AgentOutput
-from committee_lite.tools import get_financial_data, format_financial_summary
+from committee_lite.tools import (
+    get_financial_snapshot,
+    format_financial_summary,
+    format_trend_summary,
+)
+from committee_lite.tools.market_data import MarketDataProvider
+from committee_lite.tools.peer_index import PeerIndex, format_peer_summary
 
 
 class FundamentalsAgent:
     """Analyzes fundamental business quality and financial health."""
 
-    def __init__(self, llm_client: LLMClient):
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        data_provider: Optional[MarketDataProvider] = None,
+        compact: bool = False,
+        peer_index: Optional[PeerIndex] = None,
+    ):
         """
         Initialize Fundamentals Agent.
 
         Args:
             llm_client: LLM client for analysis
+            data_provider: Market data source (default: get_default_provider())
+            compact: Render input data as terse key=value lines
+            peer_index: Universe peer index; when set, the prompt also gets
+                each metric's percentile within the ticker's industry/sector
         """
         self.llm_client = llm_client
+        self.data_provider = data_provider
+        self.compact = compact
+        self.peer_index = peer_index
         self.agent_name = "Fundamentals"
 
     def analyze(self, ticker: str) -> AgentOutput:
@@ -29,9 +49,34 @@ class FundamentalsAgent:
         Returns:
             AgentOutput with fundamental analysis
         """
+        system_prompt, user_prompt = self.build_prompts(ticker)
+        return self.run_prompts(ticker, system_prompt, user_prompt)
+
+    def build_prompts(self, ticker: str) -> Tuple[str, str]:
+        """
+        Fetch input data and build the system and user prompts.
+
+        Args:
+            ticker: Stock ticker to analyze
+
+        Returns:
+            Tuple of (system_prompt, user_prompt)
+        """
         # Fetch financial data
-        financial_data = get_financial_data(ticker)
-        data_summary = format_financial_summary(financial_data)
+        financial_data = get_financial_snapshot(ticker, provider=self.data_provider)
+        data_summary = format_financial_summary(financial_data, compact=self.compact)
+        trend_summary = format_trend_summary(financial_data, compact=self.compact)
+        if trend_summary:
+            data_summary += (
+                "\n\nMULTI-YEAR TRENDS (from annual and quarterly statements; margin trends "
+                f"are percentage points per year):\n{trend_summary}"
+            )
+        peer_summary = format_peer_summary(self.peer_index, ticker, compact=self.compact)
+        if peer_summary:
+            data_summary += (
+                "\n\nPEER CONTEXT (percentile within industry, or sector if the industry "
+                f"is small; 50 = peer median):\n{peer_summary}"
+            )
 
         # Build prompt
         system_prompt = """You are a Fundamental Quality Analyst for an investment committee.
@@ -66,8 +111,29 @@ Score 0-100 where:
 
 Be concise but specific. Include exact numbers in your points."""
 
+        return system_prompt, user_prompt
+
+    def run_prompts(
+        self,
+        ticker: str,
+        system_prompt: str,
+        user_prompt: str,
+        llm_client: Optional[LLMClient] = None,
+    ) -> AgentOutput:
+        """
+        Call the LLM with prepared prompts and parse the response.
+
+        Args:
+            ticker: Stock ticker being analyzed
+            system_prompt: System prompt from build_prompts()
+            user_prompt: User prompt from build_prompts()
+            llm_client: Client for this call (default: the agent's client)
+
+        Returns:
+            AgentOutput with fundamental analysis
+        """
         # Get LLM response
-        response = self.llm_client.complete(
+        response = (llm_client or self.llm_client).complete(
             prompt=user_prompt,
             system_prompt=system_prompt,
             max_tokens=1500,
@@ -1,22 +1,34 @@
 """Sentiment Agent - analyzes market psychology and positioning."""
 
 import json
+from typing import Optional, Tuple
 from committee_lite.llm import LLMClient
 from committee_lite.schemas import AgentOutput
-from committee_lite.tools import get_financial_data
+from committee_lite.tools import get_financial_snapshot
+from committee_lite.tools.compact import compact_pairs, num
+from committee_lite.tools.market_data import MarketDataProvider
 
 
 class SentimentAgent:
     """Analyzes market sentiment, analyst views, and positioning."""
 
-    def __init__(self, llm_client: LLMClient):
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        data_provider: Optional[MarketDataProvider] = None,
+        compact: bool = False,
+    ):
         """
         Initialize Sentiment Agent.
 
         Args:
             llm_client: LLM client for analysis
+            data_provider: Market data source (default: get_default_provider())
+            compact: Render input data as terse key=value lines
         """
         self.llm_client = llm_client
+        self.data_provider = data_provider
+        self.compact = compact
         self.agent_name = "Sentiment"
 
     def analyze(self, ticker: str) -> AgentOutput:
@@ -29,18 +41,47 @@ class SentimentAgent:
         Returns:
             AgentOutput with sentiment analysis
         """
+        system_prompt, user_prompt = self.build_prompts(ticker)
+        return self.run_prompts(ticker, system_prompt, user_prompt)
+
+    def build_prompts(self, ticker: str) -> Tuple[str, str]:
+        """
+        Fetch input data and build the system and user prompts.
+
+        Args:
+            ticker: Stock ticker to analyze
+
+        Returns:
+            Tuple of (system_prompt, user_prompt)
+        """
         # Fetch financial data (includes analyst recommendations)
-        financial_data = get_financial_data(ticker)
+        financial_data = get_financial_snapshot(ticker, provider=self.data_provider)
 
         # Extract sentiment-relevant data
-        recommendation = financial_data.get('recommendation', 'hold')
-        num_analysts = financial_data.get('num_analyst_opinions', 0)
-        target_price = financial_data.get('target_price', 0)
-        current_price = financial_data.get('current_price', 0)
-
-        analyst_upside = 0
-        if current_price and target_price:
-            analyst_upside = ((target_price - current_price) / current_price) * 100
+        recommendation = (financial_data.recommendation or "hold").upper()
+        num_analysts = int(financial_data.num_analyst_opinions or 0)
+
+        def price(value):
+            return "N/A" if value is None else f"${value:.2f}"
+
+        upside = financial_data.analyst_upside_pct
+        implied = "N/A" if upside is None else f"{upside:+.1f}%"
+
+        if self.compact:
+            sentiment_data = compact_pairs([
+                ("analyst_rec", recommendation),
+                ("analysts", num_analysts),
+                ("target", num(financial_data.target_price)),
+                ("implied", num(upside, "+.1f", "%")),
+                ("price", num(financial_data.current_price)),
+                ("company", financial_data.company_name),
+                ("sector", financial_data.sector),
+            ])
+        else:
+            sentiment_data = f"""- Analyst Consensus: {recommendation} ({num_analysts} analysts)
+- Target Price: {price(financial_data.target_price)} (implied {implied} from {price(financial_data.current_price)})
+- Company: {financial_data.company_name}
+- Sector: {financial_data.sector}"""
 
         # Build prompt
         system_prompt = """You are a Sentiment Analyst for an investment committee.
@@ -63,10 +104,7 @@ Be specific. Cite your data in the evidence field."""
         user_prompt = f"""Analyze market sentiment for {ticker}.
 
 SENTIMENT DATA:
-- Analyst Consensus: {recommendation.upper()} ({num_analysts} analysts)
-- Target Price: ${target_price:.2f} (implied {analyst_upside:+.1f}% from ${current_price:.2f})
-- Company: {financial_data.get('company_name', ticker)}
-- Sector: {financial_data.get('sector', 'N/A')}
+{sentiment_data}
 
 Provide your analysis as JSON following the required schema.
 Score 0-100 where:
@@ -79,8 +117,29 @@ Score 0-100 where:
 Consider: Is the Street bullish or bearish? Crowded trade? Contrarian opportunity?
 Note: Limited data available in demo - infer what you can from analyst consensus."""
 
+        return system_prompt, user_prompt
+
+    def run_prompts(
+        self,
+        ticker: str,
+        system_prompt: str,
+        user_prompt: str,
+        llm_client: Optional[LLMClient] = None,
+    ) -> AgentOutput:
+        """
+        Call the LLM with prepared prompts and parse the response.
+
+        Args:
+            ticker: Stock ticker being analyzed
+            system_prompt: System prompt from build_prompts()
+            user_prompt: User prompt from build_prompts()
+            llm_client: Client for this call (default: the agent's client)
+
+        Returns:
+            AgentOutput with sentiment analysis
+        """
         # Get LLM response
-        response = self.llm_client.complete(
+        response = (llm_client or self.llm_client).complete(
             prompt=user_prompt,
             system_prompt=system_prompt,
             max_tokens=1500,
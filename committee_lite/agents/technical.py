@@ -1,22 +1,37 @@
 """Technical Agent - analyzes price action and entry/exit timing."""
 
 import json
+from typing import Any, Dict, Optional, Tuple
 from committee_lite.llm import LLMClient
 from committee_lite.schemas import AgentOutput
 from committee_lite.tools import get_technical_indicators, format_technical_summary
+from committee_lite.tools.market_data import MarketDataProvider
+from committee_lite.tools.price_store import PriceStore
 
 
 class TechnicalAgent:
     """Analyzes technical indicators and entry/exit timing."""
 
-    def __init__(self, llm_client: LLMClient):
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        data_provider: Optional[MarketDataProvider] = None,
+        price_store: Optional[PriceStore] = None,
+        compact: bool = False,
+    ):
         """
         Initialize Technical Agent.
 
         Args:
             llm_client: LLM client for analysis
+            data_provider: Market data source (default: get_default_provider())
+            price_store: Memory-mapped price history, read before the provider
+            compact: Render input data as terse key=value lines
         """
         self.llm_client = llm_client
+        self.data_provider = data_provider
+        self.price_store = price_store
+        self.compact = compact
         self.agent_name = "Technical"
 
     def analyze(self, ticker: str) -> AgentOutput:
@@ -29,9 +44,29 @@ class TechnicalAgent:
         Returns:
             AgentOutput with technical analysis
         """
+        system_prompt, user_prompt = self.build_prompts(ticker)
+        return self.run_prompts(ticker, system_prompt, user_prompt)
+
+    def build_prompts(
+        self, ticker: str, technical_data: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, str]:
+        """
+        Fetch input data and build the system and user prompts.
+
+        Args:
+            ticker: Stock ticker to analyze
+            technical_data: Precomputed indicators (e.g. IndicatorState.indicators());
+                fetched when omitted
+
+        Returns:
+            Tuple of (system_prompt, user_prompt)
+        """
         # Fetch technical indicators
-        technical_data = get_technical_indicators(ticker)
-        tech_summary = format_technical_summary(technical_data)
+        if technical_data is None:
+            technical_data = get_technical_indicators(
+                ticker, provider=self.data_provider, price_store=self.price_store
+            )
+        tech_summary = format_technical_summary(technical_data, compact=self.compact)
 
         # Build prompt
         system_prompt = """You are a Technical Analyst for an investment committee.
@@ -66,8 +101,29 @@ Score 0-100 where:
 
 Consider: Trend, RSI/MACD, support/resistance, volume. Is this a good entry point?"""
 
+        return system_prompt, user_prompt
+
+    def run_prompts(
+        self,
+        ticker: str,
+        system_prompt: str,
+        user_prompt: str,
+        llm_client: Optional[LLMClient] = None,
+    ) -> AgentOutput:
+        """
+        Call the LLM with prepared prompts and parse the response.
+
+        Args:
+            ticker: Stock ticker being analyzed
+            system_prompt: System prompt from build_prompts()
+            user_prompt: User prompt from build_prompts()
+            llm_client: Client for this call (default: the agent's client)
+
+        Returns:
+            AgentOutput with technical analysis
+        """
         # Get LLM response
-        response = self.llm_client.complete(
+        response = (llm_client or self.llm_client).complete(
             prompt=user_prompt,
             system_prompt=system_prompt,
             max_tokens=1500,
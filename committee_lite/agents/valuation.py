@@ -1,22 +1,38 @@
 """Valuation Agent - performs 2-stage DCF analysis."""
 
 import json
+from typing import Optional, Tuple
 from committee_lite.llm import LLMClient
 from committee_lite.schemas import AgentOutput
-from committee_lite.tools import get_financial_data, calculate_dcf_value, format_dcf_summary
+from committee_lite.tools import (
+    get_financial_snapshot,
+    calculate_dcf_value,
+    fetch_current_treasury_rate,
+    format_dcf_summary,
+)
+from committee_lite.tools.market_data import MarketDataProvider
 
 
 class ValuationAgent:
     """Performs intrinsic value analysis using 2-stage DCF."""
 
-    def __init__(self, llm_client: LLMClient):
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        data_provider: Optional[MarketDataProvider] = None,
+        compact: bool = False,
+    ):
         """
         Initialize Valuation Agent.
 
         Args:
             llm_client: LLM client for analysis
+            data_provider: Market data source (default: get_default_provider())
+            compact: Render input data as terse key=value lines
         """
         self.llm_client = llm_client
+        self.data_provider = data_provider
+        self.compact = compact
         self.agent_name = "Valuation"
 
     def analyze(self, ticker: str) -> AgentOutput:
@@ -29,12 +45,29 @@ class ValuationAgent:
         Returns:
             AgentOutput with valuation analysis
         """
+        system_prompt, user_prompt = self.build_prompts(ticker)
+        return self.run_prompts(ticker, system_prompt, user_prompt)
+
+    def build_prompts(self, ticker: str) -> Tuple[str, str]:
+        """
+        Fetch input data and build the system and user prompts.
+
+        Args:
+            ticker: Stock ticker to analyze
+
+        Returns:
+            Tuple of (system_prompt, user_prompt)
+        """
         # Fetch financial data
-        financial_data = get_financial_data(ticker)
+        financial_data = get_financial_snapshot(ticker, provider=self.data_provider)
 
         # Calculate DCF
-        dcf_results = calculate_dcf_value(ticker, financial_data)
-        dcf_summary = format_dcf_summary(dcf_results)
+        dcf_results = calculate_dcf_value(
+            ticker,
+            financial_data,
+            risk_free_rate=fetch_current_treasury_rate(self.data_provider),
+        )
+        dcf_summary = format_dcf_summary(dcf_results, compact=self.compact)
 
         # Build prompt
         system_prompt = """You are a Valuation Analyst for an investment committee.
@@ -51,7 +84,8 @@ You MUST respond with valid JSON matching this exact schema:
     "evidence": [<list of specific data sources and evidence>]
 }
 
-Focus on: margin of safety, DCF assumptions, sensitivity to growth/WACC, valuation multiples.
+Focus on: margin of safety, DCF assumptions, sensitivity to growth/WACC, valuation multiples,
+and whether the market-implied growth and FCF margin (reverse DCF) are achievable.
 Be specific with numbers. Cite your calculations in the evidence field."""
 
         user_prompt = f"""Analyze the valuation of {ticker}.
@@ -69,8 +103,29 @@ Score 0-100 where:
 
 Consider: Is upside/downside compelling? How sensitive to assumptions? Terminal value concerns?"""
 
+        return system_prompt, user_prompt
+
+    def run_prompts(
+        self,
+        ticker: str,
+        system_prompt: str,
+        user_prompt: str,
+        llm_client: Optional[LLMClient] = None,
+    ) -> AgentOutput:
+        """
+        Call the LLM with prepared prompts and parse the response.
+
+        Args:
+            ticker: Stock ticker being analyzed
+            system_prompt: System prompt from build_prompts()
+            user_prompt: User prompt from build_prompts()
+            llm_client: Client for this call (default: the agent's client)
+
+        Returns:
+            AgentOutput with valuation analysis
+        """
         # Get LLM response
-        response = self.llm_client.complete(
+        response = (llm_client or self.llm_client).complete(
             prompt=user_prompt,
             system_prompt=system_prompt,
             max_tokens=1500,
@@ -1,15 +1,32 @@
 """Command-line interface for Investment Committee Lite."""
 
 import argparse
-import json
+import contextlib
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 from committee_lite.config import Config
-from committee_lite.orchestrator import InvestmentCommittee
-from committee_lite.llm import get_llm_client
+from committee_lite.orchestrator import InvestmentCommittee, run_pipeline, run_universe
+from committee_lite.orchestrator.profiling import PhaseProfiler
+from committee_lite.orchestrator.backtest import rebalance_dates, run_backtest
+from committee_lite.orchestrator.prescreen import load_scores, prescreen, save_scores, select_shortlist
+from committee_lite.orchestrator.soak import run_soak
+from committee_lite.orchestrator.watch import Watcher
+from committee_lite.llm import Cassette, ModelRouter, get_llm_client
+from committee_lite.store import DecisionStore
+from committee_lite.jobs import (
+    PRIORITY_CLASSES,
+    CommitteeScheduler,
+    LLMScheduler,
+    ScheduledLLMClient,
+    SQLiteJobQueue,
+    run_scheduled_worker,
+    run_worker,
+)
+from committee_lite.output import WRITERS, open_writer
+from committee_lite.tools import FixtureProvider, PeerIndex, PriceStore, SnapshotArchive, get_default_provider
 
 
 def main():
@@ -31,6 +48,45 @@ Examples:
   # Adjust disagreement threshold
   committee-lite analyze MSFT --threshold 20
 
+  # Record the decision in the decision store, then list recent downgrades
+  committee-lite analyze NVDA --mock --store
+  committee-lite history --downgrades --days 7
+
+  # Run a universe across worker processes and store every decision
+  committee-lite batch --file universe.txt --workers 32 --mock --store
+
+  # Give the Fundamentals agent sector/industry peer percentiles
+  committee-lite batch --file universe.txt --mock --peers
+
+  # Stream a large universe to a file in constant memory
+  committee-lite batch --file universe.txt --mock --stream --output outputs/decisions.jsonl
+
+  # Only send the top/bottom 50 quantitative scores (and movers) to the committee
+  committee-lite batch --file universe.txt --mock --prescreen-top 50 --prescreen-bottom 50 \
+      --prescreen-state outputs/prescreen.csv
+
+  # Profile one run: per-phase wall vs CPU time, flame-graph stacks
+  committee-lite analyze NVDA --mock --profile
+
+  # Re-analyze watched tickers only when price/RSI/MACD thresholds are crossed
+  committee-lite watch NVDA AAPL --prices outputs/prices --mock --store
+
+  # Archive today's fundamentals, prices and rate, then backtest month-end decisions
+  committee-lite archive --file universe.txt --period max
+  committee-lite backtest --file universe.txt --start 2022-01-01 --end 2024-12-31 --mock \
+      --output outputs/backtest.csv
+
+  # Soak test: 30 minutes offline, fail if memory grows more than 50 MB
+  committee-lite soak --minutes 30 --max-growth-mb 50
+
+  # Distribute a universe over worker processes on several hosts
+  committee-lite enqueue --file universe.txt --universe nightly
+  committee-lite worker --mock --exit-when-empty
+
+  # Serve interactive requests ahead of a running batch over one LLM budget
+  committee-lite worker --scheduled --llm-concurrency 8
+  committee-lite enqueue NVDA --priority interactive
+
 ⚠️  EDUCATIONAL DEMO ONLY - NOT INVESTMENT ADVICE
         """
     )
@@ -54,6 +110,11 @@ Examples:
         action='store_true',
         help='Use mock mode (no API keys needed)'
     )
+    analyze_parser.add_argument(
+        '--data-dir',
+        metavar='PATH',
+        help='Read market data from a local fixture directory (no network)'
+    )
     analyze_parser.add_argument(
         '--threshold',
         type=int,
@@ -69,6 +130,41 @@ Examples:
         action='store_true',
         help='Save output as JSON'
     )
+    analyze_parser.add_argument(
+        '--store',
+        nargs='?',
+        const=Config.DECISION_STORE_PATH,
+        metavar='PATH',
+        help=f'Append decision to the decision store (default: {Config.DECISION_STORE_PATH})'
+    )
+    analyze_parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Reuse stored agent outputs whose inputs are unchanged (uses the decision store)'
+    )
+    analyze_parser.add_argument(
+        '--fast-consensus',
+        action='store_true',
+        help='Skip the PM LLM call when the committee is unanimous (rule-based synthesis)'
+    )
+    analyze_parser.add_argument(
+        '--route',
+        action='store_true',
+        help='Tiered model routing: cheap model first, strong model on escalation'
+    )
+    analyze_parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Compact prompts: key=value data, missing metrics dropped, capped PM bullets'
+    )
+    analyze_parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='outputs/profile',
+        metavar='DIR',
+        help='Profile each phase (wall vs CPU time); write collapsed stacks and a '
+             'ranked summary (default dir: outputs/profile)'
+    )
     analyze_parser.add_argument(
         '--max-tokens',
         type=int,
@@ -82,15 +178,566 @@ Examples:
         help='LLM temperature (default: 0.7)'
     )
 
+    # Batch command
+    batch_parser = subparsers.add_parser('batch', help='Analyze a universe of stocks')
+    batch_parser.add_argument('tickers', nargs='*', help='Stock ticker symbols')
+    batch_parser.add_argument(
+        '--file',
+        help='File with one ticker per line'
+    )
+    batch_parser.add_argument(
+        '--workers',
+        type=int,
+        help='Worker processes (default: CPU count)'
+    )
+    batch_parser.add_argument(
+        '--backend',
+        choices=['process', 'serial'],
+        default='process',
+        help='Execution backend (default: process)'
+    )
+    batch_parser.add_argument(
+        '--provider',
+        choices=['openai', 'anthropic'],
+        help='LLM provider (default: from .env or openai)'
+    )
+    batch_parser.add_argument(
+        '--model',
+        help='Model name (default: from .env)'
+    )
+    batch_parser.add_argument(
+        '--mock',
+        action='store_true',
+        help='Use mock mode (no API keys needed)'
+    )
+    batch_parser.add_argument(
+        '--data-dir',
+        metavar='PATH',
+        help='Read market data from a local fixture directory (no network)'
+    )
+    batch_parser.add_argument(
+        '--threshold',
+        type=int,
+        help=f'Disagreement threshold (default: {Config.DISAGREEMENT_THRESHOLD})'
+    )
+    batch_parser.add_argument(
+        '--max-rounds',
+        type=int,
+        help=f'Max reconciliation rounds (default: {Config.MAX_RECONCILE_ROUNDS})'
+    )
+    batch_parser.add_argument(
+        '--store',
+        nargs='?',
+        const=Config.DECISION_STORE_PATH,
+        metavar='PATH',
+        help=f'Append decisions to the decision store (default: {Config.DECISION_STORE_PATH})'
+    )
+    batch_parser.add_argument(
+        '--output',
+        metavar='PATH',
+        help='Write decisions to a JSONL, MessagePack or Parquet file'
+    )
+    batch_parser.add_argument(
+        '--format',
+        choices=sorted(WRITERS),
+        help='Output format (default: from the --output extension)'
+    )
+    batch_parser.add_argument(
+        '--compression',
+        help='Output compression (jsonl/msgpack: gzip; parquet: snappy, zstd, gzip)'
+    )
+    batch_parser.add_argument(
+        '--peers',
+        action='store_true',
+        help='Build a sector/industry peer index over the whole universe and give '
+             'the Fundamentals agent peer percentiles'
+    )
+    batch_parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Stream tickers through one committee, writing each decision as it '
+             'completes (constant memory, any universe size)'
+    )
+    batch_parser.add_argument(
+        '--max-in-flight',
+        type=int,
+        metavar='N',
+        help=f'With --stream: tickers fetched but not yet written '
+             f'(default: {Config.PIPELINE_MAX_IN_FLIGHT})'
+    )
+    batch_parser.add_argument(
+        '--prescreen-top',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Pre-screen the universe and send the N highest quantitative scores to the committee'
+    )
+    batch_parser.add_argument(
+        '--prescreen-bottom',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Also send the N lowest pre-screen scores to the committee'
+    )
+    batch_parser.add_argument(
+        '--prescreen-state',
+        metavar='PATH',
+        help=(
+            'CSV of previous pre-screen scores; also send tickers that are new or moved '
+            f'by at least PRESCREEN_MIN_CHANGE ({Config.PRESCREEN_MIN_CHANGE:g}), then update it'
+        )
+    )
+
+    # Soak command
+    soak_parser = subparsers.add_parser(
+        'soak', help='Run the committee for N minutes and check memory growth (offline)'
+    )
+    soak_parser.add_argument('tickers', nargs='*', help='Stock ticker symbols')
+    soak_parser.add_argument(
+        '--file',
+        help='File with one ticker per line'
+    )
+    soak_parser.add_argument(
+        '--minutes',
+        type=float,
+        default=10,
+        help='Measured run time after the warmup pass (default: 10)'
+    )
+    soak_parser.add_argument(
+        '--mode',
+        choices=['committee', 'batch'],
+        default='committee',
+        help='Drive one warm committee or repeated batch runs (default: committee)'
+    )
+    soak_parser.add_argument(
+        '--data-dir',
+        metavar='PATH',
+        help='Fixture directory (default: synthetic fixtures for the tickers)'
+    )
+    soak_parser.add_argument(
+        '--interval',
+        type=float,
+        default=10,
+        help='Seconds between memory samples (default: 10)'
+    )
+    soak_parser.add_argument(
+        '--max-growth-mb',
+        type=float,
+        default=50,
+        help='Fail if RSS or traced memory grows more than this (default: 50)'
+    )
+    soak_parser.add_argument(
+        '--latency-ms',
+        type=float,
+        default=50,
+        help='Simulated mock LLM latency per call (default: 50)'
+    )
+    soak_parser.add_argument(
+        '--top',
+        type=int,
+        default=10,
+        help='Allocation sites to report (default: 10)'
+    )
+
+    # Enqueue command
+    enqueue_parser = subparsers.add_parser('enqueue', help='Queue tickers for queue workers')
+    enqueue_parser.add_argument('tickers', nargs='*', help='Stock ticker symbols')
+    enqueue_parser.add_argument(
+        '--file',
+        help='File with one ticker per line'
+    )
+    enqueue_parser.add_argument(
+        '--universe',
+        help='Universe name; re-queuing a ticker in the same universe is a no-op '
+             '(default: "default", or a fresh one per interactive request)'
+    )
+    enqueue_parser.add_argument(
+        '--priority',
+        choices=list(PRIORITY_CLASSES),
+        default='batch',
+        help='Priority class; interactive jobs are claimed and served first (default: batch)'
+    )
+    enqueue_parser.add_argument(
+        '--queue',
+        default=Config.JOB_QUEUE_PATH,
+        metavar='PATH',
+        help=f'Job queue path (default: {Config.JOB_QUEUE_PATH})'
+    )
+
+    # Worker command
+    worker_parser = subparsers.add_parser('worker', help='Drain queued tickers')
+    worker_parser.add_argument(
+        '--queue',
+        default=Config.JOB_QUEUE_PATH,
+        metavar='PATH',
+        help=f'Job queue path (default: {Config.JOB_QUEUE_PATH})'
+    )
+    worker_parser.add_argument(
+        '--store',
+        default=Config.DECISION_STORE_PATH,
+        metavar='PATH',
+        help=f'Decision store for results (default: {Config.DECISION_STORE_PATH})'
+    )
+    worker_parser.add_argument(
+        '--provider',
+        choices=['openai', 'anthropic'],
+        help='LLM provider (default: from .env or openai)'
+    )
+    worker_parser.add_argument(
+        '--model',
+        help='Model name (default: from .env)'
+    )
+    worker_parser.add_argument(
+        '--mock',
+        action='store_true',
+        help='Use mock mode (no API keys needed)'
+    )
+    worker_parser.add_argument(
+        '--data-dir',
+        metavar='PATH',
+        help='Read market data from a local fixture directory (no network)'
+    )
+    worker_parser.add_argument(
+        '--threshold',
+        type=int,
+        help=f'Disagreement threshold (default: {Config.DISAGREEMENT_THRESHOLD})'
+    )
+    worker_parser.add_argument(
+        '--visibility-timeout',
+        type=float,
+        default=Config.JOB_VISIBILITY_TIMEOUT,
+        help=f'Job lease in seconds (default: {Config.JOB_VISIBILITY_TIMEOUT})'
+    )
+    worker_parser.add_argument(
+        '--exit-when-empty',
+        action='store_true',
+        help='Exit once the queue is drained instead of polling'
+    )
+    worker_parser.add_argument(
+        '--scheduled',
+        action='store_true',
+        help='Run interactive and batch jobs concurrently over one shared, '
+             'priority-weighted LLM call budget'
+    )
+    worker_parser.add_argument(
+        '--llm-concurrency',
+        type=int,
+        help=f'With --scheduled: LLM calls in flight (default: {Config.LLM_MAX_CONCURRENCY})'
+    )
+    worker_parser.add_argument(
+        '--rpm',
+        type=float,
+        help='With --scheduled: LLM requests per minute '
+             f'(default: {Config.LLM_REQUESTS_PER_MINUTE:g}, 0 = no limit)'
+    )
+    worker_parser.add_argument(
+        '--interactive-workers',
+        type=int,
+        default=1,
+        help='With --scheduled: concurrent interactive jobs (default: 1)'
+    )
+    worker_parser.add_argument(
+        '--batch-workers',
+        type=int,
+        help='With --scheduled: concurrent batch jobs (default: --llm-concurrency)'
+    )
+
+    # Watch command
+    watch_parser = subparsers.add_parser(
+        'watch', help='Re-analyze watched tickers when price/RSI/MACD thresholds are crossed'
+    )
+    watch_parser.add_argument('tickers', nargs='*', help='Stock ticker symbols')
+    watch_parser.add_argument(
+        '--file',
+        help='File with one ticker per line'
+    )
+    watch_parser.add_argument(
+        '--prices',
+        metavar='PATH',
+        help='PriceStore directory to poll for new bars (pushed bars are appended to it)'
+    )
+    watch_parser.add_argument(
+        '--stdin',
+        action='store_true',
+        help='Read pushed bars from stdin, one JSON object per line '
+             '({"ticker": ..., "close": ..., "volume": ..., "date": ...}); '
+             'with --prices, the store is also polled before each line'
+    )
+    watch_parser.add_argument(
+        '--interval',
+        type=float,
+        help=f'Seconds between price store polls (default: {Config.WATCH_POLL_INTERVAL:g})'
+    )
+    watch_parser.add_argument(
+        '--max-polls',
+        type=int,
+        help='Stop after N polls (default: run until interrupted)'
+    )
+    watch_parser.add_argument(
+        '--move-pct',
+        type=float,
+        help=f'Price move since the last committee run that re-runs it '
+             f'(default: {Config.WATCH_MOVE_PCT:g}%%)'
+    )
+    watch_parser.add_argument(
+        '--escalate-delta',
+        type=int,
+        help=f'Technical score shift that escalates to the committee '
+             f'(default: {Config.WATCH_ESCALATE_DELTA})'
+    )
+    watch_parser.add_argument(
+        '--store',
+        nargs='?',
+        const=Config.DECISION_STORE_PATH,
+        metavar='PATH',
+        help=f'Read last scores from and append decisions to the decision store '
+             f'(default: {Config.DECISION_STORE_PATH})'
+    )
+    watch_parser.add_argument(
+        '--provider',
+        choices=['openai', 'anthropic'],
+        help='LLM provider (default: from .env or openai)'
+    )
+    watch_parser.add_argument(
+        '--model',
+        help='Model name (default: from .env)'
+    )
+    watch_parser.add_argument(
+        '--mock',
+        action='store_true',
+        help='Use mock mode (no API keys needed)'
+    )
+    watch_parser.add_argument(
+        '--data-dir',
+        metavar='PATH',
+        help='Read market data from a local fixture directory (no network)'
+    )
+    watch_parser.add_argument(
+        '--threshold',
+        type=int,
+        help=f'Disagreement threshold (default: {Config.DISAGREEMENT_THRESHOLD})'
+    )
+
+    # Archive command
+    archive_parser = subparsers.add_parser(
+        'archive', help='Snapshot fundamentals, prices and the risk-free rate for backtests'
+    )
+    archive_parser.add_argument('tickers', nargs='*', help='Stock ticker symbols')
+    archive_parser.add_argument(
+        '--file',
+        help='File with one ticker per line'
+    )
+    archive_parser.add_argument(
+        '--archive',
+        default=Config.ARCHIVE_PATH,
+        metavar='PATH',
+        help=f'Archive directory (default: {Config.ARCHIVE_PATH})'
+    )
+    archive_parser.add_argument(
+        '--data-dir',
+        metavar='PATH',
+        help='Read market data from a local fixture directory (no network)'
+    )
+    archive_parser.add_argument(
+        '--period',
+        default='1y',
+        help='Price history to append; bars already archived are skipped (default: 1y)'
+    )
+    archive_parser.add_argument(
+        '--as-of',
+        metavar='DATE',
+        help='Date to file the fundamentals under (default: today)'
+    )
+
+    # Backtest command
+    backtest_parser = subparsers.add_parser(
+        'backtest', help='Replay the committee at past dates over the archive (no look-ahead)'
+    )
+    backtest_parser.add_argument('tickers', nargs='*', help='Stock ticker symbols (default: every archived ticker)')
+    backtest_parser.add_argument(
+        '--file',
+        help='File with one ticker per line'
+    )
+    backtest_parser.add_argument(
+        '--archive',
+        default=Config.ARCHIVE_PATH,
+        metavar='PATH',
+        help=f'Archive directory (default: {Config.ARCHIVE_PATH})'
+    )
+    backtest_parser.add_argument(
+        '--start',
+        required=True,
+        metavar='DATE',
+        help='First rebalance date'
+    )
+    backtest_parser.add_argument(
+        '--end',
+        required=True,
+        metavar='DATE',
+        help='Last rebalance date'
+    )
+    backtest_parser.add_argument(
+        '--freq',
+        default='BME',
+        help='Rebalance frequency (pandas alias, default: BME = business month end)'
+    )
+    backtest_parser.add_argument(
+        '--horizons',
+        default='21,63',
+        help='Forward-return horizons in trading days (default: 21,63)'
+    )
+    backtest_parser.add_argument(
+        '--workers',
+        type=int,
+        help=f'Concurrent committees (default: {Config.BACKTEST_WORKERS})'
+    )
+    cache_group = backtest_parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        '--llm-cache',
+        default=Config.BACKTEST_LLM_CACHE,
+        metavar='PATH',
+        help=f'Cassette serving repeated prompts; misses are recorded '
+             f'(default: {Config.BACKTEST_LLM_CACHE})'
+    )
+    cache_group.add_argument(
+        '--no-llm-cache',
+        action='store_true',
+        help='Send every prompt to the LLM'
+    )
+    backtest_parser.add_argument(
+        '--provider',
+        choices=['openai', 'anthropic'],
+        help='LLM provider (default: from .env or openai)'
+    )
+    backtest_parser.add_argument(
+        '--model',
+        help='Model name (default: from .env)'
+    )
+    backtest_parser.add_argument(
+        '--mock',
+        action='store_true',
+        help='Use mock mode (no API keys needed)'
+    )
+    backtest_parser.add_argument(
+        '--threshold',
+        type=int,
+        help=f'Disagreement threshold (default: {Config.DISAGREEMENT_THRESHOLD})'
+    )
+    backtest_parser.add_argument(
+        '--max-rounds',
+        type=int,
+        help=f'Max reconciliation rounds (default: {Config.MAX_RECONCILE_ROUNDS})'
+    )
+    backtest_parser.add_argument(
+        '--store',
+        nargs='?',
+        const=Config.DECISION_STORE_PATH,
+        metavar='PATH',
+        help=f'Append decisions (timestamped as of their date) to the decision store '
+             f'(default: {Config.DECISION_STORE_PATH})'
+    )
+    backtest_parser.add_argument(
+        '--output',
+        metavar='PATH',
+        help='Write one CSV row per decision with its forward returns'
+    )
+
+    # History command
+    history_parser = subparsers.add_parser('history', help='Query stored decisions')
+    history_parser.add_argument('ticker', nargs='?', help='Restrict to one ticker')
+    history_parser.add_argument(
+        '--store',
+        default=Config.DECISION_STORE_PATH,
+        metavar='PATH',
+        help=f'Decision store path (default: {Config.DECISION_STORE_PATH})'
+    )
+    history_parser.add_argument(
+        '--days',
+        type=int,
+        help='Only decisions from the last N days'
+    )
+    history_parser.add_argument(
+        '--rating',
+        choices=['STRONG BUY', 'BUY', 'HOLD', 'SELL', 'STRONG SELL'],
+        help='Only decisions with this final rating'
+    )
+    change_group = history_parser.add_mutually_exclusive_group()
+    change_group.add_argument(
+        '--downgrades',
+        action='store_true',
+        help='List rating downgrades vs. each ticker\'s previous decision'
+    )
+    change_group.add_argument(
+        '--upgrades',
+        action='store_true',
+        help='List rating upgrades vs. each ticker\'s previous decision'
+    )
+    history_parser.add_argument(
+        '--limit',
+        type=int,
+        default=50,
+        help='Maximum rows to show (default: 50)'
+    )
+
+    for cassette_parser in (analyze_parser, batch_parser, worker_parser, watch_parser):
+        add_cassette_arguments(cassette_parser)
+
     args = parser.parse_args()
+    if args.command in ('analyze', 'batch', 'worker', 'watch'):
+        apply_cassette_args(args)
 
     if args.command == 'analyze':
         run_analysis(args)
+    elif args.command == 'batch':
+        run_batch(args)
+    elif args.command == 'soak':
+        run_soak_test(args)
+    elif args.command == 'enqueue':
+        run_enqueue(args)
+    elif args.command == 'worker':
+        run_queue_worker(args)
+    elif args.command == 'watch':
+        run_watch(args)
+    elif args.command == 'archive':
+        run_archive(args)
+    elif args.command == 'backtest':
+        run_backtest_command(args)
+    elif args.command == 'history':
+        run_history(args)
     else:
         parser.print_help()
         sys.exit(1)
 
 
+def add_cassette_arguments(parser):
+    """Add the mutually exclusive --record/--replay/--replay-fast options."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        '--record',
+        metavar='PATH',
+        help='Record every LLM request/response (latency, tokens) to a cassette file'
+    )
+    group.add_argument(
+        '--replay',
+        metavar='PATH',
+        help='Serve LLM responses from a cassette at the recorded latency (no API calls)'
+    )
+    group.add_argument(
+        '--replay-fast',
+        metavar='PATH',
+        help='Serve LLM responses from a cassette as fast as possible (no API calls)'
+    )
+
+
+def apply_cassette_args(args):
+    """Point every LLM client at the cassette given on the command line."""
+    for mode, path in (('record', args.record), ('replay', args.replay), ('replay-fast', args.replay_fast)):
+        if path:
+            Config.LLM_CASSETTE, Config.LLM_CASSETTE_MODE = path, mode
+            # Spawned batch workers re-read Config from the environment
+            os.environ['LLM_CASSETTE'], os.environ['LLM_CASSETTE_MODE'] = path, mode
+
+
 def run_analysis(args):
     """Run investment committee analysis."""
 
@@ -103,7 +750,10 @@ def run_analysis(args):
     ticker = args.ticker.upper()
 
     # Determine mode
-    if args.mock:
+    if Config.is_replay_mode():
+        print(f"Mode: REPLAY (cassette {Config.LLM_CASSETTE}, {Config.LLM_CASSETTE_MODE})\n")
+        llm_client = get_llm_client()
+    elif args.mock:
         print(f"Mode: MOCK (using canned responses)\n")
         llm_client = get_llm_client(mock=True)
     else:
@@ -123,11 +773,30 @@ def run_analysis(args):
             print("  2. Use --mock flag for demo mode")
             sys.exit(1)
 
+    # Incremental mode caches fingerprinted outputs in the decision store
+    output_cache = None
+    if args.incremental:
+        output_cache = DecisionStore(args.store or Config.DECISION_STORE_PATH)
+
+    router = None
+    if args.route or Config.ROUTING_ENABLED:
+        router = ModelRouter.from_config(provider=args.provider, mock=args.mock)
+        print(
+            f"Routing: {router.model_name('cheap')} (cheap) -> "
+            f"{router.model_name('strong')} (strong)\n"
+        )
+
     # Create committee
     committee = InvestmentCommittee(
         llm_client=llm_client,
         disagreement_threshold=args.threshold,
         max_reconcile_rounds=args.max_rounds,
+        output_cache=output_cache,
+        data_provider=FixtureProvider(args.data_dir) if args.data_dir else None,
+        consensus_fast_path=True if args.fast_consensus else None,
+        router=router,
+        compact_prompts=True if args.compact else None,
+        profiler=PhaseProfiler() if args.profile else None,
     )
 
     # Run analysis
@@ -137,15 +806,29 @@ def run_analysis(args):
         # Print decision packet
         print("\n" + str(decision))
 
+        if Config.LLM_CASSETTE and Config.LLM_CASSETTE_MODE == 'record':
+            print(f"📼 Recorded LLM calls to cassette: {Config.LLM_CASSETTE}")
+
         # Save outputs if requested
         if args.json:
             save_outputs(ticker, decision)
 
+        if args.store:
+            with DecisionStore(args.store) as store:
+                store.append(decision)
+            print(f"\n💾 Stored decision in: {args.store}")
+
+        if committee.profiler is not None:
+            save_profile(ticker, committee.profiler, args.profile)
+
     except Exception as e:
         print(f"\n❌ Analysis failed: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        if output_cache is not None:
+            output_cache.close()
 
 
 def save_outputs(ticker: str, decision):
@@ -159,8 +842,7 @@ def save_outputs(ticker: str, decision):
     # Save JSON
     json_path = output_dir / f"{ticker}_{timestamp}.json"
     with open(json_path, 'w') as f:
-        # Convert to dict for JSON serialization
-        json.dump(decision.model_dump(), f, indent=2, default=str)
+        f.write(decision.model_dump_json(indent=2))
 
     print(f"\n💾 Saved JSON: {json_path}")
 
@@ -172,5 +854,504 @@ def save_outputs(ticker: str, decision):
     print(f"💾 Saved decision packet: {txt_path}")
 
 
+def save_profile(ticker: str, profiler, output_dir: str):
+    """Print phase timings and save the profile files."""
+    print("\n" + profiler.summary().split("\n\n", 1)[0])
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    paths = profiler.write(output_dir, f"{ticker}_{timestamp}")
+    print(f"\n🔥 Saved collapsed stacks: {paths['collapsed']} (flamegraph.pl / speedscope)")
+    print(f"🔥 Saved profile summary: {paths['summary']}")
+
+
+def read_tickers(args) -> list:
+    """Collect tickers from positional arguments and an optional file."""
+    tickers = list(args.tickers)
+    if args.file:
+        with open(args.file) as f:
+            tickers.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+    # De-duplicate, preserving order
+    return list(dict.fromkeys(t.upper() for t in tickers))
+
+
+def run_batch(args):
+    """Run the committee over a universe of tickers."""
+    tickers = read_tickers(args)
+    if not tickers:
+        print("No tickers given (pass tickers or --file)")
+        sys.exit(1)
+
+    if not args.mock:
+        try:
+            Config.validate()
+        except ValueError as e:
+            print(f"Configuration Error: {e}")
+            sys.exit(1)
+
+    peer_index = None
+    if args.peers:
+        # Peers come from the whole universe, before any pre-screen shortlist
+        provider = FixtureProvider(args.data_dir) if args.data_dir else None
+        print(f"\nBuilding peer index over {len(tickers)} tickers...")
+        peer_index = PeerIndex.from_universe(tickers, provider=provider)
+
+    if args.prescreen_top or args.prescreen_bottom or args.prescreen_state:
+        tickers = run_prescreen(args, tickers)
+        if not tickers:
+            print("No tickers passed the pre-screen")
+            return
+
+    if args.stream:
+        run_batch_stream(args, tickers, peer_index)
+        return
+
+    print(f"\nAnalyzing {len(tickers)} tickers ({args.backend} backend)...")
+    decisions, failures = run_universe(
+        tickers,
+        workers=args.workers,
+        backend=args.backend,
+        provider=args.provider,
+        model=args.model,
+        mock=args.mock,
+        disagreement_threshold=args.threshold,
+        max_reconcile_rounds=args.max_rounds,
+        data_dir=args.data_dir,
+        peer_index=peer_index,
+    )
+
+    print(f"\nDECISIONS ({len(decisions)}):")
+    print("-" * 60)
+    for decision in decisions:
+        print(
+            f"  {decision.ticker:8s}  {decision.final_rating:11s}  avg {decision.average_score:5.1f}"
+            f"  spread {decision.score_spread:3d}"
+        )
+
+    if failures:
+        print(f"\nFAILED ({len(failures)}):")
+        for ticker, error in failures.items():
+            print(f"  {ticker}: {error}")
+
+    if args.store:
+        with DecisionStore(args.store) as store:
+            store.append_many(decisions)
+        print(f"\n💾 Stored {len(decisions)} decisions in: {args.store}")
+
+    if args.output:
+        writer_kwargs = {"compression": args.compression} if args.compression else {}
+        with open_writer(args.output, format=args.format, **writer_kwargs) as writer:
+            writer.write_many(decisions)
+        print(f"\n💾 Wrote {writer.count} decisions to: {args.output}")
+
+
+def run_batch_stream(args, tickers, peer_index=None):
+    """Stream tickers through one committee into the store and/or output file."""
+    if not args.store and not args.output:
+        print("--stream needs a sink: pass --store and/or --output")
+        sys.exit(1)
+
+    llm_client = get_llm_client(provider=args.provider, model=args.model, mock=args.mock)
+    router = None
+    if Config.ROUTING_ENABLED:
+        router = ModelRouter.from_config(provider=args.provider, mock=args.mock)
+    committee = InvestmentCommittee(
+        llm_client=llm_client,
+        router=router,
+        disagreement_threshold=args.threshold,
+        max_reconcile_rounds=args.max_rounds,
+        data_provider=FixtureProvider(args.data_dir) if args.data_dir else None,
+        peer_index=peer_index,
+    )
+
+    with contextlib.ExitStack() as stack:
+        sinks = []
+        if args.store:
+            sinks.append(stack.enter_context(DecisionStore(args.store)).append)
+        if args.output:
+            writer_kwargs = {"compression": args.compression} if args.compression else {}
+            writer = stack.enter_context(
+                open_writer(args.output, format=args.format, **writer_kwargs)
+            )
+            sinks.append(writer.write)
+
+        def sink(decision):
+            for write in sinks:
+                write(decision)
+
+        print(f"\nStreaming {len(tickers)} tickers through the committee...")
+        print("-" * 60)
+        stats = run_pipeline(
+            committee, tickers, sink, max_in_flight=args.max_in_flight, verbose=True
+        )
+
+    print(
+        f"\n✓ {stats.decisions} decisions in {stats.elapsed_s:.1f}s "
+        f"(at most {stats.max_in_flight} tickers in flight)"
+    )
+    if stats.failures:
+        print(f"\nFAILED ({len(stats.failures)}):")
+        for ticker, error in stats.failures.items():
+            print(f"  {ticker}: {error}")
+    if args.store:
+        print(f"💾 Stored decisions in: {args.store}")
+    if args.output:
+        print(f"💾 Wrote decisions to: {args.output}")
+
+
+def run_prescreen(args, tickers):
+    """Score the universe quantitatively and return the shortlist for the committee."""
+    provider = FixtureProvider(args.data_dir) if args.data_dir else None
+
+    print(f"\nPre-screening {len(tickers)} tickers...")
+    screen = prescreen(tickers, provider=provider)
+    previous = load_scores(args.prescreen_state) if args.prescreen_state else None
+    shortlist = select_shortlist(
+        screen,
+        top_n=args.prescreen_top,
+        bottom_n=args.prescreen_bottom,
+        previous=previous,
+        min_change=Config.PRESCREEN_MIN_CHANGE,
+    )
+
+    print(f"\nSHORTLIST ({len(shortlist)} of {len(screen)}):")
+    print("-" * 60)
+    for ticker, reason in shortlist.items():
+        print(f"  {ticker:8s}  score {screen.at[ticker, 'score']:5.1f}  ({reason})")
+
+    if args.prescreen_state:
+        save_scores(screen, args.prescreen_state)
+
+    return list(shortlist)
+
+
+def run_soak_test(args):
+    """Run the soak test and exit non-zero if memory grew past the threshold."""
+    tickers = read_tickers(args) or ['SOAK1', 'SOAK2', 'SOAK3', 'SOAK4']
+
+    print(
+        f"\nSoak test: {args.mode} mode, {len(tickers)} tickers, {args.minutes:g} min, "
+        f"{args.latency_ms:g} ms mock latency"
+    )
+    report = run_soak(
+        duration_s=args.minutes * 60,
+        tickers=tickers,
+        data_dir=args.data_dir,
+        mode=args.mode,
+        sample_interval_s=args.interval,
+        max_growth_mb=args.max_growth_mb,
+        latency=args.latency_ms / 1000,
+        jitter=args.latency_ms / 4000,
+        top_n=args.top,
+    )
+    print(report)
+    if not report.passed:
+        sys.exit(1)
+
+
+def run_enqueue(args):
+    """Add tickers to the job queue."""
+    tickers = read_tickers(args)
+    if not tickers:
+        print("No tickers given (pass tickers or --file)")
+        sys.exit(1)
+
+    universe = args.universe
+    if universe is None:
+        # Repeat interactive requests must not be de-duplicated against old ones
+        universe = (
+            f"interactive-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}"
+            if args.priority == 'interactive' else 'default'
+        )
+
+    with SQLiteJobQueue(args.queue) as queue:
+        added = queue.enqueue(tickers, universe=universe, priority=args.priority)
+        stats = queue.stats(universe)
+
+    print(
+        f"Queued {added} new {args.priority} jobs in universe '{universe}' "
+        f"({len(tickers) - added} already present)"
+    )
+    print("  " + "  ".join(f"{status}: {count}" for status, count in stats.items()))
+
+
+def run_queue_worker(args):
+    """Drain the job queue, storing each decision."""
+    if args.mock:
+        llm_client = get_llm_client(mock=True)
+    else:
+        try:
+            Config.validate()
+        except ValueError as e:
+            print(f"Configuration Error: {e}")
+            sys.exit(1)
+        llm_client = get_llm_client(provider=args.provider, model=args.model)
+
+    router = None
+    if Config.ROUTING_ENABLED:
+        router = ModelRouter.from_config(provider=args.provider, mock=args.mock)
+
+    data_provider = FixtureProvider(args.data_dir) if args.data_dir else None
+
+    if args.scheduled:
+        run_scheduled_queue_worker(args, llm_client, router, data_provider)
+        return
+
+    committee = InvestmentCommittee(
+        llm_client=llm_client,
+        disagreement_threshold=args.threshold,
+        data_provider=data_provider,
+        router=router,
+    )
+
+    with SQLiteJobQueue(args.queue) as queue, DecisionStore(args.store) as store:
+        completed = run_worker(
+            queue,
+            committee,
+            store=store,
+            visibility_timeout=args.visibility_timeout,
+            exit_when_empty=args.exit_when_empty,
+        )
+        stats = queue.stats()
+
+    print(f"\nWorker finished: {completed} jobs completed")
+    print("  " + "  ".join(f"{status}: {count}" for status, count in stats.items()))
+
+
+def run_watch(args):
+    """Watch tickers and re-analyze on price/indicator triggers."""
+    tickers = read_tickers(args)
+    if not tickers:
+        print("No tickers given (pass symbols or --file)")
+        sys.exit(1)
+    if not args.prices and not args.stdin:
+        print(
+            "Nothing to watch: pass --prices PATH to poll a price store, --stdin for "
+            "pushed bars, or both (the store is then polled before each pushed line)"
+        )
+        sys.exit(1)
+
+    if args.mock or Config.is_replay_mode():
+        llm_client = get_llm_client(mock=args.mock)
+    else:
+        try:
+            Config.validate()
+        except ValueError as e:
+            print(f"Configuration Error: {e}")
+            sys.exit(1)
+        llm_client = get_llm_client(provider=args.provider, model=args.model)
+
+    price_store = PriceStore(args.prices) if args.prices else None
+    committee = InvestmentCommittee(
+        llm_client=llm_client,
+        disagreement_threshold=args.threshold,
+        data_provider=FixtureProvider(args.data_dir) if args.data_dir else None,
+        price_store=price_store,
+    )
+
+    with contextlib.ExitStack() as stack:
+        store = stack.enter_context(DecisionStore(args.store)) if args.store else None
+        watcher = Watcher(
+            committee,
+            price_store=price_store,
+            decision_store=store,
+            move_pct=args.move_pct,
+            escalate_delta=args.escalate_delta,
+        )
+        for ticker in tickers:
+            if not watcher.watch(ticker):
+                print(f"⚠️  No price history for {ticker}; not watching it")
+        if not watcher.tickers:
+            sys.exit(1)
+
+        print(
+            f"\nWatching {len(watcher.tickers)} tickers (move {watcher.move_pct:g}%, "
+            f"RSI 30/70, MACD flips; escalate on {watcher.escalate_delta}-point Technical shifts)"
+        )
+        try:
+            if args.stdin:
+                watcher.run_stream(sys.stdin, poll=price_store is not None)
+            else:
+                watcher.run(poll_interval=args.interval, max_polls=args.max_polls)
+        except KeyboardInterrupt:
+            pass
+
+    stats = watcher.stats
+    print(
+        f"\nWatch stopped: {stats['bars']} bars, {stats['technical_runs']} Technical runs, "
+        f"{stats['committee_runs']} committee runs, {stats['failures']} failed re-analyses"
+    )
+
+
+def run_archive(args):
+    """Capture today's fundamentals, prices and risk-free rate into the archive."""
+    tickers = read_tickers(args)
+    if not tickers:
+        print("No tickers given (pass tickers or --file)")
+        sys.exit(1)
+
+    source = FixtureProvider(args.data_dir) if args.data_dir else get_default_provider()
+    with SnapshotArchive(args.archive) as archive:
+        print(f"\nArchiving {len(tickers)} tickers into {args.archive}...")
+        captured = archive.capture(source, tickers, as_of=args.as_of, period=args.period)
+    print(f"💾 Archived fundamentals for {captured} of {len(tickers)} tickers")
+    if captured < len(tickers):
+        sys.exit(1)
+
+
+def run_backtest_command(args):
+    """Backtest the committee over the archive and report forward returns by rating."""
+    try:
+        horizons = [int(h) for h in args.horizons.split(',') if h.strip()]
+    except ValueError:
+        print(f"Invalid --horizons: {args.horizons} (expected e.g. 21,63)")
+        sys.exit(1)
+
+    if args.mock:
+        llm_client = get_llm_client(mock=True)
+    else:
+        try:
+            Config.validate()
+        except ValueError as e:
+            print(f"Configuration Error: {e}")
+            sys.exit(1)
+        llm_client = get_llm_client(provider=args.provider, model=args.model)
+
+    with contextlib.ExitStack() as stack:
+        archive = stack.enter_context(SnapshotArchive(args.archive))
+        tickers = read_tickers(args) or archive.tickers()
+        if not tickers:
+            print(f"Archive {args.archive} is empty (run committee-lite archive first)")
+            sys.exit(1)
+        dates = rebalance_dates(args.start, args.end, args.freq)
+        if not dates:
+            print(f"No {args.freq} dates between {args.start} and {args.end}")
+            sys.exit(1)
+
+        llm_cache = None if args.no_llm_cache else stack.enter_context(Cassette(args.llm_cache))
+        store = stack.enter_context(DecisionStore(args.store)) if args.store else None
+
+        print(
+            f"\nBacktesting {len(tickers)} tickers x {len(dates)} dates "
+            f"({dates[0]:%Y-%m-%d} -> {dates[-1]:%Y-%m-%d})..."
+        )
+        print("-" * 60)
+        report = run_backtest(
+            archive,
+            tickers,
+            dates,
+            llm_client=llm_client,
+            llm_cache=llm_cache,
+            workers=args.workers,
+            horizons=horizons,
+            disagreement_threshold=args.threshold,
+            max_reconcile_rounds=args.max_rounds,
+            store=store,
+            verbose=True,
+        )
+
+    print(report)
+    if report.failures:
+        print(f"\nFAILED ({len(report.failures)}):")
+        for key, error in report.failures.items():
+            print(f"  {key}: {error}")
+    if args.store:
+        print(f"\n💾 Stored decisions in: {args.store}")
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        report.to_frame().to_csv(args.output, index=False)
+        print(f"\n💾 Wrote {len(report.records)} decisions to: {args.output}")
+
+
+def run_scheduled_queue_worker(args, llm_client, router, data_provider):
+    """Drain the job queue with per-class job threads over one shared LLM budget."""
+    llm_scheduler = LLMScheduler(max_concurrent=args.llm_concurrency, requests_per_minute=args.rpm)
+
+    def make_committee(priority):
+        scheduled_router = None
+        if router is not None:
+            scheduled_router = ModelRouter(
+                {
+                    tier: ScheduledLLMClient(client, llm_scheduler, priority)
+                    for tier, client in router.tiers.items()
+                },
+                router.policy,
+            )
+        return InvestmentCommittee(
+            llm_client=ScheduledLLMClient(llm_client, llm_scheduler, priority),
+            disagreement_threshold=args.threshold,
+            data_provider=data_provider,
+            router=scheduled_router,
+        )
+
+    workers = {
+        'interactive': args.interactive_workers,
+        'batch': args.batch_workers or llm_scheduler.max_concurrent,
+    }
+    print(
+        f"Scheduled worker: {llm_scheduler.max_concurrent} LLM calls in flight, "
+        f"weights {llm_scheduler.weights}, job threads {workers}"
+    )
+
+    with CommitteeScheduler(make_committee, workers) as scheduler, \
+            SQLiteJobQueue(args.queue) as queue, DecisionStore(args.store) as store:
+        completed = run_scheduled_worker(
+            queue,
+            scheduler,
+            store=store,
+            visibility_timeout=args.visibility_timeout,
+            exit_when_empty=args.exit_when_empty,
+        )
+        stats = queue.stats()
+
+    print(f"\nWorker finished: {completed} jobs completed")
+    print("  " + "  ".join(f"{status}: {count}" for status, count in stats.items()))
+    for priority, call_stats in llm_scheduler.stats().items():
+        mean_wait = call_stats['wait_s'] / call_stats['calls'] if call_stats['calls'] else 0.0
+        print(
+            f"  {priority}: {call_stats['calls']} LLM calls, mean wait {mean_wait:.2f}s, "
+            f"max wait {call_stats['max_wait_s']:.2f}s"
+        )
+
+
+def run_history(args):
+    """Print stored decisions or rating changes from the decision store."""
+    if not Path(args.store).exists():
+        print(f"No decision store found at {args.store}")
+        sys.exit(1)
+
+    since = datetime.now() - timedelta(days=args.days) if args.days else datetime.min
+
+    with DecisionStore(args.store) as store:
+        if args.downgrades or args.upgrades:
+            direction = "downgrade" if args.downgrades else "upgrade"
+            changes = store.rating_changes(since, direction=direction)
+            if args.ticker:
+                changes = [c for c in changes if c["ticker"] == args.ticker.upper()]
+            print(f"\n{direction.upper()}S ({len(changes)}):")
+            print("-" * 60)
+            for change in changes[:args.limit]:
+                print(
+                    f"  {change['timestamp'].strftime('%Y-%m-%d %H:%M')}  {change['ticker']:8s}"
+                    f"  {change['previous_rating']} → {change['final_rating']}"
+                )
+            return
+
+        rows = store.query(
+            ticker=args.ticker,
+            since=since if args.days else None,
+            rating=args.rating,
+            limit=args.limit,
+        )
+
+    print(f"\nDECISIONS ({len(rows)}):")
+    print("-" * 60)
+    for row in rows:
+        print(
+            f"  {row['timestamp'].strftime('%Y-%m-%d %H:%M')}  {row['ticker']:8s}"
+            f"  {row['final_rating']:11s}  avg {row['average_score']:5.1f}"
+            f"  spread {row['score_spread']:3d}"
+        )
+
+
 if __name__ == "__main__":
     main()
@@ -23,10 +23,72 @@ class Config:
 
     # Committee Configuration
     DISAGREEMENT_THRESHOLD: int = int(os.getenv("DISAGREEMENT_THRESHOLD", "15"))
-    MAX_RECONCILE_ROUNDS: int = int(os.getenv("MAX_RECONCILE_ROUNDS", "1"))
+    MAX_RECONCILE_ROUNDS: int = int(os.getenv("MAX_RECONCILE_ROUNDS", "3"))
+    RECONCILE_TIMEOUT: float = float(os.getenv("RECONCILE_TIMEOUT", "60"))  # seconds, 0 = none
+    RECONCILE_TOKEN_BUDGET: int = int(os.getenv("RECONCILE_TOKEN_BUDGET", "10000"))  # 0 = none
+
+    # Consensus fast path: skip the PM LLM call for clear-cut committees
+    CONSENSUS_FAST_PATH: bool = os.getenv("CONSENSUS_FAST_PATH", "false").lower() == "true"
+    CONSENSUS_MAX_SPREAD: int = int(os.getenv("CONSENSUS_MAX_SPREAD", "5"))
+    CONSENSUS_MIN_CONFIDENCE: Literal["Low", "Medium", "High"] = os.getenv(
+        "CONSENSUS_MIN_CONFIDENCE", "High"
+    )
+
+    # Tiered model routing (cheap specialists, strong model on escalation)
+    ROUTING_ENABLED: bool = os.getenv("ROUTING_ENABLED", "false").lower() == "true"
+    ROUTING_CHEAP_MODEL: str = os.getenv("ROUTING_CHEAP_MODEL", "")
+    ROUTING_STRONG_MODEL: str = os.getenv("ROUTING_STRONG_MODEL", "")
+
+    # LLM cassette: record every exchange to / replay from this SQLite file
+    LLM_CASSETTE: str = os.getenv("LLM_CASSETTE", "")
+    LLM_CASSETTE_MODE: Literal["record", "replay", "replay-fast"] = os.getenv(
+        "LLM_CASSETTE_MODE", "record"
+    )
+
+    # Compact prompts: terse key=value data, no N/A rows, capped PM bullets
+    PROMPT_COMPACT: bool = os.getenv("PROMPT_COMPACT", "false").lower() == "true"
+    PROMPT_MAX_BULLET_CHARS: int = int(os.getenv("PROMPT_MAX_BULLET_CHARS", "120"))
+
+    # Pre-screen: promote tickers whose score moved at least this much (0-100)
+    PRESCREEN_MIN_CHANGE: float = float(os.getenv("PRESCREEN_MIN_CHANGE", "10"))
+
+    # Market Data
+    # "yfinance", "fixture" (offline), or "fixture+yfinance" (fixtures first)
+    MARKET_DATA_PROVIDER: str = os.getenv("MARKET_DATA_PROVIDER", "yfinance")
+    MARKET_DATA_FIXTURES: str = os.getenv("MARKET_DATA_FIXTURES", "")
+    DATA_CACHE_TTL: int = int(os.getenv("DATA_CACHE_TTL", "900"))  # seconds
+    # Most fundamentals snapshots / price histories kept in memory (each)
+    DATA_CACHE_MAX_ENTRIES: int = int(os.getenv("DATA_CACHE_MAX_ENTRIES", "2048"))
+
+    # Decision Store
+    DECISION_STORE_PATH: str = os.getenv("DECISION_STORE_PATH", "outputs/decisions.db")
+
+    # Job Queue
+    JOB_QUEUE_PATH: str = os.getenv("JOB_QUEUE_PATH", "outputs/jobs.db")
+    JOB_VISIBILITY_TIMEOUT: int = int(os.getenv("JOB_VISIBILITY_TIMEOUT", "300"))
+
+    # Scheduling (shared LLM budget for interactive and batch work)
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+    LLM_REQUESTS_PER_MINUTE: float = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "0"))  # 0 = no limit
+    SCHEDULER_WEIGHTS: str = os.getenv("SCHEDULER_WEIGHTS", "interactive:8,batch:1")
+
+    # Streaming Pipeline
+    PIPELINE_MAX_IN_FLIGHT: int = int(os.getenv("PIPELINE_MAX_IN_FLIGHT", "2"))  # tickers
+
+    # Backtesting
+    ARCHIVE_PATH: str = os.getenv("ARCHIVE_PATH", "outputs/archive")
+    BACKTEST_LLM_CACHE: str = os.getenv("BACKTEST_LLM_CACHE", "outputs/backtest_llm.cassette")
+    BACKTEST_WORKERS: int = int(os.getenv("BACKTEST_WORKERS", "8"))  # threads
+
+    # Watch Daemon
+    WATCH_MOVE_PCT: float = float(os.getenv("WATCH_MOVE_PCT", "5"))  # % move since last run
+    WATCH_ESCALATE_DELTA: int = int(os.getenv("WATCH_ESCALATE_DELTA", "10"))  # Technical score shift
+    WATCH_POLL_INTERVAL: float = float(os.getenv("WATCH_POLL_INTERVAL", "60"))  # seconds
 
     # Mock Mode
     MOCK_MODE: bool = os.getenv("MOCK_MODE", "false").lower() == "true"
+    MOCK_LATENCY: float = float(os.getenv("MOCK_LATENCY", "0"))  # seconds per mock call
+    MOCK_LATENCY_JITTER: float = float(os.getenv("MOCK_LATENCY_JITTER", "0"))  # +/- seconds
 
     @classmethod
     def get_active_api_key(cls) -> str:
@@ -50,6 +112,11 @@ class Config:
             return True
         return cls.MOCK_MODE
 
+    @classmethod
+    def is_replay_mode(cls) -> bool:
+        """Check if LLM responses are served from a cassette (no API calls)."""
+        return bool(cls.LLM_CASSETTE) and cls.LLM_CASSETTE_MODE != "record"
+
     @classmethod
     def validate(cls) -> None:
         """Validate configuration."""
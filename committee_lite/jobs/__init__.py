@@ -0,0 +1,19 @@
+"""Job queue backends and workers for distributed batch analysis."""
+
+from committee_lite.jobs.base import PRIORITY_CLASSES, Job, JobQueue, make_job_id
+from committee_lite.jobs.sqlite_queue import SQLiteJobQueue
+from committee_lite.jobs.scheduler import CommitteeScheduler, LLMScheduler, ScheduledLLMClient
+from committee_lite.jobs.worker import run_scheduled_worker, run_worker
+
+__all__ = [
+    "PRIORITY_CLASSES",
+    "Job",
+    "JobQueue",
+    "make_job_id",
+    "SQLiteJobQueue",
+    "CommitteeScheduler",
+    "LLMScheduler",
+    "ScheduledLLMClient",
+    "run_worker",
+    "run_scheduled_worker",
+]
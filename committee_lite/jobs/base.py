@@ -0,0 +1,117 @@
+"""Job queue interface for distributing committee runs across workers.
+
+The interface follows the lease model used by Redis/SQS-style brokers: a
+claimed job is invisible to other workers until its visibility timeout
+expires, workers extend the lease with heartbeats while they work, and a job
+whose lease lapses (e.g. the worker died) becomes claimable again.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
+
+from pydantic import BaseModel, Field
+
+# Priority classes, most urgent first. Interactive requests are claimed ahead
+# of batch jobs and their LLM calls are weighted ahead by the scheduler.
+PRIORITY_CLASSES = ("interactive", "batch")
+
+
+class Job(BaseModel):
+    """A single ticker analysis job."""
+
+    job_id: str = Field(..., description="Idempotency key ('<universe>:<TICKER>')")
+    universe: str = Field(..., description="Universe/batch this job belongs to")
+    ticker: str = Field(..., description="Stock ticker to analyze")
+    attempts: int = Field(0, description="Number of times this job has been claimed")
+    priority: str = Field("batch", description="Priority class (see PRIORITY_CLASSES)")
+
+
+def make_job_id(universe: str, ticker: str) -> str:
+    """Build the idempotency key for a ticker job."""
+    return f"{universe}:{ticker.upper()}"
+
+
+class JobQueue(ABC):
+    """Abstract base class for job queue backends."""
+
+    @abstractmethod
+    def enqueue(
+        self, tickers: Iterable[str], universe: str = "default", priority: str = "batch"
+    ) -> int:
+        """
+        Add ticker jobs to a universe. Tickers already queued for the universe
+        are ignored, so re-submitting a universe is safe.
+
+        Args:
+            tickers: Tickers to analyze
+            universe: Universe/batch name
+            priority: Priority class (see PRIORITY_CLASSES)
+
+        Returns:
+            Number of newly added jobs
+        """
+        pass
+
+    @abstractmethod
+    def claim(
+        self, worker_id: str, visibility_timeout: float, priority: Optional[str] = None
+    ) -> Optional[Job]:
+        """
+        Lease the next available job, most urgent priority class first.
+
+        Args:
+            worker_id: Claiming worker
+            visibility_timeout: Seconds before the job becomes claimable again
+            priority: Only claim jobs of this priority class
+
+        Returns:
+            Job, or None if nothing is available
+        """
+        pass
+
+    @abstractmethod
+    def heartbeat(
+        self, worker_id: str, job_id: Optional[str] = None, visibility_timeout: float = 300.0
+    ) -> bool:
+        """
+        Record worker liveness and extend the lease on its current job.
+
+        Args:
+            worker_id: Worker sending the heartbeat
+            job_id: Job whose lease to extend (None for an idle heartbeat)
+            visibility_timeout: New lease length in seconds
+
+        Returns:
+            False if the worker no longer holds the job's lease
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: str, worker_id: str) -> bool:
+        """
+        Mark a leased job as done.
+
+        Returns:
+            False if the worker no longer held the lease
+        """
+        pass
+
+    @abstractmethod
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """
+        Report a failed attempt. The job is retried until max attempts.
+
+        Returns:
+            False if the worker no longer held the lease
+        """
+        pass
+
+    @abstractmethod
+    def stats(self, universe: Optional[str] = None) -> Dict[str, int]:
+        """Count jobs by status ("pending", "running", "done", "failed")."""
+        pass
+
+    @abstractmethod
+    def workers(self) -> List[Dict[str, object]]:
+        """List known workers with their last heartbeat and current job."""
+        pass
@@ -0,0 +1,306 @@
+"""Priority-aware scheduling of committee jobs and their LLM calls.
+
+Interactive and batch work share one LLM budget. LLMScheduler is the gate
+every LLM call passes through: it caps concurrent calls (and optionally
+requests per minute) and, when callers of several priority classes are
+waiting, grants slots by weighted fair queuing. A slot is held for a single
+call only, so a batch committee run is preempted at its next call boundary
+whenever interactive calls are waiting, and resumes afterwards.
+
+CommitteeScheduler runs committee jobs on separate worker threads per
+priority class, so an interactive job never waits for a batch thread to free
+up; contention is resolved call by call at the LLMScheduler.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, TypeVar
+
+from committee_lite.config import Config
+from committee_lite.jobs.base import PRIORITY_CLASSES
+from committee_lite.llm.client import LLMClient
+from committee_lite.orchestrator import InvestmentCommittee
+
+T = TypeVar("T")
+
+
+def parse_weights(spec: str) -> Dict[str, float]:
+    """
+    Parse priority class weights, e.g. "interactive:8,batch:1".
+
+    Args:
+        spec: Comma-separated class:weight pairs
+
+    Returns:
+        Dict of class -> weight, in PRIORITY_CLASSES order
+    """
+    weights = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, _, value = part.partition(":")
+        name = name.strip()
+        if name not in PRIORITY_CLASSES:
+            raise ValueError(f"Unknown priority class: {name}")
+        weights[name] = float(value)
+        if weights[name] <= 0:
+            raise ValueError(f"Weight for {name} must be positive")
+    missing = set(PRIORITY_CLASSES) - set(weights)
+    if missing:
+        raise ValueError(f"No weight for priority classes: {', '.join(sorted(missing))}")
+    return {name: weights[name] for name in PRIORITY_CLASSES}
+
+
+class LLMScheduler:
+    """Shared LLM call budget with weighted fair sharing across priority classes."""
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+        weights: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrent: Calls in flight at once (default: Config.LLM_MAX_CONCURRENCY)
+            requests_per_minute: Call start rate limit (default: Config.LLM_REQUESTS_PER_MINUTE;
+                0 = unlimited)
+            weights: Priority class -> share of slots while several classes wait
+                (default: Config.SCHEDULER_WEIGHTS)
+        """
+        self.max_concurrent = max_concurrent or Config.LLM_MAX_CONCURRENCY
+        self.requests_per_minute = (
+            Config.LLM_REQUESTS_PER_MINUTE if requests_per_minute is None else requests_per_minute
+        )
+        self.weights = dict(weights or parse_weights(Config.SCHEDULER_WEIGHTS))
+
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._waiting: Dict[str, deque] = {name: deque() for name in self.weights}
+        # Stride scheduling: each grant advances the class's pass by 1/weight and
+        # the waiting class with the lowest pass goes next
+        self._pass: Dict[str, float] = {name: 0.0 for name in self.weights}
+        self._virtual_time = 0.0
+        # Token bucket for the request rate (burst of max_concurrent calls)
+        self._tokens = float(self.max_concurrent)
+        self._refilled_at = time.monotonic()
+        self._stats = {
+            name: {"calls": 0, "wait_s": 0.0, "max_wait_s": 0.0} for name in self.weights
+        }
+
+    @contextmanager
+    def slot(self, priority: str) -> Iterator[None]:
+        """Hold one call slot for the duration of the block."""
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def acquire(self, priority: str) -> float:
+        """
+        Block until a call slot is granted to this priority class.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if priority not in self.weights:
+            raise ValueError(f"Unknown priority class: {priority}")
+
+        ticket = object()
+        start = time.monotonic()
+        with self._cond:
+            if not self._waiting[priority]:
+                # A class that was idle doesn't bank credit for the idle time
+                self._pass[priority] = max(self._pass[priority], self._virtual_time)
+            self._waiting[priority].append(ticket)
+
+            while not (
+                self._next_ticket() is ticket
+                and self._in_flight < self.max_concurrent
+                and self._take_token()
+            ):
+                self._cond.wait(timeout=self._token_wait())
+
+            self._waiting[priority].popleft()
+            self._in_flight += 1
+            self._virtual_time = self._pass[priority]
+            self._pass[priority] += 1.0 / self.weights[priority]
+
+            waited = time.monotonic() - start
+            stats = self._stats[priority]
+            stats["calls"] += 1
+            stats["wait_s"] += waited
+            stats["max_wait_s"] = max(stats["max_wait_s"], waited)
+            # The head of the line changed
+            self._cond.notify_all()
+        return waited
+
+    def release(self) -> None:
+        """Return a call slot."""
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-class granted calls, total and maximum wait in seconds."""
+        with self._cond:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def _next_ticket(self) -> Optional[object]:
+        """Head of the waiting class with the lowest pass (caller holds the lock)."""
+        waiting = [name for name in self.weights if self._waiting[name]]
+        if not waiting:
+            return None
+        return self._waiting[min(waiting, key=lambda name: self._pass[name])][0]
+
+    def _take_token(self) -> bool:
+        """Spend a rate-limit token if one is available (caller holds the lock)."""
+        if not self.requests_per_minute:
+            return True
+        now = time.monotonic()
+        rate = self.requests_per_minute / 60.0
+        self._tokens = min(
+            float(self.max_concurrent), self._tokens + (now - self._refilled_at) * rate
+        )
+        self._refilled_at = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+    def _token_wait(self) -> Optional[float]:
+        """Seconds until the next rate-limit token (None = wait for a notify)."""
+        if not self.requests_per_minute or self._tokens >= 1.0:
+            return None
+        return (1.0 - self._tokens) / (self.requests_per_minute / 60.0)
+
+
+class ScheduledLLMClient(LLMClient):
+    """Routes every call of a wrapped client through an LLMScheduler."""
+
+    def __init__(self, inner: LLMClient, scheduler: LLMScheduler, priority: str = "batch"):
+        """
+        Initialize scheduled client.
+
+        Args:
+            inner: Client that makes the calls
+            scheduler: Shared call scheduler
+            priority: Priority class of this client's calls
+        """
+        if priority not in scheduler.weights:
+            raise ValueError(f"Unknown priority class: {priority}")
+        self.inner = inner
+        self.scheduler = scheduler
+        self.priority = priority
+        self.model = getattr(inner, "model", type(inner).__name__)
+
+    def complete(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+    ) -> str:
+        """Wait for a call slot, then call the wrapped client."""
+        with self.scheduler.slot(self.priority):
+            return self.inner.complete(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+
+
+class CommitteeScheduler:
+    """Runs committee jobs on per-priority-class worker threads."""
+
+    def __init__(
+        self,
+        committee_factory: Callable[[str], InvestmentCommittee],
+        workers: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize job scheduler.
+
+        Args:
+            committee_factory: Builds a committee for a priority class, with its
+                LLM calls going through a ScheduledLLMClient of that class. Each
+                worker thread builds its own (committees are not thread-safe).
+            workers: Priority class -> worker threads (default: 1 interactive,
+                Config.LLM_MAX_CONCURRENCY batch)
+        """
+        self.committee_factory = committee_factory
+        self.workers = workers or {"interactive": 1, "batch": Config.LLM_MAX_CONCURRENCY}
+        unknown = set(self.workers) - set(PRIORITY_CLASSES)
+        if unknown:
+            raise ValueError(f"Unknown priority classes: {', '.join(sorted(unknown))}")
+
+        self._executors = {
+            name: ThreadPoolExecutor(max_workers=count, thread_name_prefix=f"{name}-job")
+            for name, count in self.workers.items()
+        }
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._active = {name: 0 for name in self.workers}
+
+    def __enter__(self) -> "CommitteeScheduler":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+    def capacity(self, priority: str) -> int:
+        """Idle worker threads of a priority class."""
+        with self._lock:
+            return self.workers.get(priority, 0) - self._active.get(priority, 0)
+
+    def submit(self, ticker: str, priority: str = "batch") -> Future:
+        """
+        Queue a committee analysis.
+
+        Returns:
+            Future resolving to the FinalDecision
+        """
+        return self.run(priority, lambda committee: committee.analyze(ticker))
+
+    def run(self, priority: str, fn: Callable[[InvestmentCommittee], T]) -> Future:
+        """
+        Queue a job that runs fn on a worker's committee of the given class.
+
+        Returns:
+            Future resolving to fn's result
+        """
+        if priority not in self._executors:
+            raise ValueError(f"No workers for priority class: {priority}")
+        with self._lock:
+            self._active[priority] += 1
+        try:
+            return self._executors[priority].submit(self._run_job, priority, fn)
+        except Exception:
+            with self._lock:
+                self._active[priority] -= 1
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads (after queued jobs finish, if wait)."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait)
+
+    def _run_job(self, priority: str, fn: Callable[[InvestmentCommittee], T]) -> T:
+        """Run a job on this thread's committee for the class."""
+        try:
+            committees = getattr(self._local, "committees", None)
+            if committees is None:
+                committees = self._local.committees = {}
+            if priority not in committees:
+                committees[priority] = self.committee_factory(priority)
+            return fn(committees[priority])
+        finally:
+            with self._lock:
+                self._active[priority] -= 1
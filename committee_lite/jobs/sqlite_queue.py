@@ -0,0 +1,234 @@
+"""SQLite job queue backend.
+
+Suitable for several worker processes on one host, or on hosts sharing a
+filesystem with working POSIX locks. Larger deployments should implement
+JobQueue on top of a broker (Redis, SQS) with the same lease semantics.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from committee_lite.jobs.base import PRIORITY_CLASSES, Job, JobQueue, make_job_id
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    universe TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    priority TEXT NOT NULL DEFAULT 'batch',
+    worker_id TEXT,
+    lease_expires REAL,
+    enqueued_at REAL NOT NULL,
+    finished_at REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, enqueued_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_universe ON jobs (universe, status);
+
+CREATE TABLE IF NOT EXISTS workers (
+    worker_id TEXT PRIMARY KEY,
+    last_heartbeat REAL NOT NULL,
+    current_job TEXT
+);
+"""
+
+
+class SQLiteJobQueue(JobQueue):
+    """Job queue backed by a local SQLite file."""
+
+    def __init__(self, path: str = "outputs/jobs.db", max_attempts: int = 3):
+        """
+        Open (or create) a job queue.
+
+        Args:
+            path: SQLite database file
+            max_attempts: Claims allowed per job before it is marked failed
+        """
+        self.path = str(path)
+        self.max_attempts = max_attempts
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Autocommit mode so claims can take an explicit write lock
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+        # Queues created before priority classes existed
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "priority" not in columns:
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN priority TEXT NOT NULL DEFAULT 'batch'")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_priority ON jobs (status, priority, enqueued_at)"
+        )
+
+    def __enter__(self) -> "SQLiteJobQueue":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def enqueue(
+        self, tickers: Iterable[str], universe: str = "default", priority: str = "batch"
+    ) -> int:
+        """Add ticker jobs, ignoring tickers already queued for the universe."""
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(f"Unknown priority class: {priority}")
+        now = time.time()
+        rows = [
+            (make_job_id(universe, ticker), universe, ticker.upper(), priority, now)
+            for ticker in tickers
+        ]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO jobs (job_id, universe, ticker, priority, enqueued_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute("COMMIT")
+            return self._conn.total_changes - before
+
+    def claim(
+        self, worker_id: str, visibility_timeout: float, priority: Optional[str] = None
+    ) -> Optional[Job]:
+        """Lease the oldest pending (or lease-expired) job of the most urgent class."""
+        now = time.time()
+        rank = "CASE priority " + " ".join(
+            f"WHEN '{name}' THEN {i}" for i, name in enumerate(PRIORITY_CLASSES)
+        ) + f" ELSE {len(PRIORITY_CLASSES)} END"
+        where = "(status = 'pending' OR (status = 'running' AND lease_expires < ?))"
+        params = [now]
+        if priority is not None:
+            where += " AND priority = ?"
+            params.append(priority)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Expired leases that have used up their attempts are given up on
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'failed', finished_at = ?, "
+                    "error = COALESCE(error, 'lease expired') "
+                    "WHERE status = 'running' AND lease_expires < ? AND attempts >= ?",
+                    (now, now, self.max_attempts),
+                )
+                row = self._conn.execute(
+                    f"SELECT job_id, universe, ticker, attempts, priority FROM jobs "
+                    f"WHERE {where} ORDER BY {rank}, enqueued_at, job_id LIMIT 1",
+                    params,
+                ).fetchone()
+
+                if row is None:
+                    self._touch_worker(worker_id, None, now)
+                    self._conn.execute("COMMIT")
+                    return None
+
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'running', worker_id = ?, lease_expires = ?, "
+                    "attempts = attempts + 1 WHERE job_id = ?",
+                    (worker_id, now + visibility_timeout, row["job_id"]),
+                )
+                self._touch_worker(worker_id, row["job_id"], now)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return Job(
+            job_id=row["job_id"],
+            universe=row["universe"],
+            ticker=row["ticker"],
+            attempts=row["attempts"] + 1,
+            priority=row["priority"],
+        )
+
+    def heartbeat(
+        self, worker_id: str, job_id: Optional[str] = None, visibility_timeout: float = 300.0
+    ) -> bool:
+        """Record worker liveness and extend the lease on its current job."""
+        now = time.time()
+        with self._lock:
+            self._touch_worker(worker_id, job_id, now)
+            if job_id is None:
+                return True
+            cursor = self._conn.execute(
+                "UPDATE jobs SET lease_expires = ? "
+                "WHERE job_id = ? AND worker_id = ? AND status = 'running'",
+                (now + visibility_timeout, job_id, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: str, worker_id: str) -> bool:
+        """Mark a leased job as done."""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = 'done', finished_at = ?, lease_expires = NULL, error = NULL "
+                "WHERE job_id = ? AND worker_id = ? AND status = 'running'",
+                (now, job_id, worker_id),
+            )
+            self._touch_worker(worker_id, None, now)
+            return cursor.rowcount == 1
+
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """Report a failed attempt; retried until max_attempts."""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET "
+                "status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "finished_at = CASE WHEN attempts >= ? THEN ? ELSE NULL END, "
+                "lease_expires = NULL, error = ? "
+                "WHERE job_id = ? AND worker_id = ? AND status = 'running'",
+                (self.max_attempts, self.max_attempts, now, error, job_id, worker_id),
+            )
+            self._touch_worker(worker_id, None, now)
+            return cursor.rowcount == 1
+
+    def stats(self, universe: Optional[str] = None) -> Dict[str, int]:
+        """Count jobs by status."""
+        sql = "SELECT status, COUNT(*) AS n FROM jobs"
+        params = []
+        if universe is not None:
+            sql += " WHERE universe = ?"
+            params.append(universe)
+        sql += " GROUP BY status"
+
+        counts = {"pending": 0, "running": 0, "done": 0, "failed": 0}
+        with self._lock:
+            for row in self._conn.execute(sql, params):
+                counts[row["status"]] = row["n"]
+        return counts
+
+    def workers(self) -> List[Dict[str, object]]:
+        """List known workers with their last heartbeat and current job."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT worker_id, last_heartbeat, current_job FROM workers "
+                "ORDER BY last_heartbeat DESC"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def _touch_worker(self, worker_id: str, job_id: Optional[str], now: float) -> None:
+        """Upsert a worker's heartbeat row (caller holds the lock)."""
+        self._conn.execute(
+            "INSERT INTO workers (worker_id, last_heartbeat, current_job) VALUES (?, ?, ?) "
+            "ON CONFLICT(worker_id) DO UPDATE SET "
+            "last_heartbeat = excluded.last_heartbeat, current_job = excluded.current_job",
+            (worker_id, now, job_id),
+        )
@@ -0,0 +1,195 @@
+"""Queue worker that drains ticker jobs through an InvestmentCommittee."""
+
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Optional
+
+from committee_lite.jobs.base import PRIORITY_CLASSES, JobQueue
+from committee_lite.jobs.scheduler import CommitteeScheduler
+from committee_lite.orchestrator import InvestmentCommittee
+
+
+def default_worker_id() -> str:
+    """Build a worker id that is unique across hosts and processes."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class _Heartbeat:
+    """Background thread that keeps a job's lease alive while it runs."""
+
+    def __init__(self, queue: JobQueue, worker_id: str, job_id: str, visibility_timeout: float):
+        self.queue = queue
+        self.worker_id = worker_id
+        self.job_id = job_id
+        self.visibility_timeout = visibility_timeout
+        self.lease_lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "_Heartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        interval = max(self.visibility_timeout / 3, 0.05)
+        while not self._stop.wait(interval):
+            if not self.queue.heartbeat(self.worker_id, self.job_id, self.visibility_timeout):
+                self.lease_lost = True
+                return
+
+
+def run_worker(
+    queue: JobQueue,
+    committee: InvestmentCommittee,
+    store=None,
+    worker_id: Optional[str] = None,
+    visibility_timeout: float = 300.0,
+    poll_interval: float = 5.0,
+    max_jobs: Optional[int] = None,
+    exit_when_empty: bool = False,
+) -> int:
+    """
+    Claim and run jobs until stopped.
+
+    Decisions are appended to the store before the job is acknowledged, so a
+    worker that dies mid-job leaves the ticker to be re-run (at-least-once).
+
+    Args:
+        queue: Job queue to drain
+        committee: Committee used to analyze each ticker
+        store: Optional DecisionStore for results
+        worker_id: Worker identity (default: host:pid:random)
+        visibility_timeout: Lease length in seconds, extended by heartbeats
+        poll_interval: Seconds to sleep when the queue is empty
+        max_jobs: Stop after this many jobs
+        exit_when_empty: Stop as soon as no job is available
+
+    Returns:
+        Number of jobs completed by this worker
+    """
+    worker_id = worker_id or default_worker_id()
+    completed = 0
+
+    while max_jobs is None or completed < max_jobs:
+        job = queue.claim(worker_id, visibility_timeout)
+        if job is None:
+            if exit_when_empty:
+                break
+            time.sleep(poll_interval)
+            continue
+
+        print(f"[{worker_id}] {job.ticker} (attempt {job.attempts})")
+
+        try:
+            with _Heartbeat(queue, worker_id, job.job_id, visibility_timeout) as heartbeat:
+                decision = committee.analyze(job.ticker)
+        except Exception as e:
+            queue.fail(job.job_id, worker_id, str(e))
+            print(f"[{worker_id}] {job.ticker} failed: {e}")
+            continue
+
+        if heartbeat.lease_lost:
+            # Another worker has taken over this job; let it record the result
+            print(f"[{worker_id}] {job.ticker} lease lost, discarding result")
+            continue
+
+        if store is not None:
+            store.append(decision)
+        if queue.complete(job.job_id, worker_id):
+            completed += 1
+
+    return completed
+
+
+def run_scheduled_worker(
+    queue: JobQueue,
+    scheduler: CommitteeScheduler,
+    store=None,
+    worker_id: Optional[str] = None,
+    visibility_timeout: float = 300.0,
+    poll_interval: float = 1.0,
+    max_jobs: Optional[int] = None,
+    exit_when_empty: bool = False,
+) -> int:
+    """
+    Claim jobs for every priority class with idle threads and run them concurrently.
+
+    Interactive jobs are claimed as soon as an interactive thread is idle,
+    even while batch jobs are running; their LLM calls then overtake the
+    batch jobs' calls at the shared LLMScheduler. Results are stored and
+    acknowledged as in run_worker().
+
+    Args:
+        queue: Job queue to drain
+        scheduler: CommitteeScheduler with per-class worker threads
+        store: Optional DecisionStore for results
+        worker_id: Worker identity (default: host:pid:random)
+        visibility_timeout: Lease length in seconds, extended by heartbeats
+        poll_interval: Seconds between claim attempts while nothing finishes
+        max_jobs: Stop claiming after this many jobs
+        exit_when_empty: Stop once no job is available and none is running
+
+    Returns:
+        Number of jobs completed by this worker
+    """
+    worker_id = worker_id or default_worker_id()
+    completed = 0
+    claimed = 0
+    running = {}  # future -> (job, heartbeat)
+
+    while True:
+        for priority in PRIORITY_CLASSES:
+            while (max_jobs is None or claimed < max_jobs) and scheduler.capacity(priority) > 0:
+                job = queue.claim(worker_id, visibility_timeout, priority=priority)
+                if job is None:
+                    break
+                claimed += 1
+                print(f"[{worker_id}] {job.ticker} ({job.priority}, attempt {job.attempts})")
+                heartbeat = _Heartbeat(queue, worker_id, job.job_id, visibility_timeout)
+                running[scheduler.run(priority, _with_heartbeat(heartbeat, job.ticker))] = (
+                    job,
+                    heartbeat,
+                )
+
+        if not running:
+            if exit_when_empty or (max_jobs is not None and claimed >= max_jobs):
+                break
+            time.sleep(poll_interval)
+            continue
+
+        done, _ = wait(list(running), timeout=poll_interval, return_when=FIRST_COMPLETED)
+        for future in done:
+            job, heartbeat = running.pop(future)
+            try:
+                decision = future.result()
+            except Exception as e:
+                queue.fail(job.job_id, worker_id, str(e))
+                print(f"[{worker_id}] {job.ticker} failed: {e}")
+                continue
+            if heartbeat.lease_lost:
+                print(f"[{worker_id}] {job.ticker} lease lost, discarding result")
+                continue
+            if store is not None:
+                store.append(decision)
+            if queue.complete(job.job_id, worker_id):
+                completed += 1
+
+    return completed
+
+
+def _with_heartbeat(heartbeat: _Heartbeat, ticker: str):
+    """Job function that analyzes a ticker while keeping its lease alive."""
+
+    def job(committee):
+        with heartbeat:
+            return committee.analyze(ticker)
+
+    return job
@@ -1,5 +1,24 @@
 """LLM client abstraction layer."""
 
-from committee_lite.llm.client import LLMClient, get_llm_client
+from committee_lite.llm.client import LLMClient, estimate_tokens, get_llm_client
+from committee_lite.llm.router import ModelRouter, RoutingPolicy
+from committee_lite.llm.cassette import (
+    Cassette,
+    CassetteMiss,
+    RecordingClient,
+    ReplayClient,
+    CachingClient,
+)
 
-__all__ = ["LLMClient", "get_llm_client"]
+__all__ = [
+    "LLMClient",
+    "estimate_tokens",
+    "get_llm_client",
+    "ModelRouter",
+    "RoutingPolicy",
+    "Cassette",
+    "CassetteMiss",
+    "RecordingClient",
+    "ReplayClient",
+    "CachingClient",
+]
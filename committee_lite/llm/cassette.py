@@ -0,0 +1,351 @@
+"""Record-and-replay LLM cassettes.
+
+RecordingClient wraps a real client and stores every request/response pair,
+with latency and estimated token usage, in a cassette: a SQLite file keyed
+by a fingerprint of the prompts, with zlib-compressed responses. ReplayClient
+serves a cassette back offline, either at the recorded latency or as fast as
+possible, so a full production run can be re-played to profile the
+orchestrator and parsing without API calls.
+
+Identical requests are replayed in the order they were recorded (e.g. an
+escalated re-run of the same prompt gets the strong model's response), as
+long as one ReplayClient serves them; ModelRouter.from_config() shares one
+across its tiers.
+Prompts embed the market data, so replay the same data (e.g. --data-dir
+fixtures) that the recording saw.
+
+CachingClient is a read-through cache over a cassette: a request already
+answered by the same model is served from it, anything else goes to the
+real client and is recorded. Backtests use it so that re-running over the
+same archive (e.g. with a different horizon or rebalance subset) only pays
+for prompts it has not seen.
+"""
+
+import sqlite3
+import threading
+import time
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Optional
+
+from committee_lite.llm.client import LLMClient, estimate_tokens
+from committee_lite.store.output_cache import fingerprint
+
+
+CASSETTE_MODES = ("record", "replay", "replay-fast")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS exchanges (
+    request_key TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    model TEXT,
+    response BLOB NOT NULL,
+    latency_s REAL NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (request_key, seq)
+) WITHOUT ROWID;
+"""
+
+
+class CassetteMiss(LookupError):
+    """Raised when a replayed request was never recorded."""
+
+
+def request_key(prompt: str, system_prompt: Optional[str] = None) -> str:
+    """Cassette key for a request (fingerprint of the system and user prompts)."""
+    return fingerprint(system_prompt or "", prompt)
+
+
+class Cassette:
+    """SQLite file of recorded LLM exchanges."""
+
+    def __init__(self, path: str):
+        """
+        Open (or create) a cassette.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Autocommit mode so appends can take an explicit write lock
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM exchanges").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def record(
+        self,
+        key: str,
+        response: str,
+        latency_s: float,
+        input_tokens: int,
+        output_tokens: int,
+        model: Optional[str] = None,
+    ) -> int:
+        """
+        Append an exchange.
+
+        Args:
+            key: request_key() of the request
+            response: Raw LLM response
+            latency_s: Wall-clock latency of the call
+            input_tokens: Estimated prompt tokens
+            output_tokens: Estimated response tokens
+            model: Model that answered
+
+        Returns:
+            Sequence number of the exchange among requests with the same key
+        """
+        blob = zlib.compress(response.encode("utf-8"))
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                seq = self._conn.execute(
+                    "SELECT COALESCE(MAX(seq) + 1, 0) FROM exchanges WHERE request_key = ?",
+                    (key,),
+                ).fetchone()[0]
+                self._conn.execute(
+                    "INSERT INTO exchanges VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, seq, model, blob, latency_s, input_tokens, output_tokens, time.time()),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return seq
+
+    def lookup(self, key: str, seq: int = 0) -> Optional[Dict]:
+        """
+        Fetch a recorded exchange.
+
+        Args:
+            key: request_key() of the request
+            seq: Which recording of that request (0 = first)
+
+        Returns:
+            Dict with response, latency_s, input_tokens, output_tokens and
+            model, or None if not recorded
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, latency_s, input_tokens, output_tokens, model "
+                "FROM exchanges WHERE request_key = ? AND seq = ?",
+                (key, seq),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "response": zlib.decompress(row[0]).decode("utf-8"),
+            "latency_s": row[1],
+            "input_tokens": row[2],
+            "output_tokens": row[3],
+            "model": row[4],
+        }
+
+    def count(self, key: str) -> int:
+        """Number of recordings of a request."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM exchanges WHERE request_key = ?", (key,)
+            ).fetchone()[0]
+
+    def stats(self) -> Dict[str, float]:
+        """Totals over the cassette: calls, latency and estimated tokens."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(latency_s), 0), "
+                "COALESCE(SUM(input_tokens), 0), COALESCE(SUM(output_tokens), 0) FROM exchanges"
+            ).fetchone()
+        return {
+            "calls": row[0],
+            "latency_s": row[1],
+            "input_tokens": row[2],
+            "output_tokens": row[3],
+        }
+
+
+class RecordingClient(LLMClient):
+    """Wraps an LLM client and records every exchange to a cassette."""
+
+    def __init__(self, inner: LLMClient, cassette: Cassette, owns_cassette: bool = False):
+        """
+        Initialize recorder.
+
+        Args:
+            inner: Client that makes the real calls
+            cassette: Cassette to append to
+            owns_cassette: Close the cassette when the client is closed
+        """
+        self.inner = inner
+        self.cassette = cassette
+        self.owns_cassette = owns_cassette
+        self.model = getattr(inner, "model", type(inner).__name__)
+
+    def close(self) -> None:
+        """Close the cassette if this client owns it."""
+        if self.owns_cassette:
+            self.cassette.close()
+
+    def complete(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+    ) -> str:
+        """Call the wrapped client and record the exchange."""
+        start = time.perf_counter()
+        response = self.inner.complete(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        latency = time.perf_counter() - start
+
+        self.cassette.record(
+            request_key(prompt, system_prompt),
+            response,
+            latency_s=latency,
+            input_tokens=estimate_tokens((system_prompt or "") + prompt),
+            output_tokens=estimate_tokens(response),
+            model=self.model,
+        )
+        return response
+
+
+class ReplayClient(LLMClient):
+    """Serves recorded responses from a cassette (no API calls)."""
+
+    def __init__(self, cassette: Cassette, realtime: bool = False, owns_cassette: bool = False):
+        """
+        Initialize replayer.
+
+        Args:
+            cassette: Cassette to replay
+            realtime: Sleep for each exchange's recorded latency (default: as
+                fast as possible)
+            owns_cassette: Close the cassette when the client is closed
+        """
+        self.cassette = cassette
+        self.realtime = realtime
+        self.owns_cassette = owns_cassette
+        self.model = "replay"
+        self._lock = threading.Lock()
+        self._served: Dict[str, int] = defaultdict(int)
+
+    def close(self) -> None:
+        """Close the cassette if this client owns it."""
+        if self.owns_cassette:
+            self.cassette.close()
+
+    def complete(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+    ) -> str:
+        """
+        Return the next recorded response for this request.
+
+        Raises:
+            CassetteMiss: If the request was never recorded
+        """
+        key = request_key(prompt, system_prompt)
+        with self._lock:
+            seq = self._served[key]
+            self._served[key] += 1
+
+        exchange = self.cassette.lookup(key, seq)
+        if exchange is None and seq > 0:
+            # Replayed more often than recorded: repeat the last recording
+            exchange = self.cassette.lookup(key, self.cassette.count(key) - 1)
+        if exchange is None:
+            raise CassetteMiss(f"Request not in cassette {self.cassette.path}: {key[:12]}")
+
+        if self.realtime:
+            time.sleep(exchange["latency_s"])
+        return exchange["response"]
+
+
+class CachingClient(LLMClient):
+    """Read-through cache: serves repeated requests from a cassette."""
+
+    def __init__(self, inner: LLMClient, cassette: Cassette):
+        """
+        Initialize caching client.
+
+        Args:
+            inner: Client that answers cache misses
+            cassette: Cassette holding cached responses (keys are scoped to
+                the inner client's model, so switching models misses)
+        """
+        self.inner = inner
+        self.cassette = cassette
+        self.model = getattr(inner, "model", type(inner).__name__)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def cache_key(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """Cassette key for a request to this client's model."""
+        return fingerprint(self.model, system_prompt or "", prompt)
+
+    def complete(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+    ) -> str:
+        """Return the cached response, or call the wrapped client and cache it."""
+        key = self.cache_key(prompt, system_prompt)
+        exchange = self.cassette.lookup(key)
+        if exchange is not None:
+            with self._lock:
+                self.hits += 1
+            return exchange["response"]
+
+        start = time.perf_counter()
+        response = self.inner.complete(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        latency = time.perf_counter() - start
+        with self._lock:
+            self.misses += 1
+
+        self.cassette.record(
+            key,
+            response,
+            latency_s=latency,
+            input_tokens=estimate_tokens((system_prompt or "") + prompt),
+            output_tokens=estimate_tokens(response),
+            model=self.model,
+        )
+        return response
@@ -1,9 +1,12 @@
 """Unified LLM client interface."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
 from committee_lite.config import Config
 
+if TYPE_CHECKING:
+    from committee_lite.llm.cassette import Cassette
+
 
 class LLMClient(ABC):
     """Abstract base class for LLM clients."""
@@ -30,11 +33,37 @@ class LLMClient(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """Release resources the client opened (default: none)."""
+
+    def __enter__(self) -> "LLMClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count for budgeting (~4 characters per token).
+
+    Provider-agnostic and dependency-free; good enough to cap spend, not to bill.
+
+    Args:
+        text: Prompt or response text
+
+    Returns:
+        Estimated token count
+    """
+    return (len(text) + 3) // 4
+
 
 def get_llm_client(
     provider: Optional[str] = None,
     model: Optional[str] = None,
     mock: bool = False,
+    cassette: Optional[Union[str, "Cassette"]] = None,
+    cassette_mode: Optional[str] = None,
 ) -> LLMClient:
     """
     Factory function to get the appropriate LLM client.
@@ -43,17 +72,51 @@ def get_llm_client(
         provider: "openai", "anthropic", or None (uses Config.LLM_PROVIDER)
         model: Model name or None (uses Config default)
         mock: Force mock mode
+        cassette: Cassette to record to or replay from, or a cassette file to
+            open (default: Config.LLM_CASSETTE; empty = no cassette). A file
+            opened here is closed by the client's close(); a Cassette passed
+            in stays open for the caller to close.
+        cassette_mode: "record", "replay" (recorded latency) or "replay-fast"
+            (default: Config.LLM_CASSETTE_MODE)
 
     Returns:
         LLMClient instance
     """
+    from committee_lite.llm.cassette import (
+        CASSETTE_MODES,
+        Cassette,
+        RecordingClient,
+        ReplayClient,
+    )
+
+    if cassette is None:
+        cassette = Config.LLM_CASSETTE
+    cassette_mode = cassette_mode or Config.LLM_CASSETTE_MODE
+    if isinstance(cassette, Cassette) or cassette:
+        if cassette_mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode: {cassette_mode}")
+        owned = not isinstance(cassette, Cassette)
+        if cassette_mode != "record":
+            return ReplayClient(
+                Cassette(cassette) if owned else cassette,
+                realtime=cassette_mode == "replay",
+                owns_cassette=owned,
+            )
+        inner = _provider_client(provider, model, mock)
+        return RecordingClient(inner, Cassette(cassette) if owned else cassette, owns_cassette=owned)
+
+    return _provider_client(provider, model, mock)
+
+
+def _provider_client(provider: Optional[str], model: Optional[str], mock: bool) -> LLMClient:
+    """Build the mock or provider client for get_llm_client()."""
     from committee_lite.llm.mock_adapter import MockAdapter
     from committee_lite.llm.openai_adapter import OpenAIAdapter
     from committee_lite.llm.anthropic_adapter import AnthropicAdapter
 
     # Check if mock mode
     if mock or Config.is_mock_mode():
-        return MockAdapter()
+        return MockAdapter(latency=Config.MOCK_LATENCY, jitter=Config.MOCK_LATENCY_JITTER)
 
     # Determine provider
     provider = provider or Config.LLM_PROVIDER
@@ -3,14 +3,23 @@
 from typing import Optional
 from committee_lite.llm.client import LLMClient
 import json
+import random
+import time
 
 
 class MockAdapter(LLMClient):
     """Mock LLM client that returns deterministic canned responses."""
 
-    def __init__(self):
-        """Initialize mock adapter."""
-        pass
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0):
+        """
+        Initialize mock adapter.
+
+        Args:
+            latency: Simulated seconds per call (for load and soak tests)
+            jitter: Uniform +/- variation around latency, in seconds
+        """
+        self.latency = latency
+        self.jitter = jitter
 
     def complete(
         self,
@@ -20,6 +29,8 @@ class MockAdapter(LLMClient):
         temperature: float = 0.7,
     ) -> str:
         """Return canned response based on prompt content."""
+        if self.latency or self.jitter:
+            time.sleep(max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)))
 
         # Detect which agent is requesting by checking system_prompt and prompt
         # Check system_prompt first for most specific matches
@@ -0,0 +1,144 @@
+"""Tiered model routing.
+
+Specialists run on a fast, cheap model; only agents whose output is
+low-confidence or unparseable are re-run on a stronger model. The
+Portfolio Manager uses the strong model only for disputed tickers (initial
+score spread above the disagreement threshold).
+"""
+
+from typing import TYPE_CHECKING, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+from committee_lite.config import Config
+from committee_lite.llm.client import LLMClient, get_llm_client
+
+if TYPE_CHECKING:
+    from committee_lite.llm.cassette import Cassette
+
+
+class RoutingPolicy(BaseModel):
+    """Which tier each committee call runs on."""
+
+    specialist_tier: str = Field(default="cheap", description="Tier for initial specialist analyses")
+    escalation_tier: str = Field(default="strong", description="Tier for escalated specialist re-runs")
+    escalate_on_low_confidence: bool = Field(default=True, description="Re-run Low-confidence outputs")
+    escalate_on_parse_error: bool = Field(default=True, description="Re-run unparseable outputs")
+    reconcile_tier: str = Field(default="cheap", description="Tier for reconciliation score updates")
+    pm_tier: str = Field(default="cheap", description="Tier for PM synthesis on undisputed tickers")
+    pm_disputed_tier: str = Field(default="strong", description="Tier for PM synthesis on disputed tickers")
+
+
+class ModelRouter:
+    """Maps routing tiers to LLM clients and applies a RoutingPolicy."""
+
+    def __init__(
+        self,
+        tiers: Dict[str, LLMClient],
+        policy: Optional[RoutingPolicy] = None,
+        cassette: Optional["Cassette"] = None,
+    ):
+        """
+        Initialize router.
+
+        Args:
+            tiers: Tier name -> LLM client (e.g. {"cheap": ..., "strong": ...})
+            policy: Routing policy (default: RoutingPolicy())
+            cassette: Cassette shared by the tiers' clients, closed by close()
+        """
+        self.tiers = tiers
+        self.policy = policy or RoutingPolicy()
+        self.cassette = cassette
+
+        for tier in (
+            self.policy.specialist_tier,
+            self.policy.escalation_tier,
+            self.policy.reconcile_tier,
+            self.policy.pm_tier,
+            self.policy.pm_disputed_tier,
+        ):
+            if tier not in tiers:
+                raise ValueError(f"Routing policy uses unknown tier: {tier}")
+
+    @classmethod
+    def from_config(
+        cls,
+        provider: Optional[str] = None,
+        mock: bool = False,
+        policy: Optional[RoutingPolicy] = None,
+    ) -> "ModelRouter":
+        """
+        Build a cheap/strong router from Config.ROUTING_CHEAP_MODEL and
+        Config.ROUTING_STRONG_MODEL (empty = the provider's default model).
+
+        With Config.LLM_CASSETTE set, both tiers share one cassette: recording
+        appends every tier's calls to it, and replay serves them from a single
+        ReplayClient, so an escalated re-run of a prompt gets the response
+        recorded after the cheap tier's.
+
+        Args:
+            provider: LLM provider passed to get_llm_client()
+            mock: Use mock clients for both tiers
+            policy: Routing policy (default: RoutingPolicy())
+
+        Returns:
+            ModelRouter
+        """
+        from committee_lite.llm.cassette import Cassette
+
+        cassette = Cassette(Config.LLM_CASSETTE) if Config.LLM_CASSETTE else None
+        try:
+            if cassette is not None and Config.LLM_CASSETTE_MODE != "record":
+                replay = get_llm_client(provider, mock=mock, cassette=cassette)
+                tiers = {"cheap": replay, "strong": replay}
+            else:
+                tiers = {
+                    "cheap": get_llm_client(
+                        provider, Config.ROUTING_CHEAP_MODEL or None, mock, cassette=cassette
+                    ),
+                    "strong": get_llm_client(
+                        provider, Config.ROUTING_STRONG_MODEL or None, mock, cassette=cassette
+                    ),
+                }
+        except Exception:
+            if cassette is not None:
+                cassette.close()
+            raise
+        return cls(tiers, policy, cassette)
+
+    def close(self) -> None:
+        """Close every tier's client and the shared cassette opened by from_config()."""
+        for client in {id(c): c for c in self.tiers.values()}.values():
+            client.close()
+        if self.cassette is not None:
+            self.cassette.close()
+
+    def client(self, tier: str) -> LLMClient:
+        """LLM client for a tier."""
+        return self.tiers[tier]
+
+    def model_name(self, tier: str) -> str:
+        """Model name behind a tier (adapter's model, or its class for mocks)."""
+        client = self.tiers[tier]
+        return getattr(client, "model", type(client).__name__)
+
+    def escalation_reason(self, confidence: str, parse_failed: bool) -> Optional[str]:
+        """
+        Decide whether a specialist output should be re-run on the escalation tier.
+
+        Args:
+            confidence: The output's confidence
+            parse_failed: Whether the LLM response couldn't be parsed
+
+        Returns:
+            Reason string, or None to keep the output
+        """
+        if parse_failed and self.policy.escalate_on_parse_error:
+            return "parse error"
+        if confidence == "Low" and self.policy.escalate_on_low_confidence:
+            return "low confidence"
+        return None
+
+    def pm_tier(self, disputed: bool) -> str:
+        """Tier for the Portfolio Manager synthesis."""
+        return self.policy.pm_disputed_tier if disputed else self.policy.pm_tier
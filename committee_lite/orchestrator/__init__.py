@@ -2,5 +2,25 @@
 
 from committee_lite.orchestrator.committee import InvestmentCommittee
 from committee_lite.orchestrator.portfolio_manager import PortfolioManagerAgent
+from committee_lite.orchestrator.batch import run_universe
+from committee_lite.orchestrator.backtest import rebalance_dates, run_backtest
+from committee_lite.orchestrator.pipeline import run_pipeline, stream_decisions
+from committee_lite.orchestrator.profiling import PhaseProfiler
+from committee_lite.orchestrator.prescreen import prescreen, select_shortlist
+from committee_lite.orchestrator.soak import run_soak
+from committee_lite.orchestrator.watch import Watcher
 
-__all__ = ["InvestmentCommittee", "PortfolioManagerAgent"]
+__all__ = [
+    "InvestmentCommittee",
+    "PortfolioManagerAgent",
+    "run_universe",
+    "run_backtest",
+    "rebalance_dates",
+    "run_pipeline",
+    "stream_decisions",
+    "prescreen",
+    "select_shortlist",
+    "run_soak",
+    "PhaseProfiler",
+    "Watcher",
+]
@@ -0,0 +1,295 @@
+"""Point-in-time backtests of the committee over a snapshot archive.
+
+Every (rebalance date, ticker) pair is analyzed by a committee whose data
+provider is archive.provider(as_of), so agents only see fundamentals
+captured by that date, statements already filed, prices up to that close and
+the risk-free rate then in force. Forward returns are measured afterwards
+from the bars following as_of and never reach the committee.
+
+Runs are dominated by LLM latency, so pairs are spread over a thread pool
+(one committee per pair; the LLM client is shared). Wrapping the client in
+a CachingClient makes repeated backtests cheap: a re-run over the same
+archive only calls the LLM for prompts it has not answered before.
+"""
+
+import contextlib
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+from pydantic import BaseModel, Field
+
+from committee_lite.config import Config
+from committee_lite.llm import CachingClient, Cassette, LLMClient, get_llm_client
+from committee_lite.orchestrator.committee import InvestmentCommittee
+from committee_lite.schemas import FinalDecision
+from committee_lite.tools import financial_data
+from committee_lite.tools.archive import SnapshotArchive
+
+# Forward-return horizons in trading days (~1 and ~3 months)
+DEFAULT_HORIZONS = (21, 63)
+
+
+class BacktestRecord(BaseModel):
+    """One committee decision in a backtest and what happened next."""
+
+    as_of: datetime = Field(..., description="Date the committee decided as of")
+    ticker: str
+    rating: str
+    confidence: str
+    average_score: float
+    score_spread: int
+    price: Optional[float] = Field(None, description="Close on as_of")
+    forward_returns: Dict[int, Optional[float]] = Field(
+        default_factory=dict, description="Horizon (trading days) -> return (None past the data)"
+    )
+
+
+class BacktestReport(BaseModel):
+    """Outcome of a backtest run."""
+
+    dates: List[datetime] = Field(default_factory=list)
+    tickers: int = 0
+    horizons: List[int] = Field(default_factory=list)
+    records: List[BacktestRecord] = Field(default_factory=list)
+    skipped: int = Field(0, description="Pairs with no snapshot archived by the date")
+    failures: Dict[str, str] = Field(default_factory=dict, description="TICKER@date -> error")
+    llm_calls: int = Field(0, description="Calls that reached the LLM")
+    llm_cache_hits: int = Field(0, description="Calls served from the LLM cache")
+    elapsed_s: float = 0.0
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per decision, with a fwd_<h>d column per horizon."""
+        rows = []
+        for record in self.records:
+            row = record.model_dump(exclude={"forward_returns"})
+            for horizon in self.horizons:
+                row[f"fwd_{horizon}d"] = record.forward_returns.get(horizon)
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+    def by_rating(self) -> pd.DataFrame:
+        """Decision count and mean forward return per rating, best rating first."""
+        frame = self.to_frame()
+        if frame.empty:
+            return frame
+        columns = [f"fwd_{horizon}d" for horizon in self.horizons]
+        summary = frame.groupby("rating")[columns].mean()
+        summary.insert(0, "count", frame.groupby("rating").size())
+        order = ["STRONG BUY", "BUY", "HOLD", "SELL", "STRONG SELL"]
+        return summary.reindex([r for r in order if r in summary.index])
+
+    def __str__(self) -> str:
+        """Human-readable backtest summary."""
+        span = (
+            f"{self.dates[0]:%Y-%m-%d} -> {self.dates[-1]:%Y-%m-%d}" if self.dates else "no dates"
+        )
+        throughput = len(self.records) / self.elapsed_s * 60 if self.elapsed_s else 0.0
+        cached = self.llm_calls + self.llm_cache_hits
+        lines = [
+            "",
+            "=" * 60,
+            "BACKTEST",
+            "=" * 60,
+            f"Period:     {span} ({len(self.dates)} dates x {self.tickers} tickers)",
+            f"Decisions:  {len(self.records)} ({throughput:.1f}/min, "
+            f"{len(self.failures)} failed, {self.skipped} not yet archived)",
+            f"LLM calls:  {self.llm_calls}"
+            + (f" ({self.llm_cache_hits}/{cached} served from cache)" if self.llm_cache_hits else ""),
+            f"Elapsed:    {self.elapsed_s:.0f}s",
+        ]
+        summary = self.by_rating()
+        if not summary.empty:
+            lines.extend(["", "FORWARD RETURNS BY RATING:", "-" * 60])
+            header = f"  {'Rating':11s} {'Count':>6s}" + "".join(
+                f" {f'{h}d':>8s}" for h in self.horizons
+            )
+            lines.append(header)
+            for rating, row in summary.iterrows():
+                cells = "".join(
+                    f" {row[f'fwd_{h}d']:+8.2%}" if pd.notna(row[f"fwd_{h}d"]) else f" {'n/a':>8s}"
+                    for h in self.horizons
+                )
+                lines.append(f"  {rating:11s} {int(row['count']):6d}{cells}")
+        return "\n".join(lines)
+
+
+def rebalance_dates(start, end, freq: str = "BME") -> List[pd.Timestamp]:
+    """
+    Rebalance dates between start and end (inclusive).
+
+    Args:
+        start: First date
+        end: Last date
+        freq: pandas frequency ("BME" month-end, "W-FRI" weekly, "BQE" quarterly, ...)
+
+    Returns:
+        Dates in ascending order
+    """
+    return list(pd.date_range(pd.Timestamp(start), pd.Timestamp(end), freq=freq))
+
+
+def forward_returns(
+    archive: SnapshotArchive, ticker: str, as_of, horizons: Sequence[int] = DEFAULT_HORIZONS
+) -> Dict[int, Optional[float]]:
+    """
+    Returns from the close on as_of to the close `h` trading days later.
+
+    Args:
+        archive: Snapshot archive holding the bars
+        ticker: Stock ticker
+        as_of: Decision date (the last bar on or before it is the entry)
+        horizons: Holding periods in trading days
+
+    Returns:
+        Horizon -> return (None if the archive ends before the horizon)
+    """
+    closes = archive.prices.window(ticker.upper())["close"]
+    # The store's bars up to as_of are a prefix of all its bars
+    entry = len(archive.prices.window(ticker.upper(), end_date=as_of)["close"]) - 1
+    returns = {}
+    for horizon in horizons:
+        exit_ = entry + horizon
+        if entry < 0 or exit_ >= len(closes):
+            returns[horizon] = None
+        else:
+            returns[horizon] = float(closes[exit_] / closes[entry] - 1)
+    return returns
+
+
+def run_backtest(
+    archive: SnapshotArchive,
+    tickers: Sequence[str],
+    dates: Sequence,
+    llm_client: Optional[LLMClient] = None,
+    llm_cache: Optional[Cassette] = None,
+    workers: Optional[int] = None,
+    horizons: Sequence[int] = DEFAULT_HORIZONS,
+    disagreement_threshold: Optional[int] = None,
+    max_reconcile_rounds: Optional[int] = None,
+    store=None,
+    quiet: bool = True,
+    verbose: bool = False,
+) -> BacktestReport:
+    """
+    Replay the committee at each past date over the archive.
+
+    Args:
+        archive: Point-in-time snapshot archive
+        tickers: Tickers to analyze at every date (ones not yet archived by
+            a date are skipped for it)
+        dates: Dates to decide as of
+        llm_client: LLM client shared by every committee (default: configured provider)
+        llm_cache: Cassette to serve repeated prompts from (recorded on a miss)
+        workers: Concurrent (date, ticker) committees (default: Config.BACKTEST_WORKERS)
+        horizons: Forward-return horizons in trading days
+        disagreement_threshold: Score spread that triggers reconciliation
+        max_reconcile_rounds: Maximum reconciliation rounds
+        store: Optional DecisionStore; decisions are appended with
+            timestamp = as_of
+        quiet: Suppress per-ticker committee output
+        verbose: Print one line per decision
+
+    Returns:
+        BacktestReport (failed pairs are recorded, not raised)
+    """
+    client = llm_client or get_llm_client()
+    if llm_cache is not None:
+        client = CachingClient(client, llm_cache)
+    workers = workers or Config.BACKTEST_WORKERS
+    dates = sorted(pd.Timestamp(d).normalize() for d in dates)
+    tickers = [t.strip().upper() for t in tickers if t.strip()]
+
+    report = BacktestReport(
+        dates=[d.to_pydatetime() for d in dates], tickers=len(tickers), horizons=list(horizons)
+    )
+    out = sys.stdout
+    lock = threading.Lock()
+    llm_calls: List[int] = []
+
+    def decide(as_of: pd.Timestamp, ticker: str) -> Optional[BacktestRecord]:
+        if archive.fundamentals(ticker, as_of) is None:
+            return None
+        provider = archive.provider(as_of)
+        committee = InvestmentCommittee(
+            llm_client=client,
+            disagreement_threshold=disagreement_threshold,
+            max_reconcile_rounds=max_reconcile_rounds,
+            data_provider=provider,
+        )
+        try:
+            decision = committee.analyze(ticker)
+        finally:
+            # Only this (date, ticker)'s data: other dates of the ticker may be in flight
+            financial_data.clear_cache(ticker, provider=provider)
+
+        with lock:
+            llm_calls.append(len(decision.llm_calls))
+            if store is not None:
+                store.append(decision.model_copy(update={"timestamp": as_of.to_pydatetime()}))
+        return _record(decision, archive, as_of, horizons)
+
+    start = time.perf_counter()
+    total = len(dates) * len(tickers)
+    done = 0
+    with contextlib.ExitStack() as stack:
+        if quiet:
+            devnull = stack.enter_context(open(os.devnull, "w"))
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+        pool = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+        # Date-major, so early dates finish first and progress reads chronologically
+        futures = {
+            pool.submit(decide, as_of, ticker): (as_of, ticker)
+            for as_of in dates
+            for ticker in tickers
+        }
+        for future in as_completed(futures):
+            as_of, ticker = futures[future]
+            done += 1
+            try:
+                record = future.result()
+            except Exception as e:
+                report.failures[f"{ticker}@{as_of:%Y-%m-%d}"] = str(e)
+                if verbose:
+                    print(f"  ❌ {ticker:8s} {as_of:%Y-%m-%d}  {e}", file=out)
+                continue
+            if record is None:
+                report.skipped += 1
+                continue
+            report.records.append(record)
+            if verbose:
+                print(
+                    f"  {as_of:%Y-%m-%d} {ticker:8s} {record.rating:11s}"
+                    f"  avg {record.average_score:5.1f}  [{done}/{total}]",
+                    file=out,
+                )
+
+    report.records.sort(key=lambda r: (r.as_of, r.ticker))
+    report.elapsed_s = time.perf_counter() - start
+    report.llm_calls = sum(llm_calls)
+    if isinstance(client, CachingClient):
+        report.llm_cache_hits = client.hits
+        report.llm_calls = client.misses
+    return report
+
+
+def _record(
+    decision: FinalDecision, archive: SnapshotArchive, as_of: pd.Timestamp, horizons: Sequence[int]
+) -> BacktestRecord:
+    """Backtest record for a decision, with its realized forward returns."""
+    return BacktestRecord(
+        as_of=as_of.to_pydatetime(),
+        ticker=decision.ticker,
+        rating=decision.final_rating,
+        confidence=decision.final_confidence,
+        average_score=decision.average_score,
+        score_spread=decision.score_spread,
+        price=archive.close_on(decision.ticker, as_of),
+        forward_returns=forward_returns(archive, decision.ticker, as_of, horizons),
+    )
+
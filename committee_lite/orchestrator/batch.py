@@ -0,0 +1,189 @@
+"""Universe runner that shards tickers across worker processes.
+
+Each worker process builds its own LLM client and InvestmentCommittee once
+(in the pool initializer) and keeps them warm for every ticker in its shards.
+Before analyzing a shard, a worker prefetches its market data in bulk so
+the per-ticker data caches are warm. Decisions travel back to the parent as
+compact JSON payloads and are re-validated into FinalDecision objects there.
+"""
+
+import contextlib
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from committee_lite.config import Config
+from committee_lite.llm import ModelRouter, get_llm_client
+from committee_lite.orchestrator.committee import InvestmentCommittee
+from committee_lite.schemas import FinalDecision
+from committee_lite.tools import FixtureProvider, PeerIndex, fetch_bulk_data
+
+
+# Per-process committee and settings, created by _init_worker()
+_worker_committee: Optional[InvestmentCommittee] = None
+_worker_prefetch: bool = True
+_worker_quiet: bool = False
+
+# (ticker, decision_json or None, error or None)
+ShardResult = List[Tuple[str, Optional[str], Optional[str]]]
+
+
+@contextlib.contextmanager
+def _quiet_stdout(quiet: bool) -> Iterator[None]:
+    """Discard stdout for the duration of the block if quiet."""
+    with contextlib.ExitStack() as stack:
+        if quiet:
+            devnull = stack.enter_context(open(os.devnull, "w"))
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+        yield
+
+
+def _build_committee(
+    provider: Optional[str],
+    model: Optional[str],
+    mock: bool,
+    disagreement_threshold: Optional[int],
+    max_reconcile_rounds: Optional[int],
+    data_dir: Optional[str],
+    peer_index: Optional[PeerIndex] = None,
+) -> InvestmentCommittee:
+    """Create a committee with its own LLM client and data provider."""
+    llm_client = get_llm_client(provider=provider, model=model, mock=mock)
+    router = ModelRouter.from_config(provider=provider, mock=mock) if Config.ROUTING_ENABLED else None
+    return InvestmentCommittee(
+        llm_client=llm_client,
+        router=router,
+        disagreement_threshold=disagreement_threshold,
+        max_reconcile_rounds=max_reconcile_rounds,
+        data_provider=FixtureProvider(data_dir) if data_dir else None,
+        peer_index=peer_index,
+    )
+
+
+def _init_worker(
+    provider: Optional[str],
+    model: Optional[str],
+    mock: bool,
+    disagreement_threshold: Optional[int],
+    max_reconcile_rounds: Optional[int],
+    data_dir: Optional[str],
+    quiet: bool,
+    prefetch: bool,
+    peer_index: Optional[PeerIndex] = None,
+) -> None:
+    """Pool initializer: build this process's committee once."""
+    global _worker_committee, _worker_prefetch, _worker_quiet
+    _worker_prefetch, _worker_quiet = prefetch, quiet
+    with _quiet_stdout(quiet):
+        _worker_committee = _build_committee(
+            provider, model, mock, disagreement_threshold, max_reconcile_rounds, data_dir, peer_index
+        )
+
+
+def _analyze_shard(tickers: Sequence[str]) -> ShardResult:
+    """Analyze a shard of tickers with this process's committee."""
+    with _quiet_stdout(_worker_quiet):
+        return _analyze_with(_worker_committee, tickers, _worker_prefetch)
+
+
+def _analyze_with(
+    committee: InvestmentCommittee, tickers: Sequence[str], prefetch: bool
+) -> ShardResult:
+    """Analyze tickers, serializing each decision to compact JSON."""
+    if prefetch:
+        fetch_bulk_data(tickers, provider=committee.data_provider)
+
+    results = []
+    for ticker in tickers:
+        try:
+            decision = committee.analyze(ticker)
+            results.append((ticker, decision.model_dump_json(), None))
+        except Exception as e:
+            results.append((ticker, None, str(e)))
+    return results
+
+
+def shard_tickers(tickers: Sequence[str], shard_size: int) -> List[List[str]]:
+    """Split tickers into consecutive shards of at most shard_size."""
+    return [list(tickers[i:i + shard_size]) for i in range(0, len(tickers), shard_size)]
+
+
+def run_universe(
+    tickers: Sequence[str],
+    workers: Optional[int] = None,
+    backend: str = "process",
+    provider: Optional[str] = None,
+    model: Optional[str] = None,
+    mock: bool = False,
+    disagreement_threshold: Optional[int] = None,
+    max_reconcile_rounds: Optional[int] = None,
+    shard_size: Optional[int] = None,
+    quiet: bool = True,
+    prefetch: bool = True,
+    data_dir: Optional[str] = None,
+    peer_index: Optional[PeerIndex] = None,
+) -> Tuple[List[FinalDecision], Dict[str, str]]:
+    """
+    Run the investment committee over a universe of tickers.
+
+    Args:
+        tickers: Tickers to analyze
+        workers: Worker processes (default: CPU count)
+        backend: "process" for a process pool, "serial" for in-process
+        provider: LLM provider passed to get_llm_client()
+        model: Model name passed to get_llm_client()
+        mock: Use mock LLM responses
+        disagreement_threshold: Committee disagreement threshold
+        max_reconcile_rounds: Committee reconciliation round cap
+        shard_size: Tickers per task (default: ~4 shards per worker)
+        quiet: Suppress per-ticker committee output
+        prefetch: Bulk-fetch each shard's market data before analyzing it
+        data_dir: Read market data from this fixture directory (offline)
+        peer_index: Universe peer index for the Fundamentals agent (sent to
+            each worker process once)
+
+    Returns:
+        Tuple of (decisions in input order, failures as ticker -> error)
+    """
+    tickers = [t.upper() for t in tickers]
+    if not tickers:
+        return [], {}
+
+    committee_args = (
+        provider, model, mock, disagreement_threshold, max_reconcile_rounds, data_dir
+    )
+
+    if backend == "serial":
+        committee = _build_committee(*committee_args, peer_index)
+        with _quiet_stdout(quiet):
+            results = _analyze_with(committee, tickers, prefetch)
+    elif backend == "process":
+        workers = workers or os.cpu_count() or 1
+        workers = min(workers, len(tickers))
+        shard_size = shard_size or max(1, math.ceil(len(tickers) / (workers * 4)))
+
+        results = []
+        # Spawn rather than fork: the parent may hold threads (data prefetch
+        # pools, HTTP clients) that are unsafe to fork
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(*committee_args, quiet, prefetch, peer_index),
+        ) as executor:
+            for shard_results in executor.map(_analyze_shard, shard_tickers(tickers, shard_size)):
+                results.extend(shard_results)
+    else:
+        raise ValueError(f"Unknown backend: {backend}")
+
+    decisions = []
+    failures = {}
+    for ticker, payload, error in results:
+        if payload is not None:
+            decisions.append(FinalDecision.model_validate_json(payload))
+        else:
+            failures[ticker] = error
+
+    return decisions, failures
@@ -1,10 +1,14 @@
 """Investment Committee orchestration with disagreement handling."""
 
+import contextlib
 import json
-from typing import List, Dict, Any
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
-from committee_lite.llm import LLMClient, get_llm_client
+from committee_lite.llm import LLMClient, ModelRouter, estimate_tokens, get_llm_client
 from committee_lite.agents import (
     FundamentalsAgent,
     ValuationAgent,
@@ -12,9 +16,27 @@ from committee_lite.agents import (
     SentimentAgent,
 )
 from committee_lite.orchestrator.portfolio_manager import PortfolioManagerAgent
-from committee_lite.schemas import AgentOutput, FinalDecision, DebateRound, DissentingView
+from committee_lite.orchestrator.profiling import PhaseProfiler
+from committee_lite.schemas import (
+    AgentOutput,
+    AgentUpdate,
+    FinalDecision,
+    DebateRound,
+    DissentingView,
+    LLMCall,
+)
+from committee_lite.store import fingerprint
+from committee_lite.tools.market_data import MarketDataProvider
+from committee_lite.tools.peer_index import PeerIndex
+from committee_lite.tools.price_store import PriceStore
 from committee_lite.config import Config
 
+# Evidence line the specialist agents emit when the LLM response can't be parsed
+PARSE_ERROR_EVIDENCE = "Error in LLM response parsing"
+
+# Response token cap for reconciliation score updates
+RECONCILE_MAX_TOKENS = 500
+
 
 class InvestmentCommittee:
     """Orchestrates multi-agent investment analysis with disagreement handling."""
@@ -24,6 +46,16 @@ class InvestmentCommittee:
         llm_client: LLMClient = None,
         disagreement_threshold: int = None,
         max_reconcile_rounds: int = None,
+        output_cache=None,
+        data_provider: Optional[MarketDataProvider] = None,
+        price_store: Optional[PriceStore] = None,
+        consensus_fast_path: Optional[bool] = None,
+        router: Optional[ModelRouter] = None,
+        reconcile_timeout: Optional[float] = None,
+        reconcile_token_budget: Optional[int] = None,
+        compact_prompts: Optional[bool] = None,
+        profiler: Optional[PhaseProfiler] = None,
+        peer_index: Optional[PeerIndex] = None,
     ):
         """
         Initialize Investment Committee.
@@ -32,26 +64,77 @@ class InvestmentCommittee:
             llm_client: LLM client (defaults to configured provider)
             disagreement_threshold: Score spread that triggers reconciliation
             max_reconcile_rounds: Maximum reconciliation rounds
+            output_cache: Optional output cache (MemoryOutputCache or DecisionStore).
+                When set, agents whose input payload is unchanged since the last
+                run reuse their previous output instead of calling the LLM.
+            data_provider: Market data source injected into the specialist agents
+                (default: get_default_provider())
+            price_store: Memory-mapped price history the technical agent reads
+                before falling back to the data provider
+            consensus_fast_path: Synthesize unanimous committees by rule instead of
+                calling the PM LLM (default: Config.CONSENSUS_FAST_PATH; criteria
+                from Config.CONSENSUS_MAX_SPREAD / CONSENSUS_MIN_CONFIDENCE)
+            router: Tiered model router. When set, every LLM call picks its
+                client from the router's policy and llm_client is unused.
+            reconcile_timeout: Wall-clock budget in seconds for the whole debate
+                (default: Config.RECONCILE_TIMEOUT; 0 = no limit)
+            reconcile_token_budget: Estimated token budget for the whole debate
+                (default: Config.RECONCILE_TOKEN_BUDGET; 0 = no limit)
+            compact_prompts: Render agent input data and the PM's agent summaries
+                as terse key=value lines (default: Config.PROMPT_COMPACT)
+            profiler: When set, each phase (data fetch, each agent,
+                reconciliation, PM synthesis) runs under the profiler;
+                results accumulate across analyze() calls
+            peer_index: Universe peer index; gives the Fundamentals agent each
+                metric's percentile within the ticker's industry/sector
         """
+        self.router = router
+        if llm_client is None and router is not None:
+            llm_client = router.client(router.policy.specialist_tier)
         self.llm_client = llm_client or get_llm_client()
         self.disagreement_threshold = disagreement_threshold or Config.DISAGREEMENT_THRESHOLD
         self.max_reconcile_rounds = max_reconcile_rounds or Config.MAX_RECONCILE_ROUNDS
+        self.reconcile_timeout = (
+            Config.RECONCILE_TIMEOUT if reconcile_timeout is None else reconcile_timeout
+        )
+        self.reconcile_token_budget = (
+            Config.RECONCILE_TOKEN_BUDGET if reconcile_token_budget is None else reconcile_token_budget
+        )
+        self.output_cache = output_cache
+        self.profiler = profiler
+        self.consensus_fast_path = (
+            Config.CONSENSUS_FAST_PATH if consensus_fast_path is None else consensus_fast_path
+        )
+
+        compact = Config.PROMPT_COMPACT if compact_prompts is None else compact_prompts
 
         # Initialize specialist agents
-        self.fundamentals_agent = FundamentalsAgent(self.llm_client)
-        self.valuation_agent = ValuationAgent(self.llm_client)
-        self.technical_agent = TechnicalAgent(self.llm_client)
-        self.sentiment_agent = SentimentAgent(self.llm_client)
+        self.data_provider = data_provider
+        self.fundamentals_agent = FundamentalsAgent(
+            self.llm_client, data_provider, compact, peer_index
+        )
+        self.valuation_agent = ValuationAgent(self.llm_client, data_provider, compact)
+        self.technical_agent = TechnicalAgent(self.llm_client, data_provider, price_store, compact)
+        self.sentiment_agent = SentimentAgent(self.llm_client, data_provider, compact)
 
         # Initialize portfolio manager
-        self.portfolio_manager = PortfolioManagerAgent(self.llm_client)
+        self.portfolio_manager = PortfolioManagerAgent(
+            self.llm_client, compact, Config.PROMPT_MAX_BULLET_CHARS
+        )
 
-    def analyze(self, ticker: str) -> FinalDecision:
+        # LLM calls made during the current analyze() call
+        self._llm_calls: List[LLMCall] = []
+
+    def analyze(
+        self, ticker: str, prepared: Optional[List[Tuple[str, str, str]]] = None
+    ) -> FinalDecision:
         """
         Run full investment committee analysis.
 
         Args:
             ticker: Stock ticker to analyze
+            prepared: Agent prompts from prepare(ticker), if already built
+                (e.g. by a pipeline fetching data ahead of the LLM calls)
 
         Returns:
             FinalDecision with complete analysis and debate log
@@ -60,9 +143,11 @@ class InvestmentCommittee:
         print(f"INVESTMENT COMMITTEE ANALYSIS: {ticker}")
         print(f"{'='*60}\n")
 
+        self._llm_calls = []
+
         # Phase 1: Initial agent analyses
         print("Phase 1: Running specialist agent analyses...")
-        agent_outputs = self._run_initial_analyses(ticker)
+        agent_outputs = self._run_initial_analyses(ticker, prepared)
 
         # Calculate score spread
         scores = [output.score_0_100 for output in agent_outputs]
@@ -76,14 +161,16 @@ class InvestmentCommittee:
         # Phase 2: Disagreement handling
         debate_log = []
         dissenting_views = []
+        disputed = score_spread > self.disagreement_threshold
 
-        if score_spread > self.disagreement_threshold:
+        if disputed:
             print(f"\n⚠️  Score spread ({score_spread}) exceeds threshold ({self.disagreement_threshold})")
             print("Phase 2: Running disagreement reconciliation...")
 
-            agent_outputs, debate_log, dissenting_views = self._handle_disagreement(
-                ticker, agent_outputs, score_spread
-            )
+            with self._phase("reconciliation"):
+                agent_outputs, debate_log, dissenting_views = self._handle_disagreement(
+                    ticker, agent_outputs, score_spread
+                )
 
             # Recalculate after reconciliation
             scores = [output.score_0_100 for output in agent_outputs]
@@ -99,9 +186,10 @@ class InvestmentCommittee:
 
         # Phase 3: Portfolio Manager synthesis
         print("\nPhase 3: Portfolio Manager synthesis...")
-        pm_output = self.portfolio_manager.synthesize(
-            ticker, agent_outputs, dissenting_views
-        )
+        with self._phase("portfolio_manager"):
+            pm_output, synthesis_path = self._synthesize(
+                ticker, agent_outputs, dissenting_views, disputed
+            )
 
         # Build final decision
         agent_scores = {output.agent_name: output.score_0_100 for output in agent_outputs}
@@ -119,34 +207,216 @@ class InvestmentCommittee:
             action_plan=pm_output.get('action_plan', ''),
             invalidation_criteria=pm_output.get('invalidation_criteria', []),
             debate_log=debate_log,
+            synthesis_path=synthesis_path,
+            llm_calls=self._llm_calls,
         )
 
-        print("\n✓ Analysis complete!")
+        print(
+            f"\n✓ Analysis complete! ({len(self._llm_calls)} LLM calls, "
+            f"~{final_decision.input_tokens:,} input tokens)"
+        )
         return final_decision
 
-    def _run_initial_analyses(self, ticker: str) -> List[AgentOutput]:
-        """Run all specialist agents' initial analyses."""
-        agents = [
+    def _agents(self) -> List[Tuple[str, Any]]:
+        """Specialist agents in committee order."""
+        return [
             ("Fundamentals", self.fundamentals_agent),
             ("Valuation", self.valuation_agent),
             ("Technical", self.technical_agent),
             ("Sentiment", self.sentiment_agent),
         ]
 
+    def prepare(self, ticker: str) -> List[Tuple[str, str, str]]:
+        """
+        Fetch a ticker's market data and build every specialist's prompts.
+
+        This is the data phase of analyze(), with no LLM calls; it only reads
+        the agents, so it may run on another thread while analyze() runs.
+
+        Args:
+            ticker: Stock ticker
+
+        Returns:
+            List of (agent name, system_prompt, user_prompt) in committee order
+        """
+        prepared = []
+        for name, agent in self._agents():
+            with self._phase("data"):
+                system_prompt, user_prompt = agent.build_prompts(ticker)
+            prepared.append((name, system_prompt, user_prompt))
+        return prepared
+
+    def _run_initial_analyses(
+        self, ticker: str, prepared: Optional[List[Tuple[str, str, str]]] = None
+    ) -> List[AgentOutput]:
+        """Run all specialist agents' initial analyses (on prepared prompts if given)."""
+        prompts = {name: (system, user) for name, system, user in prepared or []}
+
         outputs = []
-        for name, agent in agents:
+        for name, agent in self._agents():
             print(f"  Running {name} Agent...")
-            output = agent.analyze(ticker)
+            if name in prompts:
+                system_prompt, user_prompt = prompts.pop(name)
+            else:
+                with self._phase("data"):
+                    system_prompt, user_prompt = agent.build_prompts(ticker)
+
+            with self._phase(f"agent:{name}"):
+                input_fingerprint = fingerprint(system_prompt, user_prompt)
+
+                cached = self._lookup_cached(ticker, name, input_fingerprint)
+                if cached is not None:
+                    output = AgentOutput.model_validate(cached)
+                    print("    Inputs unchanged - reusing previous output")
+                else:
+                    input_tokens = estimate_tokens(system_prompt + user_prompt)
+                    output = agent.run_prompts(
+                        ticker,
+                        system_prompt,
+                        user_prompt,
+                        llm_client=self._client_for(name, input_tokens=input_tokens),
+                    )
+                    escalation = self._escalation_reason(output)
+                    if escalation is not None:
+                        tier = self.router.policy.escalation_tier
+                        print(f"    Escalating to {tier} tier ({escalation})")
+                        output = agent.run_prompts(
+                            ticker,
+                            system_prompt,
+                            user_prompt,
+                            llm_client=self._client_for(name, tier, escalation, input_tokens),
+                        )
+                    if PARSE_ERROR_EVIDENCE not in output.evidence:
+                        self._remember(ticker, name, input_fingerprint, output.model_dump())
+
             outputs.append(output)
             print(f"    Score: {output.score_0_100}/100 | Confidence: {output.confidence}")
 
         return outputs
 
+    def _synthesize(
+        self,
+        ticker: str,
+        agent_outputs: List[AgentOutput],
+        dissenting_views: List[dict],
+        disputed: bool = False,
+    ) -> Tuple[dict, str]:
+        """
+        Run PM synthesis.
+
+        Uses the rule-based path when the fast path is enabled and the committee
+        is unanimous, otherwise the LLM (reusing the previous result if its
+        inputs are unchanged).
+
+        Returns:
+            Tuple of (PM output dict, synthesis path: "rules" or "llm")
+        """
+        if self.consensus_fast_path and not any(
+            PARSE_ERROR_EVIDENCE in output.evidence for output in agent_outputs
+        ):
+            pm_output = self.portfolio_manager.synthesize_by_rules(
+                ticker,
+                agent_outputs,
+                dissenting_views,
+                max_spread=Config.CONSENSUS_MAX_SPREAD,
+                min_confidence=Config.CONSENSUS_MIN_CONFIDENCE,
+            )
+            if pm_output is not None:
+                print("  Consensus criteria met - rule-based synthesis (PM LLM call skipped)")
+                return pm_output, "rules"
+
+        system_prompt, user_prompt = self.portfolio_manager.build_prompts(
+            ticker, agent_outputs, dissenting_views
+        )
+        input_fingerprint = fingerprint(system_prompt, user_prompt)
+
+        cached = self._lookup_cached(ticker, "PortfolioManager", input_fingerprint)
+        if cached is not None:
+            print("  Scores and views unchanged - reusing previous synthesis")
+            return cached, "llm"
+
+        tier = self.router.pm_tier(disputed) if self.router is not None else None
+        pm_output = self.portfolio_manager.run_prompts(
+            system_prompt,
+            user_prompt,
+            llm_client=self._client_for(
+                "PortfolioManager", tier, input_tokens=estimate_tokens(system_prompt + user_prompt)
+            ),
+        )
+        if "Unable to parse Portfolio Manager response" not in pm_output.get('rationale', []):
+            self._remember(ticker, "PortfolioManager", input_fingerprint, pm_output)
+        return pm_output, "llm"
+
+    def _phase(self, name: str):
+        """Profiling context for a phase (no-op without a profiler)."""
+        if self.profiler is None:
+            return contextlib.nullcontext()
+        return self.profiler.phase(name)
+
+    def _client_for(
+        self,
+        role: str,
+        tier: Optional[str] = None,
+        escalation: Optional[str] = None,
+        input_tokens: int = 0,
+    ) -> LLMClient:
+        """
+        Pick the client for one LLM call and record the call.
+
+        Args:
+            role: Caller recorded in FinalDecision.llm_calls
+            tier: Routing tier (default: the policy's specialist tier; ignored
+                when routing is off)
+            escalation: Reason when re-running an agent on a stronger tier
+            input_tokens: Estimated prompt tokens for the call
+
+        Returns:
+            LLM client to use for the call
+        """
+        if self.router is None:
+            client = self.llm_client
+            tier = "default"
+            model = getattr(client, "model", type(client).__name__)
+        else:
+            tier = tier or self.router.policy.specialist_tier
+            client = self.router.client(tier)
+            model = self.router.model_name(tier)
+
+        self._llm_calls.append(LLMCall(
+            role=role, tier=tier, model=model, escalation=escalation, input_tokens=input_tokens
+        ))
+        return client
+
+    def _escalation_reason(self, output: AgentOutput) -> Optional[str]:
+        """Why a specialist output should be re-run on a stronger tier (None if not)."""
+        if self.router is None:
+            return None
+        return self.router.escalation_reason(
+            output.confidence, PARSE_ERROR_EVIDENCE in output.evidence
+        )
+
+    def _lookup_cached(self, ticker: str, key: str, input_fingerprint: str) -> Optional[dict]:
+        """Look up a cached output payload (None when caching is disabled)."""
+        if self.output_cache is None:
+            return None
+        return self.output_cache.lookup(ticker, key, input_fingerprint)
+
+    def _remember(self, ticker: str, key: str, input_fingerprint: str, payload: dict) -> None:
+        """Store an output payload in the cache (no-op when caching is disabled)."""
+        if self.output_cache is not None:
+            self.output_cache.remember(ticker, key, input_fingerprint, payload)
+
     def _handle_disagreement(
         self, ticker: str, agent_outputs: List[AgentOutput], initial_spread: int
     ) -> tuple[List[AgentOutput], List[DebateRound], List[dict]]:
         """
-        Handle disagreement through reconciliation round.
+        Handle disagreement through up to max_reconcile_rounds reconciliation rounds.
+
+        Round 1 re-queries every agent; later rounds only re-query agents
+        outside the consensus band (more than half the threshold from the
+        median score). Each round's calls run in parallel. The debate stops
+        once the spread is within the threshold, no score moved, or the
+        wall-clock / token budget for the whole debate runs out.
 
         Args:
             ticker: Stock ticker
@@ -157,93 +427,229 @@ class InvestmentCommittee:
             Tuple of (updated_outputs, debate_log, dissenting_views)
         """
         debate_log = []
-        dissenting_views = []
-
-        # Run one reconciliation round
-        round_num = 1
-        trigger = f"score spread {initial_spread} > threshold {self.disagreement_threshold}"
+        outputs = list(agent_outputs)
+        original_scores = {output.agent_name: output.score_0_100 for output in outputs}
+        last_reasoning: Dict[str, str] = {}
 
-        print(f"\n  Reconciliation Round {round_num}:")
-        print(f"    Trigger: {trigger}")
+        deadline = time.monotonic() + self.reconcile_timeout if self.reconcile_timeout else None
+        tokens_used = 0
+        spread = initial_spread
+        targets = list(outputs)
 
-        agent_updates = []
-        updated_outputs = []
+        for round_num in range(1, self.max_reconcile_rounds + 1):
+            trigger = f"score spread {spread} > threshold {self.disagreement_threshold}"
+            if round_num > 1:
+                trigger += f"; re-querying {', '.join(o.agent_name for o in targets)}"
 
-        for output in agent_outputs:
-            old_score = output.score_0_100
-
-            # Ask agent if they want to update
-            update_result = self._request_score_update(ticker, output, agent_outputs)
-
-            if update_result['changed']:
-                new_score = update_result['score_update']
-                reasoning = update_result['reasoning']
+            print(f"\n  Reconciliation Round {round_num}:")
+            print(f"    Trigger: {trigger}")
 
+            results, round_tokens, budget_note = self._run_reconcile_round(
+                ticker, targets, outputs, deadline, tokens_used
+            )
+            tokens_used += round_tokens
+
+            agent_updates = []
+            for i, output in enumerate(outputs):
+                result = results.get(output.agent_name)
+                if result is None:
+                    continue
+                old_score = output.score_0_100
+                if not result['changed']:
+                    print(f"    {output.agent_name}: {old_score}/100 (no change)")
+                    continue
+
+                new_score = result['score_update']
+                reasoning = result['reasoning']
                 print(f"    {output.agent_name}: {old_score}→{new_score}/100")
                 print(f"      Reason: {reasoning}")
 
-                # Create updated output
-                updated_output = AgentOutput(
+                # Trusted copy: output is already validated and new_score was
+                # range-checked in _parse_score_update()
+                outputs[i] = output.model_copy(update={"score_0_100": new_score})
+                last_reasoning[output.agent_name] = reasoning
+                agent_updates.append(AgentUpdate.model_construct(
                     agent_name=output.agent_name,
-                    ticker=output.ticker,
-                    score_0_100=new_score,
-                    bull_points=output.bull_points,
-                    bear_points=output.bear_points,
-                    key_risks=output.key_risks,
-                    confidence=output.confidence,
-                    evidence=output.evidence,
-                )
-                updated_outputs.append(updated_output)
-
-                agent_updates.append({
-                    "agent_name": output.agent_name,
-                    "old_score": old_score,
-                    "new_score": new_score,
-                    "reasoning": reasoning
-                })
-
-                # Track as dissenting view if still far from average
-                new_scores = [o.score_0_100 for o in updated_outputs] + [
-                    o.score_0_100 for o in agent_outputs if o not in [output]
-                ]
-                avg = sum(new_scores) / len(new_scores)
-
-                if abs(new_score - avg) > 10:  # More than 10 points from average
-                    dissenting_views.append({
-                        "agent_name": output.agent_name,
-                        "original_score": old_score,
-                        "final_score": new_score,
-                        "reason": reasoning
-                    })
+                    old_score=old_score,
+                    new_score=new_score,
+                    reasoning=reasoning,
+                ))
+
+            scores = [output.score_0_100 for output in outputs]
+            spread = max(scores) - min(scores)
+            targets = self._outside_consensus_band(outputs)
+
+            if spread <= self.disagreement_threshold:
+                stop = f"converged (spread {spread} <= {self.disagreement_threshold})"
+            elif budget_note:
+                stop = budget_note
+            elif not agent_updates:
+                stop = "no scores moved"
+            elif round_num == self.max_reconcile_rounds:
+                stop = "round limit reached"
             else:
-                print(f"    {output.agent_name}: {old_score}/100 (no change)")
-                updated_outputs.append(output)
-
-        # Record debate round
-        outcome = f"Reconciliation complete ({len(agent_updates)} agents updated)"
-        debate_round = DebateRound(
-            round_number=round_num,
-            trigger=trigger,
-            agent_updates=agent_updates,
-            outcome=outcome
-        )
-        debate_log.append(debate_round)
+                stop = None
+
+            outcome = f"Reconciliation complete ({len(agent_updates)} agents updated)"
+            outcome += f"; {stop}" if stop else f"; spread {spread}, continuing"
+            outcome += f"; ~{tokens_used:,} tokens so far"
+            debate_log.append(DebateRound(
+                round_number=round_num,
+                trigger=trigger,
+                agent_updates=agent_updates,
+                outcome=outcome,
+            ))
+            print(f"    Outcome: {outcome}")
+
+            if stop:
+                break
+
+        # Agents that moved but still sit far from the final average
+        average = sum(scores) / len(scores)
+        dissenting_views = [
+            {
+                "agent_name": output.agent_name,
+                "original_score": original_scores[output.agent_name],
+                "final_score": output.score_0_100,
+                "reason": last_reasoning[output.agent_name],
+            }
+            for output in outputs
+            if output.agent_name in last_reasoning
+            and abs(output.score_0_100 - average) > 10  # More than 10 points from average
+        ]
+
+        return outputs, debate_log, dissenting_views
+
+    def _outside_consensus_band(self, outputs: List[AgentOutput]) -> List[AgentOutput]:
+        """Agents more than half the disagreement threshold from the median score."""
+        median = statistics.median(output.score_0_100 for output in outputs)
+        band = self.disagreement_threshold / 2
+        return [output for output in outputs if abs(output.score_0_100 - median) > band]
+
+    def _run_reconcile_round(
+        self,
+        ticker: str,
+        targets: List[AgentOutput],
+        all_outputs: List[AgentOutput],
+        deadline: Optional[float],
+        tokens_used: int,
+    ) -> Tuple[Dict[str, dict], int, Optional[str]]:
+        """
+        Ask the target agents for score updates in parallel.
+
+        Cached responses are reused without a call. Uncached requests are
+        admitted furthest-from-median first while their estimated cost fits
+        the remaining token budget; requests still running at the deadline
+        are treated as "no change". Running requests can't be cancelled, so
+        they are charged their full estimated cost (prompt plus
+        RECONCILE_MAX_TOKENS of output) against the token budget.
 
-        return updated_outputs, debate_log, dissenting_views
+        Args:
+            ticker: Stock ticker
+            targets: Agents to re-query
+            all_outputs: Current outputs of every agent
+            deadline: time.monotonic() deadline for the debate (None = no limit)
+            tokens_used: Estimated tokens already spent in this debate
 
-    def _request_score_update(
+        Returns:
+            Tuple of (agent name -> update result, estimated tokens spent,
+            budget note if a budget cut the round short)
+        """
+        results: Dict[str, dict] = {}
+        requests = []
+        for output in targets:
+            system_prompt, user_prompt = self._build_update_prompts(ticker, output, all_outputs)
+            cache_key = f"{output.agent_name}:reconcile"
+            input_fingerprint = fingerprint(system_prompt, user_prompt)
+            cached = self._lookup_cached(ticker, cache_key, input_fingerprint)
+            if cached is not None:
+                results[output.agent_name] = cached
+            else:
+                requests.append((output, cache_key, input_fingerprint, system_prompt, user_prompt))
+
+        budget_note = None
+        if self.reconcile_token_budget:
+            median = statistics.median(output.score_0_100 for output in all_outputs)
+            requests.sort(key=lambda r: abs(r[0].score_0_100 - median), reverse=True)
+            admitted = []
+            remaining = self.reconcile_token_budget - tokens_used
+            for request in requests:
+                cost = estimate_tokens(request[3] + request[4]) + RECONCILE_MAX_TOKENS
+                if cost <= remaining:
+                    admitted.append(request)
+                    remaining -= cost
+            if len(admitted) < len(requests):
+                budget_note = f"token budget exhausted ({len(requests) - len(admitted)} agents skipped)"
+            requests = admitted
+
+        if deadline is not None and time.monotonic() >= deadline and requests:
+            return results, 0, "wall-clock budget exhausted"
+        if not requests:
+            return results, 0, budget_note
+
+        tier = self.router.policy.reconcile_tier if self.router is not None else None
+        clients = [
+            self._client_for(request[1], tier, input_tokens=estimate_tokens(request[3] + request[4]))
+            for request in requests
+        ]
+
+        executor = ThreadPoolExecutor(max_workers=len(requests))
+        futures = {
+            executor.submit(
+                client.complete,
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+                max_tokens=RECONCILE_MAX_TOKENS,
+                temperature=0.5,
+            ): (output, cache_key, input_fingerprint, system_prompt, user_prompt)
+            for client, (output, cache_key, input_fingerprint, system_prompt, user_prompt)
+            in zip(clients, requests)
+        }
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        done, not_done = wait(futures, timeout=timeout)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        tokens = 0
+        for future, (output, cache_key, input_fingerprint, system_prompt, user_prompt) in futures.items():
+            tokens += estimate_tokens(system_prompt + user_prompt)
+            if future not in done:
+                # Still running in the background; its response will be billed
+                tokens += RECONCILE_MAX_TOKENS
+                continue
+            try:
+                response = future.result()
+            except Exception as e:
+                print(f"    {output.agent_name}: update request failed ({e})")
+                continue
+            tokens += estimate_tokens(response)
+            result = self._parse_score_update(response, output)
+            if result is not None:
+                self._remember(ticker, cache_key, input_fingerprint, result)
+            else:
+                result = {
+                    "changed": False,
+                    "score_update": output.score_0_100,
+                    "reasoning": "No update (parsing error)",
+                }
+            results[output.agent_name] = result
+
+        if not_done:
+            budget_note = f"wall-clock budget exhausted ({len(not_done)} agents timed out)"
+        return results, tokens, budget_note
+
+    def _build_update_prompts(
         self, ticker: str, agent_output: AgentOutput, all_outputs: List[AgentOutput]
-    ) -> Dict[str, Any]:
+    ) -> Tuple[str, str]:
         """
-        Ask an agent if they want to update their score after seeing others' views.
+        Build the prompts asking an agent to reconsider its score after seeing others' views.
 
         Args:
             ticker: Stock ticker
-            agent_output: This agent's output
-            all_outputs: All agent outputs
+            agent_output: This agent's current output
+            all_outputs: Current outputs of every agent
 
         Returns:
-            Dict with 'changed' (bool), 'score_update' (int), 'reasoning' (str)
+            Tuple of (system_prompt, user_prompt)
         """
         # Build summary of other agents' views
         other_views = []
@@ -277,13 +683,20 @@ Other agents' views:
 Do you want to update your score based on this new information?
 Respond with JSON containing your score_update and reasoning."""
 
-        response = self.llm_client.complete(
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            max_tokens=500,
-            temperature=0.5,
-        )
+        return system_prompt, user_prompt
 
+    def _parse_score_update(self, response: str, agent_output: AgentOutput) -> Optional[Dict[str, Any]]:
+        """
+        Parse a score update response.
+
+        Args:
+            response: Raw LLM response
+            agent_output: The agent's output before the update
+
+        Returns:
+            Dict with 'changed' (bool), 'score_update' (int), 'reasoning' (str),
+            or None if the response can't be parsed
+        """
         try:
             # Remove markdown code blocks if present
             cleaned_response = response.strip()
@@ -296,20 +709,13 @@ Respond with JSON containing your score_update and reasoning."""
             cleaned_response = cleaned_response.strip()
 
             data = json.loads(cleaned_response)
-            new_score = data.get('score_update', agent_output.score_0_100)
-            reasoning = data.get('reasoning', 'No reasoning provided')
-
-            changed = new_score != agent_output.score_0_100
-
-            return {
-                "changed": changed,
-                "score_update": new_score,
-                "reasoning": reasoning
-            }
+            new_score = min(100, max(0, int(data.get('score_update', agent_output.score_0_100))))
+            reasoning = str(data.get('reasoning', 'No reasoning provided'))
         except Exception:
-            # If parsing fails, assume no change
-            return {
-                "changed": False,
-                "score_update": agent_output.score_0_100,
-                "reasoning": "No update (parsing error)"
-            }
+            return None
+
+        return {
+            "changed": new_score != agent_output.score_0_100,
+            "score_update": new_score,
+            "reasoning": reasoning,
+        }
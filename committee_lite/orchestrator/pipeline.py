@@ -0,0 +1,221 @@
+"""Constant-memory streaming pipeline for universe runs.
+
+Tickers flow through the committee one at a time and are written to a sink
+as soon as their decision is ready:
+
+    tickers -> data (prepare) -> agents -> reconcile -> PM -> sink
+
+The data stage runs on its own thread, fetching market data and building
+prompts for the next tickers while the current one is with the LLM. A
+ticker is "in flight" from the moment its data is fetched until the
+consumer has taken its decision and asked for the next one; at most
+max_in_flight tickers are in flight, so a slow sink stalls the data stage
+instead of letting fetched data pile up. Once a decision is handed off, its
+agent outputs, prompts and cached DataFrames are released, so peak memory
+depends on max_in_flight, not on the size of the universe.
+"""
+
+import contextlib
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from committee_lite.config import Config
+from committee_lite.orchestrator.committee import InvestmentCommittee
+from committee_lite.schemas import FinalDecision
+from committee_lite.tools import financial_data
+
+# (ticker, decision or None, error or None)
+PipelineResult = Tuple[str, Optional[FinalDecision], Optional[str]]
+
+_DONE = object()
+
+
+class PipelineStats(BaseModel):
+    """Outcome of a streaming pipeline run."""
+
+    decisions: int = Field(0, description="Decisions written to the sink")
+    failures: Dict[str, str] = Field(default_factory=dict, description="Ticker -> error")
+    max_in_flight: int = Field(0, description="Most tickers in flight at once")
+    elapsed_s: float = 0.0
+
+
+class _InFlight:
+    """Counts tickers between data fetch and hand-off, and the peak."""
+
+    def __init__(self, limit: int):
+        self.slots = threading.Semaphore(limit)
+        self._lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def enter(self, stop: threading.Event) -> bool:
+        """Wait for a free slot (False if the pipeline stopped meanwhile)."""
+        while not self.slots.acquire(timeout=0.1):
+            if stop.is_set():
+                return False
+        if stop.is_set():
+            self.slots.release()
+            return False
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        return True
+
+    def leave(self) -> None:
+        """Free a slot."""
+        with self._lock:
+            self.current -= 1
+        self.slots.release()
+
+
+def stream_decisions(
+    committee: InvestmentCommittee,
+    tickers: Iterable[str],
+    max_in_flight: Optional[int] = None,
+    release_data: bool = True,
+    stats: Optional[PipelineStats] = None,
+) -> Iterator[PipelineResult]:
+    """
+    Analyze tickers lazily, yielding each result as soon as it is ready.
+
+    The tickers iterable is consumed on the data thread only as slots free
+    up, so it may be a generator over a file of any length. A ticker's slot
+    (and its cached market data, if release_data) is freed when the
+    consumer asks for the next result, i.e. once it has written this one.
+    The committee analyzes one ticker at a time and is not shared with
+    other threads, apart from prepare() calls on the data thread.
+
+    Args:
+        committee: Committee that analyzes every ticker
+        tickers: Tickers to analyze (upper-cased)
+        max_in_flight: Tickers fetched but not yet handed off
+            (default: Config.PIPELINE_MAX_IN_FLIGHT)
+        release_data: Drop each ticker's cached fundamentals and prices
+            once its result is handed off
+        stats: Optional stats object; max_in_flight is recorded in it
+
+    Yields:
+        Tuple of (ticker, decision or None, error or None), in input order
+    """
+    limit = max_in_flight or Config.PIPELINE_MAX_IN_FLIGHT
+    if limit < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    in_flight = _InFlight(limit)
+    ready: queue.Queue = queue.Queue()
+    stop = threading.Event()
+    producer_error = []
+
+    def prepare_ahead() -> None:
+        try:
+            for ticker in tickers:
+                ticker = ticker.strip().upper()
+                if not ticker:
+                    continue
+                if not in_flight.enter(stop):
+                    return
+                try:
+                    ready.put((ticker, committee.prepare(ticker), None))
+                except Exception as e:
+                    ready.put((ticker, None, str(e)))
+        except Exception as e:
+            # The tickers iterable itself failed; re-raised by the consumer
+            producer_error.append(e)
+        finally:
+            ready.put(_DONE)
+
+    producer = threading.Thread(target=prepare_ahead, name="pipeline-data", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = ready.get()
+            if item is _DONE:
+                break
+            ticker, prepared, error = item
+            item = None
+            decision = None
+            if error is None:
+                try:
+                    decision = committee.analyze(ticker, prepared=prepared)
+                except Exception as e:
+                    error = str(e)
+            prepared = None
+            try:
+                yield ticker, decision, error
+            finally:
+                decision = None
+                if release_data:
+                    financial_data.clear_cache(ticker)
+                in_flight.leave()
+                if stats is not None:
+                    stats.max_in_flight = in_flight.peak
+        if producer_error:
+            raise producer_error[0]
+    finally:
+        stop.set()
+        producer.join()
+        # Closed early: release data fetched for tickers that were never analyzed
+        while not ready.empty():
+            item = ready.get_nowait()
+            if item is not _DONE and release_data:
+                financial_data.clear_cache(item[0])
+
+
+def run_pipeline(
+    committee: InvestmentCommittee,
+    tickers: Iterable[str],
+    sink: Callable[[FinalDecision], None],
+    max_in_flight: Optional[int] = None,
+    release_data: bool = True,
+    quiet: bool = True,
+    verbose: bool = False,
+) -> PipelineStats:
+    """
+    Stream a universe through the committee into a sink.
+
+    Args:
+        committee: Committee that analyzes every ticker
+        tickers: Tickers to analyze (any iterable, consumed lazily)
+        sink: Called with each decision as soon as it is ready, e.g.
+            DecisionWriter.write or DecisionStore.append. A slow sink
+            throttles data fetching (back-pressure).
+        max_in_flight: Tickers fetched but not yet written
+            (default: Config.PIPELINE_MAX_IN_FLIGHT)
+        release_data: Drop each ticker's cached market data once written
+        quiet: Suppress per-ticker committee output
+        verbose: Print one line per ticker
+
+    Returns:
+        PipelineStats (failed tickers are recorded, not raised)
+    """
+    stats = PipelineStats()
+    out = sys.stdout
+    start = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        if quiet:
+            # Discard rather than buffer: the output of a long run is unbounded
+            devnull = stack.enter_context(open(os.devnull, "w"))
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+        for ticker, decision, error in stream_decisions(
+            committee, tickers, max_in_flight, release_data, stats
+        ):
+            if decision is None:
+                stats.failures[ticker] = error
+                if verbose:
+                    print(f"  ❌ {ticker:8s}  {error}", file=out)
+                continue
+            sink(decision)
+            stats.decisions += 1
+            if verbose:
+                print(
+                    f"  {decision.ticker:8s}  {decision.final_rating:11s}"
+                    f"  avg {decision.average_score:5.1f}  spread {decision.score_spread:3d}",
+                    file=out,
+                )
+    stats.elapsed_s = time.perf_counter() - start
+    return stats
@@ -1,22 +1,48 @@
 """Portfolio Manager Agent - synthesizes committee outputs into final decision."""
 
 import json
-from typing import List
+from typing import List, Optional, Tuple
 from committee_lite.llm import LLMClient
 from committee_lite.schemas import AgentOutput
+from committee_lite.tools.compact import clip
+
+CONFIDENCE_RANK = {"Low": 0, "Medium": 1, "High": 2}
+
+# Lower score bound of each rating, matching the agents' 0-100 scoring bands
+RATING_BANDS = [(80, "STRONG BUY"), (60, "BUY"), (40, "HOLD"), (20, "SELL"), (0, "STRONG SELL")]
+
+ACTION_PLANS = {
+    "STRONG BUY": "Build a full position; committee is unanimous. Re-run the committee after the next earnings report.",
+    "BUY": "Scale in gradually; committee is unanimous. Re-run the committee after the next earnings report.",
+    "HOLD": "No new position; committee agrees there is no clear edge. Re-run on a material change in data.",
+    "SELL": "Reduce exposure; committee is unanimous. Re-run the committee after the next earnings report.",
+    "STRONG SELL": "Exit or avoid; committee is unanimous. Re-run only on a material change in fundamentals.",
+}
+
+
+def rating_for_score(score: float) -> str:
+    """Map an average committee score to a rating."""
+    for lower_bound, rating in RATING_BANDS:
+        if score >= lower_bound:
+            return rating
+    return "STRONG SELL"
 
 
 class PortfolioManagerAgent:
     """Portfolio Manager that synthesizes specialist agent outputs."""
 
-    def __init__(self, llm_client: LLMClient):
+    def __init__(self, llm_client: LLMClient, compact: bool = False, max_bullet_chars: int = 0):
         """
         Initialize Portfolio Manager.
 
         Args:
             llm_client: LLM client for synthesis
+            compact: Render agent analyses as terse lines in the synthesis prompt
+            max_bullet_chars: Cap on each agent bullet in compact mode (0 = no cap)
         """
         self.llm_client = llm_client
+        self.compact = compact
+        self.max_bullet_chars = max_bullet_chars
 
     def synthesize(
         self,
@@ -35,10 +61,102 @@ class PortfolioManagerAgent:
         Returns:
             Dictionary with final decision components
         """
+        system_prompt, user_prompt = self.build_prompts(ticker, agent_outputs, dissenting_views)
+        return self.run_prompts(system_prompt, user_prompt)
+
+    def synthesize_by_rules(
+        self,
+        ticker: str,
+        agent_outputs: List[AgentOutput],
+        dissenting_views: List[dict] = None,
+        max_spread: int = 5,
+        min_confidence: str = "High",
+    ) -> Optional[dict]:
+        """
+        Deterministic synthesis for a unanimous committee (no LLM call).
+
+        Args:
+            ticker: Stock ticker
+            agent_outputs: List of AgentOutput from specialists
+            dissenting_views: Optional list of dissenting agents
+            max_spread: Largest score spread that counts as consensus
+            min_confidence: Lowest agent confidence that counts as consensus
+
+        Returns:
+            Dictionary with final decision components, or None if the
+            consensus criteria aren't met (use synthesize() instead)
+        """
+        if not agent_outputs or dissenting_views:
+            return None
+
+        scores = [output.score_0_100 for output in agent_outputs]
+        spread = max(scores) - min(scores)
+        confidences = [CONFIDENCE_RANK[output.confidence] for output in agent_outputs]
+        if spread > max_spread or min(confidences) < CONFIDENCE_RANK[min_confidence]:
+            return None
+
+        average = sum(scores) / len(scores)
+        rating = rating_for_score(average)
+        lowest = min(confidences)
+        final_confidence = next(c for c, rank in CONFIDENCE_RANK.items() if rank == lowest)
+
+        by_score = sorted(agent_outputs, key=lambda o: o.score_0_100)
+        rationale = [
+            f"Unanimous committee: {len(scores)} agents within {spread} points "
+            f"(average {average:.1f}/100)",
+            "Scores: " + ", ".join(f"{o.agent_name} {o.score_0_100}" for o in agent_outputs),
+        ]
+        if by_score[-1].bull_points:
+            rationale.append(f"Strongest case ({by_score[-1].agent_name}): {by_score[-1].bull_points[0]}")
+        if by_score[0].bear_points:
+            rationale.append(f"Main concern ({by_score[0].agent_name}): {by_score[0].bear_points[0]}")
+        rationale.append(
+            f"Rule-based synthesis: spread <= {max_spread} and all confidence >= {min_confidence}"
+        )
+
+        risks = list(dict.fromkeys(risk for o in agent_outputs for risk in o.key_risks[:1]))
+        invalidation_criteria = risks[:3] or [f"Committee scores for {ticker} diverge"]
+
+        return {
+            "final_rating": rating,
+            "final_confidence": final_confidence,
+            "rationale": rationale,
+            "action_plan": ACTION_PLANS[rating],
+            "invalidation_criteria": invalidation_criteria,
+        }
+
+    def build_prompts(
+        self,
+        ticker: str,
+        agent_outputs: List[AgentOutput],
+        dissenting_views: List[dict] = None
+    ) -> Tuple[str, str]:
+        """
+        Build the synthesis prompts from agent outputs.
+
+        Args:
+            ticker: Stock ticker
+            agent_outputs: List of AgentOutput from specialists
+            dissenting_views: Optional list of dissenting agents
+
+        Returns:
+            Tuple of (system_prompt, user_prompt)
+        """
         # Prepare agent summaries
         agent_summaries = []
         for output in agent_outputs:
-            summary = f"""
+            if self.compact:
+                def bullets(points):
+                    return "; ".join(clip(point, self.max_bullet_chars) for point in points)
+
+                summary = f"""
+{output.agent_name} score={output.score_0_100} conf={output.confidence}
+bull: {bullets(output.bull_points)}
+bear: {bullets(output.bear_points)}
+risks: {bullets(output.key_risks)}
+"""
+            else:
+                summary = f"""
 {output.agent_name} Agent: {output.score_0_100}/100 (Confidence: {output.confidence})
 Bull Points: {', '.join(output.bull_points)}
 Bear Points: {', '.join(output.bear_points)}
@@ -46,14 +164,17 @@ Key Risks: {', '.join(output.key_risks)}
 """
             agent_summaries.append(summary.strip())
 
-        all_summaries = "\n\n".join(agent_summaries)
+        all_summaries = ("\n" if self.compact else "\n\n").join(agent_summaries)
 
         # Build dissent summary if any
         dissent_summary = ""
         if dissenting_views:
             dissent_summary = "\n\nDISSENTING VIEWS:\n"
             for dissent in dissenting_views:
-                dissent_summary += f"- {dissent['agent_name']}: {dissent['reason']}\n"
+                reason = dissent['reason']
+                if self.compact:
+                    reason = clip(reason, self.max_bullet_chars)
+                dissent_summary += f"- {dissent['agent_name']}: {reason}\n"
 
         # Build prompt
         system_prompt = """You are the Portfolio Manager for an investment committee.
@@ -91,8 +212,24 @@ Consider: Where do agents agree? Where do they disagree? What's the balance of e
 Action plan should be high-level (no specific price targets in demo mode).
 Invalidation criteria should be specific conditions (not vague)."""
 
+        return system_prompt, user_prompt
+
+    def run_prompts(
+        self, system_prompt: str, user_prompt: str, llm_client: Optional[LLMClient] = None
+    ) -> dict:
+        """
+        Call the LLM with prepared synthesis prompts and parse the response.
+
+        Args:
+            system_prompt: System prompt from build_prompts()
+            user_prompt: User prompt from build_prompts()
+            llm_client: Client for this call (default: the PM's client)
+
+        Returns:
+            Dictionary with final decision components
+        """
         # Get LLM response
-        response = self.llm_client.complete(
+        response = (llm_client or self.llm_client).complete(
             prompt=user_prompt,
             system_prompt=system_prompt,
             max_tokens=1500,
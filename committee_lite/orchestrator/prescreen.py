@@ -0,0 +1,208 @@
+"""Quantitative pre-screen that decides which tickers reach the LLM committee.
+
+Every ticker gets a deterministic composite score (0-100) from three
+cross-sectional factors, each the average percentile rank of its inputs
+across the universe:
+
+- quality: ROE, profit margin, revenue growth, low debt/equity
+- value: DCF upside (vectorized calculate_dcf_value())
+- momentum: price vs 50/200-day SMA, MACD histogram
+
+Missing inputs are skipped rather than penalized. select_shortlist() then
+promotes the top and bottom names plus any whose score moved since the
+previous screen, so only the shortlist costs LLM calls.
+"""
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from committee_lite.tools import (
+    calculate_dcf_upside_batch,
+    default_dcf_assumptions,
+    compute_indicators,
+    fetch_bulk_data,
+    fetch_current_treasury_rate,
+    get_price_history,
+)
+from committee_lite.tools.market_data import MarketDataProvider
+from committee_lite.tools.price_store import PriceStore
+
+
+# Factor -> (column, higher_is_better)
+FACTORS = {
+    "quality": [
+        ("roe", True),
+        ("profit_margin", True),
+        ("revenue_growth", True),
+        ("debt_to_equity", False),
+    ],
+    "value": [("dcf_upside", True)],
+    "momentum": [
+        ("trend_200d", True),
+        ("trend_50d", True),
+        ("macd_strength", True),
+    ],
+}
+
+
+def prescreen(
+    tickers: Sequence[str],
+    provider: Optional[MarketDataProvider] = None,
+    period: str = "1y",
+    price_store: Optional[PriceStore] = None,
+) -> pd.DataFrame:
+    """
+    Score a universe without any LLM calls.
+
+    Args:
+        tickers: Universe to screen
+        provider: Market data source (default: get_default_provider())
+        period: Price history period for the technical inputs
+        price_store: Read price windows from this store when it has the ticker
+
+    Returns:
+        DataFrame indexed by ticker with the raw inputs, factor scores and a
+        "score" column (0-100, NaN if no inputs), sorted best first
+    """
+    tickers = list(dict.fromkeys(t.upper() for t in tickers))
+    if not tickers:
+        return pd.DataFrame(columns=["score"])
+
+    frame = fetch_bulk_data(tickers, period=period, provider=provider)
+
+    # Same history-based defaults as the Valuation agent's DCF
+    defaults = default_dcf_assumptions(
+        frame["revenue"].to_numpy(dtype=np.float64),
+        frame["revenue_ttm"].to_numpy(dtype=np.float64),
+        frame["revenue_cagr"].to_numpy(dtype=np.float64),
+        frame["free_cash_flow"].to_numpy(dtype=np.float64),
+    )
+    frame["dcf_upside"] = calculate_dcf_upside_batch(
+        defaults["revenue"],
+        frame["market_cap"].to_numpy(dtype=np.float64),
+        frame["current_price"].to_numpy(dtype=np.float64),
+        beta=frame["beta"].to_numpy(dtype=np.float64),
+        total_debt=frame["total_debt"].to_numpy(dtype=np.float64),
+        total_cash=frame["total_cash"].to_numpy(dtype=np.float64),
+        growth_rate_stage1=defaults["growth_rate_stage1"],
+        fcf_margin=defaults["fcf_margin"],
+        risk_free_rate=fetch_current_treasury_rate(provider),
+    )
+
+    technicals = pd.DataFrame(
+        [_technical_inputs(t, period, provider, price_store) for t in frame.index],
+        index=frame.index,
+        columns=[column for column, _ in FACTORS["momentum"]],
+    )
+    frame = frame.join(technicals)
+
+    return score_frame(frame)
+
+
+def score_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add factor and composite scores to a frame of raw screen inputs.
+
+    Args:
+        frame: One row per ticker with the FACTORS input columns
+
+    Returns:
+        Copy of the frame with factor columns and "score", sorted best first
+    """
+    frame = frame.copy()
+    for factor, inputs in FACTORS.items():
+        ranks = [
+            frame[column].astype(float).rank(pct=True, ascending=higher_is_better)
+            for column, higher_is_better in inputs
+        ]
+        frame[factor] = pd.concat(ranks, axis=1).mean(axis=1, skipna=True)
+
+    frame["score"] = frame[list(FACTORS)].mean(axis=1, skipna=True) * 100
+    return frame.sort_values("score", ascending=False, na_position="last")
+
+
+def select_shortlist(
+    screen: pd.DataFrame,
+    top_n: int = 0,
+    bottom_n: int = 0,
+    previous: Optional[pd.Series] = None,
+    min_change: float = 10.0,
+) -> Dict[str, str]:
+    """
+    Pick the tickers to promote to the full committee.
+
+    Args:
+        screen: Output of prescreen()
+        top_n: Promote the N highest scores
+        bottom_n: Promote the N lowest scores
+        previous: Scores from the previous screen (ticker -> score)
+        min_change: Promote tickers whose score moved at least this much
+            (and tickers that are new since the previous screen)
+
+    Returns:
+        Ticker -> reason, in screen order
+    """
+    scored = screen["score"].dropna()
+    reasons: Dict[str, str] = {}
+
+    for ticker in scored.index[:top_n]:
+        reasons[ticker] = "top"
+    for ticker in scored.index[::-1][:bottom_n]:
+        reasons.setdefault(ticker, "bottom")
+
+    if previous is not None:
+        change = scored - previous.reindex(scored.index)
+        for ticker in scored.index:
+            if ticker not in previous.index or pd.isna(previous[ticker]):
+                reasons.setdefault(ticker, "new")
+            elif abs(change[ticker]) >= min_change:
+                reasons.setdefault(ticker, f"changed {change[ticker]:+.1f}")
+
+    order = {ticker: i for i, ticker in enumerate(screen.index)}
+    return dict(sorted(reasons.items(), key=lambda item: order[item[0]]))
+
+
+def load_scores(path: str) -> pd.Series:
+    """Read scores saved by save_scores() (empty if the file doesn't exist)."""
+    try:
+        return pd.read_csv(path, index_col="ticker")["score"]
+    except FileNotFoundError:
+        return pd.Series(dtype=float, name="score")
+
+
+def save_scores(screen: pd.DataFrame, path: str) -> None:
+    """Save screen scores for change detection on the next run."""
+    screen[["score"]].rename_axis("ticker").to_csv(path)
+
+
+def _technical_inputs(
+    ticker: str,
+    period: str,
+    provider: Optional[MarketDataProvider],
+    price_store: Optional[PriceStore],
+) -> Dict[str, float]:
+    """Momentum inputs for one ticker (empty when there is no price history)."""
+    if price_store is not None and ticker in price_store:
+        bars = price_store.window(ticker, period=period)
+        close, volume = bars["close"], bars["volume"]
+    else:
+        hist = get_price_history(ticker, period=period, provider=provider)
+        if hist.empty:
+            return {}
+        close = hist["Close"].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(close)
+        close = close[valid]
+        volume = hist["Volume"].to_numpy(dtype=np.float64)[valid]
+
+    if len(close) == 0:
+        return {}
+
+    indicators = compute_indicators(ticker, close, volume)
+    price = indicators["current_price"]
+    return {
+        "trend_200d": price / indicators["sma_200"] - 1,
+        "trend_50d": price / indicators["sma_50"] - 1,
+        "macd_strength": indicators["macd_histogram"] / price,
+    }
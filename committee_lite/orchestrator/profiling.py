@@ -0,0 +1,189 @@
+"""Per-phase profiling of committee runs.
+
+PhaseProfiler wraps each phase of an analysis (data fetch, each specialist
+agent, reconciliation, PM synthesis) in two profilers:
+
+- cProfile on a thread CPU-time clock, for a ranked summary of where each
+  phase spends on-CPU time (pandas, pydantic, prompt rendering, parsing)
+- a wall-clock stack sampler covering the phase's thread and any worker
+  threads it starts, for collapsed stacks ("phase;frame;frame N") that
+  flamegraph.pl or speedscope render directly
+
+Phase wall time is also split into on-CPU time (process CPU time, all
+threads) and waiting time (LLM and network I/O).
+"""
+
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterator, List
+
+from pydantic import BaseModel, Field
+
+
+class PhaseTiming(BaseModel):
+    """Accumulated time of one profiled phase."""
+
+    name: str
+    calls: int = Field(..., description="Times the phase was entered")
+    wall_s: float = Field(..., description="Elapsed wall-clock time")
+    cpu_s: float = Field(..., description="Process CPU time (all threads)")
+    samples: int = Field(..., description="Wall-clock stack samples taken")
+
+    @property
+    def wait_s(self) -> float:
+        """Wall time not spent on the CPU (LLM calls, network, sleeps)."""
+        return max(self.wall_s - self.cpu_s, 0.0)
+
+
+class PhaseProfiler:
+    """Collects CPU profiles and wall-clock stack samples per phase."""
+
+    def __init__(self, sample_interval: float = 0.005, top_n: int = 25):
+        """
+        Initialize profiler.
+
+        Args:
+            sample_interval: Seconds between wall-clock stack samples
+            top_n: Functions listed per phase in the text summary
+        """
+        self.sample_interval = sample_interval
+        self.top_n = top_n
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._timings: Dict[str, PhaseTiming] = {}
+        self._stacks: Counter = Counter()
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Profile a block of code as (part of) a named phase.
+
+        Re-entering a phase accumulates into it. Phases don't nest: the CPU
+        profiler can only be active once per thread.
+
+        Args:
+            name: Phase name (e.g. "data", "agent:Technical")
+        """
+        profile = self._profiles.setdefault(name, cProfile.Profile(time.thread_time))
+        stop = threading.Event()
+        sampler = threading.Thread(
+            target=self._sample,
+            args=(name, threading.get_ident(), set(sys._current_frames()), stop),
+            name=f"profiler-{name}",
+            daemon=True,
+        )
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        sampler.start()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            stop.set()
+            sampler.join()
+            timing = self._timings.get(name) or PhaseTiming(
+                name=name, calls=0, wall_s=0.0, cpu_s=0.0, samples=0
+            )
+            timing.calls += 1
+            timing.wall_s += time.perf_counter() - wall_start
+            timing.cpu_s += time.process_time() - cpu_start
+            timing.samples = sum(
+                count for stack, count in self._stacks.items() if stack.split(";", 1)[0] == name
+            )
+            self._timings[name] = timing
+
+    def _sample(self, name: str, owner: int, existing: set, stop: threading.Event) -> None:
+        """Sample the phase's thread and the threads started during the phase."""
+        me = threading.get_ident()
+        while not stop.wait(self.sample_interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me or (ident != owner and ident in existing):
+                    continue
+                frames = []
+                while frame is not None:
+                    code = frame.f_code
+                    frames.append(f"{code.co_name} ({_short_path(code.co_filename)})")
+                    frame = frame.f_back
+                root = [name] if ident == owner else [name, f"[{names.get(ident, ident)}]"]
+                self._stacks[";".join(root + frames[::-1])] += 1
+
+    def timings(self) -> List[PhaseTiming]:
+        """Phase timings in the order phases were first entered."""
+        return list(self._timings.values())
+
+    def collapsed_stacks(self) -> str:
+        """Wall-clock samples in collapsed-stack format, one stack per line."""
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self._stacks.items()))
+
+    def summary(self) -> str:
+        """Phase time table followed by the top on-CPU functions of each phase."""
+        timings = self.timings()
+        total_wall = sum(t.wall_s for t in timings) or 1e-9
+        lines = [
+            "PHASE TIMINGS",
+            "-" * 78,
+            f"{'Phase':<24}{'Calls':>6}{'Wall s':>10}{'CPU s':>10}{'Wait s':>10}{'CPU %':>8}{'Wall %':>8}",
+        ]
+        for t in timings:
+            cpu_pct = 100 * t.cpu_s / t.wall_s if t.wall_s else 0.0
+            lines.append(
+                f"{t.name:<24}{t.calls:>6}{t.wall_s:>10.3f}{t.cpu_s:>10.3f}{t.wait_s:>10.3f}"
+                f"{cpu_pct:>7.0f}%{100 * t.wall_s / total_wall:>7.0f}%"
+            )
+        lines.append(
+            f"{'Total':<24}{'':>6}{sum(t.wall_s for t in timings):>10.3f}"
+            f"{sum(t.cpu_s for t in timings):>10.3f}{sum(t.wait_s for t in timings):>10.3f}"
+        )
+
+        for name, profile in self._profiles.items():
+            stream = io.StringIO()
+            stats = pstats.Stats(profile, stream=stream)
+            stats.sort_stats("tottime").print_stats(self.top_n)
+            lines.extend(["", "=" * 78, f"PHASE {name}: top on-CPU functions", "=" * 78])
+            lines.append(stream.getvalue().strip())
+        return "\n".join(lines) + "\n"
+
+    def write(self, output_dir: str, stem: str) -> Dict[str, str]:
+        """
+        Write the collapsed stacks and the text summary.
+
+        Args:
+            output_dir: Directory (created if missing)
+            stem: File name prefix (e.g. "NVDA_20250101_120000")
+
+        Returns:
+            Dict with the "collapsed" and "summary" file paths
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        paths = {
+            "collapsed": os.path.join(output_dir, f"{stem}.collapsed"),
+            "summary": os.path.join(output_dir, f"{stem}_profile.txt"),
+        }
+        with open(paths["collapsed"], "w") as f:
+            f.write(self.collapsed_stacks())
+        with open(paths["summary"], "w") as f:
+            f.write(self.summary())
+        return paths
+
+
+def _short_path(filename: str) -> str:
+    """Trim a source path to its package-relative part (e.g. pandas/core/frame.py)."""
+    for marker in ("site-packages" + os.sep, "lib" + os.sep + "python"):
+        if marker in filename:
+            filename = filename.rsplit(marker, 1)[1]
+            if marker.startswith("lib"):
+                filename = filename.split(os.sep, 1)[-1]
+            return filename
+    parts = filename.split(os.sep)
+    if "committee_lite" in parts:
+        return os.sep.join(parts[parts.index("committee_lite"):])
+    return os.path.basename(filename)
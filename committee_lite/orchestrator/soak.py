@@ -0,0 +1,252 @@
+"""Soak test: sustained committee runs with memory-growth detection.
+
+Drives a warm InvestmentCommittee (or the batch runner) over offline fixture
+data with a latency-simulating mock LLM for a fixed duration. After a warmup
+pass fills the data caches, it samples RSS and tracemalloc usage at a fixed
+interval; the run fails if either grew more than the allowed amount, and the
+report lists the allocation sites (file:line) that grew the most, so leaks in
+caches, debate logs or client objects show up before production.
+"""
+
+import contextlib
+import gc
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import List, Optional, Sequence
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from committee_lite.config import Config
+from committee_lite.llm.mock_adapter import MockAdapter
+from committee_lite.orchestrator.batch import run_universe
+from committee_lite.orchestrator.committee import InvestmentCommittee
+from committee_lite.tools import FixtureProvider
+from committee_lite.tools.market_data import write_synthetic_fixtures
+
+MB = 1024 * 1024
+
+
+class SoakSample(BaseModel):
+    """Memory usage at one point of a soak run."""
+
+    elapsed_s: float = Field(..., description="Seconds since the baseline")
+    decisions: int = Field(..., description="Decisions completed since the start")
+    rss_mb: float = Field(..., description="Resident set size")
+    traced_mb: float = Field(..., description="Memory currently traced by tracemalloc")
+
+
+class AllocationGrowth(BaseModel):
+    """Growth of one allocation site between the baseline and the final snapshot."""
+
+    location: str = Field(..., description="file:line of the allocation")
+    size_diff_kb: float = Field(..., description="Growth in KiB")
+    count_diff: int = Field(..., description="Growth in live blocks")
+
+
+class SoakReport(BaseModel):
+    """Outcome of a soak run."""
+
+    mode: str
+    duration_s: float
+    decisions: int
+    failures: int
+    baseline_rss_mb: float
+    rss_growth_mb: float
+    traced_growth_mb: float
+    growth_mb_per_hour: float = Field(..., description="Least-squares RSS slope over the samples")
+    max_growth_mb: float
+    passed: bool
+    samples: List[SoakSample] = Field(default_factory=list)
+    top_growth: List[AllocationGrowth] = Field(default_factory=list)
+
+    def __str__(self) -> str:
+        """Human-readable soak summary."""
+        throughput = self.decisions / self.duration_s * 60 if self.duration_s else 0.0
+        lines = [
+            "",
+            "=" * 60,
+            f"SOAK TEST ({self.mode}): {'PASSED' if self.passed else 'FAILED'}",
+            "=" * 60,
+            f"Duration:      {self.duration_s:.0f}s",
+            f"Decisions:     {self.decisions} ({throughput:.1f}/min, {self.failures} failed)",
+            f"Baseline RSS:  {self.baseline_rss_mb:.1f} MB",
+            f"RSS growth:    {self.rss_growth_mb:+.1f} MB ({self.growth_mb_per_hour:+.1f} MB/hour)",
+            f"Traced growth: {self.traced_growth_mb:+.1f} MB",
+            f"Threshold:     {self.max_growth_mb:.1f} MB",
+        ]
+        if self.top_growth:
+            lines.extend(["", "TOP ALLOCATION GROWTH:", "-" * 60])
+            for site in self.top_growth:
+                lines.append(
+                    f"  {site.size_diff_kb:+10.1f} KiB {site.count_diff:+8d} blocks  {site.location}"
+                )
+        return "\n".join(lines)
+
+
+def current_rss_mb() -> float:
+    """Current resident set size (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / MB
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        return peak / MB if sys.platform == "darwin" else peak / 1024
+
+
+def run_soak(
+    duration_s: float,
+    tickers: Sequence[str],
+    data_dir: Optional[str] = None,
+    mode: str = "committee",
+    sample_interval_s: float = 10.0,
+    max_growth_mb: float = 50.0,
+    latency: float = 0.05,
+    jitter: float = 0.02,
+    top_n: int = 10,
+    committee: Optional[InvestmentCommittee] = None,
+    verbose: bool = True,
+) -> SoakReport:
+    """
+    Run the committee at sustained throughput and check memory growth.
+
+    Args:
+        duration_s: Measured run time after the warmup pass
+        tickers: Tickers analyzed round-robin
+        data_dir: Fixture directory (default: synthetic fixtures in a temp dir)
+        mode: "committee" (one warm committee, like a queue worker) or "batch"
+            (repeated serial run_universe() calls)
+        sample_interval_s: Seconds between memory samples
+        max_growth_mb: Fail if RSS or traced memory grows more than this
+        latency: Simulated seconds per mock LLM call
+        jitter: Uniform +/- variation of the simulated latency
+        top_n: Allocation sites to report
+        committee: Committee to drive in "committee" mode (default: a mock
+            committee over data_dir)
+        verbose: Print each sample as it is taken
+
+    Returns:
+        SoakReport
+    """
+    if mode not in ("committee", "batch"):
+        raise ValueError(f"Unknown soak mode: {mode}")
+    tickers = [t.upper() for t in tickers]
+    if not tickers:
+        raise ValueError("Soak test needs at least one ticker")
+
+    with contextlib.ExitStack() as stack:
+        if data_dir is None:
+            data_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="soak-"))
+            write_synthetic_fixtures(data_dir, tickers)
+
+        # Latency for mocks built by get_llm_client() (batch mode)
+        stack.callback(setattr, Config, "MOCK_LATENCY", Config.MOCK_LATENCY)
+        stack.callback(setattr, Config, "MOCK_LATENCY_JITTER", Config.MOCK_LATENCY_JITTER)
+        Config.MOCK_LATENCY, Config.MOCK_LATENCY_JITTER = latency, jitter
+
+        if mode == "committee" and committee is None:
+            committee = InvestmentCommittee(
+                llm_client=MockAdapter(latency=latency, jitter=jitter),
+                data_provider=FixtureProvider(data_dir),
+            )
+
+        decisions = 0
+        failures = 0
+
+        def run_round() -> None:
+            """Analyze every ticker once, counting decisions and failures."""
+            nonlocal decisions, failures
+            if mode == "batch":
+                done, failed = run_universe(tickers, backend="serial", mock=True, data_dir=data_dir)
+                decisions += len(done)
+                failures += len(failed)
+                return
+            with contextlib.redirect_stdout(io.StringIO()):
+                for ticker in tickers:
+                    try:
+                        committee.analyze(ticker)
+                        decisions += 1
+                    except Exception:
+                        failures += 1
+
+        tracemalloc.start()
+        stack.callback(tracemalloc.stop)
+
+        # Warmup: fill data caches and lazily-created objects before the baseline
+        run_round()
+        gc.collect()
+        baseline = tracemalloc.take_snapshot()
+        baseline_traced = tracemalloc.get_traced_memory()[0] / MB
+        baseline_rss = current_rss_mb()
+
+        samples: List[SoakSample] = []
+        start = time.monotonic()
+        next_sample = start + sample_interval_s
+        while True:
+            run_round()
+            now = time.monotonic()
+            finished = now - start >= duration_s
+            if now >= next_sample or finished:
+                gc.collect()
+                sample = SoakSample(
+                    elapsed_s=now - start,
+                    decisions=decisions,
+                    rss_mb=current_rss_mb(),
+                    traced_mb=tracemalloc.get_traced_memory()[0] / MB,
+                )
+                samples.append(sample)
+                next_sample = now + sample_interval_s
+                if verbose:
+                    print(
+                        f"  t={sample.elapsed_s:7.1f}s  decisions={sample.decisions:6d}  "
+                        f"rss={sample.rss_mb:8.1f} MB  traced={sample.traced_mb:8.1f} MB"
+                    )
+            if finished:
+                break
+
+        final = tracemalloc.take_snapshot()
+
+    ignore = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ]
+    growth = final.filter_traces(ignore).compare_to(baseline.filter_traces(ignore), "lineno")
+    top_growth = [
+        AllocationGrowth(
+            location=f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            size_diff_kb=stat.size_diff / 1024,
+            count_diff=stat.count_diff,
+        )
+        for stat in growth[:top_n]
+        if stat.size_diff > 0
+    ]
+
+    rss_growth = samples[-1].rss_mb - baseline_rss
+    traced_growth = samples[-1].traced_mb - baseline_traced
+    if len(samples) >= 2:
+        slope = np.polyfit([s.elapsed_s for s in samples], [s.rss_mb for s in samples], 1)[0]
+    else:
+        slope = rss_growth / max(samples[-1].elapsed_s, 1e-9)
+
+    return SoakReport(
+        mode=mode,
+        duration_s=samples[-1].elapsed_s,
+        decisions=decisions,
+        failures=failures,
+        baseline_rss_mb=baseline_rss,
+        rss_growth_mb=rss_growth,
+        traced_growth_mb=traced_growth,
+        growth_mb_per_hour=float(slope) * 3600,
+        max_growth_mb=max_growth_mb,
+        passed=rss_growth <= max_growth_mb and traced_growth <= max_growth_mb,
+        samples=samples,
+        top_growth=top_growth,
+    )
@@ -0,0 +1,358 @@
+"""Watchlist daemon: event-driven re-analysis on price and indicator triggers.
+
+The watcher keeps an IndicatorState per ticker warm and feeds it new daily
+bars, either polled from a PriceStore or pushed (push_bar()). A bar that
+crosses no threshold costs an O(1) indicator update and nothing else:
+
+- RSI crossing 30 or 70, or the MACD histogram changing sign, re-runs only
+  the Technical agent on the warm indicators. The committee is re-run only
+  if the Technical score moved escalate_delta points or more since the last
+  committee run.
+- A price move of move_pct or more since the last committee run re-runs the
+  committee directly (it changes valuation as well as technicals).
+
+So re-analysis work follows market activity, not watchlist size. A
+re-analysis that fails (e.g. an API timeout) is reported on its event and
+leaves the ticker's reference point as it was, so the daemon keeps running
+and the next bar that still crosses a threshold retries it.
+"""
+
+import json
+import sys
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from committee_lite.config import Config
+from committee_lite.orchestrator.committee import PARSE_ERROR_EVIDENCE, InvestmentCommittee
+from committee_lite.schemas import FinalDecision
+from committee_lite.tools.financial_data import get_price_history
+from committee_lite.tools.price_store import PriceStore
+from committee_lite.tools.technical_indicators import IndicatorState
+
+RSI_LEVELS = (30.0, 70.0)
+
+
+class WatchEvent(BaseModel):
+    """A bar that crossed a threshold, and the re-analysis it caused."""
+
+    ticker: str
+    date: Optional[str] = None
+    price: float
+    triggers: List[str] = Field(..., description="Thresholds crossed by the bar")
+    action: str = Field(..., description='"technical" or "committee"')
+    technical_score: Optional[int] = None
+    final_rating: Optional[str] = None
+    final_confidence: Optional[str] = None
+    error: Optional[str] = Field(default=None, description="Why the re-analysis failed")
+
+    def __str__(self) -> str:
+        """One-line summary."""
+        when = f" {self.date}" if self.date else ""
+        line = f"{self.ticker}{when} @ {self.price:.2f}: {'; '.join(self.triggers)} -> {self.action}"
+        if self.technical_score is not None:
+            line += f" (Technical {self.technical_score}/100)"
+        if self.final_rating is not None:
+            line += f" => {self.final_rating} ({self.final_confidence})"
+        if self.error is not None:
+            line += f" failed: {self.error}"
+        return line
+
+
+class _Watched:
+    """Warm indicator state plus the reference point of the last committee run."""
+
+    def __init__(self, state: IndicatorState, technical_score: Optional[int]):
+        self.state = state
+        self.reference_price = state.price
+        self.technical_score = technical_score
+        self.seen = 0  # Bars consumed from the price store
+
+
+class Watcher:
+    """Keeps per-ticker indicator state warm and re-analyzes on triggers."""
+
+    def __init__(
+        self,
+        committee: InvestmentCommittee,
+        price_store: Optional[PriceStore] = None,
+        decision_store=None,
+        move_pct: Optional[float] = None,
+        escalate_delta: Optional[int] = None,
+        window: int = 252,
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            committee: Committee used for re-analysis (its technical agent
+                handles technical-only runs)
+            price_store: Local price source to poll; pushed bars are appended
+                to it so committee re-runs see them
+            decision_store: Optional DecisionStore; supplies each ticker's
+                last Technical score and stores new decisions
+            move_pct: Price move (%) since the last committee run that
+                re-runs the committee (default: Config.WATCH_MOVE_PCT)
+            escalate_delta: Technical score shift that escalates a
+                technical-only run to the committee
+                (default: Config.WATCH_ESCALATE_DELTA)
+            window: Trailing bars of indicator state per ticker
+        """
+        self.committee = committee
+        self.price_store = price_store
+        self.decision_store = decision_store
+        self.move_pct = Config.WATCH_MOVE_PCT if move_pct is None else move_pct
+        self.escalate_delta = (
+            Config.WATCH_ESCALATE_DELTA if escalate_delta is None else escalate_delta
+        )
+        self.window = window
+        self.stats = {"bars": 0, "technical_runs": 0, "committee_runs": 0, "failures": 0}
+        self._watched: Dict[str, _Watched] = {}
+
+    @property
+    def tickers(self) -> List[str]:
+        """Watched tickers."""
+        return list(self._watched)
+
+    def watch(self, ticker: str) -> bool:
+        """
+        Seed a ticker's indicator state from the price store or data provider.
+
+        Returns:
+            True if the ticker had price history to seed from
+        """
+        ticker = ticker.upper()
+        seen = 0
+        if self.price_store is not None and ticker in self.price_store:
+            seen = self.price_store.length(ticker)
+            bars = self.price_store.window(ticker, bars=self.window)
+            close, volume = bars["close"], bars["volume"]
+        else:
+            hist = get_price_history(ticker, provider=self.committee.data_provider)
+            if hist.empty:
+                return False
+            close = hist["Close"].to_numpy(dtype=np.float64)
+            valid = ~np.isnan(close)
+            close = close[valid]
+            volume = hist["Volume"].to_numpy(dtype=np.float64)[valid]
+        if len(close) == 0:
+            return False
+
+        last = self.decision_store.latest(ticker) if self.decision_store is not None else None
+        watched = _Watched(
+            IndicatorState(ticker, close, volume, window=self.window),
+            last.agent_scores.get("Technical") if last is not None else None,
+        )
+        watched.seen = seen
+        self._watched[ticker] = watched
+        return True
+
+    def push_bar(
+        self,
+        ticker: str,
+        close: float,
+        volume: float = 0.0,
+        date=None,
+        open: Optional[float] = None,
+        high: Optional[float] = None,
+        low: Optional[float] = None,
+    ) -> Optional[WatchEvent]:
+        """
+        Take a pushed bar (appended to the price store first, if there is one).
+
+        Returns:
+            WatchEvent if the bar triggered a re-analysis, else None
+        """
+        ticker = ticker.upper()
+        if ticker not in self._watched:
+            raise KeyError(f"{ticker} is not watched")
+        if self.price_store is not None and date is not None:
+            written = self.price_store.append_bar(
+                ticker,
+                date,
+                open=close if open is None else open,
+                high=close if high is None else high,
+                low=close if low is None else low,
+                close=close,
+                volume=volume,
+            )
+            if not written:
+                return None  # Not newer than the stored history
+            self._watched[ticker].seen += written
+        return self.on_bar(ticker, close, volume, date)
+
+    def poll(self) -> List[WatchEvent]:
+        """Consume bars appended to the price store since the last poll."""
+        if self.price_store is None:
+            return []
+        self.price_store.reload()
+
+        events = []
+        for ticker, watched in self._watched.items():
+            new = self.price_store.length(ticker) - watched.seen
+            if new <= 0:
+                continue
+            bars = self.price_store.window(ticker, bars=new)
+            watched.seen += new
+            for day, close, volume in zip(bars["date"], bars["close"], bars["volume"]):
+                date = str(np.datetime64(int(day), "D"))
+                event = self.on_bar(ticker, float(close), float(volume), date)
+                if event is not None:
+                    events.append(event)
+        return events
+
+    def on_bar(
+        self, ticker: str, close: float, volume: float, date: Optional[str] = None
+    ) -> Optional[WatchEvent]:
+        """
+        Update a ticker's indicators with a new bar and re-analyze on triggers.
+
+        Returns:
+            WatchEvent if the bar triggered a re-analysis, else None
+        """
+        watched = self._watched[ticker.upper()]
+        state = watched.state
+        previous_rsi, previous_histogram = state.rsi, state.macd_histogram
+        state.update(close, volume)
+        self.stats["bars"] += 1
+
+        move = (state.price / watched.reference_price - 1) * 100
+        price_trigger = abs(move) >= self.move_pct
+        triggers = [f"price {move:+.1f}% since last committee run"] if price_trigger else []
+        triggers.extend(
+            _indicator_triggers(previous_rsi, state.rsi, previous_histogram, state.macd_histogram)
+        )
+        if not triggers:
+            return None
+
+        event = WatchEvent(
+            ticker=state.ticker,
+            date=None if date is None else str(date),
+            price=state.price,
+            triggers=triggers,
+            action="technical",
+        )
+
+        try:
+            if not price_trigger:
+                output = self._run_technical(state)
+                self.stats["technical_runs"] += 1
+                event.technical_score = output.score_0_100
+                if PARSE_ERROR_EVIDENCE in output.evidence:
+                    return event
+                if (
+                    watched.technical_score is not None
+                    and abs(output.score_0_100 - watched.technical_score) < self.escalate_delta
+                ):
+                    return event
+                previous = "none" if watched.technical_score is None else watched.technical_score
+                event.triggers.append(f"Technical score {previous}->{output.score_0_100}")
+
+            event.action = "committee"
+            decision = self._run_committee(state.ticker)
+        except Exception as e:
+            # Keep the reference point so the next bar re-triggers
+            self.stats["failures"] += 1
+            event.error = f"{type(e).__name__}: {e}"
+            print(f"⚠️  {state.ticker} {event.action} re-analysis failed: {e}", file=sys.stderr)
+            return event
+
+        watched.reference_price = state.price
+        watched.technical_score = decision.agent_scores.get("Technical")
+        event.technical_score = watched.technical_score
+        event.final_rating = decision.final_rating
+        event.final_confidence = decision.final_confidence
+        return event
+
+    def _run_technical(self, state: IndicatorState):
+        """Re-run the Technical agent on the warm indicators."""
+        agent = self.committee.technical_agent
+        system_prompt, user_prompt = agent.build_prompts(state.ticker, state.indicators())
+        return agent.run_prompts(state.ticker, system_prompt, user_prompt)
+
+    def _run_committee(self, ticker: str) -> FinalDecision:
+        """Re-run the full committee and store the decision."""
+        decision = self.committee.analyze(ticker)
+        self.stats["committee_runs"] += 1
+        if self.decision_store is not None:
+            self.decision_store.append(decision)
+        return decision
+
+    def run(
+        self,
+        poll_interval: Optional[float] = None,
+        max_polls: Optional[int] = None,
+        verbose: bool = True,
+    ) -> None:
+        """
+        Poll the price store until interrupted.
+
+        Args:
+            poll_interval: Seconds between polls (default: Config.WATCH_POLL_INTERVAL)
+            max_polls: Stop after this many polls (default: run forever)
+            verbose: Print each event
+        """
+        interval = Config.WATCH_POLL_INTERVAL if poll_interval is None else poll_interval
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            for event in self.poll():
+                if verbose:
+                    print(f"🔔 {event}")
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(interval)
+
+    def run_stream(self, lines, verbose: bool = True, poll: bool = False) -> None:
+        """
+        Process pushed bars, one JSON object per line.
+
+        Each line has "ticker" and "close", optionally "volume", "date",
+        "open", "high" and "low". Unwatched tickers and malformed lines are
+        reported and skipped.
+
+        Args:
+            lines: Iterable of text lines (e.g. sys.stdin)
+            verbose: Print each event
+            poll: Also consume bars other writers appended to the price
+                store, checked before each line
+        """
+        for line in lines:
+            if poll:
+                for event in self.poll():
+                    if verbose:
+                        print(f"🔔 {event}")
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                bar = json.loads(line)
+                event = self.push_bar(
+                    bar["ticker"],
+                    float(bar["close"]),
+                    float(bar.get("volume", 0.0)),
+                    date=bar.get("date"),
+                    open=bar.get("open"),
+                    high=bar.get("high"),
+                    low=bar.get("low"),
+                )
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"⚠️  Skipping bar {line[:80]!r}: {e}", file=sys.stderr)
+                continue
+            if event is not None and verbose:
+                print(f"🔔 {event}")
+
+
+def _indicator_triggers(
+    previous_rsi: float, rsi: float, previous_histogram: float, histogram: float
+) -> List[str]:
+    """RSI level crossings and MACD histogram sign flips between two bars."""
+    triggers = []
+    if not (np.isnan(previous_rsi) or np.isnan(rsi)):
+        for level in RSI_LEVELS:
+            if (previous_rsi < level) != (rsi < level):
+                triggers.append(f"RSI crossed {level:.0f} ({previous_rsi:.0f}->{rsi:.0f})")
+    if previous_histogram * histogram < 0:
+        triggers.append("MACD turned " + ("bullish" if histogram > 0 else "bearish"))
+    return triggers
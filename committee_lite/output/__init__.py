@@ -0,0 +1,58 @@
+"""Batched writers for decision dumps (JSONL, MessagePack, Parquet)."""
+
+from typing import Optional
+
+from committee_lite.output.base import DecisionWriter
+from committee_lite.output.jsonl import JSONLWriter, read_jsonl
+from committee_lite.output.msgpack_writer import MessagePackWriter, read_msgpack
+from committee_lite.output.parquet import ParquetWriter, flatten_decision
+
+WRITERS = {
+    "jsonl": JSONLWriter,
+    "msgpack": MessagePackWriter,
+    "parquet": ParquetWriter,
+}
+
+
+def infer_format(path: str) -> str:
+    """Guess the output format from a file extension (default: jsonl)."""
+    name = path.lower()
+    if name.endswith(".parquet"):
+        return "parquet"
+    if name.endswith((".msgpack", ".msgpack.gz", ".mpk")):
+        return "msgpack"
+    return "jsonl"
+
+
+def open_writer(path: str, format: Optional[str] = None, **kwargs) -> DecisionWriter:
+    """
+    Create a decision writer.
+
+    Args:
+        path: Output file path
+        format: "jsonl", "msgpack" or "parquet" (default: from the extension)
+        **kwargs: Passed to the writer (batch_size, compression, ...)
+
+    Returns:
+        DecisionWriter (use as a context manager)
+    """
+    format = format or infer_format(path)
+    if format not in WRITERS:
+        raise ValueError(f"Unknown output format: {format}")
+    if "compression" not in kwargs and path.lower().endswith(".gz"):
+        kwargs["compression"] = "gzip"
+    return WRITERS[format](path, **kwargs)
+
+
+__all__ = [
+    "DecisionWriter",
+    "JSONLWriter",
+    "MessagePackWriter",
+    "ParquetWriter",
+    "WRITERS",
+    "flatten_decision",
+    "infer_format",
+    "open_writer",
+    "read_jsonl",
+    "read_msgpack",
+]
@@ -0,0 +1,83 @@
+"""Base class for batched decision writers."""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from committee_lite.schemas import FinalDecision
+
+
+class DecisionWriter(ABC):
+    """
+    Buffers FinalDecision objects and writes them to one file in batches.
+
+    Subclasses implement _write_batch() (and _close() if they hold a
+    file handle). Use as a context manager so the last batch is flushed.
+    """
+
+    #: Compression codecs accepted by this writer (None = uncompressed)
+    compressions: tuple = (None,)
+
+    def __init__(self, path: str, batch_size: int = 1000, compression: Optional[str] = None):
+        """
+        Initialize writer.
+
+        Args:
+            path: Output file path (parent directories are created)
+            batch_size: Decisions buffered before each write
+            compression: Compression codec (see the subclass's `compressions`)
+        """
+        if compression not in self.compressions:
+            raise ValueError(
+                f"{type(self).__name__} supports compression {self.compressions}, got {compression!r}"
+            )
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.compression = compression
+        self.count = 0
+        self._buffer: List[FinalDecision] = []
+        self._closed = False
+
+    def write(self, decision: FinalDecision) -> None:
+        """Buffer a decision, flushing when the batch is full."""
+        if self._closed:
+            raise ValueError("Writer is closed")
+        self._buffer.append(decision)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, decisions: Iterable[FinalDecision]) -> None:
+        """Buffer several decisions."""
+        for decision in decisions:
+            self.write(decision)
+
+    def flush(self) -> None:
+        """Write any buffered decisions."""
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self.count += len(self._buffer)
+            self._buffer = []
+
+    def close(self) -> None:
+        """Flush and release the file."""
+        if self._closed:
+            return
+        self.flush()
+        self._close()
+        self._closed = True
+
+    def __enter__(self) -> "DecisionWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @abstractmethod
+    def _write_batch(self, decisions: List[FinalDecision]) -> None:
+        """Write one batch of decisions."""
+        pass
+
+    def _close(self) -> None:
+        """Release file handles (default: nothing to release)."""
+        pass
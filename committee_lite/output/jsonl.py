@@ -0,0 +1,45 @@
+"""JSON Lines decision writer (one compact FinalDecision per line)."""
+
+import gzip
+from typing import Iterator, List, Optional
+
+from committee_lite.output.base import DecisionWriter
+from committee_lite.schemas import FinalDecision
+
+
+class JSONLWriter(DecisionWriter):
+    """Writes decisions as JSON Lines, optionally gzip-compressed."""
+
+    compressions = (None, "gzip")
+
+    def __init__(self, path: str, batch_size: int = 1000, compression: Optional[str] = None):
+        super().__init__(path, batch_size, compression)
+        if compression == "gzip":
+            self._file = gzip.open(self.path, "wb")
+        else:
+            self._file = open(self.path, "wb")
+
+    def _write_batch(self, decisions: List[FinalDecision]) -> None:
+        self._file.write(b"".join(d.model_dump_json().encode() + b"\n" for d in decisions))
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+def read_jsonl(path: str) -> Iterator[FinalDecision]:
+    """
+    Read decisions back from a JSONL file (gzip detected from the file header).
+
+    Args:
+        path: File written by JSONLWriter
+
+    Yields:
+        FinalDecision objects in file order
+    """
+    with open(path, "rb") as f:
+        compressed = f.read(2) == b"\x1f\x8b"
+    opener = gzip.open if compressed else open
+    with opener(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield FinalDecision.model_validate_json(line)
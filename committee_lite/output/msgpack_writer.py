@@ -0,0 +1,58 @@
+"""MessagePack decision writer (requires the optional msgpack package)."""
+
+import gzip
+from typing import Iterator, List, Optional
+
+from committee_lite.output.base import DecisionWriter
+from committee_lite.schemas import FinalDecision
+
+
+def _import_msgpack():
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError(
+            "MessagePack output requires msgpack: pip install 'investment-committee-lite[output]'"
+        ) from e
+    return msgpack
+
+
+class MessagePackWriter(DecisionWriter):
+    """Writes decisions as a stream of MessagePack maps, optionally gzip-compressed."""
+
+    compressions = (None, "gzip")
+
+    def __init__(self, path: str, batch_size: int = 1000, compression: Optional[str] = None):
+        super().__init__(path, batch_size, compression)
+        self._packer = _import_msgpack().Packer()
+        if compression == "gzip":
+            self._file = gzip.open(self.path, "wb")
+        else:
+            self._file = open(self.path, "wb")
+
+    def _write_batch(self, decisions: List[FinalDecision]) -> None:
+        self._file.write(
+            b"".join(self._packer.pack(d.model_dump(mode="json")) for d in decisions)
+        )
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+def read_msgpack(path: str) -> Iterator[FinalDecision]:
+    """
+    Read decisions back from a MessagePack stream (gzip detected from the header).
+
+    Args:
+        path: File written by MessagePackWriter
+
+    Yields:
+        FinalDecision objects in file order
+    """
+    msgpack = _import_msgpack()
+    with open(path, "rb") as f:
+        compressed = f.read(2) == b"\x1f\x8b"
+    opener = gzip.open if compressed else open
+    with opener(path, "rb") as f:
+        for record in msgpack.Unpacker(f, raw=False):
+            yield FinalDecision.model_validate(record)
@@ -0,0 +1,148 @@
+"""Parquet decision writer (requires the optional pyarrow package).
+
+Each decision becomes one row: agent scores are flattened into
+score_<agent> columns, while rationale, invalidation criteria, dissenting
+views and the debate log stay nested lists. Every flushed batch is written
+as one row group.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from committee_lite.output.base import DecisionWriter
+from committee_lite.schemas import FinalDecision
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet output requires pyarrow: pip install 'investment-committee-lite[output]'"
+        ) from e
+    return pyarrow
+
+
+def score_column(agent_name: str) -> str:
+    """Column name for an agent's score (e.g. "Fundamentals" -> "score_fundamentals")."""
+    return "score_" + agent_name.lower().replace(" ", "_")
+
+
+def flatten_decision(decision: FinalDecision, agents: Sequence[str]) -> Dict[str, Any]:
+    """
+    Flatten a decision into one Parquet row.
+
+    Args:
+        decision: Decision to flatten
+        agents: Agents that get a score column (missing scores are null)
+
+    Returns:
+        Dict of column -> value
+    """
+    row = {
+        "ticker": decision.ticker,
+        "timestamp": decision.timestamp,
+        "final_rating": decision.final_rating,
+        "final_confidence": decision.final_confidence,
+        "average_score": decision.average_score,
+        "score_spread": decision.score_spread,
+        "synthesis_path": decision.synthesis_path,
+    }
+    for agent in agents:
+        row[score_column(agent)] = decision.agent_scores.get(agent)
+
+    nested = decision.model_dump(
+        include={"rationale", "invalidation_criteria", "dissenting_views", "debate_log"}
+    )
+    row["action_plan"] = decision.action_plan
+    row.update(nested)
+    return row
+
+
+def decision_schema(agents: Sequence[str]):
+    """Arrow schema for flattened decisions."""
+    pa = _import_pyarrow()
+    update = pa.struct([
+        ("agent_name", pa.string()),
+        ("old_score", pa.int64()),
+        ("new_score", pa.int64()),
+        ("reasoning", pa.string()),
+    ])
+    debate_round = pa.struct([
+        ("round_number", pa.int64()),
+        ("trigger", pa.string()),
+        ("agent_updates", pa.list_(update)),
+        ("outcome", pa.string()),
+    ])
+    dissent = pa.struct([
+        ("agent_name", pa.string()),
+        ("original_score", pa.int64()),
+        ("final_score", pa.int64()),
+        ("reason", pa.string()),
+    ])
+    return pa.schema(
+        [
+            ("ticker", pa.string()),
+            ("timestamp", pa.timestamp("us")),
+            ("final_rating", pa.string()),
+            ("final_confidence", pa.string()),
+            ("average_score", pa.float64()),
+            ("score_spread", pa.int64()),
+            ("synthesis_path", pa.string()),
+        ]
+        + [(score_column(agent), pa.int64()) for agent in agents]
+        + [
+            ("action_plan", pa.string()),
+            ("rationale", pa.list_(pa.string())),
+            ("invalidation_criteria", pa.list_(pa.string())),
+            ("dissenting_views", pa.list_(dissent)),
+            ("debate_log", pa.list_(debate_round)),
+        ]
+    )
+
+
+class ParquetWriter(DecisionWriter):
+    """Writes decisions to a Parquet file, one row group per batch."""
+
+    compressions = (None, "snappy", "zstd", "gzip")
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 1000,
+        compression: Optional[str] = "snappy",
+        agents: Optional[Sequence[str]] = None,
+    ):
+        """
+        Initialize writer.
+
+        Args:
+            path: Output file path
+            batch_size: Decisions per row group
+            compression: Parquet codec (snappy, zstd, gzip or None)
+            agents: Agents that get score columns (default: those in the first batch)
+        """
+        super().__init__(path, batch_size, compression)
+        self._pa = _import_pyarrow()
+        self.agents = list(agents) if agents else None
+        self._writer = None
+
+    def _write_batch(self, decisions: List[FinalDecision]) -> None:
+        if self.agents is None:
+            self.agents = list(dict.fromkeys(a for d in decisions for a in d.agent_scores))
+        schema = decision_schema(self.agents)
+        table = self._pa.Table.from_pylist(
+            [flatten_decision(d, self.agents) for d in decisions], schema=schema
+        )
+        if self._writer is None:
+            self._writer = self._pa.parquet.ParquetWriter(
+                str(self.path), schema, compression=self.compression or "none"
+            )
+        self._writer.write_table(table)
+
+    def _close(self) -> None:
+        if self._writer is None:
+            # Nothing was written: still leave a valid, empty file
+            schema = decision_schema(self.agents or [])
+            self._writer = self._pa.parquet.ParquetWriter(str(self.path), schema)
+        self._writer.close()
@@ -1,11 +1,19 @@
 """Pydantic schemas for investment committee outputs."""
 
 from committee_lite.schemas.agent_output import AgentOutput
-from committee_lite.schemas.decision import FinalDecision, DebateRound, DissentingView
+from committee_lite.schemas.decision import (
+    FinalDecision,
+    DebateRound,
+    AgentUpdate,
+    DissentingView,
+    LLMCall,
+)
 
 __all__ = [
     "AgentOutput",
     "FinalDecision",
     "DebateRound",
+    "AgentUpdate",
     "DissentingView",
+    "LLMCall",
 ]
@@ -1,6 +1,6 @@
 """Schema for individual agent outputs."""
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 from typing import Literal, List
 
 
@@ -37,14 +37,6 @@ class AgentOutput(BaseModel):
         description="Data sources and specific evidence supporting the analysis"
     )
 
-    @field_validator('bull_points', 'bear_points', 'key_risks')
-    @classmethod
-    def validate_max_length(cls, v: List[str]) -> List[str]:
-        """Ensure lists have at most 3 items."""
-        if len(v) > 3:
-            raise ValueError("Maximum 3 items allowed")
-        return v
-
     def __str__(self) -> str:
         """Human-readable representation."""
         lines = [
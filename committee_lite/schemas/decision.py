@@ -14,18 +14,42 @@ class DissentingView(BaseModel):
     reason: str = Field(..., description="Why this agent disagrees with consensus")
 
 
+class AgentUpdate(BaseModel):
+    """One agent's score change during a reconciliation round."""
+
+    agent_name: str = Field(..., description="Name of the agent")
+    old_score: int = Field(..., ge=0, le=100, description="Score before the round")
+    new_score: int = Field(..., ge=0, le=100, description="Score after the round")
+    reasoning: str = Field(..., description="Why the agent changed its score")
+
+
 class DebateRound(BaseModel):
     """Tracks a single round of disagreement reconciliation."""
 
     round_number: int = Field(..., description="Round number (1-indexed)")
     trigger: str = Field(..., description="What triggered this round (e.g., 'score spread 25 > threshold 15')")
-    agent_updates: List[dict] = Field(
+    agent_updates: List[AgentUpdate] = Field(
         ...,
-        description="List of agent updates in this round (agent_name, old_score, new_score, reasoning)"
+        description="Agent score changes in this round"
     )
     outcome: str = Field(..., description="Outcome of this round (e.g., 'consensus reached', 'max rounds hit')")
 
 
+class LLMCall(BaseModel):
+    """One LLM call made for a decision, with the routing tier it used."""
+
+    role: str = Field(..., description="Caller (agent name, '<agent>:reconcile' or 'PortfolioManager')")
+    tier: str = Field(..., description="Routing tier ('default' when routing is off)")
+    model: str = Field(..., description="Model behind the tier")
+    escalation: Optional[str] = Field(
+        default=None,
+        description="Why this call re-ran an agent on a stronger tier (e.g. 'low confidence')"
+    )
+    input_tokens: int = Field(
+        default=0, ge=0, description="Estimated prompt tokens (system + user, via estimate_tokens())"
+    )
+
+
 class FinalDecision(BaseModel):
     """Final investment committee decision."""
 
@@ -82,6 +106,21 @@ class FinalDecision(BaseModel):
         description="Full transcript of disagreement reconciliation rounds"
     )
 
+    synthesis_path: Literal["llm", "rules"] = Field(
+        default="llm",
+        description="How the final rating was produced: PM LLM call or rule-based consensus"
+    )
+
+    llm_calls: List[LLMCall] = Field(
+        default_factory=list,
+        description="LLM calls made for this decision and the tier each used"
+    )
+
+    @property
+    def input_tokens(self) -> int:
+        """Estimated prompt tokens across every LLM call for this decision."""
+        return sum(call.input_tokens for call in self.llm_calls)
+
     def __str__(self) -> str:
         """Human-readable decision packet."""
         lines = [
@@ -106,6 +145,7 @@ class FinalDecision(BaseModel):
             "=" * 80,
             f"FINAL RATING: {self.final_rating}",
             f"CONFIDENCE:   {self.final_confidence}",
+            f"SYNTHESIS:    {'rule-based (unanimous committee)' if self.synthesis_path == 'rules' else 'Portfolio Manager'}",
             "=" * 80,
             "",
             "RATIONALE:",
@@ -154,14 +194,16 @@ class FinalDecision(BaseModel):
                     "-" * 40,
                 ])
                 for update in debate_round.agent_updates:
-                    agent = update.get('agent_name', 'Unknown')
-                    old = update.get('old_score', 'N/A')
-                    new = update.get('new_score', 'N/A')
-                    reasoning = update.get('reasoning', 'No reasoning provided')
-                    lines.append(f"  {agent}: {old}→{new}/100")
-                    lines.append(f"    {reasoning}")
+                    lines.append(f"  {update.agent_name}: {update.old_score}→{update.new_score}/100")
+                    lines.append(f"    {update.reasoning}")
                 lines.append(f"  Outcome: {debate_round.outcome}")
 
+        if self.llm_calls:
+            lines.extend([
+                "",
+                f"LLM calls: {len(self.llm_calls)} (~{self.input_tokens:,} input tokens)",
+            ])
+
         lines.extend([
             "",
             "=" * 80,
@@ -0,0 +1,6 @@
+"""Persistent storage for committee decisions."""
+
+from committee_lite.store.decision_store import DecisionStore, RATING_RANK
+from committee_lite.store.output_cache import MemoryOutputCache, fingerprint
+
+__all__ = ["DecisionStore", "RATING_RANK", "MemoryOutputCache", "fingerprint"]
@@ -0,0 +1,330 @@
+"""SQLite-backed store for historical FinalDecisions.
+
+Each decision is one row with indexed summary columns (ticker, timestamp,
+rating, average score, spread) and the agent scores, debate log and full
+decision payload stored alongside as JSON.
+
+The store also keeps the latest fingerprinted agent/PM outputs per ticker so
+it can serve as the output cache for incremental re-analysis.
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import TypeAdapter
+
+from committee_lite.schemas import DebateRound, FinalDecision
+
+
+# Ordinal rank used to compare ratings (higher = more bullish)
+RATING_RANK = {
+    "STRONG SELL": 0,
+    "SELL": 1,
+    "HOLD": 2,
+    "BUY": 3,
+    "STRONG BUY": 4,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decisions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticker TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    final_rating TEXT NOT NULL,
+    rating_rank INTEGER NOT NULL,
+    final_confidence TEXT NOT NULL,
+    average_score REAL NOT NULL,
+    score_spread INTEGER NOT NULL,
+    agent_scores TEXT NOT NULL,
+    debate_log TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_decisions_ticker_ts ON decisions (ticker, timestamp);
+CREATE INDEX IF NOT EXISTS idx_decisions_ts ON decisions (timestamp);
+CREATE INDEX IF NOT EXISTS idx_decisions_rating ON decisions (final_rating, timestamp);
+CREATE INDEX IF NOT EXISTS idx_decisions_score ON decisions (average_score);
+CREATE INDEX IF NOT EXISTS idx_decisions_spread ON decisions (score_spread);
+
+CREATE TABLE IF NOT EXISTS cached_outputs (
+    ticker TEXT NOT NULL,
+    key TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (ticker, key)
+);
+"""
+
+_SUMMARY_COLUMNS = (
+    "id, ticker, timestamp, final_rating, final_confidence, "
+    "average_score, score_spread, agent_scores"
+)
+
+
+class DecisionStore:
+    """Persistent, queryable archive of committee decisions."""
+
+    def __init__(self, path: str = "outputs/decisions.db"):
+        """
+        Open (or create) a decision store.
+
+        Args:
+            path: SQLite database file (":memory:" for a throwaway store)
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def __enter__(self) -> "DecisionStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def append(self, decision: FinalDecision) -> int:
+        """
+        Append a single decision.
+
+        Args:
+            decision: FinalDecision to store
+
+        Returns:
+            Row id of the stored decision
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO decisions (ticker, timestamp, final_rating, rating_rank, "
+                "final_confidence, average_score, score_spread, agent_scores, debate_log, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                _to_row(decision),
+            )
+            self._conn.commit()
+            return cursor.lastrowid
+
+    def append_many(self, decisions: Iterable[FinalDecision]) -> int:
+        """
+        Append a batch of decisions in a single transaction.
+
+        Args:
+            decisions: Decisions from a batch run
+
+        Returns:
+            Number of decisions written
+        """
+        rows = [_to_row(decision) for decision in decisions]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO decisions (ticker, timestamp, final_rating, rating_rank, "
+                "final_confidence, average_score, score_spread, agent_scores, debate_log, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def query(
+        self,
+        ticker: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        rating: Optional[str] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        min_spread: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query decision summaries using the indexed columns.
+
+        Args:
+            ticker: Restrict to one ticker
+            since: Only decisions at or after this time
+            until: Only decisions before this time
+            rating: Only decisions with this final rating
+            min_score: Minimum average score
+            max_score: Maximum average score
+            min_spread: Minimum score spread
+            limit: Maximum rows to return
+
+        Returns:
+            List of summary dicts, newest first
+        """
+        clauses = []
+        params: List[Any] = []
+
+        if ticker is not None:
+            clauses.append("ticker = ?")
+            params.append(ticker.upper())
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since.isoformat())
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(until.isoformat())
+        if rating is not None:
+            clauses.append("final_rating = ?")
+            params.append(rating)
+        if min_score is not None:
+            clauses.append("average_score >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            clauses.append("average_score <= ?")
+            params.append(max_score)
+        if min_spread is not None:
+            clauses.append("score_spread >= ?")
+            params.append(min_spread)
+
+        sql = f"SELECT {_SUMMARY_COLUMNS} FROM decisions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY timestamp DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [_summary(row) for row in rows]
+
+    def get(self, decision_id: int) -> Optional[FinalDecision]:
+        """Load the full decision stored under a row id."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM decisions WHERE id = ?", (decision_id,)
+            ).fetchone()
+        return FinalDecision.model_validate_json(row["payload"]) if row else None
+
+    def latest(self, ticker: str) -> Optional[FinalDecision]:
+        """Load the most recent decision for a ticker."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM decisions WHERE ticker = ? "
+                "ORDER BY timestamp DESC, id DESC LIMIT 1",
+                (ticker.upper(),),
+            ).fetchone()
+        return FinalDecision.model_validate_json(row["payload"]) if row else None
+
+    def rating_changes(
+        self, since: datetime, direction: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find rating changes relative to each ticker's previous decision.
+
+        Args:
+            since: Only changes recorded at or after this time
+            direction: "downgrade", "upgrade", or None for both
+
+        Returns:
+            List of dicts with ticker, timestamp, previous_rating, final_rating
+        """
+        if direction == "downgrade":
+            change_clause = "rating_rank < prev_rank"
+        elif direction == "upgrade":
+            change_clause = "rating_rank > prev_rank"
+        elif direction is None:
+            change_clause = "rating_rank != prev_rank"
+        else:
+            raise ValueError(f"Unknown direction: {direction}")
+
+        # Only tickers with a decision in the window need their history scanned
+        sql = f"""
+            SELECT id, ticker, timestamp, final_rating, prev_rating FROM (
+                SELECT id, ticker, timestamp, final_rating, rating_rank,
+                       LAG(final_rating) OVER w AS prev_rating,
+                       LAG(rating_rank) OVER w AS prev_rank
+                FROM decisions
+                WHERE ticker IN (SELECT DISTINCT ticker FROM decisions WHERE timestamp >= ?)
+                WINDOW w AS (PARTITION BY ticker ORDER BY timestamp, id)
+            )
+            WHERE timestamp >= ? AND prev_rank IS NOT NULL AND {change_clause}
+            ORDER BY timestamp DESC, id DESC
+        """
+        cutoff = since.isoformat()
+        with self._lock:
+            rows = self._conn.execute(sql, (cutoff, cutoff)).fetchall()
+
+        return [
+            {
+                "id": row["id"],
+                "ticker": row["ticker"],
+                "timestamp": datetime.fromisoformat(row["timestamp"]),
+                "previous_rating": row["prev_rating"],
+                "final_rating": row["final_rating"],
+            }
+            for row in rows
+        ]
+
+    def lookup(self, ticker: str, key: str, input_fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Return the cached output payload if its input fingerprint matches."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM cached_outputs WHERE ticker = ? AND key = ? AND fingerprint = ?",
+                (ticker.upper(), key, input_fingerprint),
+            ).fetchone()
+        return json.loads(row["payload"]) if row else None
+
+    def remember(
+        self, ticker: str, key: str, input_fingerprint: str, payload: Dict[str, Any]
+    ) -> None:
+        """Store the output payload produced from inputs with this fingerprint."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cached_outputs (ticker, key, fingerprint, payload, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (ticker.upper(), key, input_fingerprint, json.dumps(payload),
+                 datetime.now().isoformat()),
+            )
+            self._conn.commit()
+
+    def count(self) -> int:
+        """Total number of stored decisions."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM decisions").fetchone()[0]
+
+
+_DEBATE_LOG = TypeAdapter(List[DebateRound])
+
+
+def _to_row(decision: FinalDecision) -> tuple:
+    """Flatten a FinalDecision into a decisions table row."""
+    return (
+        decision.ticker.upper(),
+        decision.timestamp.isoformat(),
+        decision.final_rating,
+        RATING_RANK[decision.final_rating],
+        decision.final_confidence,
+        decision.average_score,
+        decision.score_spread,
+        json.dumps(decision.agent_scores),
+        _DEBATE_LOG.dump_json(decision.debate_log).decode(),
+        decision.model_dump_json(),
+    )
+
+
+def _summary(row: sqlite3.Row) -> Dict[str, Any]:
+    """Convert a summary row to a plain dict."""
+    return {
+        "id": row["id"],
+        "ticker": row["ticker"],
+        "timestamp": datetime.fromisoformat(row["timestamp"]),
+        "final_rating": row["final_rating"],
+        "final_confidence": row["final_confidence"],
+        "average_score": row["average_score"],
+        "score_spread": row["score_spread"],
+        "agent_scores": json.loads(row["agent_scores"]),
+    }
@@ -0,0 +1,51 @@
+"""Fingerprint-keyed cache of agent and PM outputs for incremental re-analysis.
+
+A cache entry is keyed by (ticker, key) where key is the agent name (or
+e.g. "PortfolioManager"), and is only returned when the fingerprint of the
+inputs that produced it matches the current inputs.
+"""
+
+import hashlib
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+def fingerprint(*parts: str) -> str:
+    """
+    Hash an input payload (e.g. system and user prompts) into a fingerprint.
+
+    Args:
+        parts: Strings that fully determine the LLM call
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class MemoryOutputCache:
+    """In-process output cache (latest entry per ticker and key)."""
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._entries: Dict[Tuple[str, str], Tuple[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, ticker: str, key: str, input_fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload if its input fingerprint matches."""
+        with self._lock:
+            entry = self._entries.get((ticker.upper(), key))
+        if entry and entry[0] == input_fingerprint:
+            return entry[1]
+        return None
+
+    def remember(
+        self, ticker: str, key: str, input_fingerprint: str, payload: Dict[str, Any]
+    ) -> None:
+        """Store the payload produced from inputs with this fingerprint."""
+        with self._lock:
+            self._entries[(ticker.upper(), key)] = (input_fingerprint, payload)
@@ -1,14 +1,75 @@
 """Data tools for investment analysis."""
 
-from committee_lite.tools.financial_data import get_financial_data, format_financial_summary
-from committee_lite.tools.technical_indicators import get_technical_indicators, format_technical_summary
-from committee_lite.tools.dcf_calculator import calculate_dcf_value, format_dcf_summary
+from committee_lite.tools.market_data import (
+    MarketDataProvider,
+    YFinanceProvider,
+    FixtureProvider,
+    CompositeProvider,
+    get_default_provider,
+    set_default_provider,
+    make_provider,
+)
+from committee_lite.tools.snapshot import FinancialSnapshot, SnapshotBatch
+from committee_lite.tools.statements import StatementHistory, compute_trends
+from committee_lite.tools.financial_data import (
+    get_financial_data,
+    get_financial_snapshot,
+    get_price_history,
+    fetch_bulk_data,
+    clear_cache,
+    format_financial_summary,
+    format_trend_summary,
+)
+from committee_lite.tools.price_store import PriceStore
+from committee_lite.tools.archive import SnapshotArchive, PointInTimeProvider
+from committee_lite.tools.peer_index import PeerIndex, format_peer_summary
+from committee_lite.tools.technical_indicators import (
+    get_technical_indicators,
+    compute_indicators,
+    format_technical_summary,
+)
+from committee_lite.tools.dcf_calculator import (
+    calculate_dcf_value,
+    calculate_dcf_upside_batch,
+    calculate_reverse_dcf_batch,
+    default_dcf_assumptions,
+    two_stage_multiple,
+    fetch_current_treasury_rate,
+    format_dcf_summary,
+)
 
 __all__ = [
+    "MarketDataProvider",
+    "YFinanceProvider",
+    "FixtureProvider",
+    "CompositeProvider",
+    "get_default_provider",
+    "set_default_provider",
+    "make_provider",
+    "FinancialSnapshot",
+    "SnapshotBatch",
+    "StatementHistory",
+    "compute_trends",
     "get_financial_data",
+    "get_financial_snapshot",
+    "get_price_history",
+    "fetch_bulk_data",
+    "clear_cache",
     "format_financial_summary",
+    "format_trend_summary",
+    "PriceStore",
+    "SnapshotArchive",
+    "PointInTimeProvider",
+    "PeerIndex",
+    "format_peer_summary",
     "get_technical_indicators",
+    "compute_indicators",
     "format_technical_summary",
     "calculate_dcf_value",
+    "calculate_dcf_upside_batch",
+    "calculate_reverse_dcf_batch",
+    "default_dcf_assumptions",
+    "two_stage_multiple",
+    "fetch_current_treasury_rate",
     "format_dcf_summary",
 ]
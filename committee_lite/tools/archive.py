@@ -0,0 +1,338 @@
+"""Point-in-time archive of fundamentals, price bars and the risk-free rate.
+
+Backtests must only see what was known on each past date. The archive keeps
+every fundamentals snapshot (yfinance-style info dict plus statements) under
+the date it was captured, daily bars in a PriceStore, and a dated series of
+risk-free rates. archive.provider(as_of) is a MarketDataProvider that serves
+the archive as it stood on that date:
+
+- info: the latest snapshot captured on or before as_of, with price-derived
+  fields (price, market cap, P/E, P/B, P/S, PEG, EV) re-marked to the close
+  on as_of
+- statements: that snapshot's statements, minus periods that ended less
+  than filing_lag_days before as_of (not yet filed)
+- prices: bars dated on or before as_of
+- risk-free rate: the latest rate dated on or before as_of
+
+Layout:
+
+    <root>/snapshots.db   SQLite: fundamentals snapshots and rates
+    <root>/prices/        PriceStore of daily bars
+"""
+
+import io
+import json
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from committee_lite.tools.market_data import STATEMENTS, MarketDataProvider, trim_to_period
+from committee_lite.tools.price_store import PriceStore
+
+
+# Days between a statement's period end and the filing that makes it public
+FILING_LAG_DAYS = 90
+
+# Info fields proportional to the share price, re-marked to the as-of close
+PRICE_SCALED_FIELDS = (
+    "marketCap",
+    "enterpriseValue",
+    "trailingPE",
+    "forwardPE",
+    "priceToBook",
+    "priceToSalesTrailing12Months",
+    "pegRatio",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fundamentals (
+    ticker TEXT NOT NULL,
+    as_of TEXT NOT NULL,
+    info BLOB NOT NULL,
+    statements BLOB,
+    PRIMARY KEY (ticker, as_of)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS rates (
+    as_of TEXT PRIMARY KEY,
+    rate REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def _day(date) -> pd.Timestamp:
+    """Normalize a date-like value to a tz-naive midnight Timestamp."""
+    ts = pd.Timestamp(date)
+    if ts.tz is not None:
+        ts = ts.tz_localize(None)
+    return ts.normalize()
+
+
+def _pack(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, default=str).encode("utf-8"))
+
+
+def _unpack(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+class SnapshotArchive:
+    """Dated fundamentals snapshots, daily bars and risk-free rates."""
+
+    def __init__(self, root: str):
+        """
+        Open (or create) an archive.
+
+        Args:
+            root: Archive directory
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.prices = PriceStore(str(self.root / "prices"))
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.root / "snapshots.db"), timeout=30, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "SnapshotArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def add_fundamentals(
+        self,
+        ticker: str,
+        as_of,
+        info: Dict[str, Any],
+        statements: Optional[Dict[str, pd.DataFrame]] = None,
+    ) -> None:
+        """
+        Store a fundamentals snapshot (replacing one with the same date).
+
+        Args:
+            ticker: Stock ticker
+            as_of: Date the data was known
+            info: yfinance-style info dict
+            statements: Statements keyed by name (columns = period end dates)
+        """
+        packed = None
+        if statements:
+            packed = _pack({
+                name: frame.to_json(orient="split", date_format="iso")
+                for name, frame in statements.items()
+                if frame is not None and not frame.empty
+            })
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fundamentals VALUES (?, ?, ?, ?)",
+                (ticker.upper(), _day(as_of).date().isoformat(), _pack(info), packed),
+            )
+
+    def add_prices(self, ticker: str, hist: pd.DataFrame) -> int:
+        """
+        Append daily OHLCV bars (bars not newer than the stored ones are skipped).
+
+        Returns:
+            Number of new bars written
+        """
+        with self._lock:
+            return self.prices.append_history(ticker.upper(), hist)
+
+    def add_risk_free_rate(self, as_of, rate: float) -> None:
+        """Store the risk-free rate (decimal) known on a date."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO rates VALUES (?, ?)",
+                (_day(as_of).date().isoformat(), float(rate)),
+            )
+
+    def capture(
+        self,
+        source: MarketDataProvider,
+        tickers: Sequence[str],
+        as_of=None,
+        period: str = "1y",
+    ) -> int:
+        """
+        Snapshot a live provider into the archive (e.g. from a daily job).
+
+        Args:
+            source: Provider to read from
+            tickers: Tickers to capture
+            as_of: Date to file the fundamentals under (default: today)
+            period: Price history to append (only bars newer than the stored ones)
+
+        Returns:
+            Number of tickers whose fundamentals were captured
+        """
+        as_of = _day(as_of if as_of is not None else pd.Timestamp.today())
+        rate = source.get_risk_free_rate()
+        if rate is not None:
+            self.add_risk_free_rate(as_of, rate)
+
+        captured = 0
+        for ticker, hist in source.get_price_histories(list(tickers), period).items():
+            hist = hist[pd.DatetimeIndex(hist.index).tz_localize(None).normalize() <= as_of]
+            self.add_prices(ticker, hist)
+        for ticker in tickers:
+            info = source.get_info(ticker)
+            if not info:
+                continue
+            self.add_fundamentals(ticker, as_of, info, source.get_statements(ticker))
+            captured += 1
+        return captured
+
+    def tickers(self) -> List[str]:
+        """Tickers with at least one fundamentals snapshot."""
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT ticker FROM fundamentals ORDER BY ticker")
+            return [row[0] for row in rows]
+
+    def snapshot_dates(self, ticker: str) -> List[pd.Timestamp]:
+        """Dates of a ticker's fundamentals snapshots, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT as_of FROM fundamentals WHERE ticker = ? ORDER BY as_of", (ticker.upper(),)
+            ).fetchall()
+        return [pd.Timestamp(row[0]) for row in rows]
+
+    def fundamentals(
+        self, ticker: str, as_of
+    ) -> Optional[Tuple[pd.Timestamp, Dict[str, Any], Dict[str, pd.DataFrame]]]:
+        """
+        Latest fundamentals snapshot captured on or before a date.
+
+        Returns:
+            Tuple of (snapshot date, info, statements), or None if there is none
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT as_of, info, statements FROM fundamentals "
+                "WHERE ticker = ? AND as_of <= ? ORDER BY as_of DESC LIMIT 1",
+                (ticker.upper(), _day(as_of).date().isoformat()),
+            ).fetchone()
+        if row is None:
+            return None
+
+        statements = {}
+        for name, payload in (_unpack(row[2]) if row[2] else {}).items():
+            frame = pd.read_json(io.StringIO(payload), orient="split")
+            frame.columns = pd.to_datetime(frame.columns, errors="coerce")
+            statements[name] = frame
+        return pd.Timestamp(row[0]), _unpack(row[1]), statements
+
+    def risk_free_rate(self, as_of) -> Optional[float]:
+        """Latest risk-free rate dated on or before a date."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT rate FROM rates WHERE as_of <= ? ORDER BY as_of DESC LIMIT 1",
+                (_day(as_of).date().isoformat(),),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def price_history(self, ticker: str, as_of=None, period: str = "max") -> pd.DataFrame:
+        """
+        Daily bars dated on or before a date.
+
+        Args:
+            ticker: Stock ticker
+            as_of: Last date to include (default: every bar)
+            period: Trailing period ending at as_of ("1y", "6mo", "max", ...)
+
+        Returns:
+            OHLCV DataFrame indexed by date (empty if there are no bars)
+        """
+        bars = self.prices.window(ticker.upper(), end_date=None if as_of is None else _day(as_of))
+        if len(bars["date"]) == 0:
+            return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
+        hist = pd.DataFrame(
+            {
+                "Open": np.array(bars["open"]),
+                "High": np.array(bars["high"]),
+                "Low": np.array(bars["low"]),
+                "Close": np.array(bars["close"]),
+                "Volume": np.array(bars["volume"]),
+            },
+            index=pd.DatetimeIndex(np.array(bars["date"]).astype("datetime64[D]"), name="Date"),
+        )
+        return trim_to_period(hist, period)
+
+    def close_on(self, ticker: str, date) -> Optional[float]:
+        """Close of the last bar dated on or before a date."""
+        closes = self.prices.window(ticker.upper(), bars=1, end_date=_day(date))["close"]
+        return float(closes[-1]) if len(closes) else None
+
+    def provider(self, as_of, filing_lag_days: int = FILING_LAG_DAYS) -> "PointInTimeProvider":
+        """Market data provider serving the archive as it stood on a date."""
+        return PointInTimeProvider(self, as_of, filing_lag_days)
+
+
+class PointInTimeProvider(MarketDataProvider):
+    """The archive as of one date (nothing later is visible)."""
+
+    def __init__(self, archive: SnapshotArchive, as_of, filing_lag_days: int = FILING_LAG_DAYS):
+        """
+        Initialize point-in-time provider.
+
+        Args:
+            archive: Snapshot archive
+            as_of: Date the data is served as of
+            filing_lag_days: Statement periods ending fewer days than this
+                before as_of are treated as not yet filed
+        """
+        self.archive = archive
+        self.as_of = _day(as_of)
+        self.filing_lag_days = filing_lag_days
+
+    @property
+    def cache_key(self) -> str:
+        return f"archive:{self.archive.root.resolve()}@{self.as_of.date().isoformat()}"
+
+    def get_info(self, ticker: str) -> Dict[str, Any]:
+        snapshot = self.archive.fundamentals(ticker, self.as_of)
+        if snapshot is None:
+            return {}
+        captured, info, _ = snapshot
+
+        close = self.archive.close_on(ticker, self.as_of)
+        if close is None:
+            return info
+        reference = info.get("currentPrice") or self.archive.close_on(ticker, captured)
+        info["currentPrice"] = close
+        if reference:
+            scale = close / float(reference)
+            for field in PRICE_SCALED_FIELDS:
+                if isinstance(info.get(field), (int, float)):
+                    info[field] = info[field] * scale
+        return info
+
+    def get_statements(self, ticker: str) -> Dict[str, pd.DataFrame]:
+        snapshot = self.archive.fundamentals(ticker, self.as_of)
+        statements = snapshot[2] if snapshot is not None else {}
+        cutoff = self.as_of - pd.Timedelta(days=self.filing_lag_days)
+        filed = {}
+        for name in STATEMENTS:
+            frame = statements.get(name, pd.DataFrame())
+            if not frame.empty:
+                frame = frame.loc[:, frame.columns.notna() & (frame.columns <= cutoff)]
+            filed[name] = frame
+        return filed
+
+    def get_price_history(self, ticker: str, period: str = "1y") -> pd.DataFrame:
+        return self.archive.price_history(ticker, self.as_of, period)
+
+    def get_risk_free_rate(self) -> Optional[float]:
+        return self.archive.risk_free_rate(self.as_of)
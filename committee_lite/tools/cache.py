@@ -0,0 +1,95 @@
+"""Bounded in-process caches for fetched market data.
+
+TTLCache keeps entries in least-recently-used order. An entry expires
+Config.DATA_CACHE_TTL seconds after it was stored. Expired entries are
+dropped when they are read and swept on write (at most once a second), and
+the least recently used entries are evicted beyond max_entries, so
+long-running processes (watch, soak, backtest) hold a bounded amount of
+data.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar
+
+from committee_lite.config import Config
+
+V = TypeVar("V")
+
+# Minimum seconds between sweeps of expired entries
+SWEEP_INTERVAL = 1.0
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe LRU cache whose entries expire after a TTL."""
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Most entries kept (default: Config.DATA_CACHE_MAX_ENTRIES)
+            ttl: Seconds an entry stays fresh (default: Config.DATA_CACHE_TTL,
+                read on every access)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._swept_at = time.monotonic()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Fresh value for key (marking it recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self._ttl():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Store a value, sweeping expired entries and evicting beyond the size cap."""
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (now, value)
+            self._entries.move_to_end(key)
+            if now - self._swept_at >= SWEEP_INTERVAL:
+                # Reads reorder entries, so expired ones can be anywhere
+                ttl = self._ttl()
+                for stale in [k for k, (stored, _) in self._entries.items() if now - stored > ttl]:
+                    del self._entries[stale]
+                self._swept_at = now
+            limit = self.max_entries or Config.DATA_CACHE_MAX_ENTRIES
+            while len(self._entries) > limit:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Drop one entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def discard(self, predicate: Callable[[Any], bool]) -> None:
+        """Drop every entry whose key matches the predicate."""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def _ttl(self) -> float:
+        """Effective TTL in seconds."""
+        return Config.DATA_CACHE_TTL if self.ttl is None else self.ttl
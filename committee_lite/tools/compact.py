@@ -0,0 +1,66 @@
+"""Terse key=value rendering for compact LLM prompts.
+
+Compact mode drops missing metrics instead of printing "N/A" rows and packs
+each section onto one line, e.g. "pe=45.20 fwd_pe=30.10 pb=12.00".
+"""
+
+import math
+from typing import Any, Iterable, Optional, Tuple
+
+
+def compact_pairs(pairs: Iterable[Tuple[str, Any]]) -> str:
+    """
+    Render key=value pairs separated by spaces, skipping missing values.
+
+    Args:
+        pairs: (key, value) pairs; values that are None, NaN or "" are dropped
+
+    Returns:
+        Rendered line (empty if every value is missing)
+    """
+    parts = []
+    for key, value in pairs:
+        if value is None or value == "" or (isinstance(value, float) and math.isnan(value)):
+            continue
+        parts.append(f"{key}={value}")
+    return " ".join(parts)
+
+
+def num(value: Optional[float], spec: str = ".2f", suffix: str = "") -> Optional[str]:
+    """Format a number, or None if it's missing (so compact_pairs() drops it)."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return f"{value:{spec}}{suffix}"
+
+
+def pct(value: Optional[float]) -> Optional[str]:
+    """Format a ratio as a percentage (0.25 -> "25.0%"), or None if missing."""
+    return num(None if value is None else value * 100, ".1f", "%")
+
+
+def money(value: Optional[float]) -> Optional[str]:
+    """Format a dollar amount with a T/B/M suffix, or None if missing."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    if abs(value) >= 1e12:
+        return f"{value / 1e12:.2f}T"
+    if abs(value) >= 1e9:
+        return f"{value / 1e9:.1f}B"
+    return f"{value / 1e6:.0f}M"
+
+
+def clip(text: str, max_chars: int) -> str:
+    """
+    Cap a bullet's length, cutting at a word boundary.
+
+    Args:
+        text: Bullet text
+        max_chars: Maximum length including the trailing "…" (0 = no cap)
+
+    Returns:
+        Text of at most max_chars characters
+    """
+    if not max_chars or len(text) <= max_chars:
+        return text
+    cut = text[: max_chars - 1].rsplit(" ", 1)[0] or text[: max_chars - 1]
+    return cut.rstrip(" ,;:") + "…"
@@ -4,27 +4,63 @@ This is an educational demo implementing a basic 2-stage DCF:
 - Stage 1: Explicit forecast years 1-5
 - Stage 2: Terminal value using Gordon Growth Model
 
+With q = (1 + growth) / (1 + WACC), enterprise value per unit of revenue is
+a geometric series plus the discounted Gordon terminal value:
+
+    EV / revenue = margin * (q + q^2 + ... + q^5 + q^5 * (1 + g_T) / (WACC - g_T))
+
+two_stage_multiple() evaluates this in closed form (no year loop). Reverse
+DCF inverts it: the stage-1 growth (or FCF margin) at which intrinsic value
+equals today's price, i.e. at which EV equals market cap plus net debt.
+
+When the snapshot carries statement history (tools.statements), the default
+assumptions come from it: TTM revenue as the base, the multi-year revenue
+CAGR as stage-1 growth and FCF / TTM revenue as the margin, each clipped to
+a sane range (see default_dcf_assumptions()).
+
 NOT FOR REAL INVESTMENT DECISIONS - For demonstration purposes only.
 """
 
 import numpy as np
-from typing import Dict, Any, Tuple
-import yfinance as yf
+from typing import Dict, Any, Optional, Tuple, Union
+
+from committee_lite.tools.cache import TTLCache
+from committee_lite.tools.compact import compact_pairs, num, pct
+from committee_lite.tools.market_data import MarketDataProvider, get_default_provider
+from committee_lite.tools.snapshot import FinancialSnapshot
 
 
 # Constants
 RISK_FREE_RATE = 0.045  # 4.5% (10Y Treasury)
 EQUITY_RISK_PREMIUM = 0.05  # 5.0% standard US ERP
 TAX_RATE = 0.21  # 21% corporate tax rate
+STAGE1_YEARS = 5
+
+# Search range for the market-implied stage-1 growth rate
+IMPLIED_GROWTH_BOUNDS = (-0.5, 1.0)
+
+# Default assumptions without history, and the ranges history-derived ones are clipped to
+DEFAULT_GROWTH_STAGE1 = 0.15
+DEFAULT_FCF_MARGIN = 0.15
+HISTORICAL_GROWTH_BOUNDS = (-0.05, 0.30)
+HISTORICAL_MARGIN_BOUNDS = (0.02, 0.40)
+
+# provider key -> rate, shared by every DCF in the process. One entry per
+# provider (per as-of date for point-in-time providers), so keep a few only.
+_treasury_cache: TTLCache[float] = TTLCache(max_entries=64)
+
 
+def fetch_current_treasury_rate(provider: Optional[MarketDataProvider] = None) -> float:
+    """Fetch current 10Y Treasury rate (cached), fallback to constant."""
+    provider = provider or get_default_provider()
+    cached = _treasury_cache.get(provider.cache_key)
+    if cached is not None:
+        return cached
 
-def fetch_current_treasury_rate() -> float:
-    """Fetch current 10Y Treasury rate, fallback to constant."""
     try:
-        treasury = yf.Ticker("^TNX")
-        hist = treasury.history(period="5d")
-        if not hist.empty:
-            rate = hist['Close'].iloc[-1] / 100
+        rate = provider.get_risk_free_rate()
+        if rate is not None:
+            _treasury_cache.put(provider.cache_key, rate)
             return rate
     except Exception:
         pass
@@ -33,31 +69,45 @@ def fetch_current_treasury_rate() -> float:
 
 def calculate_dcf_value(
     ticker: str,
-    financial_data: Dict[str, Any],
-    growth_rate_stage1: float = 0.15,
+    financial_data: Union[FinancialSnapshot, Dict[str, Any]],
+    growth_rate_stage1: Optional[float] = None,
     terminal_growth_rate: float = 0.03,
-    fcf_margin: float = 0.15,
+    fcf_margin: Optional[float] = None,
+    risk_free_rate: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Calculate 2-stage DCF intrinsic value.
 
     Args:
         ticker: Stock ticker
-        financial_data: Dict from get_financial_data()
-        growth_rate_stage1: Revenue growth rate for years 1-5 (default 15%)
+        financial_data: FinancialSnapshot or dict from get_financial_data()
+        growth_rate_stage1: Revenue growth rate for years 1-5 (default:
+            historical revenue CAGR, else 15%)
         terminal_growth_rate: Perpetual growth rate (default 3%)
-        fcf_margin: Free cash flow margin (default 15%)
+        fcf_margin: Free cash flow margin (default: FCF / TTM revenue, else 15%)
+        risk_free_rate: Risk-free rate (default: fetch_current_treasury_rate())
 
     Returns:
         Dictionary with DCF results
     """
     try:
         # Extract key metrics
-        revenue = financial_data.get('revenue', 0)
-        beta = financial_data.get('beta', 1.0)
-        market_cap = financial_data.get('market_cap', 0)
-        total_debt = financial_data.get('total_debt', 0)
-        total_cash = financial_data.get('total_cash', 0)
+        snapshot = FinancialSnapshot.coerce(financial_data)
+        defaults = default_dcf_assumptions(
+            [_nan(snapshot.revenue)], [_nan(snapshot.revenue_ttm)],
+            [_nan(snapshot.revenue_cagr)], [_nan(snapshot.free_cash_flow)],
+        )
+        revenue = _optional(defaults["revenue"][0])
+        growth_from_history = growth_rate_stage1 is None and defaults["growth_from_history"][0]
+        margin_from_history = fcf_margin is None and defaults["margin_from_history"][0]
+        if growth_rate_stage1 is None:
+            growth_rate_stage1 = float(defaults["growth_rate_stage1"][0])
+        if fcf_margin is None:
+            fcf_margin = float(defaults["fcf_margin"][0])
+        beta = snapshot.beta if snapshot.beta is not None else 1.0
+        market_cap = snapshot.market_cap
+        total_debt = snapshot.total_debt or 0
+        total_cash = snapshot.total_cash or 0
 
         if not revenue or not market_cap:
             return {
@@ -65,34 +115,32 @@ def calculate_dcf_value(
                 "error": "Insufficient financial data for DCF calculation"
             }
 
+        # Resolve once so the DCF and the reverse DCF use the same rate
+        if risk_free_rate is None:
+            risk_free_rate = fetch_current_treasury_rate()
+
         # Calculate WACC
-        wacc = calculate_wacc(beta, market_cap, total_debt)
+        wacc = calculate_wacc(beta, market_cap, total_debt, risk_free_rate)
 
-        # Project free cash flows
-        fcf_projections = []
-        current_revenue = revenue
+        # Stage 1 (years 1-5) and Gordon Growth terminal value, closed form
+        stage1_multiple, terminal_multiple = two_stage_multiple(
+            growth_rate_stage1, wacc, terminal_growth_rate, fcf_margin
+        )
+        stage1_value = revenue * float(stage1_multiple)
+        pv_terminal_value = revenue * float(terminal_multiple)
 
-        # Stage 1: Years 1-5 (High Growth)
-        for year in range(1, 6):
-            current_revenue *= (1 + growth_rate_stage1)
-            fcf = current_revenue * fcf_margin
-            pv_fcf = fcf / ((1 + wacc) ** year)
+        # Year-by-year projections (for display)
+        fcf_projections = []
+        for year in range(1, STAGE1_YEARS + 1):
+            year_revenue = revenue * (1 + growth_rate_stage1) ** year
+            fcf = year_revenue * fcf_margin
             fcf_projections.append({
                 "year": year,
-                "revenue": current_revenue,
+                "revenue": year_revenue,
                 "fcf": fcf,
-                "pv_fcf": pv_fcf
+                "pv_fcf": fcf / (1 + wacc) ** year,
             })
 
-        # Sum of PV(FCF) for years 1-5
-        stage1_value = sum(p['pv_fcf'] for p in fcf_projections)
-
-        # Stage 2: Terminal Value (Gordon Growth)
-        year5_revenue = fcf_projections[-1]['revenue']
-        terminal_fcf = year5_revenue * (1 + terminal_growth_rate) * fcf_margin
-        terminal_value = terminal_fcf / (wacc - terminal_growth_rate)
-        pv_terminal_value = terminal_value / ((1 + wacc) ** 5)
-
         # Enterprise Value
         enterprise_value = stage1_value + pv_terminal_value
 
@@ -101,7 +149,7 @@ def calculate_dcf_value(
         equity_value = enterprise_value - net_debt
 
         # Shares outstanding (estimate from market cap and current price)
-        current_price = financial_data.get('current_price', 0)
+        current_price = snapshot.current_price or 0
         if current_price > 0:
             shares_outstanding = market_cap / current_price
         else:
@@ -117,6 +165,15 @@ def calculate_dcf_value(
         stage1_pct = (stage1_value / enterprise_value * 100) if enterprise_value > 0 else 0
         terminal_pct = (pv_terminal_value / enterprise_value * 100) if enterprise_value > 0 else 0
 
+        # Reverse DCF: what the current price implies
+        implied = calculate_reverse_dcf_batch(
+            [revenue], [market_cap], [current_price], [beta], [total_debt], [total_cash],
+            growth_rate_stage1=growth_rate_stage1,
+            terminal_growth_rate=terminal_growth_rate,
+            fcf_margin=fcf_margin,
+            risk_free_rate=risk_free_rate,
+        )
+
         return {
             "ticker": ticker,
             "intrinsic_value_per_share": intrinsic_value_per_share,
@@ -132,11 +189,16 @@ def calculate_dcf_value(
             "stage1_contribution_pct": stage1_pct,
             "terminal_contribution_pct": terminal_pct,
             "fcf_projections": fcf_projections,
+            "implied_growth_stage1": _optional(implied["implied_growth"][0]),
+            "implied_fcf_margin": _optional(implied["implied_fcf_margin"][0]),
             "assumptions": {
-                "Revenue (base)": f"${revenue/1e9:.1f}B",
-                "Growth (years 1-5)": f"{growth_rate_stage1*100:.0f}%",
+                "Revenue (base)": f"${revenue/1e9:.1f}B"
+                + (" (TTM)" if snapshot.revenue_ttm is not None else ""),
+                "Growth (years 1-5)": f"{growth_rate_stage1*100:.0f}%"
+                + (" (revenue CAGR)" if growth_from_history else ""),
                 "Terminal Growth": f"{terminal_growth_rate*100:.1f}%",
-                "FCF Margin": f"{fcf_margin*100:.0f}%",
+                "FCF Margin": f"{fcf_margin*100:.0f}%"
+                + (" (FCF / TTM revenue)" if margin_from_history else ""),
                 "WACC": f"{wacc*100:.1f}%",
                 "Beta": f"{beta:.2f}",
             }
@@ -149,6 +211,56 @@ def calculate_dcf_value(
         }
 
 
+def default_dcf_assumptions(
+    revenue: np.ndarray,
+    revenue_ttm: Optional[np.ndarray] = None,
+    revenue_cagr: Optional[np.ndarray] = None,
+    free_cash_flow: Optional[np.ndarray] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized default DCF inputs from statement history.
+
+    NaN inputs mean missing. Where history is available the base revenue is
+    TTM revenue, stage-1 growth the revenue CAGR (clipped to
+    HISTORICAL_GROWTH_BOUNDS) and the FCF margin free cash flow over TTM
+    revenue (clipped to HISTORICAL_MARGIN_BOUNDS); otherwise the latest
+    annual revenue and the 15% / 15% defaults are used.
+
+    Args:
+        revenue: Latest annual revenue
+        revenue_ttm: Trailing-twelve-month revenue
+        revenue_cagr: Multi-year revenue CAGR
+        free_cash_flow: Trailing free cash flow
+
+    Returns:
+        Dict of "revenue", "growth_rate_stage1" and "fcf_margin" arrays, plus
+        "growth_from_history" / "margin_from_history" masks
+    """
+    revenue = np.asarray(revenue, dtype=np.float64)
+    nan = np.full_like(revenue, np.nan)
+    ttm, cagr, fcf = (
+        nan if value is None else np.asarray(value, dtype=np.float64)
+        for value in (revenue_ttm, revenue_cagr, free_cash_flow)
+    )
+
+    has_ttm = ttm > 0
+    growth_from_history = np.isfinite(cagr)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        margin = fcf / np.where(has_ttm, ttm, np.nan)
+    margin_from_history = np.isfinite(margin)
+    return {
+        "revenue": np.where(has_ttm, ttm, revenue),
+        "growth_rate_stage1": np.where(
+            growth_from_history, np.clip(cagr, *HISTORICAL_GROWTH_BOUNDS), DEFAULT_GROWTH_STAGE1
+        ),
+        "fcf_margin": np.where(
+            margin_from_history, np.clip(margin, *HISTORICAL_MARGIN_BOUNDS), DEFAULT_FCF_MARGIN
+        ),
+        "growth_from_history": growth_from_history,
+        "margin_from_history": margin_from_history,
+    }
+
+
 def calculate_wacc(beta: float, market_cap: float, total_debt: float, risk_free_rate: float = None) -> float:
     """
     Calculate Weighted Average Cost of Capital.
@@ -179,11 +291,262 @@ def calculate_wacc(beta: float, market_cap: float, total_debt: float, risk_free_
     return wacc
 
 
-def format_dcf_summary(dcf_results: Dict[str, Any]) -> str:
-    """Format DCF results into readable summary."""
+def two_stage_multiple(
+    growth_rate_stage1,
+    wacc,
+    terminal_growth_rate: float = 0.03,
+    fcf_margin=0.15,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Closed-form present value of the 2-stage model per unit of revenue.
+
+    Arguments broadcast against each other (scalars or per-ticker arrays).
+
+    Args:
+        growth_rate_stage1: Revenue growth rate for years 1-5
+        wacc: Discount rate
+        terminal_growth_rate: Perpetual growth rate
+        fcf_margin: Free cash flow margin
+
+    Returns:
+        Tuple of (stage 1 PV, terminal PV), each as a multiple of revenue
+        (terminal is inf/negative where WACC <= terminal growth)
+    """
+    growth = np.asarray(growth_rate_stage1, dtype=np.float64)
+    wacc = np.asarray(wacc, dtype=np.float64)
+    q = (1 + growth) / (1 + wacc)
+    q_n = q ** STAGE1_YEARS
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Geometric series q + ... + q^n (n terms of q where q == 1)
+        series = np.where(np.isclose(q, 1.0), STAGE1_YEARS * q, q * (1 - q_n) / (1 - q))
+        stage1 = fcf_margin * series
+        terminal = fcf_margin * q_n * (1 + terminal_growth_rate) / (wacc - terminal_growth_rate)
+    return stage1, terminal
+
+
+def calculate_dcf_upside_batch(
+    revenue: np.ndarray,
+    market_cap: np.ndarray,
+    current_price: np.ndarray,
+    beta: Optional[np.ndarray] = None,
+    total_debt: Optional[np.ndarray] = None,
+    total_cash: Optional[np.ndarray] = None,
+    growth_rate_stage1: Union[float, np.ndarray] = DEFAULT_GROWTH_STAGE1,
+    terminal_growth_rate: float = 0.03,
+    fcf_margin: Union[float, np.ndarray] = DEFAULT_FCF_MARGIN,
+    risk_free_rate: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Vectorized calculate_dcf_value() upside for a whole universe.
+
+    Same model as calculate_dcf_value(), evaluated on arrays (one element
+    per ticker). NaN inputs mean missing: beta defaults to 1.0, debt and
+    cash to 0. Pass default_dcf_assumptions() outputs to use the same
+    history-based defaults as calculate_dcf_value().
+
+    Args:
+        revenue: Latest annual revenue
+        market_cap: Market capitalization
+        current_price: Share price
+        beta: Equity beta
+        total_debt: Total debt
+        total_cash: Total cash
+        growth_rate_stage1: Revenue growth rate for years 1-5 (scalar or per ticker)
+        terminal_growth_rate: Perpetual growth rate
+        fcf_margin: Free cash flow margin (scalar or per ticker)
+        risk_free_rate: Risk-free rate (default: fetch_current_treasury_rate())
+
+    Returns:
+        Upside/downside in percent (NaN where the DCF can't be computed)
+    """
+    revenue, market_cap, price, debt, cash, wacc = _batch_inputs(
+        revenue, market_cap, current_price, beta, total_debt, total_cash, risk_free_rate
+    )
+    stage1, terminal = two_stage_multiple(growth_rate_stage1, wacc, terminal_growth_rate, fcf_margin)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        enterprise_value = revenue * (stage1 + terminal)
+        equity_value = enterprise_value - (debt - cash)
+        shares = np.where(price > 0, market_cap / price, np.nan)
+        intrinsic = equity_value / shares
+        upside = (intrinsic - price) / price * 100
+
+    valid = (revenue > 0) & (market_cap > 0) & (price > 0)
+    return np.where(valid, upside, np.nan)
+
+
+def calculate_reverse_dcf_batch(
+    revenue: np.ndarray,
+    market_cap: np.ndarray,
+    current_price: np.ndarray,
+    beta: Optional[np.ndarray] = None,
+    total_debt: Optional[np.ndarray] = None,
+    total_cash: Optional[np.ndarray] = None,
+    growth_rate_stage1: Union[float, np.ndarray] = DEFAULT_GROWTH_STAGE1,
+    terminal_growth_rate: float = 0.03,
+    fcf_margin: Union[float, np.ndarray] = DEFAULT_FCF_MARGIN,
+    risk_free_rate: Optional[float] = None,
+    growth_bounds: Tuple[float, float] = IMPLIED_GROWTH_BOUNDS,
+    tol: float = 1e-10,
+    max_iter: int = 100,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized reverse DCF: the assumptions today's price implies.
+
+    Solves, per ticker, the stage-1 growth rate at which the 2-stage DCF
+    (at fcf_margin) values the equity at market cap, and the FCF margin at
+    which it does so at growth_rate_stage1. Same inputs and conventions as
+    calculate_dcf_upside_batch().
+
+    With c = (1 + g_T) / (WACC - g_T), the target is a polynomial in
+    q = (1 + g) / (1 + WACC) that is increasing and convex for q > 0:
+
+        q + q^2 + ... + q^5 + c * q^5 = (market cap + net debt) / (revenue * margin)
+
+    so Newton steps started from the upper growth bound converge
+    monotonically, for every ticker at once. The implied margin is linear
+    and needs no iteration.
+
+    Args:
+        revenue: Latest annual revenue
+        market_cap: Market capitalization
+        current_price: Share price
+        beta: Equity beta
+        total_debt: Total debt
+        total_cash: Total cash
+        growth_rate_stage1: Growth assumed when solving the implied margin (scalar or per ticker)
+        terminal_growth_rate: Perpetual growth rate
+        fcf_margin: Margin assumed when solving the implied growth (scalar or per ticker)
+        risk_free_rate: Risk-free rate (default: fetch_current_treasury_rate())
+        growth_bounds: Growth range searched (outside it the result is NaN)
+        tol: Convergence tolerance on q
+        max_iter: Maximum Newton iterations
+
+    Returns:
+        Dict with "implied_growth" and "implied_fcf_margin" arrays (NaN where
+        the DCF can't be computed, or no growth within bounds matches the price)
+    """
+    revenue, market_cap, price, debt, cash, wacc = _batch_inputs(
+        revenue, market_cap, current_price, beta, total_debt, total_cash, risk_free_rate
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # EV the market is paying for, per unit of revenue
+        target = (market_cap + debt - cash) / revenue
+        c = (1 + terminal_growth_rate) / (wacc - terminal_growth_rate)
+        valid = (revenue > 0) & (market_cap > 0) & (price > 0) & (target > 0) & (c > 0)
+
+        # Implied margin: EV is proportional to the margin
+        stage1, terminal = two_stage_multiple(growth_rate_stage1, wacc, terminal_growth_rate, 1.0)
+        implied_margin = np.where(valid, target / (stage1 + terminal), np.nan)
+
+        # Implied growth: Newton on h(q) = q + ... + q^n + c q^n - target / margin
+        goal = target / fcf_margin
+        low = (1 + growth_bounds[0]) / (1 + wacc)
+        high = (1 + growth_bounds[1]) / (1 + wacc)
+        q = high.copy()
+        for _ in range(max_iter):
+            h, dh = _series_and_slope(q, c)
+            step = (h - goal) / dh
+            q = np.where(valid, q - step, q)
+            if not np.any(np.abs(step[valid]) > tol):
+                break
+
+        h_high, _ = _series_and_slope(high, c)
+        h_low, _ = _series_and_slope(low, c)
+        in_bounds = valid & (goal <= h_high) & (goal >= h_low)
+        implied_growth = np.where(in_bounds, q * (1 + wacc) - 1, np.nan)
+
+    return {"implied_growth": implied_growth, "implied_fcf_margin": implied_margin}
+
+
+def _series_and_slope(q: np.ndarray, c: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """q + ... + q^n + c q^n and its derivative in q (Horner form)."""
+    series = np.zeros_like(q)
+    slope = np.zeros_like(q)
+    for power in range(STAGE1_YEARS, 0, -1):
+        series = (series + 1) * q
+        slope = slope * q + power
+    q_n1 = q ** (STAGE1_YEARS - 1)
+    return series + c * q_n1 * q, slope + STAGE1_YEARS * c * q_n1
+
+
+def _batch_inputs(revenue, market_cap, current_price, beta, total_debt, total_cash, risk_free_rate):
+    """Float arrays with defaults for missing values, plus per-ticker WACC."""
+    if risk_free_rate is None:
+        risk_free_rate = fetch_current_treasury_rate()
+
+    revenue = np.asarray(revenue, dtype=np.float64)
+    market_cap = np.asarray(market_cap, dtype=np.float64)
+    price = np.asarray(current_price, dtype=np.float64)
+    ones = np.ones_like(revenue)
+    beta = np.nan_to_num(np.asarray(beta if beta is not None else ones, dtype=np.float64), nan=1.0)
+    debt = np.nan_to_num(np.asarray(total_debt if total_debt is not None else 0 * ones, dtype=np.float64))
+    cash = np.nan_to_num(np.asarray(total_cash if total_cash is not None else 0 * ones, dtype=np.float64))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cost_of_equity = risk_free_rate + beta * EQUITY_RISK_PREMIUM
+        cost_of_debt = risk_free_rate + 0.02
+        total_value = market_cap + debt
+        wacc = np.where(
+            total_value == 0,
+            cost_of_equity,
+            market_cap / total_value * cost_of_equity
+            + debt / total_value * cost_of_debt * (1 - TAX_RATE),
+        )
+    return revenue, market_cap, price, debt, cash, wacc
+
+
+def _optional(value: float) -> Optional[float]:
+    """None for NaN, else a plain float."""
+    return None if np.isnan(value) else float(value)
+
+
+def _nan(value: Optional[float]) -> float:
+    """NaN for None, else the value."""
+    return np.nan if value is None else value
+
+
+def format_dcf_summary(dcf_results: Dict[str, Any], compact: bool = False) -> str:
+    """
+    Format DCF results into readable summary.
+
+    Args:
+        dcf_results: Dict from calculate_dcf_value()
+        compact: Terse key=value lines without separators or disclaimers (for prompts)
+
+    Returns:
+        Formatted string summary
+    """
     if "error" in dcf_results:
         return f"DCF Error for {dcf_results['ticker']}: {dcf_results['error']}"
 
+    if compact:
+        assumptions = dcf_results.get('assumptions', {})
+        return "\n".join([
+            compact_pairs([
+                ("intrinsic", num(dcf_results.get('intrinsic_value_per_share'))),
+                ("price", num(dcf_results.get('current_price'))),
+                ("upside", num(dcf_results.get('upside_downside_pct'), "+.1f", "%")),
+            ]),
+            compact_pairs([
+                ("revenue", assumptions.get("Revenue (base)")),
+                ("growth_y1_5", assumptions.get("Growth (years 1-5)")),
+                ("terminal_growth", assumptions.get("Terminal Growth")),
+                ("fcf_margin", assumptions.get("FCF Margin")),
+                ("wacc", assumptions.get("WACC")),
+                ("beta", assumptions.get("Beta")),
+            ]),
+            compact_pairs([
+                ("stage1_share", num(dcf_results.get('stage1_contribution_pct'), ".1f", "%")),
+                ("terminal_share", num(dcf_results.get('terminal_contribution_pct'), ".1f", "%")),
+            ]),
+            compact_pairs([
+                ("implied_growth_y1_5", pct(dcf_results.get('implied_growth_stage1'))),
+                ("implied_fcf_margin", pct(dcf_results.get('implied_fcf_margin'))),
+            ]),
+        ])
+
     def fmt(value, prefix="$", suffix=""):
         if value is None or np.isnan(value):
             return "N/A"
@@ -208,12 +571,18 @@ def format_dcf_summary(dcf_results: Dict[str, Any]) -> str:
     for key, value in dcf_results.get('assumptions', {}).items():
         lines.append(f"  {key:20s}: {value}")
 
+    growth_label = f"Growth (years 1-5) at {dcf_results.get('fcf_margin', 0)*100:.0f}% FCF margin:"
+    margin_label = f"FCF margin at {dcf_results.get('growth_rate_stage1', 0)*100:.0f}% growth:"
     lines.extend([
         "",
         "VALUE CONTRIBUTION:",
         f"  Stage 1 (Years 1-5): {dcf_results.get('stage1_contribution_pct', 0):.1f}%",
         f"  Terminal Value:      {dcf_results.get('terminal_contribution_pct', 0):.1f}%",
         "",
+        "MARKET-IMPLIED (reverse DCF at current price):",
+        f"  {growth_label:36s} {pct(dcf_results.get('implied_growth_stage1')) or 'N/A'}",
+        f"  {margin_label:36s} {pct(dcf_results.get('implied_fcf_margin')) or 'N/A'}",
+        "",
         "⚠️  EDUCATIONAL DEMO - Simplified assumptions",
         "⚠️  NOT FOR REAL INVESTMENT DECISIONS",
     ])
@@ -1,22 +1,128 @@
-"""Financial data tool using yfinance."""
+"""Financial data tool.
 
-import yfinance as yf
-from typing import Dict, Any
+Data comes from a MarketDataProvider (yfinance by default, see
+tools.market_data). Fundamentals and price histories are cached per
+provider and ticker for Config.DATA_CACHE_TTL seconds, so the several agents
+that read the same ticker share one fetch. The caches are bounded LRUs
+(Config.DATA_CACHE_MAX_ENTRIES each, see tools.cache) keyed by the
+upper-cased ticker. fetch_bulk_data() fills the
+caches for a whole universe in a handful of grouped requests.
 
+The cache holds typed FinancialSnapshot records (tools.snapshot);
+get_financial_data() returns them in the original dict format. Each snapshot
+keeps the full annual and quarterly statement history and the trend metrics
+computed from it (tools.statements), so trends cost no extra fetches; a
+bulk fetch computes them for the whole universe in one vectorized pass.
+"""
 
-def get_financial_data(ticker: str) -> Dict[str, Any]:
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from committee_lite.tools.cache import TTLCache
+from committee_lite.tools.compact import compact_pairs, money, num, pct
+from committee_lite.tools.market_data import MarketDataProvider, get_default_provider
+from committee_lite.tools.snapshot import FinancialSnapshot, SnapshotBatch
+from committee_lite.tools.statements import TREND_FIELDS, StatementHistory, compute_trends
+
+
+# (provider key, TICKER) -> snapshot
+_financial_cache: TTLCache[FinancialSnapshot] = TTLCache()
+# (provider key, TICKER, period) -> history
+_price_cache: TTLCache[pd.DataFrame] = TTLCache()
+
+
+def clear_cache(
+    ticker: Optional[str] = None, provider: Optional[MarketDataProvider] = None
+) -> None:
+    """
+    Drop cached fundamentals and price histories.
+
+    Args:
+        ticker: Only drop this ticker's entries (default: every ticker)
+        provider: Only drop entries fetched from this provider (default: any)
+    """
+    if ticker is None and provider is None:
+        _financial_cache.clear()
+        _price_cache.clear()
+        return
+
+    ticker = ticker.upper() if ticker is not None else None
+    source = provider.cache_key if provider is not None else None
+
+    def matches(key) -> bool:
+        return (ticker is None or key[1] == ticker) and (source is None or key[0] == source)
+
+    _financial_cache.discard(matches)
+    _price_cache.discard(matches)
+
+
+def get_financial_data(
+    ticker: str,
+    use_cache: bool = True,
+    provider: Optional[MarketDataProvider] = None,
+) -> Dict[str, Any]:
     """
-    Fetch financial data for a ticker using yfinance.
+    Fetch financial data for a ticker.
 
     Args:
         ticker: Stock ticker symbol
+        use_cache: Serve from / fill the per-ticker cache
+        provider: Market data source (default: get_default_provider())
 
     Returns:
         Dictionary containing financial metrics
     """
+    return get_financial_snapshot(ticker, use_cache=use_cache, provider=provider).to_dict()
+
+
+def get_financial_snapshot(
+    ticker: str,
+    use_cache: bool = True,
+    provider: Optional[MarketDataProvider] = None,
+) -> FinancialSnapshot:
+    """
+    Fetch financial data for a ticker as a typed record.
+
+    Args:
+        ticker: Stock ticker symbol
+        use_cache: Serve from / fill the per-ticker cache
+        provider: Market data source (default: get_default_provider())
+
+    Returns:
+        FinancialSnapshot (check .ok / .error for fetch failures)
+    """
+    provider = provider or get_default_provider()
+    key = (provider.cache_key, ticker.upper())
+
+    if use_cache:
+        cached = _financial_cache.get(key)
+        if cached is not None:
+            return cached
+
+    snapshot = _build_snapshots([_fetch_financial_data(ticker, provider)])[0]
+    if snapshot.ok:
+        _financial_cache.put(key, snapshot)
+    return snapshot
+
+
+def _build_snapshots(records: List[Dict[str, Any]]) -> List[FinancialSnapshot]:
+    """Snapshots for fetched dicts, with trend metrics computed in one pass."""
+    histories = [record.get("history") for record in records]
+    fetched = [i for i, history in enumerate(histories) if history is not None]
+    trends = compute_trends([histories[i] for i in fetched])
+    for j, i in enumerate(fetched):
+        records[i].update({name: trends[name][j] for name in TREND_FIELDS})
+    return [FinancialSnapshot.from_dict(record) for record in records]
+
+
+def _fetch_financial_data(ticker: str, provider: MarketDataProvider) -> Dict[str, Any]:
+    """Fetch financial data for a ticker from the provider (uncached)."""
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = provider.get_info(ticker)
+        if not info:
+            raise ValueError(f"No market data available for {ticker}")
 
         # Basic info
         data = {
@@ -58,25 +164,16 @@ def get_financial_data(ticker: str) -> Dict[str, Any]:
             "operating_cash_flow": info.get("operatingCashflow"),
         })
 
-        # Get financial statements
-        try:
-            balance_sheet = stock.balance_sheet
-            if not balance_sheet.empty:
-                # Get most recent column (latest period)
-                latest = balance_sheet.columns[0]
-                data["total_assets"] = balance_sheet.loc["Total Assets", latest]
-                data["total_liabilities"] = balance_sheet.loc["Total Liabilities Net Minority Interest", latest]
-        except Exception:
-            pass
+        # Financial statements: keep every period, report the latest
+        statements = provider.get_statements(ticker)
 
         try:
-            income_stmt = stock.income_stmt
-            if not income_stmt.empty:
-                latest = income_stmt.columns[0]
-                data["revenue"] = income_stmt.loc["Total Revenue", latest]
-                data["net_income"] = income_stmt.loc["Net Income", latest]
+            history = StatementHistory.from_statements(ticker, statements)
         except Exception:
-            pass
+            history = StatementHistory.empty(ticker)
+        data["history"] = history
+        for item in ("total_assets", "total_liabilities", "revenue", "net_income"):
+            data[item] = history.latest(item)
 
         # Beta for CAPM
         data["beta"] = info.get("beta", 1.0)
@@ -96,57 +193,226 @@ def get_financial_data(ticker: str) -> Dict[str, Any]:
         }
 
 
-def format_financial_summary(data: Dict[str, Any]) -> str:
+def get_price_history(
+    ticker: str,
+    period: str = "1y",
+    use_cache: bool = True,
+    provider: Optional[MarketDataProvider] = None,
+) -> pd.DataFrame:
+    """
+    Fetch daily OHLCV history for a ticker.
+
+    Args:
+        ticker: Stock ticker symbol
+        period: Historical period ("1y", "6mo", "3mo", etc.)
+        use_cache: Serve from / fill the per-ticker cache
+        provider: Market data source (default: get_default_provider())
+
+    Returns:
+        DataFrame with Open/High/Low/Close/Volume columns (empty if unavailable)
+    """
+    provider = provider or get_default_provider()
+    key = (provider.cache_key, ticker.upper(), period)
+
+    if use_cache:
+        cached = _price_cache.get(key)
+        if cached is not None:
+            return cached
+
+    hist = provider.get_price_history(ticker, period=period)
+    if not hist.empty:
+        _price_cache.put(key, hist)
+    return hist
+
+
+def fetch_bulk_data(
+    tickers: Sequence[str],
+    period: str = "1y",
+    max_workers: int = 8,
+    provider: Optional[MarketDataProvider] = None,
+) -> pd.DataFrame:
+    """
+    Fetch prices and fundamentals for many tickers and fill the per-ticker caches.
+
+    Price histories for the whole universe come from one grouped request
+    (yf.download() for yfinance); fundamentals are fetched with bounded
+    concurrency and the risk-free rate is fetched once for every DCF that
+    follows.
+
+    Args:
+        tickers: Stock ticker symbols
+        period: Price history period
+        max_workers: Concurrent fundamentals requests
+        provider: Market data source (default: get_default_provider())
+
+    Returns:
+        Columnar DataFrame of financial metrics indexed by ticker
+        (NaN for missing metrics; tickers that failed have an "error" value)
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return pd.DataFrame()
+
+    provider = provider or get_default_provider()
+
+    # Imported here: dcf_calculator is a sibling tool, not a dependency of this module
+    from committee_lite.tools.dcf_calculator import fetch_current_treasury_rate
+
+    _bulk_fetch_prices(tickers, period, provider)
+    fetch_current_treasury_rate(provider)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        records = list(executor.map(lambda t: _fetch_financial_data(t, provider), tickers))
+
+    # Trends for the whole universe in one vectorized pass
+    snapshots = _build_snapshots(records)
+    for snapshot in snapshots:
+        if snapshot.ok:
+            _financial_cache.put((provider.cache_key, snapshot.ticker.upper()), snapshot)
+
+    return SnapshotBatch.from_snapshots(snapshots).to_frame()
+
+
+def _bulk_fetch_prices(tickers: List[str], period: str, provider: MarketDataProvider) -> None:
+    """Fetch price histories in one grouped request and cache them per ticker."""
+    try:
+        histories = provider.get_price_histories(tickers, period)
+    except Exception:
+        return
+
+    for ticker, hist in histories.items():
+        _price_cache.put((provider.cache_key, ticker.upper(), period), hist)
+
+
+def format_financial_summary(
+    data: Union[FinancialSnapshot, Dict[str, Any]], compact: bool = False
+) -> str:
     """
     Format financial data into a readable summary.
 
     Args:
-        data: Dictionary from get_financial_data()
+        data: FinancialSnapshot or dict from get_financial_data()
+        compact: Terse key=value lines with missing metrics dropped (for prompts)
 
     Returns:
         Formatted string summary
     """
-    if "error" in data:
-        return f"Error fetching data for {data['ticker']}: {data['error']}"
+    data = FinancialSnapshot.coerce(data)
+    if not data.ok:
+        return f"Error fetching data for {data.ticker}: {data.error}"
+
+    if compact:
+        sections = [
+            compact_pairs([
+                ("company", data.company_name), ("sector", data.sector),
+                ("industry", data.industry), ("mcap", money(data.market_cap)),
+                ("price", num(data.current_price)),
+            ]),
+            compact_pairs([
+                ("pe", num(data.pe_ratio)), ("fwd_pe", num(data.forward_pe)),
+                ("pb", num(data.price_to_book)), ("ps", num(data.price_to_sales)),
+                ("peg", num(data.peg_ratio)),
+            ]),
+            compact_pairs([
+                ("margin", pct(data.profit_margin)), ("op_margin", pct(data.operating_margin)),
+                ("roe", pct(data.roe)), ("roa", pct(data.roa)),
+                ("rev_growth", pct(data.revenue_growth)), ("eps_growth", pct(data.earnings_growth)),
+            ]),
+            compact_pairs([
+                ("current_ratio", num(data.current_ratio)), ("quick_ratio", num(data.quick_ratio)),
+                ("debt_equity", num(data.debt_to_equity)), ("fcf", money(data.free_cash_flow)),
+            ]),
+            compact_pairs([
+                ("analyst_rec", data.recommendation), ("target", num(data.target_price)),
+                ("analysts", num(data.num_analyst_opinions, ".0f")),
+            ]),
+        ]
+        return "\n".join(section for section in sections if section)
 
     def fmt(value, suffix=""):
         if value is None:
             return "N/A"
-        if isinstance(value, (int, float)):
-            if suffix == "%":
-                return f"{value*100:.1f}%"
-            elif suffix == "B":
-                return f"${value/1e9:.1f}B"
-            elif suffix == "M":
-                return f"${value/1e6:.0f}M"
-            else:
-                return f"{value:,.2f}"
-        return str(value)
+        if suffix == "%":
+            return f"{value*100:.1f}%"
+        elif suffix == "B":
+            return f"${value/1e9:.1f}B"
+        elif suffix == "M":
+            return f"${value/1e6:.0f}M"
+        return f"{value:,.2f}"
+
+    recommendation = (data.recommendation or "N/A").upper()
+    analysts = int(data.num_analyst_opinions or 0)
 
     lines = [
-        f"Company: {data.get('company_name', 'N/A')} ({data['ticker']})",
-        f"Sector: {data.get('sector', 'N/A')} | Industry: {data.get('industry', 'N/A')}",
-        f"Market Cap: {fmt(data.get('market_cap'), 'B')}",
-        f"Current Price: ${fmt(data.get('current_price'))}",
+        f"Company: {data.company_name} ({data.ticker})",
+        f"Sector: {data.sector} | Industry: {data.industry}",
+        f"Market Cap: {fmt(data.market_cap, 'B')}",
+        f"Current Price: ${fmt(data.current_price)}",
         "",
         "VALUATION:",
-        f"  P/E: {fmt(data.get('pe_ratio'))} | Forward P/E: {fmt(data.get('forward_pe'))}",
-        f"  P/B: {fmt(data.get('price_to_book'))} | P/S: {fmt(data.get('price_to_sales'))}",
-        f"  PEG: {fmt(data.get('peg_ratio'))}",
+        f"  P/E: {fmt(data.pe_ratio)} | Forward P/E: {fmt(data.forward_pe)}",
+        f"  P/B: {fmt(data.price_to_book)} | P/S: {fmt(data.price_to_sales)}",
+        f"  PEG: {fmt(data.peg_ratio)}",
         "",
         "PROFITABILITY:",
-        f"  Profit Margin: {fmt(data.get('profit_margin'), '%')} | Operating Margin: {fmt(data.get('operating_margin'), '%')}",
-        f"  ROE: {fmt(data.get('roe'), '%')} | ROA: {fmt(data.get('roa'), '%')}",
-        f"  Revenue Growth: {fmt(data.get('revenue_growth'), '%')} | Earnings Growth: {fmt(data.get('earnings_growth'), '%')}",
+        f"  Profit Margin: {fmt(data.profit_margin, '%')} | Operating Margin: {fmt(data.operating_margin, '%')}",
+        f"  ROE: {fmt(data.roe, '%')} | ROA: {fmt(data.roa, '%')}",
+        f"  Revenue Growth: {fmt(data.revenue_growth, '%')} | Earnings Growth: {fmt(data.earnings_growth, '%')}",
         "",
         "FINANCIAL HEALTH:",
-        f"  Current Ratio: {fmt(data.get('current_ratio'))} | Quick Ratio: {fmt(data.get('quick_ratio'))}",
-        f"  Debt/Equity: {fmt(data.get('debt_to_equity'))}",
-        f"  Free Cash Flow: {fmt(data.get('free_cash_flow'), 'M')}",
+        f"  Current Ratio: {fmt(data.current_ratio)} | Quick Ratio: {fmt(data.quick_ratio)}",
+        f"  Debt/Equity: {fmt(data.debt_to_equity)}",
+        f"  Free Cash Flow: {fmt(data.free_cash_flow, 'M')}",
         "",
         "ANALYST VIEW:",
-        f"  Recommendation: {data.get('recommendation', 'N/A').upper()}",
-        f"  Target Price: ${fmt(data.get('target_price'))} ({data.get('num_analyst_opinions', 0)} analysts)",
+        f"  Recommendation: {recommendation}",
+        f"  Target Price: ${fmt(data.target_price)} ({analysts} analysts)",
     ]
 
     return "\n".join(lines)
+
+
+def format_trend_summary(
+    data: Union[FinancialSnapshot, Dict[str, Any]], compact: bool = False
+) -> str:
+    """
+    Format a snapshot's multi-period trend metrics.
+
+    Args:
+        data: FinancialSnapshot or dict from get_financial_data()
+        compact: Terse key=value line (for prompts)
+
+    Returns:
+        Formatted string summary ("" if no trend could be computed)
+    """
+    data = FinancialSnapshot.coerce(data)
+    if not data.ok or all(getattr(data, name) is None for name in TREND_FIELDS):
+        return ""
+
+    def pp(value):
+        return num(None if value is None else value * 100, "+.1f", "pp/yr")
+
+    if compact:
+        return compact_pairs([
+            ("rev_ttm", money(data.revenue_ttm)), ("ni_ttm", money(data.net_income_ttm)),
+            ("rev_cagr", pct(data.revenue_cagr)), ("ni_cagr", pct(data.net_income_cagr)),
+            ("cagr_years", num(data.cagr_years, ".1f")),
+            ("gm_trend", pp(data.gross_margin_trend)),
+            ("om_trend", pp(data.operating_margin_trend)),
+            ("nm_trend", pp(data.net_margin_trend)),
+            ("rev_growth_vol", pct(data.revenue_growth_volatility)),
+        ])
+
+    def fmt(value):
+        return value or "N/A"
+
+    span = f" over {data.cagr_years:.1f}y" if data.cagr_years is not None else ""
+    lines = [
+        f"  TTM Revenue: {fmt(money(data.revenue_ttm))} | TTM Net Income: {fmt(money(data.net_income_ttm))}",
+        f"  Revenue CAGR{span}: {fmt(pct(data.revenue_cagr))} | "
+        f"Net Income CAGR: {fmt(pct(data.net_income_cagr))}",
+        f"  Margin Trend: Gross {fmt(pp(data.gross_margin_trend))} | "
+        f"Operating {fmt(pp(data.operating_margin_trend))} | Net {fmt(pp(data.net_margin_trend))}",
+        f"  Revenue Growth Volatility: {fmt(pct(data.revenue_growth_volatility))}",
+    ]
+    return "\n".join(lines)
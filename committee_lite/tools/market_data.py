@@ -0,0 +1,472 @@
+"""Market data providers.
+
+The data tools read fundamentals, financial statements, price history and
+the risk-free rate through a MarketDataProvider, so the yfinance source can
+be swapped for local fixtures (offline, reproducible runs and benchmarks) or
+another feed.
+
+Fixture layout (CSV, or Parquet when pyarrow is installed):
+
+    <root>/risk_free_rate.json         {"rate": 0.043}
+    <root>/<TICKER>/info.json          yfinance-style info dict
+    <root>/<TICKER>/balance_sheet.csv  rows = line items, columns = periods
+    <root>/<TICKER>/income_stmt.csv
+    <root>/<TICKER>/quarterly_balance_sheet.csv   (optional)
+    <root>/<TICKER>/quarterly_income_stmt.csv     (optional)
+    <root>/<TICKER>/prices.csv         index = date, OHLCV columns
+"""
+
+import json
+import re
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from committee_lite.config import Config
+
+
+STATEMENTS = ("balance_sheet", "income_stmt", "quarterly_balance_sheet", "quarterly_income_stmt")
+
+
+class MarketDataProvider(ABC):
+    """Abstract base class for market data sources.
+
+    Missing data is reported as an empty result ({} / empty DataFrame /
+    None) rather than an exception; exceptions mean the source failed.
+    """
+
+    @property
+    def cache_key(self) -> str:
+        """Identifies this source in the per-ticker data caches."""
+        return f"{type(self).__name__}:{id(self)}"
+
+    @abstractmethod
+    def get_info(self, ticker: str) -> Dict[str, Any]:
+        """Fundamentals/quote dict in yfinance `info` format."""
+        pass
+
+    @abstractmethod
+    def get_statements(self, ticker: str) -> Dict[str, pd.DataFrame]:
+        """Statements keyed by name (see STATEMENTS; annual and "quarterly_" variants)."""
+        pass
+
+    @abstractmethod
+    def get_price_history(self, ticker: str, period: str = "1y") -> pd.DataFrame:
+        """Daily OHLCV history (Open/High/Low/Close/Volume)."""
+        pass
+
+    @abstractmethod
+    def get_risk_free_rate(self) -> Optional[float]:
+        """Current risk-free rate as a decimal (e.g. 0.045)."""
+        pass
+
+    def get_price_histories(
+        self, tickers: Sequence[str], period: str = "1y"
+    ) -> Dict[str, pd.DataFrame]:
+        """Price histories for many tickers (override for a bulk request)."""
+        histories = {}
+        for ticker in tickers:
+            try:
+                hist = self.get_price_history(ticker, period)
+            except Exception:
+                continue
+            if not hist.empty:
+                histories[ticker] = hist
+        return histories
+
+
+class YFinanceProvider(MarketDataProvider):
+    """Market data from Yahoo Finance via yfinance."""
+
+    @property
+    def cache_key(self) -> str:
+        return "yfinance"
+
+    def get_info(self, ticker: str) -> Dict[str, Any]:
+        return yf.Ticker(ticker).info or {}
+
+    def get_statements(self, ticker: str) -> Dict[str, pd.DataFrame]:
+        stock = yf.Ticker(ticker)
+        statements = {}
+        for name in STATEMENTS:
+            try:
+                statements[name] = getattr(stock, name)
+            except Exception:
+                statements[name] = pd.DataFrame()
+        return statements
+
+    def get_price_history(self, ticker: str, period: str = "1y") -> pd.DataFrame:
+        return yf.Ticker(ticker).history(period=period)
+
+    def get_risk_free_rate(self) -> Optional[float]:
+        hist = yf.Ticker("^TNX").history(period="5d")
+        if hist.empty:
+            return None
+        return float(hist['Close'].iloc[-1]) / 100
+
+    def get_price_histories(
+        self, tickers: Sequence[str], period: str = "1y"
+    ) -> Dict[str, pd.DataFrame]:
+        """Download all histories in one grouped yf.download() request."""
+        tickers = list(tickers)
+        if not tickers:
+            return {}
+
+        frame = yf.download(
+            tickers,
+            period=period,
+            group_by="ticker",
+            auto_adjust=True,
+            threads=True,
+            progress=False,
+        )
+        if frame is None or frame.empty:
+            return {}
+
+        histories = {}
+        available = set(frame.columns.get_level_values(0))
+        for ticker in tickers:
+            if ticker not in available:
+                continue
+            hist = frame[ticker].dropna(how="all")
+            if not hist.empty:
+                histories[ticker] = hist
+        return histories
+
+
+class FixtureProvider(MarketDataProvider):
+    """Market data read from a local fixture directory (no network)."""
+
+    def __init__(self, root: str):
+        """
+        Initialize fixture provider.
+
+        Args:
+            root: Fixture directory (see module docstring for layout)
+        """
+        self.root = Path(root)
+
+    @property
+    def cache_key(self) -> str:
+        return f"fixture:{self.root.resolve()}"
+
+    def get_info(self, ticker: str) -> Dict[str, Any]:
+        path = self.root / ticker / "info.json"
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text())
+
+    def get_statements(self, ticker: str) -> Dict[str, pd.DataFrame]:
+        return {name: self._read_frame(ticker, name) for name in STATEMENTS}
+
+    def get_price_history(self, ticker: str, period: str = "1y") -> pd.DataFrame:
+        hist = self._read_frame(ticker, "prices")
+        if hist.empty:
+            return hist
+        hist.index = pd.to_datetime(hist.index)
+        return trim_to_period(hist, period)
+
+    def get_risk_free_rate(self) -> Optional[float]:
+        path = self.root / "risk_free_rate.json"
+        if not path.exists():
+            return None
+        return float(json.loads(path.read_text())["rate"])
+
+    def tickers(self) -> List[str]:
+        """Tickers available in the fixture directory."""
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if (p / "info.json").exists())
+
+    def _read_frame(self, ticker: str, name: str) -> pd.DataFrame:
+        """Read a fixture frame, preferring Parquet over CSV."""
+        parquet = self.root / ticker / f"{name}.parquet"
+        if parquet.exists():
+            return pd.read_parquet(parquet)
+        csv = self.root / ticker / f"{name}.csv"
+        if csv.exists():
+            return pd.read_csv(csv, index_col=0)
+        return pd.DataFrame()
+
+    @classmethod
+    def record(
+        cls,
+        source: MarketDataProvider,
+        tickers: Iterable[str],
+        root: str,
+        period: str = "1y",
+        file_format: str = "csv",
+    ) -> "FixtureProvider":
+        """
+        Snapshot tickers from another provider into a fixture directory.
+
+        Args:
+            source: Provider to read from (e.g. YFinanceProvider())
+            tickers: Tickers to record
+            root: Fixture directory to write
+            period: Price history period to record
+            file_format: "csv" or "parquet"
+
+        Returns:
+            FixtureProvider reading the recorded directory
+        """
+        root_path = Path(root)
+        root_path.mkdir(parents=True, exist_ok=True)
+
+        rate = source.get_risk_free_rate()
+        if rate is not None:
+            (root_path / "risk_free_rate.json").write_text(json.dumps({"rate": rate}))
+
+        for ticker in tickers:
+            write_fixture(
+                root,
+                ticker,
+                info=source.get_info(ticker),
+                statements=source.get_statements(ticker),
+                prices=source.get_price_history(ticker, period),
+                file_format=file_format,
+            )
+
+        return cls(root)
+
+
+class CompositeProvider(MarketDataProvider):
+    """Tries providers in order (e.g. local cache first, then a live feed).
+
+    The first provider that returns non-empty data wins; a provider that
+    raises is skipped. If every provider fails, the last error is raised.
+    """
+
+    def __init__(self, *providers: MarketDataProvider):
+        """
+        Initialize composite provider.
+
+        Args:
+            providers: Providers in priority order
+        """
+        if not providers:
+            raise ValueError("CompositeProvider needs at least one provider")
+        self.providers = providers
+
+    @property
+    def cache_key(self) -> str:
+        return "+".join(p.cache_key for p in self.providers)
+
+    def get_info(self, ticker: str) -> Dict[str, Any]:
+        return self._first(lambda p: p.get_info(ticker), lambda info: bool(info), {})
+
+    def get_statements(self, ticker: str) -> Dict[str, pd.DataFrame]:
+        return self._first(
+            lambda p: p.get_statements(ticker),
+            lambda statements: any(not df.empty for df in statements.values()),
+            {name: pd.DataFrame() for name in STATEMENTS},
+        )
+
+    def get_price_history(self, ticker: str, period: str = "1y") -> pd.DataFrame:
+        return self._first(
+            lambda p: p.get_price_history(ticker, period),
+            lambda hist: not hist.empty,
+            pd.DataFrame(),
+        )
+
+    def get_risk_free_rate(self) -> Optional[float]:
+        return self._first(lambda p: p.get_risk_free_rate(), lambda rate: rate is not None, None)
+
+    def get_price_histories(
+        self, tickers: Sequence[str], period: str = "1y"
+    ) -> Dict[str, pd.DataFrame]:
+        histories: Dict[str, pd.DataFrame] = {}
+        remaining = list(tickers)
+        for provider in self.providers:
+            if not remaining:
+                break
+            try:
+                found = provider.get_price_histories(remaining, period)
+            except Exception:
+                continue
+            histories.update(found)
+            remaining = [t for t in remaining if t not in histories]
+        return histories
+
+    def _first(self, fetch, has_data, empty):
+        """Return the first provider result that has data."""
+        error = None
+        for provider in self.providers:
+            try:
+                result = fetch(provider)
+            except Exception as e:
+                error = e
+                continue
+            if has_data(result):
+                return result
+        if error is not None:
+            raise error
+        return empty
+
+
+def write_fixture(
+    root: str,
+    ticker: str,
+    info: Dict[str, Any],
+    statements: Optional[Dict[str, pd.DataFrame]] = None,
+    prices: Optional[pd.DataFrame] = None,
+    file_format: str = "csv",
+) -> None:
+    """
+    Write one ticker's data in FixtureProvider layout.
+
+    Args:
+        root: Fixture directory
+        ticker: Stock ticker
+        info: yfinance-style info dict
+        statements: Statements keyed by name
+        prices: Daily OHLCV history
+        file_format: "csv" or "parquet"
+    """
+    ticker_dir = Path(root) / ticker
+    ticker_dir.mkdir(parents=True, exist_ok=True)
+    (ticker_dir / "info.json").write_text(json.dumps(info, default=str))
+
+    frames = dict(statements or {})
+    if prices is not None:
+        frames["prices"] = prices
+
+    for name, frame in frames.items():
+        if frame is None or frame.empty:
+            continue
+        # Column labels must be strings for Parquet/CSV round-trips
+        frame = frame.copy()
+        frame.columns = [str(c) for c in frame.columns]
+        if file_format == "parquet":
+            frame.to_parquet(ticker_dir / f"{name}.parquet")
+        else:
+            frame.to_csv(ticker_dir / f"{name}.csv")
+
+
+def write_synthetic_fixtures(root: str, tickers: Sequence[str], days: int = 300, seed: int = 0) -> str:
+    """
+    Write synthetic offline market data (random-walk prices, fundamentals and a
+    risk-free rate) for soak runs, benchmarks and tests.
+
+    Args:
+        root: Fixture directory (created if missing)
+        tickers: Tickers to generate
+        days: Business days of price history per ticker
+        seed: Random seed
+
+    Returns:
+        The fixture directory
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(end=pd.Timestamp.today().normalize(), periods=days, freq="B")
+    for ticker in tickers:
+        close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, days)))
+        prices = pd.DataFrame(
+            {
+                "Open": close,
+                "High": close * 1.01,
+                "Low": close * 0.99,
+                "Close": close,
+                "Volume": rng.integers(1e6, 5e6, days).astype(float),
+            },
+            index=index,
+        )
+        revenue = float(rng.uniform(1e9, 1e11))
+        info = {
+            "longName": f"{ticker} Corp",
+            "sector": "Technology",
+            "industry": "Software",
+            "marketCap": revenue * float(rng.uniform(2, 10)),
+            "currentPrice": float(close[-1]),
+            "trailingPE": float(rng.uniform(10, 40)),
+            "returnOnEquity": float(rng.uniform(0.05, 0.35)),
+            "profitMargins": float(rng.uniform(0.05, 0.3)),
+            "revenueGrowth": float(rng.uniform(-0.05, 0.3)),
+            "debtToEquity": float(rng.uniform(0, 150)),
+            "beta": float(rng.uniform(0.7, 1.6)),
+            "recommendationKey": "buy",
+            "targetMeanPrice": float(close[-1] * rng.uniform(0.8, 1.3)),
+            "numberOfAnalystOpinions": int(rng.integers(3, 40)),
+        }
+        statements = {
+            "income_stmt": pd.DataFrame(
+                {"2025-12-31": [revenue, revenue * 0.15]}, index=["Total Revenue", "Net Income"]
+            ),
+        }
+        write_fixture(root, ticker, info=info, statements=statements, prices=prices)
+
+    Path(root).mkdir(parents=True, exist_ok=True)
+    (Path(root) / "risk_free_rate.json").write_text('{"rate": 0.043}')
+    return root
+
+
+_PERIOD_PATTERN = re.compile(r"^(\d+)(d|wk|mo|y)$")
+
+
+def trim_to_period(hist: pd.DataFrame, period: str) -> pd.DataFrame:
+    """Keep the trailing `period` ("5d", "6mo", "1y", "max", ...) of a history."""
+    match = _PERIOD_PATTERN.match(period)
+    if period in ("max", "ytd") or not match:
+        if period == "ytd":
+            return hist[hist.index >= pd.Timestamp(hist.index[-1].year, 1, 1, tz=hist.index.tz)]
+        return hist
+
+    count, unit = int(match.group(1)), match.group(2)
+    if unit == "d":
+        return hist.tail(count)
+    offset = {
+        "wk": pd.DateOffset(weeks=count),
+        "mo": pd.DateOffset(months=count),
+        "y": pd.DateOffset(years=count),
+    }[unit]
+    return hist[hist.index > hist.index[-1] - offset]
+
+
+_default_provider: Optional[MarketDataProvider] = None
+
+
+def get_default_provider() -> MarketDataProvider:
+    """
+    Provider used when none is injected.
+
+    Built from Config.MARKET_DATA_PROVIDER: "yfinance", "fixture"
+    (MARKET_DATA_FIXTURES directory), or "fixture+yfinance" (fixtures first,
+    then live data).
+    """
+    global _default_provider
+    if _default_provider is None:
+        _default_provider = make_provider(Config.MARKET_DATA_PROVIDER, Config.MARKET_DATA_FIXTURES)
+    return _default_provider
+
+
+def set_default_provider(provider: Optional[MarketDataProvider]) -> None:
+    """Replace the process-wide default provider (None resets to Config)."""
+    global _default_provider
+    _default_provider = provider
+
+
+def make_provider(name: str, fixtures_dir: Optional[str] = None) -> MarketDataProvider:
+    """
+    Build a provider by name.
+
+    Args:
+        name: "yfinance", "fixture", or "fixture+yfinance"
+        fixtures_dir: Fixture directory for fixture-backed providers
+
+    Returns:
+        MarketDataProvider instance
+    """
+    if name == "yfinance":
+        return YFinanceProvider()
+    if name in ("fixture", "fixture+yfinance"):
+        if not fixtures_dir:
+            raise ValueError(f"Provider '{name}' requires a fixtures directory")
+        fixtures = FixtureProvider(fixtures_dir)
+        if name == "fixture":
+            return fixtures
+        return CompositeProvider(fixtures, YFinanceProvider())
+    raise ValueError(f"Unknown market data provider: {name}")
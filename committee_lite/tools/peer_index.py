@@ -0,0 +1,339 @@
+"""Sector/industry peer index for relative fundamentals.
+
+Built once per universe from financial snapshots, the index stores, for
+every ticker and metric, the ticker's percentile among its peers, the peer
+median and the peer count. Peers are the ticker's industry (within its
+sector); when fewer than min_peers industry peers report a metric, the
+whole sector is used instead. Lookups are O(1) array reads, so agents can
+put "P/E 45.2 (91st pct of 34 Semiconductors peers, median 28.1)" in a
+prompt without touching the rest of the universe.
+
+Statistics are computed with grouped (vectorized) ranks and medians. When a
+few tickers change, update() recomputes only the sectors they belong to.
+
+Percentiles use mid-ranks: the lowest of n peers sits at 50/n, the highest
+at 100 - 50/n, and ties share their average rank.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from committee_lite.tools.compact import compact_pairs, num
+from committee_lite.tools.financial_data import get_financial_snapshot
+from committee_lite.tools.market_data import MarketDataProvider
+from committee_lite.tools.snapshot import FinancialSnapshot, SnapshotBatch
+
+
+# Metric -> prompt label (ratios in PERCENT_METRICS are shown as percentages)
+PEER_METRICS = {
+    "pe_ratio": "P/E",
+    "forward_pe": "Forward P/E",
+    "price_to_book": "P/B",
+    "price_to_sales": "P/S",
+    "profit_margin": "Profit Margin",
+    "operating_margin": "Operating Margin",
+    "roe": "ROE",
+    "roa": "ROA",
+    "revenue_growth": "Revenue Growth",
+    "earnings_growth": "Earnings Growth",
+    "current_ratio": "Current Ratio",
+    "debt_to_equity": "Debt/Equity",
+}
+
+PERCENT_METRICS = {
+    "profit_margin",
+    "operating_margin",
+    "roe",
+    "roa",
+    "revenue_growth",
+    "earnings_growth",
+}
+
+# Peer group levels stored per (ticker, metric)
+_NO_PEERS, _INDUSTRY, _SECTOR = 0, 1, 2
+
+
+@dataclass(frozen=True, slots=True)
+class PeerPercentile:
+    """One metric of one ticker relative to its peer group."""
+
+    metric: str
+    value: Optional[float]
+    percentile: Optional[float]  # 0-100, None if the ticker doesn't report the metric
+    median: float
+    peers: int  # Peers reporting the metric (including the ticker)
+    group: str  # "industry" or "sector"
+    group_name: str
+
+    def describe(self, compact: bool = False) -> str:
+        """Render for a prompt, e.g. "ROE: 22.0% (81st pct of 34 Software peers, median 15.2%)"."""
+        label = PEER_METRICS[self.metric]
+        value = _format_value(self.metric, self.value)
+        median = _format_value(self.metric, self.median)
+        if compact:
+            return compact_pairs([
+                (self.metric, value),
+                ("pct", num(self.percentile, ".0f")),
+                ("median", median),
+                ("n", self.peers),
+            ])
+        if self.percentile is None:
+            return f"{label}: N/A ({self.group_name} median {median}, {self.peers} peers)"
+        return (
+            f"{label}: {value} ({_ordinal(self.percentile)} pct of {self.peers} "
+            f"{self.group_name} peers, median {median})"
+        )
+
+
+class PeerIndex:
+    """Per-ticker peer percentiles, medians and counts for a universe."""
+
+    def __init__(self, frame: pd.DataFrame, min_peers: int = 5):
+        """
+        Build the index.
+
+        Args:
+            frame: One row per ticker (index) with "sector", "industry" and the
+                PEER_METRICS columns, e.g. SnapshotBatch.to_frame() or
+                fetch_bulk_data() output; NaN marks a missing metric
+            min_peers: Peers reporting a metric needed to rank within the
+                industry; below it the sector is used, and below it again
+                the metric gets no peer context
+        """
+        self.min_peers = min_peers
+        self._columns = {metric: j for j, metric in enumerate(PEER_METRICS)}
+        self._rows: Dict[str, int] = {}
+        self._sectors = np.empty(0, dtype=object)
+        self._industries = np.empty(0, dtype=object)
+        self._values = np.empty((0, len(PEER_METRICS)))
+        self._percentiles = np.empty((0, len(PEER_METRICS)))
+        self._medians = np.empty((0, len(PEER_METRICS)))
+        self._peers = np.empty((0, len(PEER_METRICS)), dtype=np.int32)
+        self._levels = np.empty((0, len(PEER_METRICS)), dtype=np.int8)
+        self._load(_peer_frame(frame))
+
+    @classmethod
+    def from_snapshots(
+        cls,
+        snapshots: Union[SnapshotBatch, Iterable[FinancialSnapshot]],
+        min_peers: int = 5,
+    ) -> "PeerIndex":
+        """Build from a SnapshotBatch or FinancialSnapshot records."""
+        if not isinstance(snapshots, SnapshotBatch):
+            snapshots = SnapshotBatch.from_snapshots(snapshots)
+        return cls(snapshots.to_frame(), min_peers)
+
+    @classmethod
+    def from_universe(
+        cls,
+        tickers: Sequence[str],
+        provider: Optional[MarketDataProvider] = None,
+        min_peers: int = 5,
+        max_workers: int = 8,
+    ) -> "PeerIndex":
+        """
+        Build from the (cached) financial data of a universe.
+
+        Args:
+            tickers: Universe tickers
+            provider: Market data source (default: get_default_provider())
+            min_peers: See __init__
+            max_workers: Concurrent fetches for tickers not in the cache
+
+        Returns:
+            PeerIndex over the universe
+        """
+        tickers = list(dict.fromkeys(t.upper() for t in tickers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            snapshots = list(
+                executor.map(lambda t: get_financial_snapshot(t, provider=provider), tickers)
+            )
+        return cls.from_snapshots(snapshots, min_peers)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._rows
+
+    def update(self, snapshots: Union[SnapshotBatch, Iterable[FinancialSnapshot]]) -> None:
+        """
+        Replace (or add) some tickers' metrics and refresh their peer groups.
+
+        Only the sectors the tickers belonged to or now belong to are
+        recomputed, so refreshing a few names is cheap on a large index.
+
+        Args:
+            snapshots: Changed tickers' snapshots
+        """
+        if not isinstance(snapshots, SnapshotBatch):
+            snapshots = SnapshotBatch.from_snapshots(snapshots)
+        self._load(_peer_frame(snapshots.to_frame()))
+
+    def _load(self, frame: pd.DataFrame) -> None:
+        """Write rows (new or replacing existing tickers) and refresh their sectors."""
+        if frame.empty:
+            return
+        old_rows = [self._rows[t] for t in frame.index if t in self._rows]
+        sectors = set(self._sectors[old_rows]) | set(frame["sector"])
+        sectors.discard(None)
+
+        added = [t for t in frame.index if t not in self._rows]
+        if added:
+            for ticker in added:
+                self._rows[ticker] = len(self._rows)
+            extra = len(added)
+            self._sectors = np.concatenate([self._sectors, np.full(extra, None, dtype=object)])
+            self._industries = np.concatenate(
+                [self._industries, np.full(extra, None, dtype=object)]
+            )
+            for name, fill in (("_values", np.nan), ("_percentiles", np.nan), ("_medians", np.nan),
+                               ("_peers", 0), ("_levels", _NO_PEERS)):
+                array = getattr(self, name)
+                grown = np.full((extra, array.shape[1]), fill, dtype=array.dtype)
+                setattr(self, name, np.vstack([array, grown]))
+
+        rows = np.array([self._rows[t] for t in frame.index], dtype=np.intp)
+        self._sectors[rows] = frame["sector"].to_numpy(dtype=object)
+        self._industries[rows] = frame["industry"].to_numpy(dtype=object)
+        self._values[rows] = frame[list(PEER_METRICS)].to_numpy(dtype=np.float64)
+
+        affected = np.isin(self._sectors, list(sectors)) if sectors else np.zeros(len(self), bool)
+        affected[rows] = True
+        self._refresh(np.flatnonzero(affected))
+
+    def lookup(self, ticker: str, metric: str) -> Optional[PeerPercentile]:
+        """
+        One metric of a ticker relative to its peers.
+
+        Returns:
+            PeerPercentile, or None if the ticker isn't indexed or the metric
+            has too few peers
+        """
+        row = self._rows.get(ticker.upper())
+        if row is None:
+            return None
+        col = self._columns[metric]
+        level = self._levels[row, col]
+        if level == _NO_PEERS:
+            return None
+        value = self._values[row, col]
+        percentile = self._percentiles[row, col]
+        group = "industry" if level == _INDUSTRY else "sector"
+        return PeerPercentile(
+            metric=metric,
+            value=None if np.isnan(value) else float(value),
+            percentile=None if np.isnan(percentile) else float(percentile),
+            median=float(self._medians[row, col]),
+            peers=int(self._peers[row, col]),
+            group=group,
+            group_name=(self._industries if level == _INDUSTRY else self._sectors)[row],
+        )
+
+    def profile(self, ticker: str) -> List[PeerPercentile]:
+        """Every metric of a ticker that has peer context, in PEER_METRICS order."""
+        results = (self.lookup(ticker, metric) for metric in PEER_METRICS)
+        return [result for result in results if result is not None]
+
+    def _refresh(self, rows: np.ndarray) -> None:
+        """Recompute peer statistics for rows that cover whole sectors."""
+        if len(rows) == 0:
+            return
+        values = pd.DataFrame(self._values[rows], columns=list(PEER_METRICS))
+        sectors = pd.Series(self._sectors[rows], dtype=object)
+        industries = pd.Series(self._industries[rows], dtype=object)
+
+        stats = {}
+        for level, keys in ((_INDUSTRY, [sectors, industries]), (_SECTOR, [sectors])):
+            if not np.logical_and.reduce([key.notna().to_numpy() for key in keys]).any():
+                # No row has a known group, and pandas can't transform an empty groupby
+                empty = np.full(values.shape, np.nan)
+                stats[level] = (empty, empty, np.zeros(values.shape))
+                continue
+            grouped = values.groupby(keys, dropna=True, sort=False)
+            ranks = grouped.rank(method="average").to_numpy(dtype=np.float64)
+            counts = grouped.transform("count").to_numpy(dtype=np.float64)
+            medians = grouped.transform("median").to_numpy(dtype=np.float64)
+            # Tickers outside any group (unknown sector/industry) come back as NaN
+            counts = np.nan_to_num(counts, nan=0.0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                percentiles = (ranks - 0.5) / counts * 100
+            stats[level] = (percentiles, medians, counts)
+
+        industry_pct, industry_median, industry_count = stats[_INDUSTRY]
+        sector_pct, sector_median, sector_count = stats[_SECTOR]
+        use_industry = industry_count >= self.min_peers
+        use_sector = ~use_industry & (sector_count >= self.min_peers)
+
+        self._levels[rows] = np.select([use_industry, use_sector], [_INDUSTRY, _SECTOR], _NO_PEERS)
+        self._percentiles[rows] = np.select(
+            [use_industry, use_sector], [industry_pct, sector_pct], np.nan
+        )
+        self._medians[rows] = np.select(
+            [use_industry, use_sector], [industry_median, sector_median], np.nan
+        )
+        self._peers[rows] = np.select(
+            [use_industry, use_sector], [industry_count, sector_count], 0
+        ).astype(np.int32)
+
+
+def format_peer_summary(
+    peer_index: Optional[PeerIndex], ticker: str, compact: bool = False
+) -> str:
+    """
+    Format a ticker's peer percentiles for a prompt.
+
+    Args:
+        peer_index: Peer index of the universe (None = no peer context)
+        ticker: Stock ticker
+        compact: One key=value line per metric
+
+    Returns:
+        Formatted summary ("" if the ticker has no peer context)
+    """
+    if peer_index is None:
+        return ""
+    profile = [p for p in peer_index.profile(ticker) if p.percentile is not None]
+    if not profile:
+        return ""
+    if compact:
+        return "\n".join(p.describe(compact=True) for p in profile)
+    return "\n".join(f"  {p.describe()}" for p in profile)
+
+
+def _peer_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Sector, industry and metric columns; unknown groups and errored rows become NaN."""
+    if "ticker" in frame.columns:
+        frame = frame.set_index("ticker")
+    missing = pd.Series(np.nan, index=frame.index)
+    peers = pd.DataFrame(index=frame.index.astype(str).str.upper())
+
+    valid = frame["error"].isna() if "error" in frame else pd.Series(True, index=frame.index)
+    for key in ("sector", "industry"):
+        labels = frame[key] if key in frame else missing
+        known = valid & labels.notna() & ~labels.isin(["", "Unknown"])
+        peers[key] = labels.where(known).to_numpy(dtype=object)
+    for metric in PEER_METRICS:
+        column = frame[metric] if metric in frame else missing
+        peers[metric] = pd.to_numeric(column, errors="coerce").to_numpy(dtype=np.float64)
+    return peers[~peers.index.duplicated(keep="last")]
+
+
+def _format_value(metric: str, value: Optional[float]) -> str:
+    """Format a metric value for a prompt."""
+    if value is None or np.isnan(value):
+        return "N/A"
+    if metric in PERCENT_METRICS:
+        return f"{value * 100:.1f}%"
+    return f"{value:.2f}"
+
+
+def _ordinal(percentile: float) -> str:
+    """Round a percentile to an ordinal ("1st", "22nd", "63rd", "91st")."""
+    n = int(round(percentile))
+    suffix = "th" if 10 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
@@ -0,0 +1,337 @@
+"""Append-only, memory-mapped columnar store for daily price bars.
+
+Each field (date, open, high, low, close, volume) is one flat binary file
+read through numpy.memmap. An index maps every ticker to a contiguous block
+(offset, length, capacity) in those files, so loading a ticker's price window
+is a zero-copy slice - no DataFrame is built.
+
+Blocks are allocated with headroom so daily appends write in place. When a
+block fills up it is copied to the end of the files with more capacity (the
+old block becomes dead space until compact() is called). Dates are stored as
+days since the Unix epoch and must be strictly increasing per ticker.
+
+Single writer, any number of readers.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from committee_lite.tools.market_data import MarketDataProvider
+
+
+FIELDS = {
+    "date": np.int64,
+    "open": np.float64,
+    "high": np.float64,
+    "low": np.float64,
+    "close": np.float64,
+    "volume": np.float64,
+}
+
+# Frame column for each stored field
+_COLUMNS = {"open": "Open", "high": "High", "low": "Low", "close": "Close", "volume": "Volume"}
+
+# Extra rows reserved per block so daily appends don't relocate it
+DEFAULT_HEADROOM = 64
+
+
+class PriceStore:
+    """Columnar daily-bar store with a ticker -> block index."""
+
+    def __init__(self, root: str, headroom: int = DEFAULT_HEADROOM):
+        """
+        Open (or create) a price store.
+
+        Args:
+            root: Store directory
+            headroom: Spare rows reserved when a block is (re)allocated
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.headroom = headroom
+
+        self._maps: Dict[str, np.memmap] = {}
+        self.reload()
+
+    def reload(self) -> None:
+        """Re-read the index to see bars appended by another process's writer."""
+        index_path = self.root / "index.json"
+        if index_path.exists():
+            meta = json.loads(index_path.read_text())
+            self._rows = meta["rows"]
+            self._index: Dict[str, Dict[str, int]] = meta["tickers"]
+        else:
+            self._rows = 0
+            self._index = {}
+
+        # Files may have grown or been compacted since they were mapped
+        for field in FIELDS:
+            self._unmap(field)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._index and self._index[ticker]["length"] > 0
+
+    def tickers(self) -> List[str]:
+        """Tickers with stored bars."""
+        return sorted(t for t in self._index if t in self)
+
+    def length(self, ticker: str) -> int:
+        """Number of bars stored for a ticker."""
+        entry = self._index.get(ticker)
+        return entry["length"] if entry else 0
+
+    def window(
+        self,
+        ticker: str,
+        bars: Optional[int] = None,
+        period: Optional[str] = None,
+        end_date=None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Zero-copy view of a ticker's most recent bars.
+
+        Args:
+            ticker: Stock ticker
+            bars: Number of trailing bars (default: all)
+            period: Trailing calendar period ("6mo", "1y", ...) instead of bars
+            end_date: Last date to include (default: the latest bar); bars and
+                period then count back from it
+
+        Returns:
+            Dict of field -> read-only array (memmap slices)
+        """
+        entry = self._index.get(ticker)
+        if not entry or entry["length"] == 0:
+            return {field: np.empty(0, dtype=dtype) for field, dtype in FIELDS.items()}
+
+        start = entry["offset"]
+        end = start + entry["length"]
+        if end_date is not None:
+            dates = self._map("date")[start:end]
+            end = start + int(np.searchsorted(dates, _to_epoch_day(end_date), side="right"))
+
+        if period is not None:
+            dates = self._map("date")[start:end]
+            start += _period_start(dates, period)
+        elif bars is not None:
+            start = max(start, end - bars)
+
+        return {field: self._map(field)[start:end] for field in FIELDS}
+
+    def last_date(self, ticker: str) -> Optional[pd.Timestamp]:
+        """Date of the most recent stored bar."""
+        dates = self.window(ticker, bars=1)["date"]
+        return _to_timestamp(dates[-1]) if len(dates) else None
+
+    def append_bar(
+        self,
+        ticker: str,
+        date,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> int:
+        """
+        Append one daily bar (ignored if not newer than the last stored bar).
+
+        Returns:
+            Number of bars written (0 or 1)
+        """
+        return self.append(ticker, {
+            "date": np.array([_to_epoch_day(date)], dtype=np.int64),
+            "open": np.array([open], dtype=np.float64),
+            "high": np.array([high], dtype=np.float64),
+            "low": np.array([low], dtype=np.float64),
+            "close": np.array([close], dtype=np.float64),
+            "volume": np.array([volume], dtype=np.float64),
+        })
+
+    def append_history(self, ticker: str, hist: pd.DataFrame) -> int:
+        """
+        Append bars from an OHLCV DataFrame (e.g. a provider price history).
+
+        Returns:
+            Number of new bars written
+        """
+        if hist.empty:
+            return 0
+        hist = hist.dropna(subset=["Close"])
+        index = pd.DatetimeIndex(hist.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+
+        columns = {"date": index.values.astype("datetime64[D]").astype(np.int64)}
+        for field, column in _COLUMNS.items():
+            columns[field] = hist[column].to_numpy(dtype=np.float64)
+        return self.append(ticker, columns)
+
+    def append(self, ticker: str, columns: Dict[str, np.ndarray]) -> int:
+        """
+        Append bars given as field arrays; bars not newer than the last stored
+        date are skipped.
+
+        Returns:
+            Number of new bars written
+        """
+        dates = np.asarray(columns["date"], dtype=np.int64)
+        entry = self._index.get(ticker)
+
+        if entry and entry["length"]:
+            last = self._map("date")[entry["offset"] + entry["length"] - 1]
+            keep = dates > last
+            dates = dates[keep]
+            columns = {f: np.asarray(v)[keep] for f, v in columns.items()}
+        if len(dates) == 0:
+            return 0
+        if np.any(np.diff(dates) <= 0):
+            raise ValueError(f"Bars for {ticker} must have strictly increasing dates")
+
+        count = len(dates)
+        entry = self._reserve(ticker, count)
+        start = entry["offset"] + entry["length"]
+
+        for field, dtype in FIELDS.items():
+            values = dates if field == "date" else np.asarray(columns[field], dtype=dtype)
+            target = self._map(field, writable=True)
+            target[start:start + count] = values
+            target.flush()
+
+        entry["length"] += count
+        self._save_index()
+        return count
+
+    def ingest(
+        self, provider: MarketDataProvider, tickers: Sequence[str], period: str = "1y"
+    ) -> int:
+        """
+        Load price histories from a provider (one bulk request where supported).
+
+        Returns:
+            Number of new bars written
+        """
+        histories = provider.get_price_histories(list(tickers), period)
+        return sum(self.append_history(t, hist) for t, hist in histories.items())
+
+    def compact(self) -> None:
+        """Rewrite the files without dead space left by relocated blocks."""
+        new_index = {}
+        new_rows = 0
+        for ticker, entry in self._index.items():
+            capacity = entry["length"] + self.headroom
+            new_index[ticker] = {"offset": new_rows, "length": entry["length"], "capacity": capacity}
+            new_rows += capacity
+
+        for field, dtype in FIELDS.items():
+            old = self._map(field)
+            tmp_path = self._path(field).with_suffix(".tmp")
+            new = np.memmap(tmp_path, dtype=dtype, mode="w+", shape=(max(new_rows, 1),))
+            for ticker, entry in self._index.items():
+                src = old[entry["offset"]:entry["offset"] + entry["length"]]
+                dst = new_index[ticker]["offset"]
+                new[dst:dst + entry["length"]] = src
+            new.flush()
+            del new
+            self._unmap(field)
+            os.replace(tmp_path, self._path(field))
+
+        self._index = new_index
+        self._rows = new_rows
+        self._save_index()
+
+    def _reserve(self, ticker: str, count: int) -> Dict[str, int]:
+        """Ensure the ticker's block has room for `count` more rows."""
+        entry = self._index.get(ticker)
+        if entry and entry["capacity"] - entry["length"] >= count:
+            return entry
+
+        length = entry["length"] if entry else 0
+        capacity = max(2 * (length + count), length + count + self.headroom)
+        offset = self._rows
+        self._grow(offset + capacity)
+
+        if entry and length:
+            # Relocate the existing bars to the new block
+            for field in FIELDS:
+                data = self._map(field, writable=True)
+                data[offset:offset + length] = data[entry["offset"]:entry["offset"] + length]
+
+        new_entry = {"offset": offset, "length": length, "capacity": capacity}
+        self._index[ticker] = new_entry
+        self._rows = offset + capacity
+        return new_entry
+
+    def _grow(self, rows: int) -> None:
+        """Extend every field file to hold `rows` rows."""
+        for field, dtype in FIELDS.items():
+            path = self._path(field)
+            with open(path, "ab") as f:
+                f.truncate(rows * np.dtype(dtype).itemsize)
+            self._unmap(field)
+
+    def _map(self, field: str, writable: bool = False) -> np.memmap:
+        """Memory map a field file (cached; remapped after growth)."""
+        key = f"{field}:{'w' if writable else 'r'}"
+        mapped = self._maps.get(key)
+        if mapped is None:
+            mapped = np.memmap(
+                self._path(field), dtype=FIELDS[field], mode="r+" if writable else "r"
+            )
+            self._maps[key] = mapped
+        return mapped
+
+    def _unmap(self, field: str) -> None:
+        """Drop cached maps of a field file after it was resized or replaced."""
+        self._maps.pop(f"{field}:r", None)
+        self._maps.pop(f"{field}:w", None)
+
+    def _path(self, field: str) -> Path:
+        return self.root / f"{field}.bin"
+
+    def _save_index(self) -> None:
+        """Atomically persist the ticker index."""
+        tmp_path = self.root / "index.json.tmp"
+        tmp_path.write_text(json.dumps({"rows": self._rows, "tickers": self._index}))
+        os.replace(tmp_path, self.root / "index.json")
+
+
+def _to_epoch_day(date) -> int:
+    """Convert a date-like value to days since the Unix epoch."""
+    ts = pd.Timestamp(date)
+    if ts.tz is not None:
+        ts = ts.tz_localize(None)
+    return int(ts.to_datetime64().astype("datetime64[D]").astype(np.int64))
+
+
+def _to_timestamp(epoch_day: int) -> pd.Timestamp:
+    return pd.Timestamp(np.datetime64(int(epoch_day), "D"))
+
+
+def _period_start(dates: np.ndarray, period: str) -> int:
+    """Index of the first bar inside the trailing period (matches trim_to_period)."""
+    if period in ("max",) or len(dates) == 0:
+        return 0
+    if period.endswith("d") and period[:-1].isdigit():
+        return max(0, len(dates) - int(period[:-1]))
+
+    last = _to_timestamp(dates[-1])
+    if period == "ytd":
+        cutoff = _to_epoch_day(pd.Timestamp(last.year, 1, 1)) - 1
+    else:
+        number = int("".join(ch for ch in period if ch.isdigit()) or 0)
+        unit = period[len(str(number)):]
+        offset = {
+            "wk": pd.DateOffset(weeks=number),
+            "mo": pd.DateOffset(months=number),
+            "y": pd.DateOffset(years=number),
+        }.get(unit)
+        if offset is None:
+            return 0
+        cutoff = _to_epoch_day(last - offset)
+    return int(np.searchsorted(dates, cutoff, side="right"))
@@ -0,0 +1,245 @@
+"""Typed financial data records.
+
+FinancialSnapshot is the typed form of the get_financial_data() dict; a
+SnapshotBatch holds many snapshots as one NumPy structured array for
+universe-scale work. A snapshot also carries its multi-period
+StatementHistory (not part of the dict or batch form) and the trend metrics
+computed from it (tools.statements).
+
+Missing values: a snapshot uses None for any metric the source didn't
+report (non-numeric and non-finite values count as missing); a batch uses
+NaN for missing numbers and None for missing text.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from committee_lite.tools.statements import TREND_FIELDS, StatementHistory
+
+
+# Numeric metrics, in cache/dict order
+NUMERIC_FIELDS = (
+    "market_cap",
+    "current_price",
+    "pe_ratio",
+    "forward_pe",
+    "peg_ratio",
+    "price_to_book",
+    "price_to_sales",
+    "profit_margin",
+    "operating_margin",
+    "roe",
+    "roa",
+    "revenue_growth",
+    "earnings_growth",
+    "current_ratio",
+    "quick_ratio",
+    "debt_to_equity",
+    "total_cash",
+    "total_debt",
+    "free_cash_flow",
+    "operating_cash_flow",
+    "total_assets",
+    "total_liabilities",
+    "revenue",
+    "net_income",
+    "beta",
+    "target_price",
+    "num_analyst_opinions",
+) + TREND_FIELDS
+
+TEXT_FIELDS = ("ticker", "company_name", "sector", "industry", "recommendation", "error")
+
+
+def _number(value: Any) -> Optional[float]:
+    """Coerce a source value to float, or None if missing/non-numeric."""
+    if value is None or isinstance(value, (str, bool)):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+@dataclass(frozen=True, slots=True)
+class FinancialSnapshot:
+    """Financial metrics for one ticker (None = not reported)."""
+
+    ticker: str
+    company_name: str
+    sector: str = "Unknown"
+    industry: str = "Unknown"
+    recommendation: Optional[str] = None
+    error: Optional[str] = None
+
+    market_cap: Optional[float] = None
+    current_price: Optional[float] = None
+
+    pe_ratio: Optional[float] = None
+    forward_pe: Optional[float] = None
+    peg_ratio: Optional[float] = None
+    price_to_book: Optional[float] = None
+    price_to_sales: Optional[float] = None
+
+    profit_margin: Optional[float] = None
+    operating_margin: Optional[float] = None
+    roe: Optional[float] = None
+    roa: Optional[float] = None
+    revenue_growth: Optional[float] = None
+    earnings_growth: Optional[float] = None
+
+    current_ratio: Optional[float] = None
+    quick_ratio: Optional[float] = None
+    debt_to_equity: Optional[float] = None
+    total_cash: Optional[float] = None
+    total_debt: Optional[float] = None
+    free_cash_flow: Optional[float] = None
+    operating_cash_flow: Optional[float] = None
+    total_assets: Optional[float] = None
+    total_liabilities: Optional[float] = None
+    revenue: Optional[float] = None
+    net_income: Optional[float] = None
+
+    beta: Optional[float] = None
+    target_price: Optional[float] = None
+    num_analyst_opinions: Optional[float] = None
+
+    # Multi-period trends (see tools.statements.compute_trends)
+    revenue_ttm: Optional[float] = None
+    net_income_ttm: Optional[float] = None
+    revenue_cagr: Optional[float] = None
+    net_income_cagr: Optional[float] = None
+    cagr_years: Optional[float] = None
+    gross_margin_trend: Optional[float] = None
+    operating_margin_trend: Optional[float] = None
+    net_margin_trend: Optional[float] = None
+    revenue_growth_volatility: Optional[float] = None
+
+    history: Optional[StatementHistory] = field(default=None, compare=False, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        """True if the data was fetched without error."""
+        return self.error is None
+
+    @property
+    def analyst_upside_pct(self) -> Optional[float]:
+        """Upside to the analyst target price in percent, if both prices exist."""
+        if not self.current_price or self.target_price is None:
+            return None
+        return (self.target_price - self.current_price) / self.current_price * 100
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FinancialSnapshot":
+        """
+        Build a snapshot from a get_financial_data()-style dict.
+
+        Args:
+            data: Metric dict (unknown keys are ignored; a StatementHistory
+                under "history" is kept)
+
+        Returns:
+            FinancialSnapshot with numbers coerced to float or None
+        """
+        ticker = data.get("ticker") or ""
+        values: Dict[str, Any] = {
+            "ticker": ticker,
+            "company_name": data.get("company_name") or ticker,
+            "sector": data.get("sector") or "Unknown",
+            "industry": data.get("industry") or "Unknown",
+            "recommendation": data.get("recommendation") or None,
+            "error": data.get("error"),
+        }
+        for name in NUMERIC_FIELDS:
+            values[name] = _number(data.get(name))
+        if isinstance(data.get("history"), StatementHistory):
+            values["history"] = data["history"]
+        return cls(**values)
+
+    @classmethod
+    def coerce(cls, data: Union["FinancialSnapshot", Dict[str, Any]]) -> "FinancialSnapshot":
+        """Accept either a snapshot or a dict."""
+        return data if isinstance(data, cls) else cls.from_dict(data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the get_financial_data() dict format.
+
+        Returns:
+            Dict of metrics (an error snapshot yields ticker/error/company_name only)
+        """
+        if self.error is not None:
+            return {"ticker": self.ticker, "error": self.error, "company_name": self.company_name}
+
+        data = {name: getattr(self, name) for name in TEXT_FIELDS if name != "error"}
+        for name in NUMERIC_FIELDS:
+            data[name] = getattr(self, name)
+        return data
+
+
+_BATCH_DTYPE = np.dtype(
+    [(name, object) for name in TEXT_FIELDS] + [(name, np.float64) for name in NUMERIC_FIELDS]
+)
+
+
+class SnapshotBatch:
+    """Many snapshots as one NumPy structured array (one row per ticker)."""
+
+    def __init__(self, records: np.ndarray):
+        """
+        Wrap a structured array with the batch dtype.
+
+        Args:
+            records: Array with one row per ticker
+        """
+        self.records = records
+        self._rows = {ticker: i for i, ticker in enumerate(records["ticker"])}
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Iterable[FinancialSnapshot]) -> "SnapshotBatch":
+        """Pack snapshots into a batch."""
+        snapshots = list(snapshots)
+        records = np.empty(len(snapshots), dtype=_BATCH_DTYPE)
+        for name in TEXT_FIELDS:
+            records[name] = [getattr(s, name) for s in snapshots]
+        for name in NUMERIC_FIELDS:
+            records[name] = [
+                np.nan if getattr(s, name) is None else getattr(s, name) for s in snapshots
+            ]
+        return cls(records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._rows
+
+    def __getitem__(self, ticker: str) -> FinancialSnapshot:
+        row = self.records[self._rows[ticker]]
+        values = {name: row[name] for name in TEXT_FIELDS}
+        for name in NUMERIC_FIELDS:
+            values[name] = None if np.isnan(row[name]) else float(row[name])
+        return FinancialSnapshot(**values)
+
+    @property
+    def tickers(self) -> List[str]:
+        """Tickers in row order."""
+        return list(self.records["ticker"])
+
+    def column(self, name: str) -> np.ndarray:
+        """One field for every ticker (a view; NaN marks missing numbers)."""
+        return self.records[name]
+
+    def ok(self) -> np.ndarray:
+        """Boolean mask of rows fetched without error."""
+        return np.array([error is None for error in self.records["error"]], dtype=bool)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Columnar DataFrame indexed by ticker."""
+        frame = pd.DataFrame({name: self.records[name] for name in _BATCH_DTYPE.names})
+        return frame.set_index("ticker")
@@ -0,0 +1,255 @@
+"""Multi-period financial statement history and trend metrics.
+
+Providers return statements as DataFrames (rows = line items, columns =
+period ends, newest first). StatementHistory keeps every annual and
+quarterly period of the line items the tools use, as one float array per
+frequency: rows follow HISTORY_ITEMS, columns are periods oldest first, and
+NaN marks an item a period didn't report.
+
+compute_trends() turns many histories into trend metrics at once: the
+histories are right-aligned on their latest period into (tickers x items x
+periods) arrays, so every metric is a handful of array operations whatever
+the universe size:
+
+- TTM revenue / net income: sum of the last four quarters
+- CAGR of revenue and net income over up to `years` annual periods
+- Gross, operating and net margin trends: least-squares slope of the
+  annual margin per year
+- Revenue growth volatility: standard deviation of annual YoY growth
+
+The financial data tool builds a history and its trends when it fetches a
+snapshot, so they are cached with it and cost no extra requests.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Item -> (statement, row labels to try in order)
+HISTORY_ITEMS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "revenue": ("income_stmt", ("Total Revenue", "Operating Revenue")),
+    "gross_profit": ("income_stmt", ("Gross Profit",)),
+    "operating_income": ("income_stmt", ("Operating Income",)),
+    "net_income": ("income_stmt", ("Net Income", "Net Income Common Stockholders")),
+    "total_assets": ("balance_sheet", ("Total Assets",)),
+    "total_liabilities": ("balance_sheet", ("Total Liabilities Net Minority Interest",)),
+    "stockholders_equity": ("balance_sheet", ("Stockholders Equity",)),
+}
+ITEMS = tuple(HISTORY_ITEMS)
+_ROW = {item: i for i, item in enumerate(ITEMS)}
+
+# Trend metrics, in the order compute_trends() returns them
+TREND_FIELDS = (
+    "revenue_ttm",
+    "net_income_ttm",
+    "revenue_cagr",
+    "net_income_cagr",
+    "cagr_years",
+    "gross_margin_trend",
+    "operating_margin_trend",
+    "net_margin_trend",
+    "revenue_growth_volatility",
+)
+
+# Default CAGR / margin-trend window in annual periods
+TREND_YEARS = 3
+
+_DAYS_PER_YEAR = 365.25
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class StatementHistory:
+    """Annual and quarterly line items for one ticker (periods oldest first)."""
+
+    ticker: str
+    annual_periods: np.ndarray  # datetime64[D]
+    annual: np.ndarray  # (len(ITEMS), periods) float64, NaN = not reported
+    quarterly_periods: np.ndarray
+    quarterly: np.ndarray
+
+    @classmethod
+    def from_statements(cls, ticker: str, statements: Dict[str, pd.DataFrame]) -> "StatementHistory":
+        """
+        Extract the history from provider statements.
+
+        Args:
+            ticker: Stock ticker
+            statements: Statements keyed by name ("income_stmt",
+                "quarterly_income_stmt", ...); missing ones are treated as empty
+
+        Returns:
+            StatementHistory (with zero periods if nothing was reported)
+        """
+        annual_periods, annual = _align(statements, "")
+        quarterly_periods, quarterly = _align(statements, "quarterly_")
+        return cls(ticker, annual_periods, annual, quarterly_periods, quarterly)
+
+    @classmethod
+    def empty(cls, ticker: str) -> "StatementHistory":
+        """History with no periods."""
+        return cls.from_statements(ticker, {})
+
+    def series(self, item: str, quarterly: bool = False) -> pd.Series:
+        """One item over time, indexed by period end."""
+        periods, values = (
+            (self.quarterly_periods, self.quarterly) if quarterly else (self.annual_periods, self.annual)
+        )
+        return pd.Series(values[_ROW[item]], index=pd.DatetimeIndex(periods), name=item)
+
+    def latest(self, item: str) -> Optional[float]:
+        """Most recent annual value of an item that was reported."""
+        values = self.annual[_ROW[item]]
+        reported = values[np.isfinite(values)]
+        return float(reported[-1]) if len(reported) else None
+
+
+def _align(statements: Dict[str, pd.DataFrame], prefix: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Union of the statements' periods (oldest first) and the item matrix."""
+    frames = {}
+    for name in ("income_stmt", "balance_sheet"):
+        frame = statements.get(prefix + name)
+        if frame is None or frame.empty:
+            continue
+        frame = frame.copy()
+        frame.columns = pd.to_datetime(frame.columns, errors="coerce")
+        frames[name] = frame.loc[:, frame.columns.notna()]
+
+    columns = [frame.columns for frame in frames.values()]
+    periods = pd.DatetimeIndex(sorted(set().union(*columns))) if columns else pd.DatetimeIndex([])
+    values = np.full((len(ITEMS), len(periods)), np.nan)
+    for item, (name, labels) in HISTORY_ITEMS.items():
+        frame = frames.get(name)
+        if frame is None:
+            continue
+        label = next((label for label in labels if label in frame.index), None)
+        if label is None:
+            continue
+        row = pd.to_numeric(frame.loc[label], errors="coerce")
+        if isinstance(row, pd.DataFrame):  # Duplicated label: first row wins
+            row = row.iloc[0]
+        row = row.groupby(level=0).first()  # Duplicated period: first column wins
+        values[_ROW[item]] = row.reindex(periods).to_numpy(dtype=np.float64)
+    return periods.values.astype("datetime64[D]"), values
+
+
+def _stack(
+    histories: Sequence[StatementHistory], quarterly: bool, width: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Right-align the latest `width` periods of every history.
+
+    Returns:
+        Tuple of (values (tickers, items, width), period ends in years (tickers, width)),
+        NaN-padded on the left where a history is shorter
+    """
+    values = np.full((len(histories), len(ITEMS), width), np.nan)
+    years = np.full((len(histories), width), np.nan)
+    for i, history in enumerate(histories):
+        periods, matrix = (
+            (history.quarterly_periods, history.quarterly)
+            if quarterly
+            else (history.annual_periods, history.annual)
+        )
+        n = min(width, len(periods))
+        if n:
+            values[i, :, width - n:] = matrix[:, -n:]
+            years[i, width - n:] = periods[-n:].astype(np.int64) / _DAYS_PER_YEAR
+    return values, years
+
+
+def _cagr(values: np.ndarray, years: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """CAGR from the earliest to the latest reported value of each row (and its span)."""
+    finite = np.isfinite(values)
+    rows = np.arange(len(values))
+    first = np.argmax(finite, axis=1)
+    last = values.shape[1] - 1 - np.argmax(finite[:, ::-1], axis=1)
+    start, end = values[rows, first], values[rows, last]
+    span = years[rows, last] - years[rows, first]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cagr = (end / start) ** (1 / span) - 1
+    valid = finite.any(axis=1) & (start > 0) & (end > 0) & (span > 0.5)
+    return np.where(valid, cagr, np.nan), np.where(valid, span, np.nan)
+
+
+def _slope(values: np.ndarray, years: np.ndarray) -> np.ndarray:
+    """Least-squares slope per row over its finite points (NaN with fewer than 2)."""
+    mask = np.isfinite(values) & np.isfinite(years)
+    count = mask.sum(axis=1)
+    x = np.where(mask, years, 0.0)
+    y = np.where(mask, values, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_mean = x.sum(axis=1) / count
+        y_mean = y.sum(axis=1) / count
+        dx = np.where(mask, years - x_mean[:, None], 0.0)
+        dy = np.where(mask, values - y_mean[:, None], 0.0)
+        slope = (dx * dy).sum(axis=1) / (dx * dx).sum(axis=1)
+    return np.where(count >= 2, slope, np.nan)
+
+
+def compute_trends(
+    histories: Sequence[StatementHistory], years: int = TREND_YEARS
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized trend metrics for many tickers.
+
+    Args:
+        histories: One StatementHistory per ticker
+        years: CAGR and margin-trend window in annual periods (volatility
+            uses every annual period)
+
+    Returns:
+        Dict of TREND_FIELDS name -> array with one element per history (NaN
+        where the history is too short). Margins and growth are decimals;
+        margin trends are change per year (0.01 = +1pp/year); cagr_years is
+        the span the CAGRs were measured over.
+    """
+    if not histories:
+        return {name: np.empty(0) for name in TREND_FIELDS}
+
+    annual_width = max(1, max(len(h.annual_periods) for h in histories))
+    quarterly_width = max(4, max(len(h.quarterly_periods) for h in histories))
+    annual, annual_years = _stack(histories, quarterly=False, width=annual_width)
+    quarterly, quarterly_years = _stack(histories, quarterly=True, width=quarterly_width)
+    revenue = annual[:, _ROW["revenue"]]
+    window = slice(max(0, annual_width - years - 1), None)
+
+    # TTM: the last four quarters, all reported and within about a year
+    last4 = quarterly[:, :, -4:]
+    spanned = quarterly_years[:, -1] - quarterly_years[:, -4] < 0.85
+    complete = np.isfinite(last4).all(axis=2) & spanned[:, None]
+    ttm = np.where(complete, last4.sum(axis=2), np.nan)
+
+    revenue_cagr, cagr_years = _cagr(revenue[:, window], annual_years[:, window])
+    net_income_cagr, _ = _cagr(annual[:, _ROW["net_income"], window], annual_years[:, window])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        positive = np.where(revenue > 0, revenue, np.nan)
+        margins = {
+            name: annual[:, _ROW[item]] / positive
+            for name, item in (
+                ("gross", "gross_profit"), ("operating", "operating_income"), ("net", "net_income")
+            )
+        }
+        previous = np.where(revenue[:, :-1] > 0, revenue[:, :-1], np.nan)
+        growth = revenue[:, 1:] / previous - 1
+        # Sample standard deviation over the reported growth rates
+        reported = np.isfinite(growth)
+        count = reported.sum(axis=1)
+        mean = np.where(reported, growth, 0.0).sum(axis=1) / count
+        squares = np.where(reported, (growth - mean[:, None]) ** 2, 0.0).sum(axis=1)
+        volatility = np.sqrt(squares / (count - 1))
+
+    return {
+        "revenue_ttm": ttm[:, _ROW["revenue"]],
+        "net_income_ttm": ttm[:, _ROW["net_income"]],
+        "revenue_cagr": revenue_cagr,
+        "net_income_cagr": net_income_cagr,
+        "cagr_years": cagr_years,
+        "gross_margin_trend": _slope(margins["gross"][:, window], annual_years[:, window]),
+        "operating_margin_trend": _slope(margins["operating"][:, window], annual_years[:, window]),
+        "net_margin_trend": _slope(margins["net"][:, window], annual_years[:, window]),
+        "revenue_growth_volatility": np.where(count >= 2, volatility, np.nan),
+    }
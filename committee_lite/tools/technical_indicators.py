@@ -1,86 +1,237 @@
 """Technical indicators calculator."""
 
-import yfinance as yf
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Any, Optional
 
+from committee_lite.tools.compact import compact_pairs, num
+from committee_lite.tools.financial_data import get_price_history
+from committee_lite.tools.market_data import MarketDataProvider
 
-def get_technical_indicators(ticker: str, period: str = "1y") -> Dict[str, Any]:
+if TYPE_CHECKING:
+    from committee_lite.tools.price_store import PriceStore
+
+
+def get_technical_indicators(
+    ticker: str,
+    period: str = "1y",
+    provider: Optional[MarketDataProvider] = None,
+    price_store: Optional["PriceStore"] = None,
+) -> Dict[str, Any]:
     """
     Calculate technical indicators for a ticker.
 
     Args:
         ticker: Stock ticker symbol
         period: Historical period ("1y", "6mo", "3mo", etc.)
+        provider: Market data source (default: get_default_provider())
+        price_store: Read bars from this store when it holds the ticker
+            (memory-mapped, no DataFrame is built)
 
     Returns:
         Dictionary containing technical indicators
     """
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period=period)
-
-        if hist.empty:
+        if price_store is not None and ticker in price_store:
+            bars = price_store.window(ticker, period=period)
+            close, volume = bars["close"], bars["volume"]
+        else:
+            hist = get_price_history(ticker, period=period, provider=provider)
+            if hist.empty:
+                return {"ticker": ticker, "error": "No price data available"}
+            # Mask in numpy: the history is a shared cached frame, and every
+            # pandas-level copy of it leaves a copy-on-write reference behind.
+            # The column views taken here still register weak references, but
+            # pandas drops dead ones as the list grows, so they stay bounded.
+            close = hist["Close"].to_numpy(dtype=np.float64)
+            valid = ~np.isnan(close)
+            close = close[valid]
+            volume = hist["Volume"].to_numpy(dtype=np.float64)[valid]
+
+        if len(close) == 0:
             return {"ticker": ticker, "error": "No price data available"}
 
-        # Current price
-        current_price = hist['Close'].iloc[-1]
-
-        # Moving averages
-        sma_20 = hist['Close'].rolling(window=20).mean().iloc[-1]
-        sma_50 = hist['Close'].rolling(window=50).mean().iloc[-1]
-        sma_200 = hist['Close'].rolling(window=200).mean().iloc[-1]
+        return compute_indicators(ticker, close, volume)
 
-        # RSI (14-day)
-        rsi = calculate_rsi(hist['Close'], period=14)
+    except Exception as e:
+        return {
+            "ticker": ticker,
+            "error": str(e)
+        }
 
-        # MACD
-        macd_line, signal_line, histogram = calculate_macd(hist['Close'])
 
-        # Bollinger Bands
-        bb_upper, bb_middle, bb_lower = calculate_bollinger_bands(hist['Close'])
+def compute_indicators(ticker: str, close: np.ndarray, volume: np.ndarray) -> Dict[str, Any]:
+    """
+    Calculate technical indicators from raw close/volume arrays.
 
-        # Volatility
-        returns = hist['Close'].pct_change().dropna()
-        volatility = returns.std() * np.sqrt(252)  # Annualized
+    Matches the pandas calculations (rolling windows, adjust=False EMAs,
+    sample standard deviations) without building a Series or DataFrame.
 
-        # Price statistics
-        high_52w = hist['Close'].max()
-        low_52w = hist['Close'].min()
-        avg_volume = hist['Volume'].mean()
+    Args:
+        ticker: Stock ticker symbol
+        close: Daily closes, oldest first
+        volume: Daily volumes aligned with close
 
-        # Support/resistance (simple heuristic: recent highs/lows)
-        recent_30d = hist['Close'].tail(30)
-        resistance = recent_30d.quantile(0.75)
-        support = recent_30d.quantile(0.25)
+    Returns:
+        Dictionary containing technical indicators
+    """
+    # MACD
+    ema_fast = _ema(close, 12)
+    ema_slow = _ema(close, 26)
+    macd_series = ema_fast - ema_slow
+    macd_signal_series = _ema(macd_series, 9)
+
+    return _indicator_values(ticker, close, volume, macd_series[-1], macd_signal_series[-1])
+
+
+def _indicator_values(
+    ticker: str,
+    close: np.ndarray,
+    volume: np.ndarray,
+    macd_line: float,
+    signal_line: float,
+) -> Dict[str, Any]:
+    """Indicator dict from price/volume arrays and precomputed MACD values."""
+    # Bollinger Bands
+    bb_middle = _tail_mean(close, 20)
+    bb_std = np.std(close[-20:], ddof=1) if len(close) >= 20 else np.nan
+    bb_upper = bb_middle + bb_std * 2.0
+    bb_lower = bb_middle - bb_std * 2.0
+
+    # Volatility
+    returns = close[1:] / close[:-1] - 1
+    volatility = np.std(returns, ddof=1) * np.sqrt(252) if len(returns) > 1 else np.nan
+
+    # Support/resistance (simple heuristic: recent highs/lows)
+    recent_30d = close[-30:]
+
+    return {
+        "ticker": ticker,
+        "current_price": close[-1],
+        "sma_20": _tail_mean(close, 20),
+        "sma_50": _tail_mean(close, 50),
+        "sma_200": _tail_mean(close, 200),
+        "rsi": _rsi(close, 14),
+        "macd": macd_line,
+        "macd_signal": signal_line,
+        "macd_histogram": macd_line - signal_line,
+        "bb_upper": bb_upper,
+        "bb_middle": bb_middle,
+        "bb_lower": bb_lower,
+        "volatility_annual": volatility,
+        "high_52w": close.max(),
+        "low_52w": close.min(),
+        "avg_volume": volume.mean() if len(volume) else np.nan,
+        "support": np.quantile(recent_30d, 0.25),
+        "resistance": np.quantile(recent_30d, 0.75),
+    }
+
+
+class IndicatorState:
+    """
+    Per-ticker indicator state, updated one bar at a time.
 
-        return {
-            "ticker": ticker,
-            "current_price": current_price,
-            "sma_20": sma_20,
-            "sma_50": sma_50,
-            "sma_200": sma_200,
-            "rsi": rsi,
-            "macd": macd_line,
-            "macd_signal": signal_line,
-            "macd_histogram": histogram,
-            "bb_upper": bb_upper,
-            "bb_middle": bb_middle,
-            "bb_lower": bb_lower,
-            "volatility_annual": volatility,
-            "high_52w": high_52w,
-            "low_52w": low_52w,
-            "avg_volume": avg_volume,
-            "support": support,
-            "resistance": resistance,
-        }
+    MACD EMAs are carried forward in O(1) per bar and the trailing closes and
+    volumes live in bounded buffers, so a new bar never re-fetches or
+    re-scans the history. indicators() matches compute_indicators() over the
+    buffered window (the carried EMAs differ from a fresh re-seed only by the
+    decayed influence of bars that left the window).
+    """
 
-    except Exception as e:
-        return {
-            "ticker": ticker,
-            "error": str(e)
-        }
+    def __init__(self, ticker: str, close: np.ndarray, volume: np.ndarray, window: int = 252):
+        """
+        Seed the state from history.
+
+        Args:
+            ticker: Stock ticker symbol
+            close: Daily closes, oldest first (at least one)
+            volume: Daily volumes aligned with close
+            window: Trailing bars kept (about one year by default)
+        """
+        close = np.asarray(close, dtype=np.float64)[-window:]
+        volume = np.asarray(volume, dtype=np.float64)[-window:]
+        if len(close) == 0:
+            raise ValueError(f"No price history to seed indicators for {ticker}")
+
+        self.ticker = ticker
+        self.closes = deque(close.tolist(), maxlen=window)
+        self.volumes = deque(volume.tolist(), maxlen=window)
+        self.ema_fast = self.ema_slow = float(close[0])
+        self.macd_signal = 0.0
+        for value in close[1:]:
+            self._step_macd(float(value))
+
+    def update(self, close: float, volume: float) -> None:
+        """Add the next bar."""
+        self.closes.append(float(close))
+        self.volumes.append(float(volume))
+        self._step_macd(float(close))
+
+    def _step_macd(self, close: float) -> None:
+        """Advance the MACD EMAs (spans 12/26, signal 9, adjust=False) by one bar."""
+        self.ema_fast += 2.0 / 13 * (close - self.ema_fast)
+        self.ema_slow += 2.0 / 27 * (close - self.ema_slow)
+        self.macd_signal += 2.0 / 10 * (self.macd - self.macd_signal)
+
+    @property
+    def price(self) -> float:
+        """Latest close."""
+        return self.closes[-1]
+
+    @property
+    def macd(self) -> float:
+        """MACD line (fast EMA - slow EMA)."""
+        return self.ema_fast - self.ema_slow
+
+    @property
+    def macd_histogram(self) -> float:
+        """MACD line minus its signal line."""
+        return self.macd - self.macd_signal
+
+    @property
+    def rsi(self) -> float:
+        """14-period RSI of the latest bars."""
+        tail = [self.closes[i] for i in range(max(len(self.closes) - 15, 0), len(self.closes))]
+        return float(_rsi(np.array(tail), 14))
+
+    def indicators(self) -> Dict[str, Any]:
+        """Full indicator dict, as returned by get_technical_indicators()."""
+        return _indicator_values(
+            self.ticker,
+            np.fromiter(self.closes, dtype=np.float64, count=len(self.closes)),
+            np.fromiter(self.volumes, dtype=np.float64, count=len(self.volumes)),
+            self.macd,
+            self.macd_signal,
+        )
+
+
+def _tail_mean(values: np.ndarray, window: int) -> float:
+    """Mean of the last `window` values (NaN if there are fewer)."""
+    return values[-window:].mean() if len(values) >= window else np.nan
+
+
+def _rsi(close: np.ndarray, period: int) -> float:
+    """RSI over the last `period` price changes."""
+    if len(close) < period:
+        return np.nan
+    # The first change is 0, as with the where(delta > 0, 0) on a diff() Series
+    delta = np.diff(close[-period - 1:]) if len(close) > period else np.diff(close, prepend=close[0])
+    gain = np.where(delta > 0, delta, 0.0).mean()
+    loss = np.where(delta < 0, -delta, 0.0).mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 - (100 / (1 + gain / loss))
+
+
+def _ema(values: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average series (adjust=False)."""
+    alpha = 2.0 / (span + 1)
+    out = np.empty(len(values), dtype=np.float64)
+    acc = values[0]
+    for i, value in enumerate(values):
+        acc = acc + alpha * (value - acc)
+        out[i] = acc
+    return out
 
 
 def calculate_rsi(prices: pd.Series, period: int = 14) -> float:
@@ -118,8 +269,17 @@ def calculate_bollinger_bands(prices: pd.Series, period: int = 20, std_dev: floa
     return upper_band.iloc[-1], sma.iloc[-1], lower_band.iloc[-1]
 
 
-def format_technical_summary(data: Dict[str, Any]) -> str:
-    """Format technical indicators into readable summary."""
+def format_technical_summary(data: Dict[str, Any], compact: bool = False) -> str:
+    """
+    Format technical indicators into readable summary.
+
+    Args:
+        data: Dict from get_technical_indicators()
+        compact: Terse key=value lines with missing indicators dropped (for prompts)
+
+    Returns:
+        Formatted string summary
+    """
     if "error" in data:
         return f"Error fetching technical data for {data['ticker']}: {data['error']}"
 
@@ -159,6 +319,29 @@ def format_technical_summary(data: Dict[str, Any]) -> str:
     signal = data.get('macd_signal', 0)
     macd_status = "Bullish" if macd > signal else "Bearish"
 
+    if compact:
+        volatility = data.get('volatility_annual')
+        sections = [
+            compact_pairs([
+                ("price", num(price)), ("trend", trend), ("sma20", num(sma_20)),
+                ("sma50", num(sma_50)), ("sma200", num(sma_200)),
+            ]),
+            compact_pairs([
+                ("rsi", num(rsi, ".1f")), ("rsi_state", rsi_status), ("macd", num(macd)),
+                ("signal", num(signal)), ("macd_state", macd_status),
+            ]),
+            compact_pairs([
+                ("vol_annual", num(None if volatility is None else volatility * 100, ".1f", "%")),
+                ("high_52w", num(data.get('high_52w'))), ("low_52w", num(data.get('low_52w'))),
+                ("support", num(data.get('support'))), ("resistance", num(data.get('resistance'))),
+            ]),
+            compact_pairs([
+                ("bb_upper", num(data.get('bb_upper'))), ("bb_mid", num(data.get('bb_middle'))),
+                ("bb_lower", num(data.get('bb_lower'))),
+            ]),
+        ]
+        return "\n".join(section for section in sections if section)
+
     lines = [
         f"Technical Analysis: {data['ticker']}",
         f"Current Price: ${fmt(price)}",
@@ -0,0 +1,52 @@
+"""Shared test fixtures."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from committee_lite.tools import FixtureProvider, financial_data
+from committee_lite.tools.market_data import write_synthetic_fixtures
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark", action="store_true", help="run tests that assert wall-clock bounds"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmark-marked tests unless --benchmark is given."""
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="wall-clock bound; run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def clear_data_cache():
+    """Drop data cached by the data tools after every test."""
+    yield
+    financial_data.clear_cache()
+
+
+def make_history(days=260, start=100.0, drift=0.0):
+    """Synthetic daily OHLCV history: an oscillating walk plus a linear drift."""
+    index = pd.date_range("2025-01-01", periods=days, freq="B")
+    close = start + drift * np.arange(days) + np.cumsum(np.sin(np.arange(days) / 7.0))
+    return pd.DataFrame(
+        {"Open": close, "High": close + 1, "Low": close - 1, "Close": close, "Volume": 1e6},
+        index=index,
+    )
+
+
+@pytest.fixture
+def synthetic_provider(tmp_path):
+    """Factory for a FixtureProvider over synthetic data for the given tickers."""
+
+    def make(tickers, days=300, seed=0):
+        root = write_synthetic_fixtures(str(tmp_path / "synthetic"), tickers, days=days, seed=seed)
+        return FixtureProvider(root)
+
+    return make
@@ -0,0 +1,124 @@
+"""Test the point-in-time archive and backtest runner."""
+
+import pandas as pd
+import pytest
+
+from committee_lite.llm import CachingClient, Cassette
+from committee_lite.llm.mock_adapter import MockAdapter
+from committee_lite.orchestrator import InvestmentCommittee, rebalance_dates, run_backtest
+from committee_lite.store import DecisionStore
+from committee_lite.tools import SnapshotArchive, financial_data
+
+TICKERS = ["BT0", "BT1", "BT2"]
+TODAY = pd.Timestamp.today().normalize()
+# Fundamentals captured a year, eight months and four months ago
+CAPTURES = [TODAY - pd.DateOffset(months=m) for m in (12, 8, 4)]
+
+
+@pytest.fixture
+def archive(tmp_path, synthetic_provider):
+    """Archive with three fundamentals captures of fixture data."""
+    source = synthetic_provider(TICKERS, days=400)
+    with SnapshotArchive(str(tmp_path / "archive")) as archive:
+        for i, as_of in enumerate(CAPTURES):
+            archive.capture(source, TICKERS, as_of=as_of, period="max")
+            archive.add_risk_free_rate(as_of, 0.03 + i * 0.01)
+            info = source.get_info("BT0")
+            info["returnOnEquity"] = 0.1 * (i + 1)
+            archive.add_fundamentals("BT0", as_of, info, source.get_statements("BT0"))
+        yield archive
+
+
+class CountingAdapter(MockAdapter):
+    """Mock LLM that counts the calls that reach it."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def complete(self, prompt, system_prompt=None, max_tokens=2000, temperature=0.7):
+        self.calls += 1
+        return super().complete(prompt, system_prompt, max_tokens, temperature)
+
+
+def test_provider_serves_archive_as_of_date(archive):
+    """Test snapshot, price, rate and statement selection, and repricing to the as-of close."""
+    as_of = CAPTURES[1] + pd.Timedelta(days=10)
+    provider = archive.provider(as_of)
+
+    info = provider.get_info("bt0")
+    assert info["returnOnEquity"] == pytest.approx(0.2)
+    assert provider.get_risk_free_rate() == pytest.approx(0.04)
+
+    hist = provider.get_price_history("BT0", period="max")
+    assert hist.index[-1] <= as_of
+    assert archive.price_history("BT0").index[-1] > as_of
+    close = hist["Close"].iloc[-1]
+    captured = archive.fundamentals("BT0", as_of)[1]
+    assert info["currentPrice"] == pytest.approx(close)
+    assert info["marketCap"] / captured["marketCap"] == pytest.approx(close / captured["currentPrice"])
+
+    # Statement periods are only visible once filed
+    period_end = archive.fundamentals("BT0", TODAY)[2]["income_stmt"].columns[0]
+    before = archive.provider(period_end + pd.Timedelta(days=30)).get_statements("BT0")
+    after = archive.provider(period_end + pd.Timedelta(days=120)).get_statements("BT0")
+    assert before["income_stmt"].empty
+    assert list(after["income_stmt"].columns) == [period_end]
+
+    assert archive.provider(CAPTURES[0] - pd.Timedelta(days=1)).get_info("BT0") == {}
+
+
+def test_committee_prompts_have_no_look_ahead(archive):
+    """Test the committee's prompts as of a date match an archive truncated at that date."""
+    as_of = CAPTURES[1] + pd.Timedelta(days=10)
+    committee = InvestmentCommittee(llm_client=MockAdapter(), data_provider=archive.provider(as_of))
+    prompts = committee.prepare("BT0")
+    latest = archive.price_history("BT0")["Close"].iloc[-1]
+
+    text = "".join(user for _, _, user in prompts)
+    assert f"{latest:.2f}" not in text
+    assert f"{archive.close_on('BT0', as_of):.2f}" in text
+
+
+def test_backtest_records_forward_returns_and_caches_llm(archive, tmp_path):
+    """Test every (date, ticker) is decided once, returns are realized and re-runs hit the cache."""
+    dates = rebalance_dates(CAPTURES[0], TODAY - pd.DateOffset(months=1), freq="BQE")
+    adapter = CountingAdapter()
+
+    with Cassette(str(tmp_path / "llm.cassette")) as cache, DecisionStore(str(tmp_path / "d.db")) as store:
+        first = run_backtest(
+            archive, TICKERS, dates, llm_client=adapter, llm_cache=cache, workers=4, store=store
+        )
+        calls = adapter.calls
+        second = run_backtest(archive, TICKERS, dates, llm_client=adapter, llm_cache=cache, workers=4)
+        stored = store.query()
+
+    assert len(first.records) == len(dates) * len(TICKERS)
+    assert not first.failures
+    assert first.llm_calls == calls > 0
+    assert (second.llm_calls, adapter.calls) == (0, calls)
+    assert second.to_frame().equals(first.to_frame())
+    assert {row["timestamp"].date() for row in stored} == {d.date() for d in dates}
+    # Each (date, ticker) released its own cached data
+    assert len(financial_data._financial_cache) == 0
+
+    record = first.records[0]
+    hist = archive.price_history(record.ticker)
+    entry = hist.index.get_indexer([hist.index[hist.index <= record.as_of][-1]])[0]
+    expected = hist["Close"].iloc[entry + 21] / hist["Close"].iloc[entry] - 1
+    assert record.price == pytest.approx(hist["Close"].iloc[entry])
+    assert record.forward_returns[21] == pytest.approx(expected)
+    assert first.by_rating().loc["BUY", "count"] == len(first.records)
+
+
+def test_caching_client_scopes_by_model(tmp_path):
+    """Test cached responses are keyed by model as well as prompts."""
+    first, second = CountingAdapter(), CountingAdapter()
+    second.model = "other-model"
+    with Cassette(str(tmp_path / "llm.cassette")) as cache:
+        client = CachingClient(first, cache)
+        assert client.complete("prompt", "system") == client.complete("prompt", "system")
+        CachingClient(second, cache).complete("prompt", "system")
+
+    assert (client.hits, client.misses) == (1, 1)
+    assert (first.calls, second.calls) == (1, 1)
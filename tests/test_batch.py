@@ -0,0 +1,30 @@
+"""Test the universe batch runner."""
+
+from committee_lite.orchestrator import run_universe
+from committee_lite.orchestrator.batch import shard_tickers
+from committee_lite.schemas import FinalDecision
+
+
+def test_shard_tickers():
+    """Test tickers are split into bounded consecutive shards."""
+    shards = shard_tickers(["A", "B", "C", "D", "E"], 2)
+    assert shards == [["A", "B"], ["C", "D"], ["E"]]
+
+
+def test_serial_backend():
+    """Test serial backend returns decisions in input order."""
+    decisions, failures = run_universe(["nvda", "aapl"], backend="serial", mock=True)
+
+    assert failures == {}
+    assert [d.ticker for d in decisions] == ["NVDA", "AAPL"]
+    assert all(isinstance(d, FinalDecision) for d in decisions)
+
+
+def test_process_backend():
+    """Test process backend shards tickers across workers."""
+    tickers = ["NVDA", "AAPL", "MSFT", "GOOGL"]
+    decisions, failures = run_universe(tickers, workers=2, backend="process", mock=True)
+
+    assert failures == {}
+    assert [d.ticker for d in decisions] == tickers
+    assert all(d.final_rating for d in decisions)
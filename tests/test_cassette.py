@@ -0,0 +1,110 @@
+"""Test LLM cassette recording and replay."""
+
+import sqlite3
+import time
+
+import pytest
+
+from committee_lite.llm import (
+    Cassette,
+    CassetteMiss,
+    RecordingClient,
+    ReplayClient,
+    get_llm_client,
+)
+from committee_lite.orchestrator import InvestmentCommittee
+
+
+class SequenceClient:
+    """Returns numbered responses, optionally after a delay."""
+
+    model = "test-model"
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+
+    def complete(self, prompt, system_prompt=None, max_tokens=2000, temperature=0.7):
+        time.sleep(self.delay)
+        self.calls += 1
+        return f"response {self.calls} to {prompt}"
+
+
+def test_replay_reproduces_committee_run(tmp_path, synthetic_provider):
+    """Test a recorded committee run replays to the same decision without the real client."""
+    path = str(tmp_path / "run.cassette")
+    provider = synthetic_provider(["NVDA"])
+
+    with Cassette(path) as cassette:
+        recorder = RecordingClient(get_llm_client(mock=True), cassette)
+        recorded = InvestmentCommittee(
+            llm_client=recorder, disagreement_threshold=5, data_provider=provider
+        ).analyze("NVDA")
+        stats = cassette.stats()
+
+    assert stats["calls"] == len(recorded.llm_calls)
+    assert stats["input_tokens"] > 0 and stats["output_tokens"] > 0
+
+    with Cassette(path) as cassette:
+        replayed = InvestmentCommittee(
+            llm_client=ReplayClient(cassette), disagreement_threshold=5, data_provider=provider
+        ).analyze("NVDA")
+
+    assert replayed.agent_scores == recorded.agent_scores
+    assert replayed.final_rating == recorded.final_rating
+    assert replayed.debate_log == recorded.debate_log
+
+
+def test_repeated_requests_replay_in_order(tmp_path):
+    """Test identical requests are served in recorded order, and misses raise."""
+    with Cassette(str(tmp_path / "c.db")) as cassette:
+        recorder = RecordingClient(SequenceClient(), cassette)
+        assert recorder.complete("hello", "sys") == "response 1 to hello"
+        assert recorder.complete("hello", "sys") == "response 2 to hello"
+
+        replay = ReplayClient(cassette)
+        assert replay.complete("hello", "sys") == "response 1 to hello"
+        assert replay.complete("hello", "sys") == "response 2 to hello"
+        assert replay.complete("hello", "sys") == "response 2 to hello"  # past the end: last one
+
+        with pytest.raises(CassetteMiss):
+            replay.complete("hello", "other system prompt")
+
+
+def test_cassette_modes_and_latency(tmp_path):
+    """Test get_llm_client() cassette modes and real-time vs fast replay."""
+    path = str(tmp_path / "c.db")
+
+    with get_llm_client(mock=True, cassette=path, cassette_mode="record") as recorder:
+        assert isinstance(recorder, RecordingClient)
+        recorder.inner = SequenceClient(delay=0.2)
+        recorder.complete("slow", "sys")
+
+    with get_llm_client(cassette=path, cassette_mode="replay-fast") as fast:
+        start = time.perf_counter()
+        assert fast.complete("slow", "sys") == "response 1 to slow"
+        assert time.perf_counter() - start < 0.1
+
+    with get_llm_client(cassette=path, cassette_mode="replay") as realtime:
+        start = time.perf_counter()
+        realtime.complete("slow", "sys")
+        assert time.perf_counter() - start >= 0.2
+
+    with pytest.raises(ValueError):
+        get_llm_client(cassette=path, cassette_mode="rewind")
+
+
+def test_clients_close_only_cassettes_they_opened(tmp_path):
+    """Test a cassette opened from a path closes with the client; a passed-in one stays open."""
+    path = str(tmp_path / "c.db")
+    with get_llm_client(mock=True, cassette=path, cassette_mode="record") as recorder:
+        recorder.complete("hello")
+    with pytest.raises(sqlite3.ProgrammingError):
+        len(recorder.cassette)
+
+    with Cassette(path) as cassette:
+        for mode in ("record", "replay-fast"):
+            with get_llm_client(mock=True, cassette=cassette, cassette_mode=mode) as client:
+                assert client.cassette is cassette
+                client.complete("hello")
+        assert len(cassette) == 2
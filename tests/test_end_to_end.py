@@ -71,7 +71,7 @@ def test_debate_log_structure():
 
         # Each update should have required fields
         for update in round.agent_updates:
-            assert "agent_name" in update
-            assert "old_score" in update
-            assert "new_score" in update
-            assert "reasoning" in update
+            assert update.agent_name
+            assert 0 <= update.old_score <= 100
+            assert 0 <= update.new_score <= 100
+            assert update.reasoning
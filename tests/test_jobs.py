@@ -0,0 +1,96 @@
+"""Test the job queue and queue worker."""
+
+import time
+
+import pytest
+from committee_lite.jobs import SQLiteJobQueue, run_worker
+from committee_lite.llm import get_llm_client
+from committee_lite.orchestrator import InvestmentCommittee
+from committee_lite.store import DecisionStore
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """SQLite job queue in a temp directory."""
+    with SQLiteJobQueue(str(tmp_path / "jobs.db"), max_attempts=2) as q:
+        yield q
+
+
+def test_enqueue_is_idempotent(queue):
+    """Test re-queuing the same universe doesn't duplicate jobs."""
+    assert queue.enqueue(["nvda", "AAPL"], universe="nightly") == 2
+    assert queue.enqueue(["NVDA", "MSFT"], universe="nightly") == 1
+    assert queue.stats("nightly")["pending"] == 3
+
+
+def test_visibility_timeout_requeues_job(queue):
+    """Test a job whose lease expires can be claimed by another worker."""
+    queue.enqueue(["NVDA"])
+
+    job = queue.claim("worker-a", visibility_timeout=0.05)
+    assert job.ticker == "NVDA"
+    assert queue.claim("worker-b", visibility_timeout=60) is None
+
+    time.sleep(0.1)
+    retry = queue.claim("worker-b", visibility_timeout=60)
+    assert retry.job_id == job.job_id
+    assert retry.attempts == 2
+
+    # The original worker lost its lease and can no longer acknowledge
+    assert not queue.complete(job.job_id, "worker-a")
+    assert queue.complete(job.job_id, "worker-b")
+    assert queue.stats()["done"] == 1
+
+
+def test_heartbeat_extends_lease(queue):
+    """Test heartbeats keep a job invisible to other workers."""
+    queue.enqueue(["NVDA"])
+    job = queue.claim("worker-a", visibility_timeout=0.05)
+
+    assert queue.heartbeat("worker-a", job.job_id, visibility_timeout=60)
+    time.sleep(0.1)
+    assert queue.claim("worker-b", visibility_timeout=60) is None
+    assert queue.workers()[0]["worker_id"] in ("worker-a", "worker-b")
+
+
+def test_failed_job_retries_until_max_attempts(queue):
+    """Test failures are retried, then marked failed."""
+    queue.enqueue(["NVDA"])
+
+    job = queue.claim("w", visibility_timeout=60)
+    queue.fail(job.job_id, "w", "boom")
+    assert queue.stats()["pending"] == 1
+
+    job = queue.claim("w", visibility_timeout=60)
+    queue.fail(job.job_id, "w", "boom")
+    assert queue.stats()["failed"] == 1
+    assert queue.claim("w", visibility_timeout=60) is None
+
+
+def test_worker_drains_queue_into_store(queue):
+    """Test a worker runs every job and stores each decision."""
+    queue.enqueue(["NVDA", "AAPL"], universe="nightly")
+    committee = InvestmentCommittee(llm_client=get_llm_client(mock=True))
+
+    with DecisionStore(":memory:") as store:
+        completed = run_worker(queue, committee, store=store, exit_when_empty=True)
+
+        assert completed == 2
+        assert store.count() == 2
+        assert store.latest("AAPL").ticker == "AAPL"
+
+    assert queue.stats("nightly") == {"pending": 0, "running": 0, "done": 2, "failed": 0}
+
+
+def test_interactive_jobs_claimed_first(queue):
+    """Test interactive jobs jump the batch backlog, and claims can filter by class."""
+    queue.enqueue(["AAA", "BBB"], universe="nightly")
+    queue.enqueue(["NVDA"], universe="adhoc", priority="interactive")
+
+    assert queue.claim("w", visibility_timeout=60, priority="batch").ticker == "AAA"
+    job = queue.claim("w", visibility_timeout=60)
+    assert (job.ticker, job.priority) == ("NVDA", "interactive")
+    assert queue.claim("w", visibility_timeout=60, priority="interactive") is None
+
+    with pytest.raises(ValueError):
+        queue.enqueue(["MSFT"], priority="urgent")
@@ -1,7 +1,12 @@
 """Test orchestrator and disagreement handling."""
 
+import json
+import re
+import time
+
 import pytest
 from committee_lite.orchestrator import InvestmentCommittee
+from committee_lite.orchestrator.committee import RECONCILE_MAX_TOKENS
 from committee_lite.llm import get_llm_client
 from committee_lite.schemas import FinalDecision
 
@@ -59,3 +64,214 @@ def test_dissenting_views_tracking(mock_committee):
         assert isinstance(dissent.original_score, int)
         assert isinstance(dissent.final_score, int)
         assert dissent.reason
+
+
+class CountingClient:
+    """Mock client wrapper that counts LLM calls."""
+
+    def __init__(self):
+        self.inner = get_llm_client(mock=True)
+        self.calls = 0
+
+    def complete(self, prompt, system_prompt=None, max_tokens=2000, temperature=0.7):
+        self.calls += 1
+        return self.inner.complete(prompt, system_prompt, max_tokens, temperature)
+
+
+def test_incremental_reanalysis_skips_unchanged_agents(monkeypatch):
+    """Test agents with unchanged inputs reuse cached outputs."""
+    from committee_lite.agents import fundamentals, valuation, technical, sentiment
+    from committee_lite.store import MemoryOutputCache
+    from committee_lite.tools import FinancialSnapshot
+
+    financials = FinancialSnapshot(ticker="NVDA", company_name="NVDA", error="offline")
+    technicals = {"ticker": "NVDA", "error": "offline"}
+    for module in (fundamentals, valuation, sentiment):
+        monkeypatch.setattr(module, "get_financial_snapshot", lambda t, **kw: financials)
+    monkeypatch.setattr(technical, "get_technical_indicators", lambda t, **kw: dict(technicals))
+
+    client = CountingClient()
+    committee = InvestmentCommittee(llm_client=client, output_cache=MemoryOutputCache())
+
+    first = committee.analyze("NVDA")
+    assert client.calls == 5  # 4 agents + PM
+
+    client.calls = 0
+    second = committee.analyze("NVDA")
+    assert client.calls == 0
+    assert second.agent_scores == first.agent_scores
+    assert second.final_rating == first.final_rating
+
+    # Only the Technical agent's inputs change; its score doesn't move, so PM is reused
+    technicals["error"] = "new bar"
+    client.calls = 0
+    committee.analyze("NVDA")
+    assert client.calls == 1
+
+
+class UnanimousClient:
+    """Client whose specialists all agree; counts Portfolio Manager calls."""
+
+    def __init__(self):
+        self.inner = get_llm_client(mock=True)
+        self.pm_calls = 0
+
+    def complete(self, prompt, system_prompt=None, max_tokens=2000, temperature=0.7):
+        if "Portfolio Manager" in (system_prompt or ""):
+            self.pm_calls += 1
+            return self.inner.complete(prompt, system_prompt, max_tokens, temperature)
+        return (
+            '{"score_0_100": 84, "bull_points": ["Strong moat"], "bear_points": ["Rich multiple"],'
+            ' "key_risks": ["Competition"], "confidence": "High", "evidence": ["10-K"]}'
+        )
+
+
+def test_consensus_fast_path_skips_pm():
+    """Test a unanimous committee is synthesized by rule, without the PM call."""
+    client = UnanimousClient()
+    committee = InvestmentCommittee(llm_client=client, consensus_fast_path=True)
+
+    decision = committee.analyze("NVDA")
+
+    assert client.pm_calls == 0
+    assert decision.synthesis_path == "rules"
+    assert decision.final_rating == "STRONG BUY"
+    assert decision.final_confidence == "High"
+    assert decision.invalidation_criteria == ["Competition"]
+
+
+def test_consensus_fast_path_falls_back_to_llm(mock_committee):
+    """Test committees that miss the consensus criteria still use the PM LLM."""
+    mock_committee.consensus_fast_path = True  # mock scores spread 7 with mixed confidence
+
+    decision = mock_committee.analyze("NVDA")
+
+    assert decision.synthesis_path == "llm"
+
+
+class DebateClient:
+    """Client with scripted specialist scores and reconciliation replies."""
+
+    AGENT_ORDER = ["Fundamentals", "Valuation", "Technical", "Sentiment"]
+
+    def __init__(self, initial, updates, delay=0.0):
+        self.inner = get_llm_client(mock=True)
+        self.initial = dict(initial)
+        self.updates = {name: list(scores) for name, scores in updates.items()}
+        self.delay = delay
+        self.specialist_calls = 0
+        self.reconcile_calls = {}
+
+    def complete(self, prompt, system_prompt=None, max_tokens=2000, temperature=0.7):
+        system_prompt = system_prompt or ""
+        if "Portfolio Manager" in system_prompt:
+            return self.inner.complete(prompt, system_prompt, max_tokens, temperature)
+
+        match = re.match(r"You are the (\w+) Agent reviewing", system_prompt)
+        if match:
+            name = match.group(1)
+            self.reconcile_calls[name] = self.reconcile_calls.get(name, 0) + 1
+            time.sleep(self.delay)
+            current = int(re.search(r"Score: (\d+)/100", prompt).group(1))
+            pending = self.updates.get(name)
+            score = pending.pop(0) if pending else current
+            return json.dumps({"score_update": score, "reasoning": f"{name} reconsidered"})
+
+        name = self.AGENT_ORDER[self.specialist_calls % 4]
+        self.specialist_calls += 1
+        return json.dumps({
+            "score_0_100": self.initial[name], "bull_points": [f"{name} bull"],
+            "bear_points": ["Risk"], "key_risks": ["Risk"], "confidence": "Medium",
+            "evidence": ["Data"],
+        })
+
+
+DEBATE_INITIAL = {"Fundamentals": 80, "Valuation": 40, "Technical": 70, "Sentiment": 75}
+
+
+def test_multi_round_reconciliation_converges():
+    """Test later rounds only re-query agents outside the consensus band."""
+    client = DebateClient(DEBATE_INITIAL, {"Valuation": [55, 66]})
+    committee = InvestmentCommittee(
+        llm_client=client, disagreement_threshold=15, max_reconcile_rounds=3
+    )
+
+    decision = committee.analyze("NVDA")
+
+    assert len(decision.debate_log) == 2
+    assert "converged" in decision.debate_log[-1].outcome
+    assert "re-querying Valuation" in decision.debate_log[1].trigger
+    assert client.reconcile_calls == {
+        "Fundamentals": 1, "Valuation": 2, "Technical": 1, "Sentiment": 1
+    }
+    assert decision.agent_scores["Valuation"] == 66
+    assert decision.score_spread == 14
+
+
+def test_reconciliation_stops_when_scores_stop_moving():
+    """Test the debate ends after a round in which nobody moves."""
+    client = DebateClient(DEBATE_INITIAL, {"Valuation": [50]})
+    committee = InvestmentCommittee(
+        llm_client=client, disagreement_threshold=15, max_reconcile_rounds=5
+    )
+
+    decision = committee.analyze("NVDA")
+
+    assert len(decision.debate_log) == 2
+    assert "no scores moved" in decision.debate_log[-1].outcome
+    assert decision.agent_scores["Valuation"] == 50
+
+
+def test_reconciliation_budgets():
+    """Test the token and wall-clock budgets cap the debate."""
+    client = DebateClient(DEBATE_INITIAL, {"Valuation": [55]})
+    committee = InvestmentCommittee(
+        llm_client=client, disagreement_threshold=15, reconcile_token_budget=1000
+    )
+
+    decision = committee.analyze("NVDA")
+
+    assert "token budget exhausted" in decision.debate_log[0].outcome
+    assert client.reconcile_calls == {"Valuation": 1}  # furthest from the median goes first
+
+    client = DebateClient(DEBATE_INITIAL, {"Valuation": [55]}, delay=0.5)
+    committee = InvestmentCommittee(
+        llm_client=client, disagreement_threshold=15, reconcile_timeout=0.1
+    )
+
+    decision = committee.analyze("NVDA")
+
+    outcome = decision.debate_log[0].outcome
+    assert "wall-clock budget exhausted (4 agents timed out)" in outcome
+    assert decision.agent_scores == DEBATE_INITIAL
+    # Abandoned calls keep running, so their output is charged to the budget
+    tokens = int(re.search(r"~([\d,]+) tokens", outcome).group(1).replace(",", ""))
+    assert tokens > 4 * RECONCILE_MAX_TOKENS
+
+
+def test_compact_prompts_reduce_input_tokens(monkeypatch):
+    """Test compact prompts cut the estimated input tokens recorded per call."""
+    from committee_lite.agents import fundamentals, valuation, technical, sentiment
+    from committee_lite.tools import FinancialSnapshot
+
+    financials = FinancialSnapshot(
+        ticker="NVDA", company_name="NVIDIA", sector="Technology", market_cap=2e12,
+        current_price=120.0, pe_ratio=45.2, roe=0.35, revenue=1e11,
+    )
+    technicals = {"ticker": "NVDA", "error": "offline"}
+    for module in (fundamentals, valuation, sentiment):
+        monkeypatch.setattr(module, "get_financial_snapshot", lambda t, **kw: financials)
+    monkeypatch.setattr(valuation, "fetch_current_treasury_rate", lambda provider=None: 0.04)
+    monkeypatch.setattr(technical, "get_technical_indicators", lambda t, **kw: dict(technicals))
+
+    client = get_llm_client(mock=True)
+    verbose = InvestmentCommittee(llm_client=client, compact_prompts=False).analyze("NVDA")
+    compact = InvestmentCommittee(llm_client=client, compact_prompts=True).analyze("NVDA")
+
+    assert all(call.input_tokens > 0 for call in compact.llm_calls)
+    verbose_tokens = {call.role: call.input_tokens for call in verbose.llm_calls}
+    compact_tokens = {call.role: call.input_tokens for call in compact.llm_calls}
+    for role in ("Fundamentals", "Valuation", "Sentiment", "PortfolioManager"):
+        assert compact_tokens[role] < verbose_tokens[role]
+    assert compact.input_tokens < verbose.input_tokens
+    assert f"~{compact.input_tokens:,} input tokens" in str(compact)
@@ -0,0 +1,90 @@
+"""Test batched decision writers."""
+
+from datetime import datetime
+
+import pytest
+
+from committee_lite.output import JSONLWriter, flatten_decision, open_writer, read_jsonl
+from committee_lite.schemas import AgentUpdate, DebateRound, FinalDecision
+
+
+def make_decision(ticker="NVDA", score=70):
+    return FinalDecision(
+        ticker=ticker,
+        timestamp=datetime(2025, 6, 2, 16, 0),
+        agent_scores={"Fundamentals": score, "Valuation": 60},
+        average_score=(score + 60) / 2,
+        score_spread=abs(score - 60),
+        final_rating="BUY",
+        final_confidence="Medium",
+        rationale=["Quality business", "Fair valuation"],
+        action_plan="Scale in",
+        invalidation_criteria=["Margin compression"],
+        debate_log=[
+            DebateRound(
+                round_number=1,
+                trigger="spread",
+                agent_updates=[
+                    AgentUpdate(agent_name="Valuation", old_score=50, new_score=60, reasoning="DCF")
+                ],
+                outcome="done",
+            )
+        ],
+    )
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_jsonl_writer_round_trip(tmp_path, compression):
+    """Test JSONL output flushes in batches and reads back losslessly."""
+    decisions = [make_decision(f"T{i}", 60 + i) for i in range(5)]
+    path = tmp_path / "decisions.jsonl"
+
+    with JSONLWriter(str(path), batch_size=2, compression=compression) as writer:
+        writer.write_many(decisions)
+        assert writer.count == 4  # two full batches flushed, one buffered
+
+    assert writer.count == 5
+    assert list(read_jsonl(str(path))) == decisions
+
+
+def test_flatten_decision_columns():
+    """Test agent scores become columns while lists stay nested."""
+    row = flatten_decision(make_decision(), ["Fundamentals", "Valuation", "Technical"])
+
+    assert row["score_fundamentals"] == 70
+    assert row["score_technical"] is None
+    assert row["rationale"] == ["Quality business", "Fair valuation"]
+    assert row["debate_log"][0]["agent_updates"][0]["new_score"] == 60
+
+
+def test_parquet_writer(tmp_path):
+    """Test Parquet output has one row per decision and one row group per batch."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "decisions.parquet")
+
+    with open_writer(path, batch_size=2) as writer:
+        writer.write_many(make_decision(f"T{i}") for i in range(3))
+
+    parquet_file = pq.ParquetFile(path)
+    assert parquet_file.metadata.num_rows == 3
+    assert parquet_file.metadata.num_row_groups == 2
+    table = parquet_file.read()
+    assert table.column("score_valuation").to_pylist() == [60, 60, 60]
+
+
+def test_msgpack_writer_round_trip(tmp_path):
+    """Test MessagePack output reads back losslessly."""
+    pytest.importorskip("msgpack")
+    from committee_lite.output import read_msgpack
+
+    path = str(tmp_path / "decisions.msgpack.gz")
+    with open_writer(path) as writer:
+        writer.write(make_decision())
+
+    assert list(read_msgpack(path)) == [make_decision()]
+
+
+def test_unsupported_compression(tmp_path):
+    """Test writers reject codecs they can't produce."""
+    with pytest.raises(ValueError):
+        JSONLWriter(str(tmp_path / "d.jsonl"), compression="zstd")
@@ -0,0 +1,170 @@
+"""Test the sector/industry peer index."""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from committee_lite.agents import FundamentalsAgent
+from committee_lite.llm.mock_adapter import MockAdapter
+from committee_lite.tools import FinancialSnapshot, PeerIndex
+from committee_lite.tools.peer_index import PEER_METRICS
+
+
+def snapshot(ticker, sector, industry, **metrics):
+    """Snapshot with just the given metrics."""
+    return FinancialSnapshot(ticker=ticker, company_name=ticker, sector=sector, industry=industry, **metrics)
+
+
+def random_universe(n, seed=0):
+    """Synthetic universe spread over 11 sectors and 60 industries."""
+    rng = np.random.default_rng(seed)
+    return [
+        snapshot(
+            f"T{i}",
+            f"Sector{i % 60 % 11}",
+            f"Industry{i % 60}",
+            pe_ratio=float(rng.uniform(5, 60)),
+            roe=None if i % 7 == 0 else float(rng.normal(0.15, 0.1)),
+            debt_to_equity=float(rng.uniform(0, 200)),
+        )
+        for i in range(n)
+    ]
+
+
+def test_percentiles_medians_and_fallbacks():
+    """Test mid-rank percentiles, sector fallback for small industries and unknown groups."""
+    snapshots = [snapshot(f"S{i}", "Tech", "Software", pe_ratio=10.0 * (i + 1)) for i in range(5)]
+    snapshots += [snapshot("CHIP", "Tech", "Semis", pe_ratio=45.0, roe=0.3)]
+    snapshots += [snapshot("ODD", "Unknown", "Unknown", pe_ratio=12.0)]
+    index = PeerIndex.from_snapshots(snapshots, min_peers=5)
+
+    top = index.lookup("S4", "pe_ratio")
+    assert (top.group, top.group_name, top.peers) == ("industry", "Software", 5)
+    assert top.percentile == pytest.approx(90.0)
+    assert top.median == pytest.approx(30.0)
+    assert index.lookup("s0", "pe_ratio").percentile == pytest.approx(10.0)
+
+    # One Semis name: ranked within the 6-name sector instead
+    chip = index.lookup("CHIP", "pe_ratio")
+    assert (chip.group, chip.group_name, chip.peers) == ("sector", "Tech", 6)
+    assert chip.percentile == pytest.approx((5 - 0.5) / 6 * 100)
+    assert chip.describe() == "P/E: 45.00 (75th pct of 6 Tech peers, median 35.00)"
+
+    # Too few peers report ROE; unknown sector has no peers; unindexed ticker
+    assert index.lookup("CHIP", "roe") is None
+    assert index.lookup("ODD", "pe_ratio") is None
+    assert index.lookup("NOPE", "pe_ratio") is None
+    assert [p.metric for p in index.profile("S1")] == ["pe_ratio"]
+
+
+def test_incremental_update_matches_rebuild():
+    """Test updating a few tickers gives the same index as building from scratch."""
+    snapshots = random_universe(600)
+    index = PeerIndex.from_snapshots(snapshots)
+
+    changed = [
+        snapshot("T5", "Sector7", "Industry7", pe_ratio=500.0, roe=0.9),  # Moves sector
+        snapshot("T42", "Sector9", "Industry42", pe_ratio=1.0),
+        snapshot("NEW", "Sector0", "Industry0", pe_ratio=20.0, roe=0.1),
+    ]
+    index.update(changed)
+    rebuilt = PeerIndex.from_snapshots(
+        [s for s in snapshots if s.ticker not in ("T5", "T42")] + changed
+    )
+
+    assert len(index) == len(rebuilt) == 601
+    for ticker in ("T5", "T42", "NEW", "T3", "T14", "T100"):
+        for metric in PEER_METRICS:
+            assert index.lookup(ticker, metric) == rebuilt.lookup(ticker, metric), (ticker, metric)
+    assert index.lookup("T5", "pe_ratio").group_name == "Industry7"
+
+
+def test_large_universe_lookup_counts_peers():
+    """Test lookups in a 5,000-name index count every industry peer with the metric."""
+    snapshots = random_universe(5000)
+    index = PeerIndex.from_snapshots(snapshots)
+
+    assert len(index) == 5000
+    assert index.lookup("T1", "roe").peers == sum(
+        1 for s in snapshots if s.industry == "Industry1" and s.roe is not None
+    )
+
+
+@pytest.mark.benchmark
+def test_build_for_large_universe_is_fast():
+    """Test a 5,000-name index builds well within seconds and lookups are cheap."""
+    snapshots = random_universe(5000)
+
+    start = time.perf_counter()
+    index = PeerIndex.from_snapshots(snapshots)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(1000):
+        index.lookup(f"T{i}", "roe")
+    lookup_s = (time.perf_counter() - start) / 1000
+
+    assert build_s < 2.0
+    assert lookup_s < 1e-4
+
+
+def test_fundamentals_prompt_includes_peer_context(synthetic_provider):
+    """Test the Fundamentals agent prompt gains peer percentiles only with an index."""
+    tickers = [f"PEER{i}" for i in range(6)]
+    provider = synthetic_provider(tickers)
+    index = PeerIndex.from_universe(tickers, provider=provider)
+
+    _, plain = FundamentalsAgent(MockAdapter(), provider).build_prompts("PEER0")
+    _, user_prompt = FundamentalsAgent(MockAdapter(), provider, peer_index=index).build_prompts("PEER0")
+    _, compact = FundamentalsAgent(MockAdapter(), provider, True, index).build_prompts("PEER0")
+
+    assert "PEER CONTEXT" not in plain
+    assert "PEER CONTEXT" in user_prompt
+    assert "pct of 6 Software peers" in user_prompt
+    assert "pe_ratio=" in compact and " n=6" in compact
+
+
+def test_universe_without_known_groups():
+    """Test unknown sectors give no peer context and unknown industries use the sector."""
+    unknown = PeerIndex.from_snapshots(
+        [snapshot(f"U{i}", "Unknown", "Unknown", pe_ratio=float(i)) for i in range(6)]
+    )
+    assert len(unknown) == 6
+    assert unknown.lookup("U1", "pe_ratio") is None
+
+    no_industry = PeerIndex.from_snapshots(
+        [snapshot(f"U{i}", "Tech", "Unknown", pe_ratio=float(i)) for i in range(6)]
+    )
+    fallback = no_industry.lookup("U1", "pe_ratio")
+    assert (fallback.group, fallback.group_name, fallback.peers) == ("sector", "Tech", 6)
+
+
+def test_update_with_errored_snapshot():
+    """Test adding a snapshot whose fetch failed leaves it without peers and the rest intact."""
+    index = PeerIndex.from_snapshots(random_universe(200))
+    before = index.lookup("T3", "pe_ratio")
+
+    index.update([FinancialSnapshot(ticker="NEW", company_name="NEW", error="timeout")])
+
+    assert "NEW" in index
+    assert index.profile("NEW") == []
+    assert index.lookup("T3", "pe_ratio") == before
+
+
+def test_build_from_plain_frame():
+    """Test a frame with only sector, industry and metric columns gets peer context."""
+    frame = pd.DataFrame(
+        {
+            "sector": ["Tech"] * 5,
+            "industry": ["Software"] * 5,
+            "pe_ratio": [10.0, 20.0, 30.0, 40.0, 50.0],
+        },
+        index=["a", "b", "c", "d", "e"],
+    )
+    index = PeerIndex(frame)
+
+    top = index.lookup("E", "pe_ratio")
+    assert (top.group, top.peers) == ("industry", 5)
+    assert top.percentile == pytest.approx(90.0)
@@ -0,0 +1,112 @@
+"""Test the constant-memory streaming pipeline."""
+
+import threading
+import time
+import tracemalloc
+
+import pytest
+
+from committee_lite.llm.mock_adapter import MockAdapter
+from committee_lite.orchestrator import InvestmentCommittee, run_pipeline, stream_decisions
+from committee_lite.tools import FixtureProvider, financial_data
+from committee_lite.tools.market_data import write_synthetic_fixtures
+
+
+@pytest.fixture(scope="module")
+def fixture_dir(tmp_path_factory):
+    """Offline market data for a 120-name universe."""
+    root = tmp_path_factory.mktemp("pipeline_fixtures")
+    return write_synthetic_fixtures(str(root), [f"P{i:03d}" for i in range(120)], days=260)
+
+
+class CountingCommittee(InvestmentCommittee):
+    """Committee that counts prepare() calls and fails on request."""
+
+    def __init__(self, fail=(), **kwargs):
+        super().__init__(**kwargs)
+        self.fail = set(fail)
+        self.prepared = 0
+        self._lock = threading.Lock()
+
+    def prepare(self, ticker):
+        if ticker in self.fail:
+            raise RuntimeError(f"no data for {ticker}")
+        prepared = super().prepare(ticker)
+        with self._lock:
+            self.prepared += 1
+        return prepared
+
+
+def make_committee(fixture_dir, **kwargs):
+    """Mock committee over the fixture universe."""
+    return CountingCommittee(
+        llm_client=MockAdapter(), data_provider=FixtureProvider(fixture_dir), **kwargs
+    )
+
+
+def test_pipeline_writes_every_decision_in_order(fixture_dir):
+    """Test decisions reach the sink in input order and failures are recorded."""
+    committee = make_committee(fixture_dir, fail={"P003"})
+    written = []
+
+    stats = run_pipeline(
+        committee, (f"p{i:03d}" for i in range(8)), written.append, max_in_flight=3
+    )
+
+    assert [d.ticker for d in written] == ["P000", "P001", "P002", "P004", "P005", "P006", "P007"]
+    assert all(d.final_rating == "BUY" for d in written)
+    assert stats.decisions == 7
+    assert list(stats.failures) == ["P003"]
+    assert "no data for P003" in stats.failures["P003"]
+    # Each ticker's cached market data was released once its decision was written
+    assert not financial_data._financial_cache and not financial_data._price_cache
+
+
+def test_slow_sink_limits_work_in_flight(fixture_dir):
+    """Test a slow sink stalls data fetching at max_in_flight tickers."""
+    committee = make_committee(fixture_dir)
+    ahead = []
+
+    def slow_sink(decision):
+        time.sleep(0.05)  # Gives the data thread time to run as far ahead as it can
+        ahead.append(committee.prepared - len(ahead))
+
+    stats = run_pipeline(committee, [f"P{i:03d}" for i in range(10)], slow_sink, max_in_flight=2)
+
+    assert stats.decisions == 10
+    assert max(ahead) == 2
+    assert stats.max_in_flight == 2
+
+
+def test_closing_the_stream_early_stops_fetching(fixture_dir):
+    """Test abandoning the generator stops the data thread and releases its data."""
+    committee = make_committee(fixture_dir)
+    stream = stream_decisions(committee, [f"P{i:03d}" for i in range(50)], max_in_flight=2)
+
+    ticker, decision, error = next(stream)
+    assert (ticker, error) == ("P000", None)
+    stream.close()
+
+    assert committee.prepared <= 3
+    assert not any(t.is_alive() for t in threading.enumerate() if t.name == "pipeline-data")
+    assert not financial_data._financial_cache and not financial_data._price_cache
+
+
+def test_peak_memory_does_not_grow_with_universe_size(fixture_dir):
+    """Test traced peak memory for 100 names stays at the level of 10 names."""
+    committee = make_committee(fixture_dir)
+    # Warm up imports and lazily built objects outside the measurement
+    run_pipeline(committee, ["P110", "P111", "P112"], lambda d: None)
+
+    def peak_mb(tickers):
+        tracemalloc.start()
+        try:
+            run_pipeline(committee, tickers, lambda d: None)
+            return tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        finally:
+            tracemalloc.stop()
+
+    small = peak_mb([f"P{i:03d}" for i in range(10)])
+    large = peak_mb([f"P{i:03d}" for i in range(100)])
+
+    assert large < small * 1.5 + 0.25, f"peak {small:.2f} MB -> {large:.2f} MB"
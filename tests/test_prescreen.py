@@ -0,0 +1,116 @@
+"""Test the quantitative pre-screen."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from committee_lite.orchestrator import prescreen, select_shortlist
+from committee_lite.orchestrator.prescreen import load_scores, save_scores, score_frame
+from committee_lite.tools import FixtureProvider, calculate_dcf_upside_batch
+from committee_lite.tools.dcf_calculator import calculate_dcf_value
+from committee_lite.tools.market_data import write_fixture
+from tests.conftest import make_history
+
+
+def test_batch_dcf_matches_scalar():
+    """Test the vectorized DCF reproduces calculate_dcf_value() upside."""
+    rows = [
+        {"revenue": 5e8, "market_cap": 2e9, "current_price": 20.0, "beta": 1.2,
+         "total_debt": 1e8, "total_cash": 3e8},
+        {"revenue": 1e10, "market_cap": 5e10, "current_price": 150.0, "beta": None,
+         "total_debt": None, "total_cash": 2e9},
+    ]
+    expected = [
+        calculate_dcf_value("T", row, risk_free_rate=0.04)["upside_downside_pct"] for row in rows
+    ]
+
+    def column(name):
+        return np.array([np.nan if r[name] is None else r[name] for r in rows], dtype=float)
+
+    upside = calculate_dcf_upside_batch(
+        column("revenue"),
+        column("market_cap"),
+        column("current_price"),
+        beta=column("beta"),
+        total_debt=column("total_debt"),
+        total_cash=column("total_cash"),
+        risk_free_rate=0.04,
+    )
+
+    np.testing.assert_allclose(upside, expected)
+    assert np.isnan(calculate_dcf_upside_batch([0.0], [1e9], [10.0], risk_free_rate=0.04)[0])
+
+
+def test_score_frame_ranks_and_skips_missing():
+    """Test factor ranks ignore missing inputs instead of penalizing them."""
+    frame = pd.DataFrame(
+        {
+            "roe": [0.30, 0.10, np.nan],
+            "profit_margin": [0.25, 0.05, np.nan],
+            "revenue_growth": [0.20, 0.00, np.nan],
+            "debt_to_equity": [20.0, 150.0, np.nan],
+            "dcf_upside": [40.0, -30.0, 10.0],
+            "trend_200d": [0.1, -0.1, np.nan],
+            "trend_50d": [0.05, -0.05, np.nan],
+            "macd_strength": [0.01, -0.01, np.nan],
+        },
+        index=["GOOD", "BAD", "SPARSE"],
+    )
+
+    screen = score_frame(frame)
+
+    assert list(screen.index) == ["GOOD", "SPARSE", "BAD"]
+    assert screen.at["GOOD", "score"] == 100
+    assert np.isnan(screen.at["SPARSE", "quality"])
+    assert screen.at["SPARSE", "score"] == pytest.approx(200 / 3)
+
+
+def test_select_shortlist():
+    """Test top/bottom selection plus new and changed tickers."""
+    screen = pd.DataFrame(
+        {"score": [90.0, 70.0, 50.0, 30.0, 10.0, np.nan]},
+        index=["A", "B", "C", "D", "E", "F"],
+    )
+    previous = pd.Series({"A": 88.0, "B": 70.0, "C": 35.0, "D": 31.0, "E": 12.0})
+
+    assert select_shortlist(screen, top_n=1, bottom_n=1) == {"A": "top", "E": "bottom"}
+
+    shortlist = select_shortlist(screen, top_n=1, previous=previous, min_change=10)
+    assert shortlist == {"A": "top", "C": "changed +15.0"}
+
+    previous = previous.drop("D")
+    assert select_shortlist(screen, previous=previous, min_change=10) == {
+        "C": "changed +15.0",
+        "D": "new",
+    }
+
+
+def test_prescreen_from_fixtures(tmp_path):
+    """Test an offline pre-screen ranks the cheap, rising ticker first and round-trips state."""
+    for ticker, market_cap, drift in (("CHEAP", 1e9, 0.2), ("RICH", 2e10, -0.2)):
+        write_fixture(
+            str(tmp_path),
+            ticker,
+            info={
+                "marketCap": market_cap,
+                "currentPrice": 20.0,
+                "returnOnEquity": 0.2,
+            },
+            statements={
+                "income_stmt": pd.DataFrame({"2025-12-31": [5e8]}, index=["Total Revenue"]),
+            },
+            prices=make_history(drift=drift),
+        )
+    (tmp_path / "risk_free_rate.json").write_text('{"rate": 0.04}')
+
+    screen = prescreen(["rich", "cheap", "MISSING"], provider=FixtureProvider(str(tmp_path)))
+
+    assert list(screen.index) == ["CHEAP", "RICH", "MISSING"]
+    assert screen.at["CHEAP", "dcf_upside"] > screen.at["RICH", "dcf_upside"]
+    assert screen.at["CHEAP", "trend_200d"] > 0 > screen.at["RICH", "trend_200d"]
+    assert np.isnan(screen.at["MISSING", "score"])
+
+    state = str(tmp_path / "prescreen.csv")
+    assert load_scores(state).empty
+    save_scores(screen, state)
+    assert load_scores(state).loc["CHEAP"] == pytest.approx(screen.at["CHEAP", "score"])
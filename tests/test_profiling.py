@@ -0,0 +1,82 @@
+"""Test per-phase profiling."""
+
+import threading
+import time
+from pathlib import Path
+
+from committee_lite.llm.mock_adapter import MockAdapter
+from committee_lite.orchestrator import InvestmentCommittee, PhaseProfiler
+
+
+def busy(seconds):
+    """Burn the given CPU time on this thread (however loaded the machine is)."""
+    end = time.thread_time() + seconds
+    while time.thread_time() < end:
+        sum(range(1000))
+
+
+def test_phase_separates_cpu_from_wait():
+    """Test phases accumulate wall and CPU time separately."""
+    profiler = PhaseProfiler(sample_interval=0.002)
+
+    with profiler.phase("waiting"):
+        time.sleep(0.2)
+    with profiler.phase("working"):
+        busy(0.2)
+    with profiler.phase("working"):
+        busy(0.05)
+
+    waiting, working = profiler.timings()
+    assert (waiting.name, working.name) == ("waiting", "working")
+    assert working.calls == 2
+    assert waiting.wall_s >= 0.2
+    # Process CPU time includes at least the CPU this thread burned
+    assert working.cpu_s >= 0.25
+
+    summary = profiler.summary()
+    assert "PHASE working: top on-CPU functions" in summary
+    assert "busy" in summary.split("PHASE working")[1]
+
+
+def test_collapsed_stacks_cover_worker_threads(tmp_path):
+    """Test samples are rooted at the phase and include threads started in it."""
+    profiler = PhaseProfiler(sample_interval=0.002)
+
+    with profiler.phase("fanout"):
+        worker = threading.Thread(target=time.sleep, args=(0.1,), name="llm-worker")
+        worker.start()
+        worker.join()
+
+    stacks = profiler.collapsed_stacks().splitlines()
+    assert stacks and all(line.startswith("fanout;") for line in stacks)
+    assert any(line.startswith("fanout;[llm-worker];") for line in stacks)
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in stacks)
+
+    paths = profiler.write(str(tmp_path), "run")
+    assert Path(paths["collapsed"]).read_text() == profiler.collapsed_stacks()
+    assert Path(paths["summary"]).read_text().startswith("PHASE TIMINGS")
+
+
+def test_committee_profiles_each_phase():
+    """Test analyze() records the data, agent, reconciliation and PM phases."""
+    profiler = PhaseProfiler()
+    committee = InvestmentCommittee(
+        llm_client=MockAdapter(latency=0.02),
+        disagreement_threshold=5,
+        profiler=profiler,
+    )
+
+    committee.analyze("NVDA")
+
+    timings = {t.name: t for t in profiler.timings()}
+    assert list(timings) == [
+        "data",
+        "agent:Fundamentals",
+        "agent:Valuation",
+        "agent:Technical",
+        "agent:Sentiment",
+        "reconciliation",
+        "portfolio_manager",
+    ]
+    assert timings["data"].calls == 4
+    assert timings["agent:Technical"].wait_s > 0.01
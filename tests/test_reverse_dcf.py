@@ -0,0 +1,118 @@
+"""Test the closed-form and reverse (market-implied) DCF."""
+
+import time
+
+import numpy as np
+import pytest
+
+from committee_lite.tools import (
+    calculate_dcf_upside_batch,
+    dcf_calculator,
+    calculate_dcf_value,
+    calculate_reverse_dcf_batch,
+    format_dcf_summary,
+    two_stage_multiple,
+)
+
+COMPANY = {"revenue": 1e10, "market_cap": 5e10, "current_price": 50.0, "beta": 1.2,
+           "total_debt": 5e9, "total_cash": 2e9}
+
+
+def year_loop_multiple(growth, wacc, terminal_growth, margin):
+    """Reference 2-stage model, summed year by year."""
+    stage1 = sum(margin * (1 + growth) ** t / (1 + wacc) ** t for t in range(1, 6))
+    terminal = margin * (1 + growth) ** 5 * (1 + terminal_growth) / (wacc - terminal_growth) / (1 + wacc) ** 5
+    return stage1, terminal
+
+
+@pytest.mark.parametrize("growth,wacc", [(0.15, 0.09), (-0.1, 0.08), (0.08, 0.08), (0.5, 0.12)])
+def test_closed_form_matches_year_loop(growth, wacc):
+    """Test the geometric-series form, including growth == WACC."""
+    stage1, terminal = two_stage_multiple(growth, wacc, 0.03, 0.15)
+    expected = year_loop_multiple(growth, wacc, 0.03, 0.15)
+
+    assert float(stage1) == pytest.approx(expected[0], rel=1e-12)
+    assert float(terminal) == pytest.approx(expected[1], rel=1e-12)
+
+
+def test_implied_assumptions_reprice_to_current_price():
+    """Test the DCF at the implied growth (or margin) is worth exactly the current price."""
+    dcf = calculate_dcf_value("X", COMPANY, risk_free_rate=0.04)
+    growth, margin = dcf["implied_growth_stage1"], dcf["implied_fcf_margin"]
+
+    at_growth = calculate_dcf_value("X", COMPANY, growth_rate_stage1=growth, risk_free_rate=0.04)
+    at_margin = calculate_dcf_value("X", COMPANY, fcf_margin=margin, risk_free_rate=0.04)
+    assert growth > 0.15 and margin > 0.15  # Price is above the default DCF value
+    assert at_growth["intrinsic_value_per_share"] == pytest.approx(50.0)
+    assert at_margin["intrinsic_value_per_share"] == pytest.approx(50.0)
+
+    summary = format_dcf_summary(dcf)
+    assert "MARKET-IMPLIED" in summary and f"{growth * 100:.1f}%" in summary
+    assert f"implied_growth_y1_5={growth * 100:.1f}%" in format_dcf_summary(dcf, compact=True)
+
+    # Priced beyond 100% growth: no implied growth within bounds, margin still solvable
+    rich = calculate_dcf_value(
+        "X", {**COMPANY, "market_cap": 5e12, "current_price": 5000.0}, risk_free_rate=0.04
+    )
+    assert rich["implied_growth_stage1"] is None and rich["implied_fcf_margin"] > 1
+    assert "N/A" in format_dcf_summary(rich)
+
+
+def test_risk_free_rate_is_resolved_once(monkeypatch):
+    """Test the DCF and reverse DCF share one treasury rate lookup."""
+    calls = []
+
+    def fetch(provider=None):
+        calls.append(provider)
+        return 0.04
+
+    monkeypatch.setattr(dcf_calculator, "fetch_current_treasury_rate", fetch)
+    dcf = calculate_dcf_value("X", COMPANY)
+
+    assert len(calls) == 1
+    assert dcf == calculate_dcf_value("X", COMPANY, risk_free_rate=0.04)
+
+
+def large_universe():
+    """Company columns for 5,000 names, with zero/missing revenue and negative EV first."""
+    rng = np.random.default_rng(0)
+    n = 5000
+    revenue = rng.uniform(1e8, 1e11, n)
+    market_cap = revenue * rng.uniform(0.3, 20, n)
+    price = rng.uniform(5, 500, n)
+    beta = np.where(rng.random(n) < 0.1, np.nan, rng.uniform(0.5, 2.0, n))
+    debt = market_cap * rng.uniform(0, 0.5, n)
+    cash = market_cap * rng.uniform(0, 0.2, n)
+    revenue[:3] = [0.0, np.nan, 1e9]
+    market_cap[2], debt[2], cash[2] = 1e6, 0.0, 1e7  # Net cash exceeds market cap: negative EV
+    return revenue, market_cap, price, beta, debt, cash
+
+
+def test_reverse_dcf_batch_for_large_universe():
+    """Test 5,000 reverse DCFs skip unsolvable names and round-trip to zero upside."""
+    revenue, market_cap, price, beta, debt, cash = large_universe()
+    implied = calculate_reverse_dcf_batch(revenue, market_cap, price, beta, debt, cash, risk_free_rate=0.04)
+
+    growth = implied["implied_growth"]
+    assert np.isnan(growth[:3]).all() and np.isnan(implied["implied_fcf_margin"][:3]).all()
+    assert not np.isnan(growth[3:]).any()
+
+    sample = np.arange(3, 200)
+    upside = [
+        calculate_dcf_upside_batch(
+            revenue[i:i + 1], market_cap[i:i + 1], price[i:i + 1], beta[i:i + 1],
+            debt[i:i + 1], cash[i:i + 1], growth_rate_stage1=growth[i], risk_free_rate=0.04,
+        )[0]
+        for i in sample
+    ]
+    np.testing.assert_allclose(upside, 0.0, atol=1e-6)
+
+
+@pytest.mark.benchmark
+def test_reverse_dcf_batch_is_fast():
+    """Test 5,000 reverse DCFs solve in well under a second."""
+    columns = large_universe()
+
+    start = time.perf_counter()
+    calculate_reverse_dcf_batch(*columns, risk_free_rate=0.04)
+    assert time.perf_counter() - start < 0.5
@@ -0,0 +1,122 @@
+"""Test tiered model routing."""
+
+import json
+
+import pytest
+
+from committee_lite.config import Config
+from committee_lite.llm import ModelRouter, RecordingClient, ReplayClient, RoutingPolicy, get_llm_client
+from committee_lite.orchestrator import InvestmentCommittee
+
+
+class LowConfidenceTechnical:
+    """Cheap-tier stand-in: mock responses, but the Technical agent is unsure."""
+
+    model = "cheap-model"
+
+    def __init__(self, score=None):
+        self.inner = get_llm_client(mock=True)
+        self.score = score
+
+    def complete(self, prompt, system_prompt=None, max_tokens=2000, temperature=0.7):
+        response = self.inner.complete(prompt, system_prompt, max_tokens, temperature)
+        if "Technical Analyst" in (system_prompt or ""):
+            data = json.loads(response)
+            data["confidence"] = "Low"
+            if self.score is not None:
+                data["score_0_100"] = self.score
+            response = json.dumps(data)
+        return response
+
+
+class StrongClient:
+    """Strong-tier stand-in that counts calls."""
+
+    model = "strong-model"
+
+    def __init__(self):
+        self.inner = get_llm_client(mock=True)
+        self.calls = 0
+
+    def complete(self, prompt, system_prompt=None, max_tokens=2000, temperature=0.7):
+        self.calls += 1
+        return self.inner.complete(prompt, system_prompt, max_tokens, temperature)
+
+
+@pytest.fixture
+def router():
+    return ModelRouter({"cheap": LowConfidenceTechnical(), "strong": StrongClient()})
+
+
+def test_low_confidence_agent_escalates(router):
+    """Test only the Low-confidence specialist is re-run on the strong tier."""
+    committee = InvestmentCommittee(router=router)
+
+    decision = committee.analyze("NVDA")
+
+    escalated = [c for c in decision.llm_calls if c.escalation]
+    assert [(c.role, c.tier, c.model, c.escalation) for c in escalated] == [
+        ("Technical", "strong", "strong-model", "low confidence")
+    ]
+    assert router.tiers["strong"].calls == 1
+    assert decision.agent_scores["Technical"] == 72  # escalated output kept
+    pm_call = next(c for c in decision.llm_calls if c.role == "PortfolioManager")
+    assert pm_call.tier == "cheap"  # spread 7 is under the threshold
+
+
+def test_disputed_ticker_uses_strong_pm(router):
+    """Test the PM escalates on disputed tickers while reconciliation stays cheap."""
+    committee = InvestmentCommittee(router=router, disagreement_threshold=5)
+
+    decision = committee.analyze("NVDA")
+
+    tiers = {c.role: c.tier for c in decision.llm_calls}
+    assert tiers["PortfolioManager"] == "strong"
+    assert tiers["Valuation:reconcile"] == "cheap"
+
+
+def test_unrouted_calls_are_recorded():
+    """Test calls are recorded with the default tier when routing is off."""
+    committee = InvestmentCommittee(llm_client=get_llm_client(mock=True))
+
+    decision = committee.analyze("NVDA")
+
+    assert len(decision.llm_calls) == 5
+    assert {c.tier for c in decision.llm_calls} == {"default"}
+
+
+def test_policy_rejects_unknown_tier():
+    """Test a policy naming a missing tier fails fast."""
+    with pytest.raises(ValueError):
+        ModelRouter({"cheap": get_llm_client(mock=True)}, RoutingPolicy())
+
+
+def test_routed_run_replays_escalations(tmp_path, monkeypatch, synthetic_provider):
+    """Test a routed run replays from one cassette, escalated re-runs included."""
+    provider = synthetic_provider(["NVDA"])
+    unsure = LowConfidenceTechnical(score=10)  # Built before its mock would record too
+    monkeypatch.setattr(Config, "LLM_CASSETTE", str(tmp_path / "routed.cassette"))
+
+    monkeypatch.setattr(Config, "LLM_CASSETTE_MODE", "record")
+    router = ModelRouter.from_config(mock=True)
+    try:
+        assert isinstance(router.tiers["cheap"], RecordingClient)
+        assert router.tiers["cheap"].cassette is router.tiers["strong"].cassette
+        router.tiers["cheap"].inner = unsure
+        recorded = InvestmentCommittee(router=router, data_provider=provider).analyze("NVDA")
+    finally:
+        router.close()
+
+    monkeypatch.setattr(Config, "LLM_CASSETTE_MODE", "replay-fast")
+    router = ModelRouter.from_config(mock=True)
+    try:
+        assert isinstance(router.tiers["cheap"], ReplayClient)
+        assert router.tiers["cheap"] is router.tiers["strong"]
+        replayed = InvestmentCommittee(router=router, data_provider=provider).analyze("NVDA")
+    finally:
+        router.close()
+
+    assert [c.role for c in recorded.llm_calls if c.escalation] == ["Technical"]
+    assert recorded.agent_scores["Technical"] == 72  # strong tier's answer kept
+    assert replayed.agent_scores == recorded.agent_scores
+    assert replayed.final_rating == recorded.final_rating
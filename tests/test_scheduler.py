@@ -0,0 +1,198 @@
+"""Test priority-aware scheduling of committee jobs and LLM calls."""
+
+import threading
+import time
+from collections import deque
+
+import pytest
+
+from committee_lite.jobs import (
+    CommitteeScheduler,
+    LLMScheduler,
+    ScheduledLLMClient,
+    SQLiteJobQueue,
+    run_scheduled_worker,
+)
+from committee_lite.jobs.scheduler import parse_weights
+from committee_lite.llm.mock_adapter import MockAdapter
+from committee_lite.orchestrator import InvestmentCommittee
+from committee_lite.store import DecisionStore
+
+
+def start_waiter(scheduler, priority, order, hold=0.0):
+    """Thread that takes a slot, records the grant and holds it briefly."""
+
+    def run():
+        with scheduler.slot(priority):
+            order.append(priority)
+            time.sleep(hold)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_parse_weights():
+    """Test weight specs cover every priority class."""
+    assert parse_weights("batch:1, interactive:8") == {"interactive": 8.0, "batch": 1.0}
+    with pytest.raises(ValueError):
+        parse_weights("interactive:8")
+    with pytest.raises(ValueError):
+        parse_weights("interactive:8,batch:1,urgent:2")
+
+
+def test_interactive_call_takes_next_slot():
+    """Test a waiting interactive call overtakes queued batch calls at the next release."""
+    scheduler = LLMScheduler(max_concurrent=1, weights={"interactive": 8, "batch": 1})
+    order = []
+
+    scheduler.acquire("batch")
+    threads = []
+    for _ in range(3):
+        threads.append(start_waiter(scheduler, "batch", order))
+        time.sleep(0.02)
+    threads.append(start_waiter(scheduler, "interactive", order))
+    time.sleep(0.02)
+
+    scheduler.release()
+    for thread in threads:
+        thread.join()
+
+    assert order == ["interactive", "batch", "batch", "batch"]
+    stats = scheduler.stats()
+    assert stats["batch"]["calls"] == 4 and stats["interactive"]["calls"] == 1
+
+
+def test_weighted_fair_share_under_contention():
+    """Test grants follow the class weights while both classes keep waiting."""
+    scheduler = LLMScheduler(max_concurrent=1, weights={"interactive": 3, "batch": 1})
+    order = []
+
+    scheduler.acquire("batch")
+    threads = []
+    for _ in range(8):
+        threads.append(start_waiter(scheduler, "batch", order, hold=0.005))
+        threads.append(start_waiter(scheduler, "interactive", order, hold=0.005))
+    time.sleep(0.05)
+    scheduler.release()
+    for thread in threads:
+        thread.join()
+
+    # Counting the holder's batch grant, interactive gets 3 of every 4 slots
+    # until it runs out of waiters
+    assert order[:8].count("batch") == 1
+    assert order[-6:] == ["batch"] * 6
+
+
+def test_rate_limit_spaces_calls():
+    """Test the requests-per-minute budget delays calls beyond the burst."""
+    scheduler = LLMScheduler(
+        max_concurrent=1, requests_per_minute=600, weights={"interactive": 1, "batch": 1}
+    )
+    client = ScheduledLLMClient(MockAdapter(), scheduler, "batch")
+
+    start = time.perf_counter()
+    for _ in range(3):
+        client.complete("Analyze NVDA fundamentals", "You are a fundamentals analyst")
+    # One call from the burst, then one every 0.1s
+    assert time.perf_counter() - start >= 0.18
+
+
+def record_grants(scheduler):
+    """
+    Log the scheduler's queueing and granting of calls, in order.
+
+    The scheduler appends to and pops its per-class waiting queues under its
+    lock, so the log records arrivals and grants in the order they happened.
+
+    Returns:
+        Tuple of (log of (event, priority, ticket) with event "wait" or
+        "grant", Event set once a batch call has queued)
+    """
+    log = []
+    batch_queued = threading.Event()
+
+    class LoggedQueue(deque):
+        def __init__(self, priority):
+            super().__init__()
+            self.priority = priority
+
+        def append(self, ticket):
+            super().append(ticket)
+            log.append(("wait", self.priority, ticket))
+            if self.priority == "batch":
+                batch_queued.set()
+
+        def popleft(self):
+            ticket = super().popleft()
+            log.append(("grant", self.priority, ticket))
+            return ticket
+
+    scheduler._waiting = {name: LoggedQueue(name) for name in scheduler.weights}
+    return log, batch_queued
+
+
+def overtaken_batch_calls(log):
+    """
+    Count batch calls each interactive call overtook.
+
+    Raises AssertionError if a batch call that was already waiting when an
+    interactive call arrived is granted before that interactive call.
+    """
+    waiting_batch = set()
+    ahead = {}  # Interactive ticket -> batch tickets waiting when it arrived
+    overtaken = 0
+    for event, priority, ticket in log:
+        if priority == "batch":
+            if event == "wait":
+                waiting_batch.add(ticket)
+                continue
+            waiting_batch.discard(ticket)
+            assert not any(ticket in batch for batch in ahead.values()), "batch call overtook"
+        elif event == "wait":
+            ahead[ticket] = set(waiting_batch)
+        else:
+            overtaken += len(ahead.pop(ticket))
+    return overtaken
+
+
+def test_scheduled_worker_serves_interactive_ahead_of_batch(tmp_path, synthetic_provider):
+    """Test interactive calls are granted before batch calls already queued for a slot."""
+    finished = []
+    # More batch workers than slots, so batch calls queue for the scheduler
+    scheduler = LLMScheduler(max_concurrent=2, weights={"interactive": 8, "batch": 1})
+    log, batch_queued = record_grants(scheduler)
+
+    class RecordingCommittee(InvestmentCommittee):
+        def analyze(self, ticker):
+            if ticker == "NVDA":
+                # Start once batch calls are queued behind the busy slots
+                assert batch_queued.wait(timeout=30)
+            decision = super().analyze(ticker)
+            finished.append(ticker)
+            return decision
+
+    batch = [f"B{i:02d}" for i in range(12)]
+    provider = synthetic_provider(batch + ["NVDA"])
+
+    def make_committee(priority):
+        client = ScheduledLLMClient(MockAdapter(latency=0.01), scheduler, priority)
+        return RecordingCommittee(llm_client=client, data_provider=provider)
+
+    with SQLiteJobQueue(str(tmp_path / "jobs.db")) as queue:
+        queue.enqueue(batch, universe="nightly")
+        queue.enqueue(["NVDA"], universe="adhoc", priority="interactive")
+
+        with CommitteeScheduler(make_committee, {"interactive": 1, "batch": 6}) as jobs, \
+                DecisionStore(str(tmp_path / "decisions.db")) as store:
+            completed = run_scheduled_worker(
+                queue, jobs, store=store, poll_interval=0.01, exit_when_empty=True
+            )
+            assert store.latest("NVDA") is not None
+
+        assert completed == 13
+        assert queue.stats()["done"] == 13
+
+    assert scheduler.stats()["interactive"]["calls"] == 5
+    assert overtaken_batch_calls(log) > 0
+    assert "NVDA" in finished
@@ -2,7 +2,13 @@
 
 import pytest
 from datetime import datetime
-from committee_lite.schemas import AgentOutput, FinalDecision, DebateRound, DissentingView
+from committee_lite.schemas import (
+    AgentOutput,
+    AgentUpdate,
+    FinalDecision,
+    DebateRound,
+    DissentingView,
+)
 
 
 def test_agent_output_valid():
@@ -87,6 +93,13 @@ def test_debate_round():
 
     assert debate.round_number == 1
     assert len(debate.agent_updates) == 1
+    assert isinstance(debate.agent_updates[0], AgentUpdate)
+    assert debate.agent_updates[0].new_score == 75
+
+    with pytest.raises(ValueError):
+        AgentUpdate(agent_name="Valuation", old_score=70, new_score=101, reasoning="Too high")
+
+    assert DebateRound.model_validate_json(debate.model_dump_json()) == debate
 
 
 def test_dissenting_view():
@@ -0,0 +1,87 @@
+"""Test the soak-test harness."""
+
+import time
+
+from committee_lite.llm.mock_adapter import MockAdapter
+from committee_lite.orchestrator import InvestmentCommittee, run_soak
+from committee_lite.tools import FixtureProvider, financial_data, get_technical_indicators
+from committee_lite.tools.market_data import write_synthetic_fixtures
+
+
+class LeakyCommittee(InvestmentCommittee):
+    """Committee that keeps a large buffer from every analysis."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retained = []
+
+    def analyze(self, ticker):
+        self.retained.append(bytearray(256 * 1024))
+        return super().analyze(ticker)
+
+
+def test_soak_passes_for_steady_committee(tmp_path):
+    """Test a short soak over synthetic fixtures completes and passes."""
+    report = run_soak(
+        duration_s=1.0,
+        tickers=["aaa", "bbb"],
+        data_dir=write_synthetic_fixtures(str(tmp_path), ["AAA", "BBB"]),
+        sample_interval_s=0.5,
+        max_growth_mb=20,
+        latency=0.0,
+        jitter=0.0,
+        verbose=False,
+    )
+
+    assert report.passed
+    assert report.failures == 0
+    assert report.decisions >= 4
+    assert report.samples and report.samples[-1].elapsed_s >= 1.0
+    assert "SOAK TEST (committee): PASSED" in str(report)
+
+
+def test_soak_flags_leak_and_reports_site(tmp_path):
+    """Test retained allocations fail the soak and point at the leaking line."""
+    data_dir = write_synthetic_fixtures(str(tmp_path), ["LEAK"])
+    committee = LeakyCommittee(
+        llm_client=MockAdapter(), data_provider=FixtureProvider(data_dir)
+    )
+    report = run_soak(
+        duration_s=1.0,
+        tickers=["LEAK"],
+        data_dir=data_dir,
+        sample_interval_s=0.5,
+        max_growth_mb=2,
+        committee=committee,
+        verbose=False,
+    )
+
+    assert not report.passed
+    assert report.traced_growth_mb > 2
+    assert report.top_growth[0].location.startswith(__file__)
+
+
+def test_mock_latency():
+    """Test the mock adapter simulates call latency."""
+    client = MockAdapter(latency=0.1, jitter=0.02)
+    start = time.perf_counter()
+    client.complete("Analyze NVDA fundamentals", "You are a fundamentals analyst")
+    assert time.perf_counter() - start >= 0.08
+
+
+def test_indicator_calls_keep_cached_history_references_bounded(tmp_path):
+    """Test repeated indicator calls don't pile up copy-on-write references on the cached history."""
+    provider = FixtureProvider(write_synthetic_fixtures(str(tmp_path), ["REFS"]))
+    hist = financial_data.get_price_history("REFS", period="1y", provider=provider)
+
+    def references():
+        return max(len(block.refs.referenced_blocks) for block in hist._mgr.blocks)
+
+    for _ in range(100):
+        get_technical_indicators("REFS", provider=provider)
+    after_warmup = references()
+    for _ in range(5000):
+        get_technical_indicators("REFS", provider=provider)
+
+    # pandas prunes dead weak references as the list grows, so it plateaus
+    assert references() <= max(after_warmup, 1000)
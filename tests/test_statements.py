@@ -0,0 +1,181 @@
+"""Test multi-period statement history and trend metrics."""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from committee_lite.agents import FundamentalsAgent
+from committee_lite.llm.mock_adapter import MockAdapter
+from committee_lite.tools import (
+    FixtureProvider,
+    StatementHistory,
+    calculate_dcf_upside_batch,
+    calculate_dcf_value,
+    compute_trends,
+    default_dcf_assumptions,
+    fetch_bulk_data,
+    format_trend_summary,
+    get_financial_snapshot,
+)
+from committee_lite.tools.market_data import write_fixture
+from committee_lite.tools.statements import ITEMS
+
+YEARS = ["2025-12-31", "2024-12-31", "2023-12-31", "2022-12-31"]  # Newest first, like yfinance
+QUARTERS = ["2026-03-31", "2025-12-31", "2025-09-30", "2025-06-30", "2025-03-31"]
+
+
+def statements(revenue=(133.1, 121.0, 110.0, 100.0), op_margin=(0.26, 0.24, 0.22, 0.20)):
+    """Four years of 10% growth with a rising operating margin, plus five quarters."""
+    revenue = np.array(revenue)
+    return {
+        "income_stmt": pd.DataFrame(
+            [revenue, revenue * 0.5, revenue * np.array(op_margin), revenue * 0.1],
+            index=["Total Revenue", "Gross Profit", "Operating Income", "Net Income"],
+            columns=YEARS,
+        ),
+        "balance_sheet": pd.DataFrame(
+            [[500.0, 480.0, np.nan, 440.0]], index=["Total Assets"], columns=YEARS
+        ),
+        "quarterly_income_stmt": pd.DataFrame(
+            [[45.0, 40.0, 35.0, 30.0, 25.0], [4.5, 4.0, 3.5, 3.0, 2.5]],
+            index=["Total Revenue", "Net Income"],
+            columns=QUARTERS,
+        ),
+    }
+
+
+def test_history_alignment_and_trend_values():
+    """Test periods are kept oldest first and trends match hand-computed values."""
+    history = StatementHistory.from_statements("ACME", statements())
+
+    assert list(history.series("revenue").index.year) == [2022, 2023, 2024, 2025]
+    assert history.latest("revenue") == pytest.approx(133.1)
+    assert history.latest("total_assets") == pytest.approx(500.0)
+    assert np.isnan(history.series("total_assets").loc["2023-12-31"])
+    assert history.latest("stockholders_equity") is None
+    assert len(history.series("revenue", quarterly=True)) == 5
+
+    trends = compute_trends([history, StatementHistory.empty("NONE")])
+
+    assert trends["revenue_ttm"][0] == pytest.approx(45 + 40 + 35 + 30)
+    assert trends["net_income_ttm"][0] == pytest.approx(15.0)
+    assert trends["revenue_cagr"][0] == pytest.approx(0.10, abs=1e-3)  # 365 vs 365.25-day years
+    assert trends["cagr_years"][0] == pytest.approx(3.0, abs=0.01)
+    assert trends["operating_margin_trend"][0] == pytest.approx(0.02, abs=1e-4)
+    assert trends["gross_margin_trend"][0] == pytest.approx(0.0, abs=1e-12)
+    assert trends["revenue_growth_volatility"][0] == pytest.approx(0.0, abs=1e-12)
+    assert all(np.isnan(trends[name][1]) for name in trends)
+
+
+def ragged_histories(count=5000):
+    """Histories of two to four years with some missing revenue and no quarters."""
+    rng = np.random.default_rng(0)
+    periods = np.array(YEARS[::-1], dtype="datetime64[D]")
+    histories = []
+    for i in range(count):
+        n = 2 + i % 3
+        annual = np.full((len(ITEMS), n), np.nan)
+        annual[ITEMS.index("revenue")] = rng.uniform(50, 150, n)
+        annual[ITEMS.index("revenue"), rng.random(n) < 0.1] = np.nan
+        annual[ITEMS.index("operating_income")] = annual[ITEMS.index("revenue")] * rng.uniform(0.05, 0.3)
+        quarterly = np.full((len(ITEMS), 0), np.nan)
+        histories.append(StatementHistory(f"T{i}", periods[-n:], annual, periods[:0], quarterly))
+    return histories
+
+
+def test_compute_trends_vectorized_for_large_universe():
+    """Test trends for 5,000 ragged histories match trending them one by one."""
+    histories = ragged_histories()
+    trends = compute_trends(histories)
+
+    for i in range(0, 5000, 97):
+        single = compute_trends([histories[i]])
+        for name, values in trends.items():
+            np.testing.assert_allclose(values[i], single[name][0], equal_nan=True, err_msg=name)
+
+
+@pytest.mark.benchmark
+def test_compute_trends_is_fast():
+    """Test 5,000 ragged histories are trended in well under a second."""
+    histories = ragged_histories()
+
+    start = time.perf_counter()
+    compute_trends(histories)
+    assert time.perf_counter() - start < 1.0
+
+
+class CountingProvider(FixtureProvider):
+    """Fixture provider that counts statement fetches."""
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.statement_calls = 0
+
+    def get_statements(self, ticker):
+        self.statement_calls += 1
+        return super().get_statements(ticker)
+
+
+def test_trends_are_cached_with_the_snapshot(tmp_path):
+    """Test bulk and single fetches carry history and trends, with no extra requests."""
+    for i, ticker in enumerate(["GROW", "FLAT"]):
+        info = {"longName": ticker, "marketCap": 1e12, "currentPrice": 100.0, "freeCashflow": 30.0}
+        revenue = (133.1, 121.0, 110.0, 100.0) if i == 0 else (100.0,) * 4
+        write_fixture(str(tmp_path), ticker, info=info, statements=statements(revenue=revenue))
+    provider = CountingProvider(str(tmp_path))
+
+    frame = fetch_bulk_data(["GROW", "FLAT"], provider=provider)
+    snapshot = get_financial_snapshot("GROW", provider=provider)
+    _, prompt = FundamentalsAgent(MockAdapter(), provider).build_prompts("GROW")
+    _, compact = FundamentalsAgent(MockAdapter(), provider, compact=True).build_prompts("GROW")
+
+    assert provider.statement_calls == 2
+    assert frame.loc["GROW", "revenue_cagr"] == pytest.approx(0.10, abs=1e-3)
+    assert frame.loc["FLAT", "revenue_cagr"] == pytest.approx(0.0, abs=1e-12)
+    assert snapshot.revenue_ttm == pytest.approx(150.0) and snapshot.revenue == pytest.approx(133.1)
+    assert snapshot.history.latest("revenue") == snapshot.revenue
+    assert "revenue_ttm" in snapshot.to_dict() and "history" not in snapshot.to_dict()
+
+    assert "MULTI-YEAR TRENDS" in prompt and "Operating +2.0pp/yr" in prompt
+    assert "rev_cagr=10.0%" in compact and "om_trend=+2.0pp/yr" in compact
+    assert format_trend_summary(get_financial_snapshot("NOPE", provider=provider)) == ""
+
+
+def test_dcf_defaults_come_from_history():
+    """Test the DCF uses TTM revenue, clipped CAGR growth and FCF margin, scalar and batch alike."""
+    base = {"ticker": "X", "revenue": 1e10, "market_cap": 5e10, "current_price": 50.0,
+            "beta": 1.2, "total_debt": 5e9, "total_cash": 2e9, "free_cash_flow": 2.4e9}
+
+    plain = calculate_dcf_value("X", base, risk_free_rate=0.04)
+    assert (plain["growth_rate_stage1"], plain["fcf_margin"]) == (0.15, 0.15)
+
+    trended = {**base, "revenue_ttm": 1.2e10, "revenue_cagr": 0.08}
+    dcf = calculate_dcf_value("X", trended, risk_free_rate=0.04)
+    explicit = calculate_dcf_value(
+        "X", {**base, "revenue": 1.2e10}, growth_rate_stage1=0.08, fcf_margin=0.2, risk_free_rate=0.04
+    )
+    assert (dcf["growth_rate_stage1"], dcf["fcf_margin"]) == pytest.approx((0.08, 0.2))
+    assert dcf["intrinsic_value_per_share"] == pytest.approx(explicit["intrinsic_value_per_share"])
+    assert dcf["assumptions"]["Growth (years 1-5)"] == "8% (revenue CAGR)"
+    assert dcf["assumptions"]["Revenue (base)"] == "$12.0B (TTM)"
+
+    hot = calculate_dcf_value("X", {**trended, "revenue_cagr": 0.9}, risk_free_rate=0.04)
+    assert hot["growth_rate_stage1"] == pytest.approx(0.30)
+
+    rows = [base, trended, {**trended, "revenue_cagr": 0.9}]
+
+    def column(name):
+        return np.array([row.get(name, np.nan) for row in rows], dtype=np.float64)
+
+    defaults = default_dcf_assumptions(
+        column("revenue"), column("revenue_ttm"), column("revenue_cagr"), column("free_cash_flow")
+    )
+    upside = calculate_dcf_upside_batch(
+        defaults["revenue"], column("market_cap"), column("current_price"), column("beta"),
+        column("total_debt"), column("total_cash"), growth_rate_stage1=defaults["growth_rate_stage1"],
+        fcf_margin=defaults["fcf_margin"], risk_free_rate=0.04,
+    )
+    expected = [r["upside_downside_pct"] for r in (plain, dcf, hot)]
+    np.testing.assert_allclose(upside, expected, rtol=1e-10)
@@ -0,0 +1,82 @@
+"""Test the decision store."""
+
+import pytest
+from datetime import datetime, timedelta
+from committee_lite.schemas import FinalDecision, DebateRound
+from committee_lite.store import DecisionStore
+
+
+def make_decision(ticker, rating, timestamp, average=60.0, spread=10):
+    """Build a minimal FinalDecision for storage tests."""
+    return FinalDecision(
+        ticker=ticker,
+        timestamp=timestamp,
+        agent_scores={"Fundamentals": 70, "Valuation": 60},
+        average_score=average,
+        score_spread=spread,
+        final_rating=rating,
+        final_confidence="Medium",
+        rationale=["Reason"],
+        action_plan="Wait",
+        invalidation_criteria=["Thesis breaks"],
+        debate_log=[
+            DebateRound(round_number=1, trigger="spread", agent_updates=[], outcome="done")
+        ],
+    )
+
+
+@pytest.fixture
+def store():
+    """In-memory decision store."""
+    with DecisionStore(":memory:") as s:
+        yield s
+
+
+def test_append_and_latest(store):
+    """Test decisions round-trip through the store."""
+    now = datetime.now()
+    store.append(make_decision("NVDA", "HOLD", now - timedelta(days=1)))
+    store.append(make_decision("NVDA", "BUY", now))
+
+    latest = store.latest("nvda")
+    assert latest.final_rating == "BUY"
+    assert latest.debate_log[0].outcome == "done"
+    assert store.count() == 2
+
+
+def test_query_filters(store):
+    """Test indexed column filters."""
+    now = datetime.now()
+    store.append_many([
+        make_decision("AAPL", "BUY", now, average=72.0, spread=5),
+        make_decision("MSFT", "SELL", now, average=35.0, spread=30),
+        make_decision("TSLA", "BUY", now - timedelta(days=30), average=65.0),
+    ])
+
+    recent_buys = store.query(rating="BUY", since=now - timedelta(days=7))
+    assert [row["ticker"] for row in recent_buys] == ["AAPL"]
+    assert recent_buys[0]["agent_scores"]["Fundamentals"] == 70
+
+    disputed = store.query(min_spread=20)
+    assert [row["ticker"] for row in disputed] == ["MSFT"]
+
+
+def test_rating_changes(store):
+    """Test downgrades are detected against each ticker's previous decision."""
+    now = datetime.now()
+    store.append_many([
+        make_decision("AAPL", "BUY", now - timedelta(days=20)),
+        make_decision("AAPL", "HOLD", now - timedelta(days=2)),
+        make_decision("MSFT", "HOLD", now - timedelta(days=20)),
+        make_decision("MSFT", "BUY", now - timedelta(days=1)),
+        make_decision("TSLA", "SELL", now - timedelta(days=1)),
+    ])
+
+    since = now - timedelta(days=7)
+    downgrades = store.rating_changes(since, direction="downgrade")
+    assert [(c["ticker"], c["previous_rating"], c["final_rating"]) for c in downgrades] == [
+        ("AAPL", "BUY", "HOLD")
+    ]
+
+    upgrades = store.rating_changes(since, direction="upgrade")
+    assert [c["ticker"] for c in upgrades] == ["MSFT"]
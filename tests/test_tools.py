@@ -0,0 +1,294 @@
+"""Test data tools."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from committee_lite.config import Config
+from committee_lite.tools import (
+    CompositeProvider,
+    FinancialSnapshot,
+    FixtureProvider,
+    PriceStore,
+    SnapshotBatch,
+    YFinanceProvider,
+    cache,
+    dcf_calculator,
+    financial_data,
+    market_data,
+    technical_indicators,
+)
+from committee_lite.tools.market_data import write_fixture
+from tests.conftest import make_history
+
+
+class FakeTicker:
+    """Stand-in for yf.Ticker that records calls."""
+
+    calls = []
+
+    def __init__(self, ticker):
+        self.ticker = ticker
+        self.info = {"longName": ticker, "marketCap": 1e9, "currentPrice": 10.0}
+        self.balance_sheet = pd.DataFrame()
+        self.income_stmt = pd.DataFrame()
+
+    def history(self, period="1y"):
+        FakeTicker.calls.append(("history", self.ticker))
+        return market_data.trim_to_period(make_history(), period)
+
+
+class FakeYF:
+    """Stand-in for the yfinance module."""
+
+    Ticker = FakeTicker
+
+    def __init__(self):
+        self.download_calls = []
+
+    def download(self, tickers, **kwargs):
+        self.download_calls.append(list(tickers))
+        return pd.concat({t: make_history() for t in tickers}, axis=1)
+
+
+@pytest.fixture
+def fake_yf(monkeypatch):
+    """Patch yfinance in the data tools and start with empty caches."""
+    fake = FakeYF()
+    FakeTicker.calls = []
+    monkeypatch.setattr(market_data, "yf", fake)
+    market_data.set_default_provider(YFinanceProvider())
+    dcf_calculator._treasury_cache.clear()
+    financial_data.clear_cache()
+    yield fake
+    market_data.set_default_provider(None)
+
+
+def test_financial_data_is_cached(fake_yf):
+    """Test repeated lookups reuse the per-ticker cache."""
+    first = financial_data.get_financial_data("NVDA")
+    first["market_cap"] = 0  # callers get a copy
+    second = financial_data.get_financial_data("NVDA")
+
+    assert second["market_cap"] == 1e9
+
+
+def test_bulk_fetch_fills_caches(fake_yf):
+    """Test one grouped download serves every ticker's technicals."""
+    frame = financial_data.fetch_bulk_data(["NVDA", "AAPL", "MSFT"])
+
+    assert fake_yf.download_calls == [["NVDA", "AAPL", "MSFT"]]
+    assert list(frame.index) == ["NVDA", "AAPL", "MSFT"]
+    assert frame.loc["AAPL", "market_cap"] == 1e9
+
+    FakeTicker.calls = []
+    indicators = technical_indicators.get_technical_indicators("AAPL")
+    assert "error" not in indicators
+    assert FakeTicker.calls == []  # no per-ticker history request
+
+
+def test_data_caches_are_bounded_and_case_insensitive(fake_yf, monkeypatch):
+    """Test tickers share entries regardless of case and the LRU entry is evicted at the cap."""
+    monkeypatch.setattr(Config, "DATA_CACHE_MAX_ENTRIES", 2)
+
+    financial_data.get_price_history("nvda")
+    financial_data.get_price_history("NVDA")
+    assert FakeTicker.calls == [("history", "nvda")]
+
+    financial_data.get_price_history("AAPL")
+    financial_data.get_price_history("NVDA")  # Now more recently used than AAPL
+    financial_data.get_price_history("MSFT")
+    assert len(financial_data._price_cache) == 2
+
+    FakeTicker.calls = []
+    financial_data.get_price_history("NVDA")
+    financial_data.get_price_history("AAPL")
+    assert FakeTicker.calls == [("history", "AAPL")]
+
+    financial_data.clear_cache("aapl")
+    assert len(financial_data._price_cache) == 1
+
+
+def test_ttl_cache_drops_expired_entries(monkeypatch):
+    """Test expired entries are never served and are swept when another entry is stored."""
+    clock = [0.0]
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    ttl_cache = cache.TTLCache(max_entries=10, ttl=60)
+    ttl_cache.put("a", 1)
+    ttl_cache.put("b", 2)
+
+    clock[0] = 30.0
+    assert ttl_cache.get("a") == 1  # Reading doesn't extend the TTL
+    ttl_cache.put("c", 3)
+
+    clock[0] = 61.0
+    assert ttl_cache.get("a") is None and "b" in ttl_cache._entries
+    ttl_cache.put("d", 4)
+    assert len(ttl_cache) == 2 and ttl_cache.get("c") == 3
+
+
+@pytest.fixture
+def fixture_dir(tmp_path):
+    """Fixture directory with one ticker and a risk-free rate."""
+    statements = {
+        "income_stmt": pd.DataFrame(
+            {"2025-12-31": [5e8, 5e7]}, index=["Total Revenue", "Net Income"]
+        ),
+    }
+    write_fixture(
+        str(tmp_path),
+        "NVDA",
+        info={"longName": "NVIDIA", "marketCap": 2e9, "currentPrice": 20.0, "beta": 1.2},
+        statements=statements,
+        prices=make_history(),
+    )
+    (tmp_path / "risk_free_rate.json").write_text('{"rate": 0.04}')
+    return str(tmp_path)
+
+
+def test_fixture_provider_offline(fixture_dir):
+    """Test the data tools run entirely from fixtures."""
+    provider = FixtureProvider(fixture_dir)
+
+    data = financial_data.get_financial_data("NVDA", provider=provider)
+    assert data["company_name"] == "NVIDIA"
+    assert data["revenue"] == 5e8
+
+    indicators = technical_indicators.get_technical_indicators("NVDA", period="6mo", provider=provider)
+    assert "error" not in indicators
+
+    assert dcf_calculator.fetch_current_treasury_rate(provider) == 0.04
+    assert "error" in financial_data.get_financial_data("MISSING", provider=provider)
+
+
+def test_composite_provider_falls_back(fixture_dir, fake_yf):
+    """Test the composite provider serves fixtures first, then the live source."""
+    provider = CompositeProvider(FixtureProvider(fixture_dir), YFinanceProvider())
+
+    assert provider.get_info("NVDA")["longName"] == "NVIDIA"
+    assert provider.get_info("AAPL")["longName"] == "AAPL"  # from fake yfinance
+
+
+def test_price_store_indicators_match_pandas(tmp_path, fake_yf):
+    """Test memory-mapped windows give the same indicators as the DataFrame path."""
+    hist = make_history()
+    store = PriceStore(str(tmp_path / "prices"))
+    assert store.append_history("NVDA", hist) == len(hist)
+
+    window = store.window("NVDA")
+    assert isinstance(window["close"], np.memmap)  # zero-copy view
+
+    from_frame = technical_indicators.get_technical_indicators("NVDA")
+    from_store = technical_indicators.get_technical_indicators("NVDA", price_store=store)
+    for key, value in from_frame.items():
+        if key != "ticker":
+            assert from_store[key] == pytest.approx(value, nan_ok=True), key
+
+    close = hist["Close"]
+    assert from_store["rsi"] == pytest.approx(technical_indicators.calculate_rsi(close))
+    assert from_store["macd"] == pytest.approx(technical_indicators.calculate_macd(close)[0])
+
+
+def test_price_store_appends_and_reopens(tmp_path):
+    """Test daily appends, block relocation and persistence across reopen."""
+    root = str(tmp_path / "prices")
+    store = PriceStore(root, headroom=2)
+    store.append_history("AAPL", make_history(days=5))
+    store.append_history("MSFT", make_history(days=5))
+
+    # Overlapping history is skipped; only newer bars are written
+    assert store.append_history("AAPL", make_history(days=8)) == 3
+    assert store.append_bar("AAPL", "2030-01-02", 1, 2, 0.5, 1.5, 100) == 1
+    assert store.append_bar("AAPL", "2030-01-02", 1, 2, 0.5, 1.5, 100) == 0
+
+    reopened = PriceStore(root)
+    assert reopened.length("AAPL") == 9
+    assert reopened.window("AAPL", bars=1)["close"][0] == 1.5
+    assert reopened.last_date("AAPL") == pd.Timestamp("2030-01-02")
+    assert list(reopened.window("MSFT")["close"]) == list(make_history(days=5)["Close"])
+
+    reopened.compact()
+    assert reopened.length("AAPL") == 9
+    assert reopened.window("AAPL", bars=1)["close"][0] == 1.5
+
+
+def test_financial_snapshot_missing_values():
+    """Test snapshots coerce source values and format without None arithmetic."""
+    snapshot = FinancialSnapshot.from_dict({
+        "ticker": "NVDA",
+        "market_cap": np.int64(2_000_000_000),
+        "trailing": "ignored",
+        "pe_ratio": "Infinity",
+        "target_price": None,
+        "recommendation": None,
+        "num_analyst_opinions": None,
+    })
+
+    assert snapshot.market_cap == 2e9 and isinstance(snapshot.market_cap, float)
+    assert snapshot.pe_ratio is None
+    assert snapshot.analyst_upside_pct is None
+    assert FinancialSnapshot.from_dict(snapshot.to_dict()) == snapshot
+
+    summary = financial_data.format_financial_summary(snapshot)
+    assert "Recommendation: N/A" in summary
+    assert "Target Price: $N/A (0 analysts)" in summary
+
+
+def test_snapshot_batch_round_trip():
+    """Test the structured-array batch keeps values and missing markers."""
+    snapshots = [
+        FinancialSnapshot(ticker="NVDA", company_name="NVIDIA", revenue=5e8),
+        FinancialSnapshot(ticker="AAPL", company_name="AAPL", error="offline"),
+    ]
+    batch = SnapshotBatch.from_snapshots(snapshots)
+
+    assert len(batch) == 2
+    assert batch["NVDA"] == snapshots[0]
+    assert batch["AAPL"] == snapshots[1]
+    assert list(batch.ok()) == [True, False]
+    assert np.isnan(batch.column("revenue")[1])
+    assert batch.to_frame().loc["NVDA", "revenue"] == 5e8
+
+
+def test_compact_summaries_drop_missing_metrics():
+    """Test compact summaries skip N/A rows and are shorter than the verbose ones."""
+    from committee_lite.llm import estimate_tokens
+    from committee_lite.tools.compact import clip
+
+    snapshot = FinancialSnapshot(
+        ticker="NVDA", company_name="NVIDIA", sector="Technology", market_cap=2e12,
+        current_price=120.0, pe_ratio=45.2, roe=0.35,
+    )
+    verbose = financial_data.format_financial_summary(snapshot)
+    compact = financial_data.format_financial_summary(snapshot, compact=True)
+
+    assert "N/A" in verbose
+    assert "N/A" not in compact and "None" not in compact
+    assert "pe=45.20" in compact and "roe=35.0%" in compact and "mcap=2.00T" in compact
+    assert estimate_tokens(compact) < estimate_tokens(verbose) / 2
+
+    dcf = dcf_calculator.calculate_dcf_value(
+        "NVDA", {**snapshot.to_dict(), "revenue": 1e11}, risk_free_rate=0.04
+    )
+    compact_dcf = dcf_calculator.format_dcf_summary(dcf, compact=True)
+    assert "NOT FOR REAL" not in compact_dcf and "wacc=" in compact_dcf
+    assert len(compact_dcf) < len(dcf_calculator.format_dcf_summary(dcf))
+
+    assert clip("Strong revenue growth at 25% YoY", 20) == "Strong revenue…"
+    assert clip("short", 20) == "short"
+
+
+def test_clear_cache_scopes_by_provider(tmp_path):
+    """Test clearing one provider's entries for a ticker keeps another provider's."""
+    for name in ("a", "b"):
+        write_fixture(str(tmp_path / name), "NVDA", info={"longName": "NVIDIA", "marketCap": 1e12})
+    first, second = FixtureProvider(str(tmp_path / "a")), FixtureProvider(str(tmp_path / "b"))
+    financial_data.get_financial_snapshot("NVDA", provider=first)
+    financial_data.get_financial_snapshot("NVDA", provider=second)
+
+    financial_data.clear_cache("nvda", provider=first)
+
+    assert len(financial_data._financial_cache) == 1
+    assert (second.cache_key, "NVDA") in financial_data._financial_cache
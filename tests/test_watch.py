@@ -0,0 +1,219 @@
+"""Test the watchlist daemon and incremental indicators."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from committee_lite.llm.mock_adapter import MockAdapter
+from committee_lite.orchestrator import InvestmentCommittee, Watcher
+from committee_lite.orchestrator.watch import _indicator_triggers
+from committee_lite.tools import PriceStore
+from committee_lite.tools.technical_indicators import IndicatorState, compute_indicators
+
+
+class CountingClient(MockAdapter):
+    """Mock adapter that counts calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def complete(self, prompt, system_prompt=None, max_tokens=2000, temperature=0.7):
+        self.calls += 1
+        return super().complete(prompt, system_prompt, max_tokens, temperature)
+
+
+class FlakyClient(MockAdapter):
+    """Mock adapter that raises while failing is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.failing = True
+
+    def complete(self, prompt, system_prompt=None, max_tokens=2000, temperature=0.7):
+        if self.failing:
+            raise ConnectionError("API timeout")
+        return super().complete(prompt, system_prompt, max_tokens, temperature)
+
+
+def random_walk(days, seed=0):
+    """Synthetic closes and volumes."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, days)))
+    return close, rng.uniform(1e6, 2e6, days)
+
+
+def make_store(path, ticker, close, volume):
+    """Price store holding one ticker's history."""
+    store = PriceStore(str(path / "prices"))
+    index = pd.date_range("2024-01-01", periods=len(close), freq="B")
+    store.append_history(
+        ticker,
+        pd.DataFrame(
+            {"Open": close, "High": close, "Low": close, "Close": close, "Volume": volume},
+            index=index,
+        ),
+    )
+    return store, index[-1]
+
+
+def test_indicator_state_tracks_full_recompute():
+    """Test one-bar updates match compute_indicators() over the trailing window."""
+    close, volume = random_walk(500)
+    state = IndicatorState("X", close[:300], volume[:300])
+
+    seeded = state.indicators()
+    expected = compute_indicators("X", close[48:300], volume[48:300])
+    for key, value in expected.items():
+        assert seeded[key] == pytest.approx(value, rel=1e-12), key
+
+    for i in range(300, 500):
+        state.update(close[i], volume[i])
+
+    updated = state.indicators()
+    expected = compute_indicators("X", close[-252:], volume[-252:])
+    for key, value in expected.items():
+        assert updated[key] == pytest.approx(value, rel=1e-6, abs=1e-6), key
+    assert state.rsi == pytest.approx(expected["rsi"])
+
+
+def test_indicator_triggers():
+    """Test RSI level crossings and MACD histogram sign flips."""
+    assert _indicator_triggers(50, 55, 0.1, 0.2) == []
+    assert _indicator_triggers(65, 72, 0.1, 0.2) == ["RSI crossed 70 (65->72)"]
+    assert _indicator_triggers(31, 28, 0.1, -0.2) == ["RSI crossed 30 (31->28)", "MACD turned bearish"]
+    assert _indicator_triggers(np.nan, 28, -0.1, 0.0) == []
+
+
+def test_watcher_reanalyzes_only_on_triggers(tmp_path, synthetic_provider):
+    """Test quiet bars cost no LLM calls; triggers run Technical or the committee."""
+    close, volume = random_walk(300, seed=3)
+    store, last_date = make_store(tmp_path, "WTCH", close, volume)
+    client = CountingClient()
+    committee = InvestmentCommittee(
+        llm_client=client,
+        data_provider=synthetic_provider(["WTCH"]),
+        price_store=store,
+    )
+    watcher = Watcher(committee, price_store=store, move_pct=5, escalate_delta=10)
+    assert watcher.watch("wtch")
+
+    # Re-pushing stored history is ignored
+    assert watcher.push_bar("WTCH", close[-1], date=last_date) is None
+
+    price = close[-1]
+    day = last_date
+    events = []
+    for step in range(60):
+        price *= 1.002 if (step // 15) % 2 == 0 else 0.998
+        day += pd.offsets.BDay()
+        event = watcher.push_bar("WTCH", price, 1.5e6, date=day)
+        if event is not None:
+            events.append(event)
+
+    assert watcher.stats["bars"] == 60
+    assert events and len(events) < 60
+    technical = [e for e in events if e.action == "technical"]
+    committee_runs = [e for e in events if e.action == "committee"]
+    escalated = [e for e in committee_runs if e.triggers[-1].startswith("Technical score")]
+    assert watcher.stats["technical_runs"] == len(technical) + len(escalated)
+    assert watcher.stats["committee_runs"] == len(committee_runs)
+    # No baseline score: the first indicator trigger escalates to the committee
+    assert events[0].action == "committee"
+    assert "Technical score none->" in events[0].triggers[-1]
+    # One call per Technical run, four agents + PM per committee run
+    assert client.calls == watcher.stats["technical_runs"] + 5 * watcher.stats["committee_runs"]
+    assert store.length("WTCH") == 360
+
+    # A 6% move from the last committee run's price re-runs the committee directly
+    calls = client.calls
+    day += pd.offsets.BDay()
+    event = watcher.push_bar("WTCH", committee_runs[-1].price * 1.06, 1.5e6, date=day)
+    assert event.action == "committee"
+    assert event.triggers[0] == "price +6.0% since last committee run"
+    assert client.calls == calls + 5
+
+
+def test_watcher_polls_price_store(tmp_path, synthetic_provider):
+    """Test bars appended by another writer are picked up on the next poll."""
+    close, volume = random_walk(300, seed=5)
+    store, last_date = make_store(tmp_path, "POLL", close, volume)
+    provider = synthetic_provider(["POLL"])
+    watcher = Watcher(
+        InvestmentCommittee(llm_client=MockAdapter(), data_provider=provider, price_store=store),
+        price_store=store,
+        move_pct=3,
+    )
+    watcher.watch("POLL")
+    assert watcher.poll() == []
+
+    writer = PriceStore(str(tmp_path / "prices"))
+    for offset, factor in ((1, 1.001), (2, 1.05)):
+        writer.append_bar(
+            "POLL", last_date + pd.offsets.BDay(offset), 0, 0, 0, close[-1] * factor, 1e6
+        )
+
+    events = watcher.poll()
+    assert watcher.stats["bars"] == 2
+    assert [e.action for e in events][-1] == "committee"
+    assert events[-1].triggers[0].startswith("price +5.0%")
+    assert watcher.poll() == []
+
+
+def test_failed_reanalysis_keeps_watching(tmp_path, synthetic_provider):
+    """Test a re-analysis error is reported on the event and retried on the next trigger."""
+    close, volume = random_walk(300, seed=5)
+    store, last_date = make_store(tmp_path, "FAIL", close, volume)
+    client = FlakyClient()
+    watcher = Watcher(
+        InvestmentCommittee(
+            llm_client=client, data_provider=synthetic_provider(["FAIL"]), price_store=store
+        ),
+        price_store=store,
+        move_pct=3,
+    )
+    watcher.watch("FAIL")
+    reference = watcher._watched["FAIL"].reference_price
+
+    writer = PriceStore(str(tmp_path / "prices"))
+    writer.append_bar("FAIL", last_date + pd.offsets.BDay(1), 0, 0, 0, close[-1] * 1.05, 1e6)
+    watcher.run(poll_interval=0, max_polls=3, verbose=False)
+
+    assert watcher.stats["failures"] == 1
+    assert watcher.stats["committee_runs"] == 0
+    assert watcher._watched["FAIL"].reference_price == reference
+
+    client.failing = False
+    writer.append_bar("FAIL", last_date + pd.offsets.BDay(2), 0, 0, 0, close[-1] * 1.06, 1e6)
+    events = watcher.poll()
+
+    assert [(e.action, e.error) for e in events] == [("committee", None)]
+    assert events[0].triggers[0].startswith("price +6.0%")
+    assert watcher._watched["FAIL"].reference_price == pytest.approx(close[-1] * 1.06)
+
+
+def test_stream_polls_price_store_between_lines(tmp_path, synthetic_provider):
+    """Test pushed bars go to the store and other writers' bars are polled between lines."""
+    close, volume = random_walk(300, seed=5)
+    store, last_date = make_store(tmp_path, "MIX", close, volume)
+    watcher = Watcher(
+        InvestmentCommittee(
+            llm_client=MockAdapter(), data_provider=synthetic_provider(["MIX"]), price_store=store
+        ),
+        price_store=store,
+        move_pct=3,
+    )
+    watcher.watch("MIX")
+
+    def lines():
+        yield f'{{"ticker": "MIX", "close": {close[-1]}, "date": "{last_date + pd.offsets.BDay(1)}"}}'
+        # Another writer appends a bar between pushed lines
+        writer = PriceStore(str(tmp_path / "prices"))
+        writer.append_bar("MIX", last_date + pd.offsets.BDay(2), 0, 0, 0, close[-1] * 1.05, 1e6)
+        yield ""
+
+    watcher.run_stream(lines(), verbose=False, poll=True)
+
+    assert watcher.stats["bars"] == 2
+    assert watcher.stats["committee_runs"] == 1
+    assert watcher._watched["MIX"].seen == store.length("MIX") == 302